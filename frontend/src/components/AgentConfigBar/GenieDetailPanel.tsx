@@ -12,6 +12,9 @@ interface GenieDetailPanelProps {
 
 export default function GenieDetailPanel({ tool, mode, onSave, onCancel }: GenieDetailPanelProps) {
   const [description, setDescription] = useState(tool.description ?? '');
+  const [cacheResults, setCacheResults] = useState(
+    tool.type === 'genie' && 'cache_results' in tool ? tool.cache_results !== false : true,
+  );
   const textareaRef = useRef<HTMLTextAreaElement>(null);
 
   useEffect(() => {
@@ -33,6 +36,7 @@ export default function GenieDetailPanel({ tool, mode, onSave, onCancel }: Genie
         ...tool,
         type: 'genie',
         description,
+        cache_results: cacheResults,
       } as GenieTool;
       if ('conversation_id' in tool) {
         (entry as GenieTool & { conversation_id?: string }).conversation_id = (
@@ -43,6 +47,7 @@ export default function GenieDetailPanel({ tool, mode, onSave, onCancel }: Genie
       entry = {
         ...toGenieToolEntry(tool as AvailableTool),
         description,
+        cache_results: cacheResults,
       };
     }
 
@@ -98,6 +103,22 @@ export default function GenieDetailPanel({ tool, mode, onSave, onCancel }: Genie
         />
       </div>
 
+      {/* Result cache */}
+      <div className="mb-4">
+        <label className="flex items-center gap-2 text-sm text-gray-600">
+          <input
+            type="checkbox"
+            data-testid="genie-cache-results"
+            checked={cacheResults}
+            onChange={(e) => setCacheResults(e.target.checked)}
+          />
+          Reuse recent answers to repeated questions
+        </label>
+        <p className="text-xs text-gray-400 mt-1 ml-6">
+          Turn off for spaces whose data must always be queried live
+        </p>
+      </div>
+
       {/* Buttons */}
       <div className="flex items-center justify-end gap-2">
         <button
@@ -55,8 +55,9 @@ export const ChatInput: React.FC<ChatInputProps> = ({
         const asset = await api.uploadImage(f, { saveToLibrary: false });
         // thumbnail_base64 is already a complete data URI (data:<mime>;base64,...)
         // from the backend — use it as-is. Prepending another scheme here yields a
-        // doubled prefix and net::ERR_INVALID_URL.
-        const previewUrl = asset.thumbnail_base64 ?? undefined;
+        // doubled prefix and net::ERR_INVALID_URL. It is null while the backend
+        // renders the thumbnail off-request, so preview the local file meanwhile.
+        const previewUrl = asset.thumbnail_base64 ?? URL.createObjectURL(f);
         addUploadedImage(asset.id, previewUrl);
       } catch (err) {
         console.warn('Paste image upload failed:', err);
@@ -78,7 +79,7 @@ export const ChatInput: React.FC<ChatInputProps> = ({
           const asset = await api.uploadImage(file, { saveToLibrary: false });
           // thumbnail_base64 is already a complete data URI from the backend —
           // use it as-is (see handlePaste).
-          const previewUrl = asset.thumbnail_base64 ?? undefined;
+          const previewUrl = asset.thumbnail_base64 ?? URL.createObjectURL(file);
           addUploadedImage(asset.id, previewUrl);
         }
       } catch (err) {
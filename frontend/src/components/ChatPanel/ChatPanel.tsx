@@ -245,6 +245,13 @@ export const ChatPanel = forwardRef<ChatPanelHandle, ChatPanelProps>(({
           }
           break;
 
+        case 'slide_ready':
+          // Provisional slide HTML; the deck itself arrives with 'complete'.
+          if (event.slide_index !== undefined) {
+            setLoadingMessage(`Slide ${event.slide_index + 1} drafted...`);
+          }
+          break;
+
         case 'session_title':
           if (event.session_title) {
             setSessionTitle(event.session_title);
@@ -7,6 +7,8 @@ import { DOCS_URLS } from '../../constants/docs';
 const MAX_FILE_SIZE = 5 * 1024 * 1024;
 const ALLOWED_TYPES = ['image/png', 'image/jpeg', 'image/gif', 'image/svg+xml'];
 const CATEGORIES = ['all', 'branding', 'content', 'background'] as const;
+// Thumbnails render off-request after upload; refetch while any is pending.
+const THUMBNAIL_POLL_MS = 2000;
 
 interface ImageLibraryProps {
   /** If provided, clicking an image calls this instead of showing details */
@@ -32,26 +34,43 @@ export const ImageLibrary: React.FC<ImageLibraryProps> = ({
   const [dragOver, setDragOver] = useState(false);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
+  const fetchImages = useCallback(async () => {
+    const params: { category?: string; query?: string } = {};
+    if (selectedCategory !== 'all') params.category = selectedCategory;
+    if (searchQuery.trim()) params.query = searchQuery.trim();
+    const result = await api.listImages(params);
+    setImages(result.images);
+  }, [selectedCategory, searchQuery]);
+
   const loadImages = useCallback(async () => {
     setLoading(true);
     setError(null);
     try {
-      const params: { category?: string; query?: string } = {};
-      if (selectedCategory !== 'all') params.category = selectedCategory;
-      if (searchQuery.trim()) params.query = searchQuery.trim();
-      const result = await api.listImages(params);
-      setImages(result.images);
+      await fetchImages();
     } catch (err: any) {
       setError(err.message || 'Failed to load images');
     } finally {
       setLoading(false);
     }
-  }, [selectedCategory, searchQuery]);
+  }, [fetchImages]);
 
   useEffect(() => {
     loadImages();
   }, [loadImages]);
 
+  const hasPendingThumbnails = images.some(img => img.thumbnail_status === 'pending');
+
+  // Quietly refetch (no loading state) until every thumbnail has rendered.
+  useEffect(() => {
+    if (!hasPendingThumbnails) return;
+    const timer = setTimeout(() => {
+      fetchImages().catch(() => {
+        // Transient list failure: keep the current grid; the next change retries.
+      });
+    }, THUMBNAIL_POLL_MS);
+    return () => clearTimeout(timer);
+  }, [hasPendingThumbnails, images, fetchImages]);
+
   const validateFile = (file: File): string | null => {
     if (!ALLOWED_TYPES.includes(file.type)) {
       return `${file.name}: Invalid file type (${file.type}). Allowed: PNG, JPEG, GIF, SVG`;
@@ -86,14 +105,17 @@ export const ImageLibrary: React.FC<ImageLibraryProps> = ({
     const category = selectedCategory === 'all' ? 'content' : selectedCategory;
     let uploaded = 0;
 
-    for (const file of validFiles) {
-      setUploadProgress(`Uploading ${uploaded + 1} of ${validFiles.length}...`);
-      try {
-        await api.uploadImage(file, { category });
-        uploaded++;
-      } catch (err: any) {
-        errors.push(`${file.name}: ${err.message || 'Upload failed'}`);
+    setUploadProgress(
+      `Uploading ${validFiles.length} image${validFiles.length !== 1 ? 's' : ''}...`
+    );
+    try {
+      const result = await api.uploadImagesBatch(validFiles, { category });
+      uploaded = result.images.length;
+      for (const rejected of result.errors) {
+        errors.push(`${rejected.original_filename}: ${rejected.detail}`);
       }
+    } catch (err: any) {
+      errors.push(err.message || 'Upload failed');
     }
 
     setUploading(false);
@@ -255,6 +277,8 @@ export const ImageLibrary: React.FC<ImageLibraryProps> = ({
                   />
                 ) : image.mime_type === 'image/svg+xml' ? (
                   <span className="text-2xl text-gray-400">SVG</span>
+                ) : image.thumbnail_status === 'pending' ? (
+                  <span className="text-xs text-gray-400 animate-pulse">Rendering preview...</span>
                 ) : (
                   <span className="text-2xl text-gray-400">?</span>
                 )}
@@ -455,9 +455,33 @@ function SlidePanelComponent(props: SlidePanelProps, ref: React.Ref<SlidePanelHa
 
     setVerifyingSlides(new Set(slidesToVerify.map(s => s.index)));
 
+    slidesToVerify.forEach(({ contentHash }) => autoVerifyTriggeredRef.current.add(contentHash));
+
+    // One deck-level job: deck and source data load once, results stream in
+    // per slide. Slides it didn't report fall back to per-slide calls.
+    const verified = new Set<number>();
+    try {
+      await api.verifyDeck(
+        capturedSessionId,
+        slidesToVerify.map(({ index }) => index),
+        (index) => {
+          verified.add(index);
+          setVerifyingSlides((prev) => {
+            const next = new Set(prev);
+            next.delete(index);
+            return next;
+          });
+        },
+      );
+    } catch (error) {
+      console.error('[Auto-verify] Deck verification failed, verifying per slide:', error);
+    }
+
     const verificationPromises = slidesToVerify.map(async ({ index, contentHash }) => {
+      if (verified.has(index)) {
+        return { index, success: true };
+      }
       try {
-        autoVerifyTriggeredRef.current.add(contentHash);
         console.log(`[Auto-verify] Verifying slide ${index + 1} (hash: ${contentHash.substring(0, 8)}...)`);
         await api.verifySlide(capturedSessionId, index);
         console.log(`[Auto-verify] Slide ${index + 1} verified`);
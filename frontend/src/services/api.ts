@@ -1,5 +1,10 @@
 import type { ChatResponse } from '../types/message';
-import type { ImageAsset, ImageListResponse, ImageDataResponse } from '../types/image';
+import type {
+  ImageAsset,
+  ImageBatchUploadResponse,
+  ImageListResponse,
+  ImageDataResponse,
+} from '../types/image';
 import type { SlideDeck, Slide, SlideContext, ReplacementInfo } from '../types/slide';
 import type { VerificationResult } from '../types/verification';
 import type { AgentConfig, ToolEntry, AvailableTool, ProfileSummary, DiscoveryResponse, ColumnDiscoveryResponse } from '../types/agentConfig';
@@ -59,7 +64,7 @@ const isPollingMode = (): boolean => {
 };
 
 // Streaming event types matching backend StreamEventType
-export type StreamEventType = 'assistant' | 'tool_call' | 'tool_result' | 'error' | 'complete' | 'session_title' | 'session_created';
+export type StreamEventType = 'assistant' | 'tool_call' | 'tool_result' | 'error' | 'complete' | 'session_title' | 'session_created' | 'slide_ready';
 
 export interface StreamEvent {
   type: StreamEventType;
@@ -76,6 +81,8 @@ export interface StreamEvent {
   experiment_url?: string;
   session_title?: string;
   session_id?: string;
+  slide_index?: number;
+  slide_html?: string;
 }
 
 export interface SessionMessage {
@@ -1060,6 +1067,32 @@ export const api = {
     return response.json();
   },
 
+  /**
+   * Upload several files in one request. Each file is stored independently:
+   * rejected files come back in `errors`, and thumbnails for the stored ones
+   * render in parallel server-side (`thumbnail_status: 'pending'` until done).
+   */
+  async uploadImagesBatch(
+    files: File[],
+    metadata: { tags?: string[]; description?: string; category?: string } = {}
+  ): Promise<ImageBatchUploadResponse> {
+    const formData = new FormData();
+    for (const file of files) formData.append('files', file);
+    if (metadata.tags) formData.append('tags', JSON.stringify(metadata.tags));
+    if (metadata.description) formData.append('description', metadata.description);
+    if (metadata.category) formData.append('category', metadata.category);
+
+    const response = await fetch(`${API_BASE_URL}/api/images/upload/batch`, {
+      method: 'POST',
+      body: formData,
+    });
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new ApiError(response.status, error.detail || 'Upload failed');
+    }
+    return response.json();
+  },
+
   async listImages(params?: { category?: string; query?: string }): Promise<ImageListResponse> {
     const searchParams = new URLSearchParams();
     if (params?.category) searchParams.set('category', params.category);
@@ -1159,6 +1192,67 @@ export const api = {
     }
   },
 
+  /**
+   * Verify several slides in one deck-level job, streaming results via SSE.
+   *
+   * The backend loads the deck and source data once, reuses results already
+   * stored for a slide's content hash and saves new ones in one write.
+   * `onSlide` fires as each slide finishes; resolves with the job summary.
+   */
+  async verifyDeck(
+    sessionId: string,
+    slideIndices: number[],
+    onSlide: (slideIndex: number, verification: VerificationResult) => void,
+  ): Promise<{
+    verified: number;
+    reused: number;
+    cache_hits: number;
+    failed: number;
+    judge_calls: number;
+  }> {
+    const response = await fetch(`${API_BASE_URL}/api/verification/deck`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ session_id: sessionId, slide_indices: slideIndices }),
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new ApiError(response.status, error.detail || 'Failed to verify deck');
+    }
+
+    const reader = response.body?.getReader();
+    if (!reader) {
+      throw new Error('No response body');
+    }
+
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+
+      const lines = buffer.split('\n');
+      buffer = lines.pop() || ''; // Keep incomplete line in buffer
+
+      for (const line of lines) {
+        if (!line.startsWith('data: ')) continue;
+        const event = JSON.parse(line.slice(6));
+        if (event.type === 'slide') {
+          onSlide(event.slide_index, event.verification);
+        } else if (event.type === 'complete') {
+          return event;
+        } else if (event.type === 'error') {
+          throw new ApiError(500, event.error || 'Failed to verify deck');
+        }
+      }
+    }
+    throw new ApiError(500, 'Deck verification ended early');
+  },
+
   /**
    * Submit feedback on a verification result
    * Feedback is linked to the original verification trace for labeling/review
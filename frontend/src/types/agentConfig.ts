@@ -4,6 +4,7 @@ export interface GenieTool {
   space_name: string;
   description?: string;
   conversation_id?: string;
+  cache_results?: boolean;
 }
 
 export interface MCPTool {
@@ -5,6 +5,7 @@ export interface ImageAsset {
   mime_type: string;
   size_bytes: number;
   thumbnail_base64: string | null;
+  thumbnail_status?: 'pending' | 'ready' | 'failed'; // rendered off-request after upload
   tags: string[];
   description: string | null;
   category: string | null;
@@ -14,6 +15,16 @@ export interface ImageAsset {
   updated_at: string;
 }
 
+export interface ImageUploadError {
+  original_filename: string;
+  detail: string;
+}
+
+export interface ImageBatchUploadResponse {
+  images: ImageAsset[];
+  errors: ImageUploadError[]; // per-file rejections; the rest of the batch is stored
+}
+
 export interface ImageListResponse {
   images: ImageAsset[];
   total: number;
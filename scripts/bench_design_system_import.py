@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Peak RSS of a design-system bundle import versus bundle size.
+
+Each measurement runs in a fresh subprocess (so ``ru_maxrss`` is that import's
+high-water mark alone) against a file-backed SQLite database (an in-memory one
+would hold every stored byte in RSS itself), importing a
+SYNTHETIC bundle padded with incompressible font/background assets.
+
+    python scripts/bench_design_system_import.py --sizes 16 64 128
+
+``--source bytes`` reproduces the old whole-upload-in-memory path for comparison;
+the default ``file`` source reads the bundle from a temporary file the way the
+route hands over the spooled upload.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_CHILD = r"""
+import json, os, resource, sys
+sys.path.insert(0, os.getcwd())
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from src.core.database import Base
+import src.database.models  # noqa: F401
+from src.services.design_system_service import import_bundle
+
+path, source, db_path = sys.argv[1], sys.argv[2], sys.argv[3]
+engine = create_engine(
+    f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+Base.metadata.create_all(bind=engine)
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+with Session(engine) as db, open(path, "rb") as fh:
+    if source == "bytes":
+        import_bundle(db, zip_bytes=fh.read(), user="bench")
+    else:
+        import_bundle(db, zip_file=fh, user="bench")
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"baseline_kb": baseline, "peak_kb": peak}))
+"""
+
+
+def _write_bundle(path: str, size_mb: int) -> None:
+    sys.path.insert(0, os.getcwd())
+    from tests.unit.conftest_design_system import SVG_LOGO, make_bundle_zip
+
+    chunk = 4 * 1024 * 1024
+    files = {"assets/logo.svg": SVG_LOGO}
+    for i in range(max(1, size_mb // 4)):
+        files[f"fonts/pad-{i:03d}.woff2"] = os.urandom(chunk)
+    with open(path, "wb") as fh:
+        fh.write(make_bundle_zip(files=files))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 128], help="bundle MB")
+    parser.add_argument("--source", choices=("file", "bytes"), default="file")
+    args = parser.parse_args()
+
+    print(f"{'bundle MB':>10} {'peak RSS MB':>12} {'delta MB':>10}")
+    for size_mb in args.sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bundle.zip")
+            _write_bundle(path, size_mb)
+            out = subprocess.run(
+                [sys.executable, "-c", _CHILD, path, args.source, os.path.join(tmpdir, "bench.db")],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            peak = result["peak_kb"] / 1024
+            delta = (result["peak_kb"] - result["baseline_kb"]) / 1024
+            print(f"{size_mb:>10} {peak:>12.1f} {delta:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
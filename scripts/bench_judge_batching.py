@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""Tokens sent and wall time of a deck verification, per-slide versus batched judge calls.
+
+Runs the whole-deck job (``verify_deck``) on the Direct judge backend against a
+STUBBED judge model: no endpoint is called. The stub counts prompt tokens
+(``estimate_tokens``) and sleeps a fixed per-call overhead plus a per-1k-token
+prefill cost, so the wall times show the shape of the saving, not real latency.
+
+    python scripts/bench_judge_batching.py --slides 20 --corpus-kb 32
+
+``--batch-sizes`` lists the ``batch_max_slides`` values to compare; ``1`` is the
+old one-call-per-slide path.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.getcwd())
+os.environ.setdefault("VERIFICATION_CACHE_ENABLED", "false")
+
+
+class _StubChat:
+    def __init__(self, call_s: float, per_1k_s: float):
+        self.call_s = call_s
+        self.per_1k_s = per_1k_s
+        self.calls = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        return self
+
+    def invoke(self, messages):
+        from src.core.prompt_metrics import estimate_tokens
+
+        prompt = messages[0].content
+        tokens = estimate_tokens(prompt)
+        with self._lock:
+            self.calls += 1
+            self.tokens += tokens
+        time.sleep(self.call_s + self.per_1k_s * tokens / 1000)
+        ids = re.findall(r"^### SLIDE (\S+)$", prompt, flags=re.MULTILINE)
+        if not ids:
+            return SimpleNamespace(content=json.dumps({"rating": "green", "explanation": ""}))
+        results = [{"slide_id": i, "rating": "green", "explanation": ""} for i in ids]
+        return SimpleNamespace(content=json.dumps({"results": results}))
+
+
+def _manager(slides: int, corpus_kb: int) -> MagicMock:
+    row = "| region | quarter | revenue | margin |\n"
+    corpus = row * (corpus_kb * 1024 // len(row))
+    manager = MagicMock()
+    manager.get_session.return_value = {"genie_conversation_id": None}
+    manager.get_slide_deck.return_value = {
+        "slides": [
+            {
+                "html": f"<div class='slide'><h1>Q{i % 4 + 1}</h1><p>Revenue {i}.2M</p></div>",
+                "content_hash": f"bench-{i}",
+                "verification": None,
+            }
+            for i in range(slides)
+        ]
+    }
+    manager.get_messages.return_value = [
+        {"role": "tool", "message_type": "tool_result", "content": corpus}
+    ]
+    return manager
+
+
+def _run(batch_max_slides: int, args: argparse.Namespace) -> tuple:
+    from src.api.services import deck_verification
+
+    chat = _StubChat(args.call_ms / 1000, args.per_1k_ms / 1000)
+
+    async def collect():
+        return [
+            event
+            async for event in deck_verification.verify_deck(
+                "bench", batch_max_slides=batch_max_slides
+            )
+        ]
+
+    with patch("src.core.databricks_client.get_system_client", return_value=MagicMock()), patch(
+        "databricks_langchain.ChatDatabricks", chat
+    ), patch.object(
+        deck_verification,
+        "get_session_manager",
+        return_value=_manager(args.slides, args.corpus_kb),
+    ), patch.object(
+        deck_verification, "get_settings", return_value=SimpleNamespace(llm_judge_backend="direct")
+    ):
+        start = time.perf_counter()
+        events = asyncio.run(collect())
+        elapsed = time.perf_counter() - start
+    return chat.calls, chat.tokens, elapsed, events[-1]["verified"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--corpus-kb", type=int, default=32, help="source corpus size")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--call-ms", type=float, default=800, help="stub per-call overhead")
+    parser.add_argument("--per-1k-ms", type=float, default=40, help="stub cost per 1k tokens")
+    args = parser.parse_args()
+
+    print(f"{'batch':>6} {'calls':>6} {'tokens sent':>12} {'wall s':>8} {'verified':>9}")
+    for batch in args.batch_sizes:
+        calls, tokens, elapsed, verified = _run(batch, args)
+        print(f"{batch:>6} {calls:>6} {tokens:>12,} {elapsed:>8.2f} {verified:>9}")
+
+
+if __name__ == "__main__":
+    main()
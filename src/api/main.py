@@ -141,6 +141,15 @@ async def lifespan(app: FastAPI):
                 logger.info(f"Recovered {recovered} stuck chat requests")
         except Exception as e:
             logger.warning(f"Failed to recover stuck requests: {e}")
+
+        # Re-render thumbnails a previous process left pending (shutdown
+        # cancels queued renders; a crash drops in-flight ones).
+        try:
+            from src.services.image_service import reschedule_pending_thumbnails
+
+            await asyncio.to_thread(reschedule_pending_thumbnails)
+        except Exception as e:
+            logger.warning(f"Failed to reschedule pending thumbnails: {e}")
     else:
         logger.info("Test mode: skipping background workers and recovery")
 
@@ -185,6 +194,16 @@ async def lifespan(app: FastAPI):
             pass
         logger.info("MCP job timeout sweeper stopped")
 
+    # Stop the off-request image thumbnail workers (no-op if never started).
+    from src.services.image_service import shutdown_thumbnail_pool
+
+    shutdown_thumbnail_pool()
+
+    # Close pooled MCP tool sessions (no-op if no MCP tool ran).
+    from src.services.tools.mcp_sessions import shutdown_mcp_sessions
+
+    shutdown_mcp_sessions()
+
     # Tear down the FastMCP session manager's task group. Safe to call
     # unconditionally — the stack was entered unconditionally at startup.
     await mcp_lifespan_stack.aclose()
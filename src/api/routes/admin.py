@@ -1,9 +1,12 @@
 """Admin endpoints for app-wide configuration.
 
-Includes global Google OAuth credentials management.
+Includes global Google OAuth credentials management, the prompt-budget
+report, the LLM admission report, the tool latency report and the
+verification cache report and purge.
 """
 
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from pydantic import BaseModel, Field
@@ -13,6 +16,9 @@ from src.api.routes._authz import require_admin
 from src.api.utils.validation import validate_credentials_json
 from src.core.database import get_db
 from src.core.encryption import decrypt_data, encrypt_data
+from src.core.http_transport import latency_report
+from src.core.llm_admission import admission_report
+from src.core.prompt_metrics import prompt_section_report
 from src.core.settings_db import (
     normalize_llm_judge_backend,
     reload_settings,
@@ -21,6 +27,11 @@ from src.core.settings_db import (
 from src.core.user_context import get_current_user
 from src.database.models import GoogleGlobalCredentials
 from src.database.models.google_oauth_token import GoogleOAuthToken
+from src.services.tools.vector_tool import get_vector_search_cache
+from src.services.verification_cache import (
+    purge_verification_cache,
+    verification_cache_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +85,64 @@ def put_judge_backend(body: JudgeBackendUpdate, db: Session = Depends(get_db)):
     return {"backend": raw}
 
 
+@router.get("/prompt-budget")
+def get_prompt_budget():
+    """p50/p95 characters and estimated tokens per prompt section.
+
+    Covers this worker's most recent agent requests (see ``prompt_metrics``),
+    plus the cached share of input tokens when the endpoint reports it.
+    """
+    return prompt_section_report()
+
+
+@router.get("/llm-admission")
+def get_llm_admission():
+    """Per-endpoint LLM admission state and p50/p95 queue wait per priority class.
+
+    Covers this worker's governors (see ``llm_admission``).
+    """
+    return admission_report()
+
+
+@router.get("/tool-latency")
+def get_tool_latency():
+    """Latency histogram and p50/p95 per serving endpoint and vector index.
+
+    Covers this worker's tool calls (see ``http_transport``), plus the vector
+    search cache's hit counts.
+    """
+    return {**latency_report(), "vector_search_cache": get_vector_search_cache().stats()}
+
+
+@router.get("/verification-cache")
+def get_verification_cache(db: Session = Depends(get_db)):
+    """Verification cache hit rate and cached verdicts per judge backend.
+
+    Lookup/hit counters cover this worker; row and lifetime hit counts cover
+    the shared table (see ``verification_cache``).
+    """
+    return verification_cache_report(db)
+
+
+@router.delete("/verification-cache")
+def delete_verification_cache(
+    judge_backend: Optional[str] = None,
+    prompt_version: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Purge cached verdicts, optionally only one judge backend's or prompt version's."""
+    deleted = purge_verification_cache(db, judge_backend, prompt_version)
+    logger.info(
+        "Verification cache purged (admin)",
+        extra={
+            "judge_backend": judge_backend,
+            "prompt_version": prompt_version,
+            "deleted": deleted,
+        },
+    )
+    return {"deleted": deleted}
+
+
 @router.post("/google-credentials")
 async def upload_google_credentials(
     file: UploadFile = File(...),
@@ -371,6 +371,7 @@ async def start_google_slides_export(
     session_manager = get_session_manager()
     existing_info = session_manager.get_google_slides_info(request_body.session_id)
     existing_presentation_id = existing_info["presentation_id"] if existing_info else None
+    existing_page_map = existing_info.get("page_map") if existing_info else None
 
     # Enqueue background job
     job_id = generate_job_id()
@@ -383,6 +384,7 @@ async def start_google_slides_export(
         "chart_images_per_slide": chart_images_per_slide,
         "job_type": "google_slides",
         "existing_presentation_id": existing_presentation_id,
+        "existing_page_map": existing_page_map,
     }
     await enqueue_export_job(job_id, payload)
 
@@ -1,12 +1,14 @@
 """Image upload and management API endpoints."""
+import asyncio
 import base64
+import json
 import logging
 import os
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.database import get_db
 from src.database.models.image import ImageAsset
@@ -27,6 +29,9 @@ class ImageResponse(BaseModel):
     mime_type: str
     size_bytes: int
     thumbnail_base64: Optional[str]
+    # 'pending' until the off-request renderer fills the thumbnail in, then
+    # 'ready' or 'failed'. Legacy rows (NULL) were rendered inline → 'ready'.
+    thumbnail_status: str
     tags: List[str]
     description: Optional[str]
     category: Optional[str]
@@ -39,6 +44,18 @@ class ImageResponse(BaseModel):
         from_attributes = True
 
 
+class ImageUploadError(BaseModel):
+    """A single file rejected from a batch upload."""
+    original_filename: str
+    detail: str
+
+
+class ImageBatchUploadResponse(BaseModel):
+    """Response for a multi-file upload: stored images plus per-file rejections."""
+    images: List[ImageResponse]
+    errors: List[ImageUploadError]
+
+
 class ImageListResponse(BaseModel):
     """Response for listing images."""
     images: List[ImageResponse]
@@ -87,6 +104,7 @@ def _image_to_response(img: ImageAsset) -> ImageResponse:
         mime_type=img.mime_type,
         size_bytes=img.size_bytes,
         thumbnail_base64=img.thumbnail_base64,
+        thumbnail_status=img.thumbnail_status or image_service.THUMBNAIL_STATUS_READY,
         tags=img.tags or [],
         description=img.description,
         category=img.category,
@@ -99,6 +117,43 @@ def _image_to_response(img: ImageAsset) -> ImageResponse:
 
 # --- Endpoints ---
 
+def _store_and_schedule(
+    db: Session,
+    content: bytes,
+    original_filename: str,
+    mime_type: str,
+    user: str,
+    tags: List[str],
+    description: Optional[str],
+    category: str,
+) -> ImageAsset:
+    """Persist the original, then hand thumbnail rendering to the process pool.
+
+    The row is committed with ``thumbnail_status='pending'`` and returned as
+    soon as the bytes are stored; the renderer writes the thumbnail through a
+    session bound to this request's engine.
+    """
+    image = image_service.upload_image(
+        db=db,
+        file_content=content,
+        original_filename=original_filename,
+        mime_type=mime_type,
+        user=user,
+        tags=tags,
+        description=description,
+        category=category,
+        defer_thumbnail=True,
+    )
+    if image.thumbnail_status == image_service.THUMBNAIL_STATUS_PENDING:
+        image_service.schedule_thumbnail(
+            image.id,
+            content,
+            image.mime_type,
+            session_factory=sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind()),
+        )
+    return image
+
+
 @router.post("/upload", response_model=ImageResponse, status_code=status.HTTP_201_CREATED)
 async def upload_image(
     file: UploadFile = File(...),
@@ -108,9 +163,7 @@ async def upload_image(
     save_to_library: Optional[str] = Form("true"),  # "true" or "false" (Form fields are strings)
     db: Session = Depends(get_db),
 ):
-    """Upload an image file."""
-    import json
-
+    """Upload an image file. The thumbnail is rendered asynchronously."""
     try:
         content = await file.read()
         parsed_tags = json.loads(tags) if tags else []
@@ -119,15 +172,16 @@ async def upload_image(
         # Override category to ephemeral when not saving to library
         effective_category = category if save_to_library != "false" else "ephemeral"
 
-        image = image_service.upload_image(
-            db=db,
-            file_content=content,
-            original_filename=file.filename or "unknown",
-            mime_type=file.content_type or "application/octet-stream",
-            user=user,
-            tags=parsed_tags,
-            description=description,
-            category=effective_category,
+        image = await asyncio.to_thread(
+            _store_and_schedule,
+            db,
+            content,
+            file.filename or "unknown",
+            file.content_type or "application/octet-stream",
+            user,
+            parsed_tags,
+            description,
+            effective_category,
         )
 
         return _image_to_response(image)
@@ -145,6 +199,68 @@ async def upload_image(
         )
 
 
+@router.post(
+    "/upload/batch",
+    response_model=ImageBatchUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_images_batch(
+    files: List[UploadFile] = File(...),
+    tags: Optional[str] = Form(None),
+    description: Optional[str] = Form(None),
+    category: Optional[str] = Form("content"),
+    save_to_library: Optional[str] = Form("true"),
+    db: Session = Depends(get_db),
+):
+    """Upload several image files in one request.
+
+    Each file is validated and stored independently — a rejected file is
+    reported in ``errors`` and does not fail the rest. Thumbnails for the
+    stored files render in parallel on the shared process pool.
+    """
+    try:
+        parsed_tags = json.loads(tags) if tags else []
+        user = _get_current_user()
+        effective_category = category if save_to_library != "false" else "ephemeral"
+
+        stored: List[ImageResponse] = []
+        errors: List[ImageUploadError] = []
+        for upload in files:
+            filename = upload.filename or "unknown"
+            content = await upload.read()
+            try:
+                image = await asyncio.to_thread(
+                    _store_and_schedule,
+                    db,
+                    content,
+                    filename,
+                    upload.content_type or "application/octet-stream",
+                    user,
+                    parsed_tags,
+                    description,
+                    effective_category,
+                )
+            except ValueError as e:
+                db.rollback()
+                errors.append(ImageUploadError(original_filename=filename, detail=str(e)))
+                continue
+            stored.append(_image_to_response(image))
+
+        return ImageBatchUploadResponse(images=stored, errors=errors)
+
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error uploading images: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload images",
+        )
+
+
 @router.get("", response_model=ImageListResponse)
 def list_images(
     category: Optional[str] = None,
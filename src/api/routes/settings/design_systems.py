@@ -537,8 +537,15 @@ async def import_design_system(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Upload exceeds the maximum bundle size of {MAX_BUNDLE_SIZE_BYTES} bytes",
         )
-    content = await file.read()
-    if len(content) > MAX_BUNDLE_SIZE_BYTES:  # backstop when size was unknown
+    # The multipart parser has already streamed the upload into a
+    # SpooledTemporaryFile (memory up to its threshold, then disk). The importer
+    # reads that file in place, so the bundle is never materialised as one bytes
+    # object; only its size is measured here.
+    spooled = file.file
+    spooled.seek(0, os.SEEK_END)
+    upload_size = spooled.tell()
+    spooled.seek(0)
+    if upload_size > MAX_BUNDLE_SIZE_BYTES:  # backstop when size was unknown
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Upload exceeds the maximum bundle size of {MAX_BUNDLE_SIZE_BYTES} bytes",
@@ -549,7 +556,7 @@ async def import_design_system(
         dropped: list[design_system_service.BundleImportWarning] = []
         ds = design_system_service.import_bundle(
             db,
-            zip_bytes=content,
+            zip_file=spooled,
             user=_current_user(),
             name_override=name,
             source_filename=file.filename,
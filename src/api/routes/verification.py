@@ -1,81 +1,36 @@
 """Slide verification endpoints using LLM as Judge.
 
-Provides API for verifying slide accuracy against Genie source data.
-Uses MLflow's make_judge API for semantic comparison.
+Provides API for verifying slide accuracy against Genie source data, one
+slide at a time or a whole deck in one streamed job. Uses MLflow's make_judge
+API for semantic comparison (see src/api/services/deck_verification.py).
 """
 
 import asyncio
+import json
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.api.routes._authz import _check_deck_permission_for_session
+from src.api.services.deck_verification import (
+    build_verification_corpus,
+    judge_backend_setting,
+    judge_slide,
+    unverifiable_result,
+    verify_deck,
+)
 from src.api.services.session_manager import SessionNotFoundError, get_session_manager
-from src.core.settings_db import get_settings
 from src.database.models.profile_contributor import PermissionLevel
-from src.services.evaluation import evaluate_with_judge
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/verification", tags=["verification"])
 
-
-# Asset-lookup tools return filename/handle LISTINGS for layout purposes, not
-# source data — judging numeric claims against them produced blanket
-# unknown/"Review suggested" badges on design-system decks (dsv2 battery F4).
-# Exclusion is strictly name-based: results persisted without tool_name
-# metadata keep flowing to the judge.
-_ASSET_SEARCH_TOOL_NAMES = frozenset({"search_images", "search_brand_assets"})
-
-
-def _build_verification_corpus(messages: list) -> str:
-    """Join data-bearing tool results into the judge's source corpus.
-
-    Collects tool results from any DATA tool (Genie, Vector Index, Agent
-    Bricks, Model Endpoint, MCP, …) and skips asset-search results. Returns
-    ``""`` when nothing data-bearing remains, which routes verification to the
-    honest "No source data available" path.
-    """
-    source_data_parts = []
-    for msg in messages:
-        if msg.get("role") != "tool" or msg.get("message_type") != "tool_result":
-            continue
-        metadata = msg.get("metadata") or {}
-        if metadata.get("tool_name") in _ASSET_SEARCH_TOOL_NAMES:
-            continue
-        content = msg.get("content", "")
-        if content and content.strip():
-            source_data_parts.append(content)
-    return "\n---\n".join(source_data_parts)
-
-
-def _source_data_insufficient_for_verification(genie_data: str) -> bool:
-    """True when tool/source text has no substantive facts to verify against (skip judge)."""
-    s = (genie_data or "").strip()
-    if not s:
-        return True
-    low = s.lower()
-    markers = (
-        "no images found",
-        "no images matching",
-        "no rows",
-        "no results",
-        "no data found",
-        "empty result",
-        "did not return any",
-        "0 rows",
-        "no matching",
-    )
-    if not any(m in low for m in markers):
-        return False
-    digit_count = sum(ch.isdigit() for ch in s)
-    if digit_count >= 8:
-        return False
-    if len(s) > 8000:
-        return False
-    return True
+# Running deck jobs, referenced so they finish after a client disconnects.
+_deck_jobs: set[asyncio.Task] = set()
 
 
 class VerifySlideRequest(BaseModel):
@@ -98,6 +53,14 @@ class VerifySlideResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+class VerifyDeckRequest(BaseModel):
+    """Request to verify every slide of a deck."""
+
+    session_id: str
+    slide_indices: Optional[list[int]] = None  # None = all slides
+    force: bool = False  # Re-judge slides that already have a result
+
+
 class FeedbackRequest(BaseModel):
     """Request to submit feedback on verification."""
 
@@ -108,6 +71,78 @@ class FeedbackRequest(BaseModel):
     trace_id: Optional[str] = None  # MLflow trace ID to link feedback to
 
 
+@router.post("/deck")
+async def verify_deck_stream(request: VerifyDeckRequest) -> StreamingResponse:
+    """Verify a whole deck in one job, streaming per-slide results via SSE.
+
+    The deck and the source corpus are loaded once, slides that already have
+    a result for their content hash (in the deck or the verification cache)
+    are reported without a judge call, and new results are saved in one
+    write. Emits one ``slide`` event per slide and a final ``complete`` event
+    (``error`` if the job fails part way).
+
+    The job runs independently of the response: if the client disconnects,
+    in-flight judge calls still finish and are saved.
+
+    Raises:
+        HTTPException: 404 if session/slides not found, 500 on error
+    """
+    # Same gate as verify_slide: writes state and bills LLM-judge runs.
+    _check_deck_permission_for_session(request.session_id, PermissionLevel.CAN_EDIT)
+
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def run_job() -> None:
+        try:
+            async for event in verify_deck(
+                request.session_id,
+                slide_indices=request.slide_indices,
+                force=request.force,
+            ):
+                await events.put(event)
+        except Exception as e:
+            await events.put(e)
+        finally:
+            await events.put(None)  # Signal completion
+
+    job = asyncio.create_task(run_job())
+    _deck_jobs.add(job)
+    job.add_done_callback(_deck_jobs.discard)
+
+    first = await events.get()
+    if isinstance(first, SessionNotFoundError):
+        raise HTTPException(status_code=404, detail=f"Session not found: {request.session_id}")
+    if isinstance(first, LookupError):
+        raise HTTPException(status_code=404, detail=str(first))
+    if isinstance(first, Exception):
+        logger.error(f"Deck verification failed: {first}", exc_info=first)
+        raise HTTPException(status_code=500, detail="Verification failed")
+
+    async def generate_events():
+        event = first
+        while event is not None:
+            if isinstance(event, Exception):
+                logger.error(f"Deck verification failed: {event}", exc_info=event)
+                yield _sse({"type": "error", "error": "Verification failed"})
+                break
+            yield _sse(event)
+            event = await events.get()
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
 @router.post("/{slide_index}", response_model=VerifySlideResponse)
 async def verify_slide(slide_index: int, request: VerifySlideRequest):
     """Verify a slide's numerical accuracy against Genie source data.
@@ -175,24 +210,12 @@ async def verify_slide(slide_index: int, request: VerifySlideRequest):
         )
 
         # Combine data-bearing tool results (asset-search listings excluded —
-        # see _build_verification_corpus).
-        genie_data = _build_verification_corpus(messages)
-
-        if not genie_data:
-            # No tool data found - verification cannot be performed
-            unknown_result = {
-                "score": 0,
-                "rating": "unknown",
-                "explanation": (
-                    "No source data available for verification. "
-                    "This may be a title slide or slides generated without data queries."
-                ),
-                "issues": [{"type": "no_data", "detail": "No tool query results found in session"}],
-                "duration_ms": 0,
-                "genie_conversation_id": genie_conversation_id,
-                "error": False,
-            }
+        # see build_verification_corpus).
+        genie_data = build_verification_corpus(messages)
 
+        # No (substantive) tool data - verification cannot be performed
+        unknown_result = unverifiable_result(genie_data, genie_conversation_id)
+        if unknown_result is not None:
             # Save this result by content hash (so it's remembered)
             await asyncio.to_thread(
                 session_manager.save_verification,
@@ -200,34 +223,6 @@ async def verify_slide(slide_index: int, request: VerifySlideRequest):
                 content_hash,
                 unknown_result,
             )
-
-            return VerifySlideResponse(**unknown_result)
-
-        if _source_data_insufficient_for_verification(genie_data):
-            unknown_result = {
-                "score": 0,
-                "rating": "unknown",
-                "explanation": (
-                    "No substantive source data was available to verify this slide "
-                    "(for example empty tool results or a no-results message only). "
-                    "Verification cannot assess factual accuracy without ground truth."
-                ),
-                "issues": [
-                    {
-                        "type": "insufficient_source",
-                        "detail": "Tool results contained no verifiable facts to compare",
-                    }
-                ],
-                "duration_ms": 0,
-                "genie_conversation_id": genie_conversation_id,
-                "error": False,
-            }
-            await asyncio.to_thread(
-                session_manager.save_verification,
-                request.session_id,
-                content_hash,
-                unknown_result,
-            )
             return VerifySlideResponse(**unknown_result)
 
         # Get session's experiment_id for LLM judge to use
@@ -235,30 +230,16 @@ async def verify_slide(slide_index: int, request: VerifySlideRequest):
             session_manager.get_experiment_id, request.session_id
         )
 
-        settings = get_settings()
-        judge_backend = getattr(settings, "llm_judge_backend", None) or "mlflow"
-
         # Run LLM judge evaluation using session's experiment (backend from Admin Judge)
-        result = await evaluate_with_judge(
-            genie_data=genie_data,
-            slide_content=slide_html,
+        verification_result = await judge_slide(
+            slide_html,
+            genie_data,
+            content_hash=content_hash,
             experiment_id=experiment_id,
-            judge_backend=judge_backend,
+            judge_backend=judge_backend_setting(),
+            genie_conversation_id=genie_conversation_id,
         )
 
-        # Build verification result dict
-        verification_result = {
-            "score": result.score,
-            "rating": result.rating,
-            "explanation": result.explanation,
-            "issues": result.issues,
-            "duration_ms": result.duration_ms,
-            "trace_id": result.trace_id,
-            "genie_conversation_id": genie_conversation_id,
-            "error": result.error,
-            "error_message": result.error_message,
-        }
-
         # Save verification by content hash (survives deck regeneration)
         await asyncio.to_thread(
             session_manager.save_verification,
@@ -273,8 +254,8 @@ async def verify_slide(slide_index: int, request: VerifySlideRequest):
                 "session_id": request.session_id,
                 "slide_index": slide_index,
                 "content_hash": content_hash,
-                "score": result.score,
-                "rating": result.rating,
+                "score": verification_result["score"],
+                "rating": verification_result["rating"],
             },
         )
 
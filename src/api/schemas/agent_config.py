@@ -30,6 +30,9 @@ class GenieTool(BaseModel):
     space_name: str = Field(..., min_length=1)
     description: Optional[str] = None
     conversation_id: Optional[str] = None
+    # Admins switch this off for spaces whose answers must always be queried
+    # live; it only matters when GENIE_RESULT_CACHE_ENABLED is on.
+    cache_results: bool = True
 
 
 class MCPTool(BaseModel):
@@ -20,6 +20,7 @@ class StreamEventType(str, Enum):
     COMPLETE = "complete"  # Generation finished
     SESSION_TITLE = "session_title"  # Auto-generated session title
     SESSION_CREATED = "session_created"  # New session created on first message
+    SLIDE_READY = "slide_ready"  # Provisional slide HTML, as soon as it is complete
 
 
 class StreamEvent(BaseModel):
@@ -34,6 +35,8 @@ class StreamEvent(BaseModel):
         slides: Slide deck data (for complete event)
         error: Error message (for error events)
         message_id: Database ID of persisted message
+        slide_index: Position of the slide in the LLM response (for slide_ready events)
+        slide_html: Provisional slide HTML (for slide_ready events)
     """
 
     type: StreamEventType = Field(..., description="Event type")
@@ -52,6 +55,8 @@ class StreamEvent(BaseModel):
     experiment_url: Optional[str] = Field(default=None, description="MLflow experiment URL")
     session_title: Optional[str] = Field(default=None, description="Auto-generated session title")
     session_id: Optional[str] = Field(default=None, description="Session ID (for session_created events)")
+    slide_index: Optional[int] = Field(default=None, description="Slide position in the response")
+    slide_html: Optional[str] = Field(default=None, description="Provisional slide HTML")
 
     def to_sse(self) -> str:
         """Format event as SSE data line.
@@ -30,6 +30,7 @@ from src.domain.slide import Slide, has_slide_wrapper
 from src.domain.slide_deck import SlideDeck
 from src.api.schemas.agent_config import resolve_agent_config
 from src.services.agent_factory import build_agent_for_request
+from src.services.chat_history_compaction import compact_chat_history
 from src.services.streaming_callback import StreamingCallbackHandler
 from src.utils.html_utils import (
     extract_canvas_ids_from_html,
@@ -1159,11 +1160,16 @@ class ChatService:
                 from src.core.databricks_client import get_user_client
 
                 from src.core.defaults import DEFAULT_CONFIG
+                from src.core.llm_admission import LLMPriority
+                from src.services.llm_admission_callback import LLMAdmissionCallback
                 naming_model = ChatDatabricks(
                     endpoint=DEFAULT_CONFIG["llm"]["endpoint"],
                     max_tokens=50,
                     temperature=0.3,
                     workspace_client=get_user_client(),
+                    callbacks=[LLMAdmissionCallback(
+                        DEFAULT_CONFIG["llm"]["endpoint"], LLMPriority.NAMING,
+                    )],
                 )
                 generated_title = generate_session_title(message, naming_model)
                 if generated_title:
@@ -1532,6 +1538,8 @@ class ChatService:
         complete_metadata = result.get("metadata") or {}
         if conflict_note:
             complete_metadata["conflict_note"] = conflict_note
+        # Time to first slide_ready event, next to the agent's latency_seconds.
+        complete_metadata.update(callback_handler.slide_stream_stats())
 
         # AISEC-248: the safety-gate retry notice is emitted live (mid-stream) via
         # callback_handler.emit_notice during agent execution, so it appears in the
@@ -1553,6 +1561,7 @@ class ChatService:
                 "session_id": session_id,
                 "has_slide_deck": slide_deck_dict is not None,
                 "had_conflict_note": conflict_note is not None,
+                "first_slide_ms": complete_metadata.get("first_slide_ms"),
             },
         )
 
@@ -1752,7 +1761,7 @@ class ChatService:
         if not db_messages:
             return 0
 
-        count = 0
+        messages = []
         # Hydrate only real conversation turns. clarification IS kept — it is an
         # assistant turn the user answers; dropping it regresses "add or replace?"
         # flows. reasoning/info/tool_* are agent-internal noise and must not be
@@ -1767,19 +1776,30 @@ class ChatService:
             if not content:
                 continue
             if role == "user" and mtype in HUMAN_TYPES:
-                chat_history.add_message(HumanMessage(content=content))
-                count += 1
+                messages.append(HumanMessage(content=content))
             elif role == "assistant" and mtype in AI_TYPES:
-                chat_history.add_message(AIMessage(content=content))
-                count += 1
+                messages.append(AIMessage(content=content))
             # Skip reasoning / info / tool_call / tool_result — agent-internal noise.
 
+        # Older assistant turns carry full deck HTML; replaying them all makes
+        # every request re-send every earlier deck version. Fit the replay into
+        # the configured token budget (see chat_history_compaction).
+        messages, stats = compact_chat_history(messages)
+        chat_history.add_messages(messages)
+
         logger.info(
             "Hydrated chat history from database",
-            extra={"session_id": session_id, "message_count": count},
+            extra={
+                "session_id": session_id,
+                "message_count": len(messages),
+                "history_tokens_raw": stats.tokens_in,
+                "history_tokens": stats.tokens_out,
+                "history_turns_summarized": stats.summarized,
+                "history_messages_dropped": stats.dropped,
+            },
         )
 
-        return count
+        return len(messages)
 
     def _detect_add_intent(self, message: str) -> bool:
         """Detect if user wants to add a new slide (RC2 fix).
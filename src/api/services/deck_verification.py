@@ -0,0 +1,368 @@
+"""Slide verification: source corpus, per-slide judging and whole-deck runs.
+
+``POST /api/verification/{slide_index}`` judges one slide. Auto-verification
+used to fan that out per slide, so an N-slide deck re-read the session, deck
+and messages and rebuilt the corpus N times. :func:`verify_deck` does one
+pass for the whole deck:
+
+- The session, deck (with its ``verification_map`` merged in) and messages
+  are read once and the corpus is built once.
+- Slides whose content hash already has a non-error result are reported as
+  they are and not judged again (unless ``force``). Slides with identical
+  content share one judge call.
+- Remaining slides are looked up in the global verification cache
+  (``src/services/verification_cache.py``) in one query; only misses reach
+  the judge, and their verdicts are added to the cache afterwards.
+- Judge calls run concurrently, at most ``VERIFY_DECK_MAX_CONCURRENCY``
+  (default 4) at a time; each still takes an LLM admission slot. With the
+  Direct judge backend each call rates up to ``JUDGE_BATCH_MAX_SLIDES``
+  slides against one copy of the corpus (``evaluate_batch_with_judge``).
+- Progress is yielded per slide as each call finishes, and all new results
+  are persisted with one ``save_verifications`` write at the end (also when
+  the run is cancelled part way).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Optional
+
+from src.api.services.session_manager import get_session_manager
+from src.core.settings_db import get_settings, normalize_llm_judge_backend
+from src.services.evaluation import (
+    LLMJudgeResult,
+    evaluate_batch_with_judge,
+    evaluate_with_judge,
+    plan_judge_batches,
+)
+from src.services.evaluation.llm_judge import JUDGE_BATCH_MAX_SLIDES
+from src.services.verification_cache import VerificationCache
+
+logger = logging.getLogger(__name__)
+
+VERIFY_DECK_MAX_CONCURRENCY = int(os.getenv("VERIFY_DECK_MAX_CONCURRENCY", "4"))
+
+
+# Asset-lookup tools return filename/handle LISTINGS for layout purposes, not
+# source data — judging numeric claims against them produced blanket
+# unknown/"Review suggested" badges on design-system decks (dsv2 battery F4).
+# Exclusion is strictly name-based: results persisted without tool_name
+# metadata keep flowing to the judge.
+_ASSET_SEARCH_TOOL_NAMES = frozenset({"search_images", "search_brand_assets"})
+
+
+def build_verification_corpus(messages: list) -> str:
+    """Join data-bearing tool results into the judge's source corpus.
+
+    Collects tool results from any DATA tool (Genie, Vector Index, Agent
+    Bricks, Model Endpoint, MCP, …) and skips asset-search results. Returns
+    ``""`` when nothing data-bearing remains, which routes verification to the
+    honest "No source data available" path.
+    """
+    source_data_parts = []
+    for msg in messages:
+        if msg.get("role") != "tool" or msg.get("message_type") != "tool_result":
+            continue
+        metadata = msg.get("metadata") or {}
+        if metadata.get("tool_name") in _ASSET_SEARCH_TOOL_NAMES:
+            continue
+        content = msg.get("content", "")
+        if content and content.strip():
+            source_data_parts.append(content)
+    return "\n---\n".join(source_data_parts)
+
+
+def source_data_insufficient_for_verification(genie_data: str) -> bool:
+    """True when tool/source text has no substantive facts to verify against (skip judge)."""
+    s = (genie_data or "").strip()
+    if not s:
+        return True
+    low = s.lower()
+    markers = (
+        "no images found",
+        "no images matching",
+        "no rows",
+        "no results",
+        "no data found",
+        "empty result",
+        "did not return any",
+        "0 rows",
+        "no matching",
+    )
+    if not any(m in low for m in markers):
+        return False
+    digit_count = sum(ch.isdigit() for ch in s)
+    if digit_count >= 8:
+        return False
+    if len(s) > 8000:
+        return False
+    return True
+
+
+def _unknown_result(
+    explanation: str, issue_type: str, detail: str, genie_conversation_id: Optional[str]
+) -> dict[str, Any]:
+    return {
+        "score": 0,
+        "rating": "unknown",
+        "explanation": explanation,
+        "issues": [{"type": issue_type, "detail": detail}],
+        "duration_ms": 0,
+        "genie_conversation_id": genie_conversation_id,
+        "error": False,
+    }
+
+
+def unverifiable_result(
+    genie_data: str, genie_conversation_id: Optional[str]
+) -> Optional[dict[str, Any]]:
+    """The "unknown" result for a corpus the judge cannot use, or None if it can."""
+    if not genie_data:
+        return _unknown_result(
+            "No source data available for verification. "
+            "This may be a title slide or slides generated without data queries.",
+            "no_data",
+            "No tool query results found in session",
+            genie_conversation_id,
+        )
+    if source_data_insufficient_for_verification(genie_data):
+        return _unknown_result(
+            "No substantive source data was available to verify this slide "
+            "(for example empty tool results or a no-results message only). "
+            "Verification cannot assess factual accuracy without ground truth.",
+            "insufficient_source",
+            "Tool results contained no verifiable facts to compare",
+            genie_conversation_id,
+        )
+    return None
+
+
+def judge_backend_setting() -> str:
+    """The workspace judge backend (Admin Judge panel), ``mlflow`` by default."""
+    return getattr(get_settings(), "llm_judge_backend", None) or "mlflow"
+
+
+async def _run_judge(
+    slide_html: str,
+    genie_data: str,
+    *,
+    experiment_id: Optional[str],
+    judge_backend: str,
+    genie_conversation_id: Optional[str],
+) -> dict[str, Any]:
+    result = await evaluate_with_judge(
+        genie_data=genie_data,
+        slide_content=slide_html,
+        experiment_id=experiment_id,
+        judge_backend=judge_backend,
+    )
+    return _verification(result, genie_conversation_id)
+
+
+def _verification(result: LLMJudgeResult, genie_conversation_id: Optional[str]) -> dict[str, Any]:
+    return {
+        "score": result.score,
+        "rating": result.rating,
+        "explanation": result.explanation,
+        "issues": result.issues,
+        "duration_ms": result.duration_ms,
+        "trace_id": result.trace_id,
+        "genie_conversation_id": genie_conversation_id,
+        "error": result.error,
+        "error_message": result.error_message,
+    }
+
+
+async def judge_slide(
+    slide_html: str,
+    genie_data: str,
+    *,
+    content_hash: str,
+    experiment_id: Optional[str],
+    judge_backend: str,
+    genie_conversation_id: Optional[str],
+) -> dict[str, Any]:
+    """Judge one slide and return the result as stored in ``verification_map``.
+
+    A verdict already in the verification cache for this slide, corpus and
+    judge is returned without a judge call; a new verdict is added to it.
+    """
+    cache = VerificationCache.for_judge(judge_backend, genie_data)
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get_many, [content_hash])
+        if content_hash in cached:
+            return {**cached[content_hash], "genie_conversation_id": genie_conversation_id}
+    verification = await _run_judge(
+        slide_html,
+        genie_data,
+        experiment_id=experiment_id,
+        judge_backend=judge_backend,
+        genie_conversation_id=genie_conversation_id,
+    )
+    if cache is not None:
+        await asyncio.to_thread(cache.put_many, {content_hash: verification})
+    return verification
+
+
+# -- whole deck --------------------------------------------------------------
+
+
+def _slide_event(index: int, content_hash: str, verification: dict, cached: bool) -> dict:
+    return {
+        "type": "slide",
+        "slide_index": index,
+        "content_hash": content_hash,
+        "cached": cached,
+        "verification": verification,
+    }
+
+
+async def verify_deck(
+    session_id: str,
+    *,
+    slide_indices: Optional[list[int]] = None,
+    force: bool = False,
+    max_concurrency: int = VERIFY_DECK_MAX_CONCURRENCY,
+    batch_max_slides: int = JUDGE_BATCH_MAX_SLIDES,
+) -> AsyncIterator[dict[str, Any]]:
+    """Verify a deck's slides, yielding one ``slide`` event per slide and a ``complete`` event.
+
+    Raises:
+        SessionNotFoundError: unknown session.
+        LookupError: the session has no slides.
+    """
+    from src.utils.slide_hash import compute_slide_hash
+
+    started = time.monotonic()
+    session_manager = get_session_manager()
+    session = await asyncio.to_thread(session_manager.get_session, session_id)
+    genie_conversation_id = session.get("genie_conversation_id")
+    slide_deck = await asyncio.to_thread(session_manager.get_slide_deck, session_id)
+    slides = (slide_deck or {}).get("slides") or []
+    if not slides:
+        raise LookupError("No slides found for this session")
+
+    indices = range(len(slides)) if slide_indices is None else slide_indices
+    pending: dict[str, list[int]] = {}  # content hash -> slide indices
+    html_by_hash: dict[str, str] = {}
+    reused = 0
+    for index in indices:
+        if not 0 <= index < len(slides):
+            continue
+        html = slides[index].get("html", "")
+        content_hash = slides[index].get("content_hash") or compute_slide_hash(html)
+        existing = slides[index].get("verification")
+        if existing and not existing.get("error") and not force:
+            reused += 1
+            yield _slide_event(index, content_hash, existing, cached=True)
+            continue
+        pending.setdefault(content_hash, []).append(index)
+        html_by_hash[content_hash] = html
+
+    results: dict[str, dict[str, Any]] = {}  # new verification_map entries
+    judged: dict[str, dict[str, Any]] = {}  # ... of which came from a judge call
+    cache: Optional[VerificationCache] = None
+    verified = failed = judge_calls = cache_hits = 0
+    if pending:
+        messages = await asyncio.to_thread(session_manager.get_messages, session_id)
+        genie_data = build_verification_corpus(messages)
+        unverifiable = unverifiable_result(genie_data, genie_conversation_id)
+        try:
+            if unverifiable is not None:
+                for content_hash, slide_indexes in pending.items():
+                    results[content_hash] = unverifiable
+                    for index in slide_indexes:
+                        verified += 1
+                        yield _slide_event(index, content_hash, unverifiable, cached=False)
+            else:
+                judge_backend = judge_backend_setting()
+                cache = VerificationCache.for_judge(judge_backend, genie_data)
+                if cache is not None:
+                    cached = await asyncio.to_thread(cache.get_many, list(pending))
+                    for content_hash, verdict in cached.items():
+                        verification = {**verdict, "genie_conversation_id": genie_conversation_id}
+                        results[content_hash] = verification
+                        for index in pending.pop(content_hash):
+                            verified += 1
+                            cache_hits += 1
+                            yield _slide_event(index, content_hash, verification, cached=True)
+
+                experiment_id = await asyncio.to_thread(
+                    session_manager.get_experiment_id, session_id
+                )
+                limit = asyncio.Semaphore(max(1, max_concurrency))
+
+                if normalize_llm_judge_backend(judge_backend) == "direct":
+                    # Several slides per call against one copy of the corpus.
+                    groups = plan_judge_batches(
+                        genie_data,
+                        [(h, html_by_hash[h]) for h in pending],
+                        max_slides=max(1, batch_max_slides),
+                    )
+                else:
+                    groups = [[h] for h in pending]
+
+                async def judge(group: list[str]) -> dict[str, dict[str, Any]]:
+                    async with limit:
+                        if len(group) == 1:
+                            return {
+                                group[0]: await _run_judge(
+                                    html_by_hash[group[0]],
+                                    genie_data,
+                                    experiment_id=experiment_id,
+                                    judge_backend=judge_backend,
+                                    genie_conversation_id=genie_conversation_id,
+                                )
+                            }
+                        batch = await evaluate_batch_with_judge(
+                            genie_data, {h: html_by_hash[h] for h in group}
+                        )
+                        return {
+                            h: _verification(result, genie_conversation_id)
+                            for h, result in batch.items()
+                        }
+
+                tasks = [asyncio.create_task(judge(group)) for group in groups]
+                judge_calls = len(tasks)
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        for content_hash, verification in (await next_done).items():
+                            results[content_hash] = verification
+                            judged[content_hash] = verification
+                            failed += int(bool(verification.get("error")))
+                            for index in pending[content_hash]:
+                                verified += 1
+                                yield _slide_event(
+                                    index, content_hash, verification, cached=False
+                                )
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            if results:
+                await asyncio.to_thread(
+                    session_manager.save_verifications, session_id, results
+                )
+            if judged and cache is not None:
+                await asyncio.to_thread(cache.put_many, judged)
+
+    logger.info(
+        "Deck verification completed",
+        extra={
+            "session_id": session_id,
+            "judge_calls": judge_calls,
+            "reused": reused,
+            "cache_hits": cache_hits,
+            "failed": failed,
+        },
+    )
+    yield {
+        "type": "complete",
+        "verified": verified,
+        "reused": reused,
+        "cache_hits": cache_hits,
+        "failed": failed,
+        "judge_calls": judge_calls,
+        "duration_ms": int((time.monotonic() - started) * 1000),
+    }
@@ -409,6 +409,7 @@ async def process_google_slides_job(job_id: str, payload: dict) -> None:
         "chart_images_per_slide"
     )
     existing_presentation_id: Optional[str] = payload.get("existing_presentation_id")
+    existing_page_map: Optional[List[List[str]]] = payload.get("existing_page_map")
     total_slides = len(slides_html)
 
     try:
@@ -431,13 +432,14 @@ async def process_google_slides_job(job_id: str, payload: dict) -> None:
                 }),
             )
 
-        converter = HtmlToGoogleSlidesConverter(google_auth=auth)
+        converter = HtmlToGoogleSlidesConverter(google_auth=auth, user_identity=user_identity)
         result = await converter.convert_slide_deck(
             slides=slides_html,
             title=title,
             chart_images_per_slide=chart_images_per_slide,
             progress_callback=on_progress,
             existing_presentation_id=existing_presentation_id,
+            existing_page_map=existing_page_map,
             on_presentation_created=on_pres_created,
         )
 
@@ -449,6 +451,7 @@ async def process_google_slides_job(job_id: str, payload: dict) -> None:
                 session_id,
                 result["presentation_id"],
                 result["presentation_url"],
+                page_map=result.get("page_map"),
             )
         except Exception:
             logger.warning("Failed to persist Google Slides info on session", exc_info=True)
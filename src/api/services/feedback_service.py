@@ -13,8 +13,10 @@ from sqlalchemy.orm import Session
 
 from sqlalchemy import func
 
+from src.core.llm_admission import LLMPriority
 from src.database.models.feedback import FeedbackConversation, SurveyResponse
 from src.database.models.session import UserSession
+from src.services.llm_admission_callback import LLMAdmissionCallback
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +75,10 @@ class FeedbackService:
 
     def chat(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         """Send a feedback conversation to the LLM and return the response."""
-        model = ChatDatabricks(endpoint=self.endpoint, temperature=0.3, max_tokens=500)
+        model = ChatDatabricks(
+            endpoint=self.endpoint, temperature=0.3, max_tokens=500,
+            callbacks=[LLMAdmissionCallback(self.endpoint, LLMPriority.CHAT)],
+        )
 
         lc_messages = [SystemMessage(content=FEEDBACK_SYSTEM_PROMPT)]
         for msg in messages:
@@ -292,7 +297,10 @@ Feedback items:
 
 Respond with valid JSON only."""
 
-        model = ChatDatabricks(endpoint=self.endpoint, temperature=0.2, max_tokens=800)
+        model = ChatDatabricks(
+            endpoint=self.endpoint, temperature=0.2, max_tokens=800,
+            callbacks=[LLMAdmissionCallback(self.endpoint, LLMPriority.EXPORT)],
+        )
         response = model.invoke([HumanMessage(content=report_prompt)])
 
         try:
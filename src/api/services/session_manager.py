@@ -613,6 +613,7 @@ class SessionManager:
                 experiment_id=None,
                 google_slides_presentation_id=None,
                 google_slides_url=None,
+                google_slides_page_map=None,
             )
             db.add(new_session)
             db.flush()
@@ -691,17 +692,25 @@ class SessionManager:
         session_id: str,
         presentation_id: str,
         presentation_url: str,
+        page_map: Optional[List[List[str]]] = None,
     ) -> None:
         """Store Google Slides presentation info on the deck owner session.
 
         For contributor sessions the info is written to the parent so
         re-exports by any contributor overwrite the same presentation.
+
+        ``page_map`` is the ``[slide content hash, page objectId]`` list of a
+        presentation built page by page; omitting it clears any stored map,
+        since a replaced presentation's page ids no longer apply.
         """
         with get_db_session() as db:
             session = self._get_session_or_raise(db, session_id)
             deck_owner = self._get_deck_owner_session(db, session)
             deck_owner.google_slides_presentation_id = presentation_id
             deck_owner.google_slides_url = presentation_url
+            deck_owner.google_slides_page_map = (
+                json.dumps(page_map) if page_map is not None else None
+            )
 
             logger.info(
                 "Stored Google Slides info on deck owner session",
@@ -718,15 +727,26 @@ class SessionManager:
         For contributor sessions reads from the deck owner.
 
         Returns:
-            Dict with ``presentation_id`` and ``presentation_url``, or None.
+            Dict with ``presentation_id``, ``presentation_url`` and
+            ``page_map`` (``None`` when not recorded), or None.
         """
         with get_db_session() as db:
             session = self._get_session_or_raise(db, session_id)
             deck_owner = self._get_deck_owner_session(db, session)
             if deck_owner.google_slides_presentation_id:
+                page_map = None
+                if deck_owner.google_slides_page_map:
+                    try:
+                        page_map = json.loads(deck_owner.google_slides_page_map)
+                    except ValueError:
+                        logger.warning(
+                            "Ignoring unreadable Google Slides page map",
+                            extra={"session_id": session_id},
+                        )
                 return {
                     "presentation_id": deck_owner.google_slides_presentation_id,
                     "presentation_url": deck_owner.google_slides_url,
+                    "page_map": page_map,
                 }
             return None
 
@@ -1136,6 +1156,22 @@ class SessionManager:
             content_hash: Hash of the slide content
             verification: Verification result dictionary
         """
+        self.save_verifications(session_id, {content_hash: verification})
+
+    def save_verifications(
+        self,
+        session_id: str,
+        verifications: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Save verification results for several slides in one write.
+
+        Args:
+            session_id: Session to save verification for
+            verifications: Verification result dictionaries by content hash
+        """
+        if not verifications:
+            return
+
         with get_db_session() as db:
             session = self._get_session_or_raise(db, session_id)
             deck_owner = self._get_deck_owner_session(db, session)
@@ -1154,20 +1190,27 @@ class SessionManager:
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid verification_map JSON, starting fresh")
             
-            # Update with new verification
-            verification_map[content_hash] = verification
+            # Update with new verifications
+            verification_map.update(verifications)
             
             # Save back to database
             deck.verification_map = json.dumps(verification_map)
             
-            logger.info(
-                "Saved verification",
-                extra={
-                    "session_id": session_id,
-                    "content_hash": content_hash,
-                    "score": verification.get("score"),
-                },
-            )
+            if len(verifications) == 1:
+                content_hash, verification = next(iter(verifications.items()))
+                logger.info(
+                    "Saved verification",
+                    extra={
+                        "session_id": session_id,
+                        "content_hash": content_hash,
+                        "score": verification.get("score"),
+                    },
+                )
+            else:
+                logger.info(
+                    "Saved verifications",
+                    extra={"session_id": session_id, "count": len(verifications)},
+                )
 
     def get_verification_map(self, session_id: str) -> Dict[str, Any]:
         """Get the verification map for a session.
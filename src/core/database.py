@@ -527,6 +527,12 @@ def _run_migrations(engine, schema: str | None = None):
         # --- image_assets.token: unguessable external id + backfill (SDR-4437 F-TM-7) ---
         _migrate_image_assets_add_token(conn, inspector, schema, _qual, is_sqlite)
 
+        # --- image_assets.thumbnail_status: async (off-request) thumbnail pipeline ---
+        _migrate_image_assets_thumbnail_status(conn, inspector, schema, _qual)
+
+        # --- user_sessions.google_slides_page_map: incremental Slides re-export ---
+        _migrate_google_slides_page_map(conn, inspector, schema, _qual)
+
         # --- stored decks: rewrite {{image:<int-id>}} -> {{image:<token>}} placeholders
         # --- (SDR-4437 F-TM-7). Runs AFTER the token backfill so every image has one. ---
         _migrate_rewrite_deck_image_placeholders(
@@ -557,6 +563,9 @@ def _run_migrations(engine, schema: str | None = None):
         # deleted, so a reader of this list can see what happened to them.
         _migrate_uncap_brand_text_columns(conn, inspector, schema, _qual, is_sqlite)
 
+        # --- design system: indexes backing SQL-side brand-asset search ---
+        _migrate_design_system_asset_search_indexes(conn, schema, _qual, is_sqlite)
+
         # --- design system: name uniqueness scoped to LIVE rows, so a soft delete
         # --- stops reserving the name forever (partial unique index) ---
         _migrate_design_system_partial_name_index(
@@ -858,6 +867,56 @@ def _migrate_uncap_brand_text_columns(
 _DS_NAME_ACTIVE_INDEX = "uq_design_system_name_active"
 
 
+_DS_ASSET_KIND_INDEX = "ix_design_system_asset_ds_kind"
+_DS_ASSET_FILENAME_TRGM_INDEX = "ix_design_system_asset_filename_trgm"
+
+
+def _migrate_design_system_asset_search_indexes(conn, schema, _qual, is_sqlite) -> None:
+    """Indexes for ``design_system_service.search_assets`` (idempotent).
+
+    - ``(design_system_id, kind)`` — every brand-asset search filters on both. The
+      ORM declares it, so fresh ``create_all`` databases already have it; this adds
+      it to tables provisioned before it existed.
+    - A trigram GIN index on ``filename`` (PostgreSQL only) so the case-insensitive
+      ``ILIKE '%query%'`` substring match is index-assisted. Needs ``pg_trgm``: the
+      extension is created if the role may, otherwise the index is skipped and the
+      search falls back to scanning the (already design-system-scoped) rows.
+
+    Each statement runs in its OWN SAVEPOINT so a missing privilege cannot poison
+    the outer migration transaction.
+    """
+    from sqlalchemy import text
+
+    table = _qual("design_system_asset")
+    try:
+        with conn.begin_nested():
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {_DS_ASSET_KIND_INDEX} "
+                f"ON {table} (design_system_id, kind)"
+            ))
+    except Exception:
+        logger.warning(
+            "Migration: could not create %s", _DS_ASSET_KIND_INDEX, exc_info=True
+        )
+    if is_sqlite:
+        return
+
+    try:
+        with conn.begin_nested():
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        with conn.begin_nested():
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {_DS_ASSET_FILENAME_TRGM_INDEX} "
+                f"ON {table} USING gin (filename gin_trgm_ops)"
+            ))
+    except Exception:
+        logger.info(
+            "Migration: pg_trgm unavailable; brand-asset filename search stays "
+            "unindexed (%s not created)",
+            _DS_ASSET_FILENAME_TRGM_INDEX,
+        )
+
+
 def _migrate_design_system_partial_name_index(
     conn, inspector, schema, _qual, is_sqlite
 ) -> None:
@@ -1106,6 +1165,48 @@ def _migrate_image_assets_add_token(conn, inspector, schema, _qual, is_sqlite) -
         conn.execute(text(f"ALTER TABLE {q} ALTER COLUMN token SET NOT NULL"))
 
 
+def _migrate_image_assets_thumbnail_status(conn, inspector, schema, _qual) -> None:
+    """Add ``thumbnail_status`` to image_assets for the off-request thumbnail pool.
+
+    Existing rows keep NULL, which readers treat as 'ready' — their thumbnails
+    were rendered inline at upload time. Idempotent: gated on the column's absence.
+    """
+    from sqlalchemy import text
+
+    table = "image_assets"
+    try:
+        cols = {c["name"] for c in inspector.get_columns(table, schema=schema)}
+    except Exception:
+        return
+    if not cols or "thumbnail_status" in cols:
+        return
+    logger.info(f"Migration: adding thumbnail_status column to {table}")
+    conn.execute(text(
+        f"ALTER TABLE {_qual(table)} ADD COLUMN thumbnail_status VARCHAR(20) NULL"
+    ))
+
+
+def _migrate_google_slides_page_map(conn, inspector, schema, _qual) -> None:
+    """Add ``google_slides_page_map`` to user_sessions for incremental re-export.
+
+    Existing rows keep NULL: their next export builds a fresh presentation and
+    records the map. Idempotent: gated on the column's absence.
+    """
+    from sqlalchemy import text
+
+    table = "user_sessions"
+    try:
+        cols = {c["name"] for c in inspector.get_columns(table, schema=schema)}
+    except Exception:
+        return
+    if not cols or "google_slides_page_map" in cols:
+        return
+    logger.info(f"Migration: adding google_slides_page_map column to {table}")
+    conn.execute(text(
+        f"ALTER TABLE {_qual(table)} ADD COLUMN google_slides_page_map TEXT NULL"
+    ))
+
+
 #: Persistent (table, column) pairs whose stored text can carry an
 #: ``{{image:<id>}}`` placeholder — the same field set ``substitute_deck_dict_images``
 #: resolves at render time, but at their storage sites:
@@ -26,6 +26,8 @@ from typing import Optional, Tuple
 import yaml
 from databricks.sdk import WorkspaceClient
 
+from src.core.http_transport import attach_shared_transport
+
 logger = logging.getLogger(__name__)
 
 # User client cache: avoid creating a new client on every request (e.g. poll every 2s)
@@ -453,7 +455,8 @@ def get_or_create_user_client(token: str) -> WorkspaceClient:
     """
     Return a cached user-scoped WorkspaceClient when possible to avoid creating
     a new client on every request (e.g. chat poll every 2s). Uses a short TTL
-    so token refresh is still respected.
+    so token refresh is still respected. New clients use the shared pooled
+    transport (:mod:`src.core.http_transport`).
     """
     now = time.monotonic()
     key = _user_client_cache_key(token)
@@ -472,6 +475,9 @@ def get_or_create_user_client(token: str) -> WorkspaceClient:
             )
             del _user_client_cache[oldest_key]
         client = create_user_client(token)
+        # Share keep-alive connections across users' clients (requests are
+        # still authenticated per client).
+        attach_shared_transport(client)
         _user_client_cache[key] = (client, now + _USER_CLIENT_CACHE_TTL_SEC)
         return client
 
@@ -0,0 +1,152 @@
+"""Shared keep-alive HTTP transport for user-scoped Databricks clients.
+
+Every ``WorkspaceClient`` builds its own ``requests.Session`` with its own
+connection pool, and a user client is rebuilt whenever its cache entry
+expires (``databricks_client.get_or_create_user_client``). Model-serving,
+Agent Bricks and vector-search tools therefore kept paying a new TCP + TLS
+handshake to the same workspace host per user and per client.
+
+:func:`attach_shared_transport` mounts one process-wide ``HTTPAdapter`` on a
+client's session instead. The adapter only owns connections: each request is
+still authenticated by the session it goes through, so users share sockets,
+never credentials. The pool keeps up to ``HTTP_POOL_MAX_PER_HOST`` (default
+32) connections per host for up to ``HTTP_POOL_MAX_HOSTS`` (default 8)
+hosts; a caller that finds every connection to a host busy waits for one.
+
+Tool calls are timed per endpoint with :func:`timed`. Durations go into a
+fixed-bucket histogram plus a bounded window for p50/p95, reported by
+``GET /api/admin/tool-latency``. Pool and histograms are per worker process.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_MAX_PER_HOST = int(os.getenv("HTTP_POOL_MAX_PER_HOST", "32"))
+HTTP_POOL_MAX_HOSTS = int(os.getenv("HTTP_POOL_MAX_HOSTS", "8"))
+
+# Histogram bucket upper bounds, seconds (the last bucket is unbounded).
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Calls kept per endpoint for the p50/p95 report.
+LATENCY_METRICS_WINDOW = 500
+
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def get_shared_adapter() -> HTTPAdapter:
+    """The process-wide pooled adapter, created on first use."""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_MAX_HOSTS,
+                pool_maxsize=HTTP_POOL_MAX_PER_HOST,
+                pool_block=True,
+            )
+        return _adapter
+
+
+def attach_shared_transport(client: Any) -> bool:
+    """Route ``client``'s HTTPS requests through the shared pool.
+
+    Returns False (and leaves the client unchanged) when the SDK does not
+    expose its session where expected.
+    """
+    try:
+        session = client.api_client._api_client._session
+    except AttributeError:
+        logger.debug("WorkspaceClient exposes no HTTP session; keeping its own pool")
+        return False
+    if not isinstance(session, requests.Session):
+        return False
+    session.mount("https://", get_shared_adapter())
+    return True
+
+
+# -- latency histograms ------------------------------------------------------
+
+
+class _Latency:
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_S) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.window: "deque[float]" = deque(maxlen=LATENCY_METRICS_WINDOW)
+
+    def add(self, seconds: float, error: bool) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS_S, seconds)] += 1
+        self.calls += 1
+        self.errors += int(error)
+        self.total_s += seconds
+        self.window.append(seconds)
+
+    def report(self) -> dict:
+        values = sorted(self.window)
+        labels = [f"le_{b:g}s" for b in LATENCY_BUCKETS_S] + ["inf"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_s": round(self.total_s / self.calls, 3) if self.calls else None,
+            "p50_s": round(_percentile(values, 50), 3) if values else None,
+            "p95_s": round(_percentile(values, 95), 3) if values else None,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+_latencies: dict[str, _Latency] = {}
+_latencies_lock = threading.Lock()
+
+
+def record_latency(kind: str, endpoint: str, seconds: float, error: bool = False) -> None:
+    """Add one call to ``{kind}:{endpoint}``'s histogram."""
+    key = f"{kind}:{endpoint}"
+    with _latencies_lock:
+        latency = _latencies.get(key)
+        if latency is None:
+            latency = _latencies[key] = _Latency()
+        latency.add(seconds, error)
+
+
+@contextmanager
+def timed(kind: str, endpoint: str) -> Iterator[None]:
+    """Record the block's duration for ``endpoint``; exceptions count as errors."""
+    started = time.monotonic()
+    try:
+        yield
+    except BaseException:
+        record_latency(kind, endpoint, time.monotonic() - started, error=True)
+        raise
+    record_latency(kind, endpoint, time.monotonic() - started)
+
+
+def latency_report() -> dict:
+    """Histogram, p50/p95 and error count per endpoint seen by this worker."""
+    with _latencies_lock:
+        endpoints = {key: latency.report() for key, latency in sorted(_latencies.items())}
+    return {"window": LATENCY_METRICS_WINDOW, "endpoints": endpoints}
+
+
+def clear_latency_metrics() -> None:
+    """Drop every recorded call (tests)."""
+    with _latencies_lock:
+        _latencies.clear()
@@ -0,0 +1,362 @@
+"""Process-wide admission control for LLM serving-endpoint calls.
+
+LLM calls come from many places — the chat agent, export code generation,
+the verification judge, session naming and the feedback assistant. Without
+coordination a large export's parallel code generation competes with
+interactive chat and pushes the endpoint into 429s for everyone. Every call
+site instead goes through one :class:`EndpointGovernor` per serving endpoint,
+which admits calls by:
+
+- **Concurrency** — at most ``LLM_MAX_CONCURRENT_PER_ENDPOINT`` calls in
+  flight (default 8).
+- **Rate** — a token bucket of ``LLM_REQUESTS_PER_MINUTE`` calls per minute
+  (default 300, ``0`` disables) with a burst of ``LLM_REQUEST_BURST``
+  (default 20).
+- **Priority** — waiting calls are admitted in :class:`LLMPriority` order
+  (chat > edit > verification > export > naming), first come first served
+  within a class.
+
+A 429 from the endpoint (:meth:`EndpointGovernor.record_rate_limited`) pauses new admissions
+for a backoff that doubles with each consecutive rate-limit (1s up to 30s) and
+resets on the next success, so one client's burst slows every caller down
+together instead of each retrying on its own schedule.
+
+LangChain models take :class:`~src.services.llm_admission_callback.LLMAdmissionCallback`;
+direct calls use :func:`admitted_call`, :func:`llm_slot` or :func:`allm_slot`.
+Queue waits per priority class go to a bounded window that
+``GET /api/admin/llm-admission`` reports as p50/p95.
+
+Governors and their windows are per worker process, like the app's other
+in-process limits.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Calls in flight per endpoint.
+MAX_CONCURRENT_PER_ENDPOINT = int(os.getenv("LLM_MAX_CONCURRENT_PER_ENDPOINT", "8"))
+
+# Token bucket per endpoint (calls per minute, back-to-back allowance).
+REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "300"))
+REQUEST_BURST = int(os.getenv("LLM_REQUEST_BURST", "20"))
+
+# Admission pause after a 429: doubles per consecutive rate-limit, capped.
+_BACKOFF_BASE_S = 1.0
+_BACKOFF_MAX_S = 30.0
+
+# A 429 named in error text only counts next to HTTP/status wording, so token
+# counts and lengths that merely contain the digits ("length 142900") do not.
+_HTTP_429_RE = re.compile(
+    r"\b(?:http(?:/[\d.]+)?|status(?:[ _]?code)?|error[ _]code)\b\W{0,3}429\b",
+    re.IGNORECASE,
+)
+
+# Queue waits kept per priority class for the p50/p95 report.
+ADMISSION_METRICS_WINDOW = 1000
+
+
+class LLMPriority(IntEnum):
+    """Admission order for queued calls; lower values go first."""
+
+    CHAT = 0
+    EDIT = 1
+    VERIFICATION = 2
+    EXPORT = 3
+    NAMING = 4
+
+
+_current_priority: contextvars.ContextVar[Optional[LLMPriority]] = contextvars.ContextVar(
+    "llm_priority", default=None
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run the block's LLM calls at ``priority`` unless a call site sets its own.
+
+    Used where one model serves several kinds of request — the agent runs
+    both chat and slide edits.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority(default: LLMPriority = LLMPriority.CHAT) -> LLMPriority:
+    """Priority set by the innermost :func:`llm_priority` block, else ``default``."""
+    priority = _current_priority.get()
+    return default if priority is None else priority
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True if ``exc`` is a serving-endpoint rate-limit (HTTP 429) error."""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    msg = str(exc)
+    lowered = msg.lower()
+    return (
+        "REQUEST_LIMIT_EXCEEDED" in msg
+        or "rate limit" in lowered
+        or "too many requests" in lowered
+        or _HTTP_429_RE.search(msg) is not None
+    )
+
+
+class EndpointGovernor:
+    """Concurrency limit, token bucket and priority queue for one endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        max_concurrent: int = MAX_CONCURRENT_PER_ENDPOINT,
+        requests_per_minute: float = REQUESTS_PER_MINUTE,
+        burst: int = REQUEST_BURST,
+    ) -> None:
+        self.endpoint = endpoint
+        self._max_concurrent = max(1, max_concurrent)
+        self._rate = max(0.0, requests_per_minute) / 60.0
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiting: list = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._active = 0
+        self._paused_until = 0.0
+        self._backoff = 0.0
+        self._waits: Dict[LLMPriority, deque] = {
+            p: deque(maxlen=ADMISSION_METRICS_WINDOW) for p in LLMPriority
+        }
+        self._rate_limited = 0
+
+    # -- admission ---------------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        if self._rate:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+        self._updated = now
+
+    def _admission_delay(self, now: float) -> float:
+        """Seconds until the head of the queue may start (0 = now)."""
+        delay = self._paused_until - now
+        if self._rate and self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self._rate)
+        return max(0.0, delay)
+
+    def acquire(self, priority: LLMPriority) -> float:
+        """Block until a call at ``priority`` is admitted. Returns seconds waited.
+
+        Every successful ``acquire`` must be paired with :meth:`release`.
+        """
+        ticket = (int(priority), next(self._seq))
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] == ticket and self._active < self._max_concurrent:
+                        now = time.monotonic()
+                        self._refill(now)
+                        delay = self._admission_delay(now)
+                        if delay <= 0:
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        self._cond.wait()
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._active += 1
+            if self._rate:
+                self._tokens -= 1
+            waited = time.monotonic() - start
+            self._waits[LLMPriority(priority)].append(waited)
+            # The next waiter may be admissible too.
+            self._cond.notify_all()
+        if waited >= 1:
+            logger.info(
+                "LLM call queued before admission",
+                extra={
+                    "endpoint": self.endpoint,
+                    "priority": LLMPriority(priority).name.lower(),
+                    "wait_s": round(waited, 2),
+                },
+            )
+        return waited
+
+    def release(self) -> None:
+        """Free the slot taken by :meth:`acquire`."""
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            self._cond.notify_all()
+
+    # -- endpoint feedback -------------------------------------------------
+
+    def record_rate_limited(self) -> None:
+        """The endpoint returned 429: pause admissions, doubling the backoff."""
+        with self._cond:
+            self._backoff = min(
+                _BACKOFF_MAX_S, self._backoff * 2 if self._backoff else _BACKOFF_BASE_S
+            )
+            self._paused_until = max(self._paused_until, time.monotonic() + self._backoff)
+            self._rate_limited += 1
+            backoff = self._backoff
+        logger.warning(
+            "LLM endpoint rate-limited; pausing admissions",
+            extra={"endpoint": self.endpoint, "backoff_s": backoff},
+        )
+
+    def record_success(self) -> None:
+        """A call completed: the endpoint is keeping up again."""
+        with self._cond:
+            self._backoff = 0.0
+
+    # -- reporting -----------------------------------------------------------
+
+    def report(self) -> dict:
+        """Queue length, calls in flight and p50/p95 admission wait per class."""
+        with self._cond:
+            waits = {p: sorted(values) for p, values in self._waits.items()}
+            state = {
+                "in_flight": self._active,
+                "queued": len(self._waiting),
+                "max_concurrent": self._max_concurrent,
+                "requests_per_minute": self._rate * 60,
+                "rate_limited": self._rate_limited,
+                "backoff_s": self._backoff,
+            }
+        state["wait_s"] = {
+            p.name.lower(): {
+                "calls": len(values),
+                "p50": round(_percentile(values, 50), 3),
+                "p95": round(_percentile(values, 95), 3),
+                "max": round(values[-1], 3),
+            }
+            for p, values in waits.items()
+            if values
+        }
+        return state
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+_governors: Dict[str, EndpointGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_governor(endpoint: str) -> EndpointGovernor:
+    """The process-wide governor for ``endpoint`` (created on first use)."""
+    with _governors_lock:
+        governor = _governors.get(endpoint)
+        if governor is None:
+            governor = _governors[endpoint] = EndpointGovernor(endpoint)
+        return governor
+
+
+def reset_governors() -> None:
+    """Forget every governor and its metrics (tests)."""
+    with _governors_lock:
+        _governors.clear()
+
+
+def admission_report() -> dict:
+    """:meth:`EndpointGovernor.report` for every endpoint seen by this worker."""
+    with _governors_lock:
+        governors = list(_governors.values())
+    return {
+        "window": ADMISSION_METRICS_WINDOW,
+        "endpoints": {g.endpoint: g.report() for g in governors},
+    }
+
+
+@contextmanager
+def llm_slot(endpoint: str, priority: Optional[LLMPriority] = None) -> Iterator[None]:
+    """Hold an admission slot on ``endpoint`` for the duration of the block."""
+    governor = get_governor(endpoint)
+    governor.acquire(current_priority() if priority is None else priority)
+    try:
+        yield
+    finally:
+        governor.release()
+
+
+@asynccontextmanager
+async def allm_slot(endpoint: str, priority: Optional[LLMPriority] = None):
+    """:func:`llm_slot` for coroutines: waits in a worker thread, not on the loop."""
+    governor = get_governor(endpoint)
+    resolved = current_priority() if priority is None else priority
+    admitted = asyncio.ensure_future(asyncio.to_thread(governor.acquire, resolved))
+    try:
+        await asyncio.shield(admitted)
+    except asyncio.CancelledError:
+        # The worker thread still gets admitted eventually; give the slot back.
+        admitted.add_done_callback(
+            lambda f: f.cancelled() or f.exception() is not None or governor.release()
+        )
+        raise
+    try:
+        yield
+    finally:
+        governor.release()
+
+
+def admitted_call(
+    endpoint: str,
+    priority: LLMPriority,
+    fn: Callable[[], T],
+    *,
+    max_attempts: int = 3,
+) -> T:
+    """Run ``fn()`` under admission control, retrying rate-limit errors.
+
+    Each attempt takes its own slot; a 429 pauses the endpoint's admissions
+    (shared backoff) before the retry queues again. Other errors, and the last
+    rate-limit error, propagate.
+    """
+    governor = get_governor(endpoint)
+    for attempt in range(1, max_attempts + 1):
+        governor.acquire(priority)
+        try:
+            result = fn()
+        except Exception as exc:
+            if not is_rate_limit_error(exc):
+                raise
+            governor.record_rate_limited()
+            if attempt == max_attempts:
+                raise
+            continue
+        finally:
+            governor.release()
+        governor.record_success()
+        return result
+    raise AssertionError("unreachable")
@@ -0,0 +1,145 @@
+"""Per-section prompt size accounting.
+
+Each agent request records how many characters (and estimated tokens) every
+part of its prompt contributed — the system-prompt sections assembled by
+``prompt_modules``, the replayed chat history, the slide context and the user's
+question. The sizes go on the generation span and the request log, and into a
+bounded in-process window that ``GET /api/admin/prompt-budget`` aggregates into
+p50/p95 per section, so it is clear which prompt knob actually moves latency.
+
+When the serving endpoint reports prompt-cache use for a call (cached input
+tokens), :func:`record_cache_usage` adds it to a second window and the report
+includes the cached share of input tokens.
+
+The windows are per worker process (like the app's other in-process caches): a
+multi-worker deployment reports the worker that served the admin request.
+"""
+
+import hashlib
+import math
+import threading
+from collections import deque
+from typing import Any, Iterable, Mapping, Optional
+
+# Rough characters per token for English prose and HTML alike.
+CHARS_PER_TOKEN = 4
+
+# Requests kept for the p50/p95 report.
+PROMPT_METRICS_WINDOW = 1000
+
+_samples: "deque[dict[str, int]]" = deque(maxlen=PROMPT_METRICS_WINDOW)
+_cache_samples: "deque[tuple[int, int]]" = deque(maxlen=PROMPT_METRICS_WINDOW)
+_samples_lock = threading.Lock()
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for ``text`` (characters / 4, rounded up)."""
+    return chars_to_tokens(len(text or ""))
+
+
+def chars_to_tokens(chars: int) -> int:
+    """Estimated tokens for ``chars`` characters."""
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+def section_chars(sections: Iterable[tuple[str, str]]) -> dict[str, int]:
+    """``{name: characters}`` for named prompt sections (repeats are summed)."""
+    sizes: dict[str, int] = {}
+    for name, text in sections:
+        sizes[name] = sizes.get(name, 0) + len(text or "")
+    return sizes
+
+
+def prompt_prefix_hash(prefix: str) -> str:
+    """Short stable id of a prompt's shared prefix (``prompt_modules.shared_prefix``).
+
+    Requests logging the same id send a byte-identical prefix — the population
+    a serving endpoint's prefix cache can serve.
+    """
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+
+def record_prompt_sections(sizes: dict[str, int]) -> None:
+    """Add one request's ``{section: characters}`` to the report window."""
+    with _samples_lock:
+        _samples.append(dict(sizes))
+
+
+def clear_prompt_metrics() -> None:
+    """Drop every recorded sample (tests)."""
+    with _samples_lock:
+        _samples.clear()
+        _cache_samples.clear()
+
+
+def cache_usage(usage: Optional[Mapping[str, Any]]) -> Optional[tuple[int, int]]:
+    """``(input_tokens, cached_input_tokens)`` from one LLM call's usage block.
+
+    Understands LangChain ``usage_metadata`` (``input_token_details.cache_read``)
+    and the OpenAI-style ``usage`` serving endpoints return
+    (``prompt_tokens_details.cached_tokens``, or ``cache_read_input_tokens``).
+    ``None`` when the block does not report cached tokens at all.
+    """
+    if not isinstance(usage, Mapping):
+        return None
+    if "input_tokens" in usage:
+        details = usage.get("input_token_details") or {}
+        cached = details.get("cache_read")
+        input_tokens = usage.get("input_tokens")
+    else:
+        details = usage.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens", usage.get("cache_read_input_tokens"))
+        input_tokens = usage.get("prompt_tokens")
+    if cached is None or input_tokens is None:
+        return None
+    return int(input_tokens), int(cached)
+
+
+def record_cache_usage(input_tokens: int, cached_input_tokens: int) -> None:
+    """Add one LLM call's reported input / cached-input tokens to the window."""
+    with _samples_lock:
+        _cache_samples.append((input_tokens, cached_input_tokens))
+
+
+def _percentile(sorted_values: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def prompt_section_report() -> dict:
+    """p50/p95 characters and estimated tokens per section over the window.
+
+    A section absent from a request (no deck prompt, no slide context) counts
+    as 0 for that request, so percentiles describe every request in the window.
+    """
+    with _samples_lock:
+        samples = list(_samples)
+        cache_samples = list(_cache_samples)
+
+    names = sorted({name for sample in samples for name in sample})
+    sections = {}
+    for name in names:
+        values = sorted(sample.get(name, 0) for sample in samples)
+        p50 = _percentile(values, 50)
+        p95 = _percentile(values, 95)
+        sections[name] = {
+            "p50_chars": p50,
+            "p95_chars": p95,
+            "p50_tokens": chars_to_tokens(p50),
+            "p95_tokens": chars_to_tokens(p95),
+            "max_chars": values[-1],
+        }
+    input_tokens = sum(sample[0] for sample in cache_samples)
+    cached_tokens = sum(sample[1] for sample in cache_samples)
+    return {
+        "requests": len(samples),
+        "window": PROMPT_METRICS_WINDOW,
+        "sections": sections,
+        "prefix_cache": {
+            "llm_calls": len(cache_samples),
+            "input_tokens": input_tokens,
+            "cached_input_tokens": cached_tokens,
+            "cached_ratio": round(cached_tokens / input_tokens, 3) if input_tokens else None,
+        },
+    }
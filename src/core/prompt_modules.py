@@ -190,7 +190,7 @@ HTML_OUTPUT_FORMAT = (
 # defer instruction (EDITING_RULES) so generation defers to the DS the same way.
 DESIGN_SYSTEM_PRECEDENCE = (
     "DESIGN SYSTEM PRECEDENCE:\n"
-    "A design system is selected (the SLIDE VISUAL STYLE above). It is "
+    "A design system is selected (the SLIDE VISUAL STYLE section). It is "
     "AUTHORITATIVE for ALL visual styling of this deck — colors, typography, "
     "layout, spacing, shadows, and imagery — and takes precedence over any "
     "generic styling guidance elsewhere in this prompt. Follow it; do NOT impose "
@@ -298,6 +298,26 @@ EDITING_OUTPUT_FORMAT = (
 # Assembly functions
 # ---------------------------------------------------------------------------
 
+# Sections that vary between decks sharing a design system / slide style. The
+# assembly functions emit them strictly after every shared section, so the text
+# before the first of them is a byte-stable prefix across requests and users.
+PER_DECK_SECTIONS = frozenset({"template", "deck_prompt", "type_scale"})
+
+
+def shared_prefix(sections: list[tuple[str, str]]) -> str:
+    """The joined text of ``sections`` before the first per-deck section.
+
+    Identical for every request with the same mode, design system / slide style
+    and image guidelines — the part of the system prompt a serving endpoint's
+    prefix cache can reuse across decks and users.
+    """
+    shared = []
+    for name, text in sections:
+        if name in PER_DECK_SECTIONS:
+            break
+        shared.append(text)
+    return "\n\n".join(shared)
+
 def _build_image_section(
     image_guidelines: Optional[str] = None,
     design_system_active: bool = False,
@@ -333,12 +353,67 @@ def _build_image_section(
     return section
 
 
+def generation_prompt_sections(
+    slide_style: str,
+    deck_prompt: Optional[str] = None,
+    image_guidelines: Optional[str] = None,
+    design_system_active: bool = False,
+    type_scale_reassertion: Optional[str] = None,
+    template_block: Optional[str] = None,
+) -> list[tuple[str, str]]:
+    """Named ``(section, text)`` blocks of the generation system prompt, in order.
+
+    :func:`build_generation_system_prompt` joins these; prompt size accounting
+    (``prompt_metrics``) reads the per-section sizes. Section names:
+    ``base`` (the static instruction blocks), ``images`` (image support +
+    guidelines), ``slide_style`` (compiled design system or slide style),
+    ``template`` (a pinned template's block), ``deck_prompt`` and ``type_scale``.
+
+    Ordered from most to least shared so serving endpoints can reuse a cached
+    prompt prefix: the ``base`` blocks are identical for every request, the
+    ``images`` and ``slide_style`` sections for every request with the same
+    design system or slide style, and only the trailing per-deck sections
+    (:data:`PER_DECK_SECTIONS`) vary between decks.
+    """
+    sections: list[tuple[str, str]] = []
+
+    sections.append(("base", BASE_PROMPT))
+    sections.append(("base", UNTRUSTED_DATA_NOTICE))
+    sections.append(("base", GENERATION_GOALS))
+    sections.append(("base", DATA_ANALYSIS_GUIDELINES))
+    sections.append(("base", PRESENTATION_GUIDELINES))
+    sections.append(("base", SLIDE_GUIDELINES))
+    sections.append(("base", CHART_JS_RULES))
+    sections.append(("base", HTML_OUTPUT_FORMAT))
+    # A selected design system is authoritative — emitted AFTER the generic styling
+    # blocks (esp. HTML_OUTPUT_FORMAT's 'modern') so it overrides them. DS path only.
+    if design_system_active:
+        sections.append(("base", DESIGN_SYSTEM_PRECEDENCE))
+    sections.append((
+        "images",
+        _build_image_section(image_guidelines, design_system_active=design_system_active),
+    ))
+    sections.append(("slide_style", slide_style.strip()))
+    if template_block and template_block.strip():
+        sections.append(("template", template_block.strip()))
+    if deck_prompt and deck_prompt.strip():
+        sections.append(("deck_prompt", f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}"))
+    # LAST: the title type scale is the contract the model measurably ignored
+    # when it was stated only early, so it gets the final word (plus a pre-emit
+    # self-check). It depends on the pinned template, so it is per-deck. DS path only.
+    if type_scale_reassertion and type_scale_reassertion.strip():
+        sections.append(("type_scale", type_scale_reassertion.strip()))
+
+    return sections
+
+
 def build_generation_system_prompt(
     slide_style: str,
     deck_prompt: Optional[str] = None,
     image_guidelines: Optional[str] = None,
     design_system_active: bool = False,
     type_scale_reassertion: Optional[str] = None,
+    template_block: Optional[str] = None,
 ) -> str:
     """Assemble a complete system prompt for slide *generation* mode.
 
@@ -346,68 +421,76 @@ def build_generation_system_prompt(
 
     ``design_system_active`` is True ONLY when a design system is the resolved
     slide-style source (set by agent_factory._get_prompt_content). It gates the
-    DS-only precedence + brand-asset blocks; when False the assembled prompt is
-    BYTE-IDENTICAL to the legacy/default output (no-DS invariant).
+    DS-only precedence + brand-asset blocks; when False the assembled prompt
+    carries none of them (no-DS invariant).
 
     ``type_scale_reassertion`` is the design system's title type-scale contract
     restated for LAST position (built by
     ``design_system_compiler.build_type_scale_reassertion``). The compiled design
-    system arrives as block #2 — before every generic block — so its numeric title
-    contract needs the final word; appending it here is what gives it that
-    salience. ``None`` on the no-DS/legacy path, which keeps that output
-    byte-identical.
+    system states it mid-prompt, so its numeric title contract needs the final
+    word; appending it here is what gives it that salience. ``None`` on the
+    no-DS/legacy path.
+
+    ``template_block`` is a pinned template's SELECTED-TEMPLATE block; it follows
+    ``slide_style`` (whose SLIDE TEMPLATES list it refers back to) so the
+    template-agnostic design-system text stays in the shared prefix.
     """
-    parts: list[str] = []
+    sections = generation_prompt_sections(
+        slide_style,
+        deck_prompt=deck_prompt,
+        image_guidelines=image_guidelines,
+        design_system_active=design_system_active,
+        type_scale_reassertion=type_scale_reassertion,
+        template_block=template_block,
+    )
+    return "\n\n".join(text for _, text in sections)
+
+
+def editing_prompt_sections(
+    slide_style: str,
+    deck_prompt: Optional[str] = None,
+    image_guidelines: Optional[str] = None,
+    template_block: Optional[str] = None,
+) -> list[tuple[str, str]]:
+    """Named ``(section, text)`` blocks of the editing system prompt, in order.
 
+    Same section names and shared-prefix ordering as
+    :func:`generation_prompt_sections`.
+    """
+    sections: list[tuple[str, str]] = []
+
+    sections.append(("base", BASE_PROMPT))
+    sections.append(("base", UNTRUSTED_DATA_NOTICE))
+    sections.append(("base", DATA_ANALYSIS_GUIDELINES))
+    sections.append(("base", SLIDE_GUIDELINES))
+    sections.append(("base", CHART_JS_RULES))
+    sections.append(("base", EDITING_RULES))
+    sections.append(("base", EDITING_OUTPUT_FORMAT))
+    sections.append(("images", _build_image_section(image_guidelines)))
+    sections.append(("slide_style", slide_style.strip()))
+    if template_block and template_block.strip():
+        sections.append(("template", template_block.strip()))
     if deck_prompt and deck_prompt.strip():
-        parts.append(f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}")
-
-    parts.append(slide_style.strip())
-    parts.append(BASE_PROMPT)
-    parts.append(UNTRUSTED_DATA_NOTICE)
-    parts.append(GENERATION_GOALS)
-    parts.append(DATA_ANALYSIS_GUIDELINES)
-    parts.append(PRESENTATION_GUIDELINES)
-    parts.append(SLIDE_GUIDELINES)
-    parts.append(CHART_JS_RULES)
-    parts.append(HTML_OUTPUT_FORMAT)
-    # A selected design system is authoritative — emitted AFTER the generic styling
-    # blocks (esp. HTML_OUTPUT_FORMAT's 'modern') so it overrides them. DS path only.
-    if design_system_active:
-        parts.append(DESIGN_SYSTEM_PRECEDENCE)
-    parts.append(_build_image_section(image_guidelines, design_system_active=design_system_active))
-    # LAST — deliberately after the image block: the title type scale is the
-    # contract the model measurably ignored when it was stated only early, so it
-    # gets the final word (plus a pre-emit self-check). DS path only.
-    if type_scale_reassertion and type_scale_reassertion.strip():
-        parts.append(type_scale_reassertion.strip())
+        sections.append(("deck_prompt", f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}"))
 
-    return "\n\n".join(parts)
+    return sections
 
 
 def build_editing_system_prompt(
     slide_style: str,
     deck_prompt: Optional[str] = None,
     image_guidelines: Optional[str] = None,
+    template_block: Optional[str] = None,
 ) -> str:
     """Assemble a complete system prompt for slide *editing* mode.
 
     Includes editing rules and fragment output format.
     Excludes full-deck HTML output rules.
     """
-    parts: list[str] = []
-
-    if deck_prompt and deck_prompt.strip():
-        parts.append(f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}")
-
-    parts.append(slide_style.strip())
-    parts.append(BASE_PROMPT)
-    parts.append(UNTRUSTED_DATA_NOTICE)
-    parts.append(DATA_ANALYSIS_GUIDELINES)
-    parts.append(SLIDE_GUIDELINES)
-    parts.append(CHART_JS_RULES)
-    parts.append(EDITING_RULES)
-    parts.append(EDITING_OUTPUT_FORMAT)
-    parts.append(_build_image_section(image_guidelines))
-
-    return "\n\n".join(parts)
+    sections = editing_prompt_sections(
+        slide_style,
+        deck_prompt=deck_prompt,
+        image_guidelines=image_guidelines,
+        template_block=template_block,
+    )
+    return "\n\n".join(text for _, text in sections)
@@ -9,6 +9,7 @@ from src.database.models.design_system import (
     DesignSystemToken,
 )
 from src.database.models.encryption_key import EncryptionKey
+from src.database.models.export_code_cache import ExportCodeCacheEntry
 from src.database.models.feedback import FeedbackConversation, SurveyResponse
 from src.database.models.genie_space import ConfigGenieSpace
 from src.database.models.google_global_credentials import GoogleGlobalCredentials
@@ -36,6 +37,7 @@ from src.database.models.slide_deck_prompt import SlideDeckPromptLibrary
 from src.database.models.slide_style_library import SlideStyleLibrary
 from src.database.models.usage_event import UsageEvent
 from src.database.models.user_preference import UserProfilePreference
+from src.database.models.verification_cache import VerificationCacheEntry
 
 __all__ = [
     "AppIdentity",
@@ -51,6 +53,7 @@ __all__ = [
     "DesignSystemFile",
     "DesignSystemTemplate",
     "DesignSystemToken",
+    "ExportCodeCacheEntry",
     "ExportJob",
     "FeedbackConversation",
     "GoogleGlobalCredentials",
@@ -69,4 +72,5 @@ __all__ = [
     "UsageEvent",
     "UserProfilePreference",
     "UserSession",
+    "VerificationCacheEntry",
 ]
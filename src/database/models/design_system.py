@@ -248,6 +248,13 @@ class DesignSystemAsset(Base):
     """
 
     __tablename__ = "design_system_asset"
+    __table_args__ = (
+        # ``search_brand_assets`` filters by design system + kind on every call.
+        Index("ix_design_system_asset_ds_kind", "design_system_id", "kind"),
+        # Case-insensitive filename substring search (``ILIKE '%q%'``). Trigram
+        # GIN on PostgreSQL only; created by the startup migration when the
+        # ``pg_trgm`` extension is available, so it is not declared here.
+    )
 
     id = Column(Integer, primary_key=True)
     design_system_id = Column(
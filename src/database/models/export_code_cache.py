@@ -0,0 +1,43 @@
+"""Content-addressed cache of LLM-generated per-slide export code.
+
+One row per (export target, cache key). The key is a digest of everything the
+generated snippet depends on — slide HTML, asset bytes, prompt version and
+model endpoint — so a row never needs invalidating: any change produces a new
+key. Rows are only written for snippets that executed successfully in the
+converter jail. See ``src/services/export_code_cache.py``.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+
+from src.core.database import Base
+
+
+class ExportCodeCacheEntry(Base):
+    """A generated slide snippet that is known to run cleanly."""
+
+    __tablename__ = "export_code_cache"
+
+    id = Column(Integer, primary_key=True)
+    # Which converter produced the code ("pptx", "gslides").
+    target = Column(String(20), nullable=False)
+    # sha256 hex of the slide's inputs (see export_code_cache.slide_cache_key).
+    cache_key = Column(String(64), nullable=False)
+    code = Column(Text, nullable=False)
+    # Recorded for inspection / targeted purges; both are already part of the key.
+    prompt_version = Column(String(64), nullable=False)
+    model_endpoint = Column(String(255), nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("target", "cache_key", name="uq_export_code_cache_target_key"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ExportCodeCacheEntry(id={self.id}, target='{self.target}', "
+            f"cache_key='{self.cache_key[:12]}', hit_count={self.hit_count})>"
+        )
@@ -47,6 +47,10 @@ class ImageAsset(Base):
     # Stored as data URI: "data:image/jpeg;base64,..."
     # For SVGs: stores None (render as-is in UI, they scale natively)
     thumbnail_base64 = Column(Text, nullable=True)
+    # Thumbnail pipeline state: 'pending' while the off-request renderer runs,
+    # then 'ready' or 'failed'. NULL on rows that predate async rendering —
+    # those were rendered inline at upload, so NULL reads as 'ready'.
+    thumbnail_status = Column(String(20), nullable=True)
 
     # Organization
     tags = Column(_TagsColumn, default=list)                 # ["branding", "logo", "chart"]
@@ -128,6 +128,10 @@ class UserSession(Base):
     # Google Slides export tracking (reuse existing presentation on re-export)
     google_slides_presentation_id = Column(String(255), nullable=True)
     google_slides_url = Column(String(512), nullable=True)
+    # JSON list of [slide content hash, page objectId] in deck order, so a
+    # re-export only touches pages whose content changed. NULL when the
+    # presentation was not built page by page (e.g. a Drive PPTX upload).
+    google_slides_page_map = Column(Text, nullable=True)
 
     # Agent configuration override (tools, style, prompts) — stored as JSON blob.
     # The column type enforces style-authority exclusivity on EVERY write, so no
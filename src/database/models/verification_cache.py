@@ -0,0 +1,44 @@
+"""Content-addressed cache of LLM-judge verification results.
+
+One row per cache key. The key is a digest of everything a verdict depends on
+— normalised slide hash, source-corpus hash, judge backend, judge prompt
+version and judge model — so a row never needs invalidating: any change
+produces a new key. Unlike ``session_slide_decks.verification_map`` the table
+is global, so duplicated decks and restored versions reuse verdicts. See
+``src/services/verification_cache.py``.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+
+from src.core.database import Base
+
+
+class VerificationCacheEntry(Base):
+    """A judge verdict for one slide against one source corpus."""
+
+    __tablename__ = "verification_cache"
+
+    id = Column(Integer, primary_key=True)
+    # sha256 hex of the parts below (see verification_cache.verification_cache_key).
+    cache_key = Column(String(64), nullable=False)
+    # Recorded for inspection / targeted purges; all are already part of the key.
+    slide_hash = Column(String(64), nullable=False)
+    corpus_hash = Column(String(64), nullable=False)
+    judge_backend = Column(String(20), nullable=False)
+    prompt_version = Column(String(64), nullable=False)
+    model_endpoint = Column(String(255), nullable=False)
+    # JSON verification result as stored in verification_map.
+    result = Column(Text, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (UniqueConstraint("cache_key", name="uq_verification_cache_key"),)
+
+    def __repr__(self):
+        return (
+            f"<VerificationCacheEntry(id={self.id}, cache_key='{self.cache_key[:12]}', "
+            f"judge_backend='{self.judge_backend}', hit_count={self.hit_count})>"
+        )
@@ -17,7 +17,7 @@ from typing import Any, Optional, Tuple
 import mlflow
 from bs4 import BeautifulSoup
 from databricks_langchain import ChatDatabricks
-from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
+from langchain_classic.agents import create_tool_calling_agent
 from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import AIMessage, HumanMessage
@@ -26,6 +26,7 @@ from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from src.core.defaults import DEFAULT_CONFIG
+from src.core.llm_admission import LLMPriority, llm_priority
 from src.core.mlflow_agent_spans import mlflow_agent_generate_spans_enabled
 from src.core.mlflow_tracing import (
     configure_tracing_environment,
@@ -38,10 +39,23 @@ from src.core.databricks_client import (
     get_service_principal_folder,
     get_system_client,
 )
+from src.core.prompt_metrics import chars_to_tokens, prompt_prefix_hash, record_prompt_sections
 from src.core.settings_db import get_settings
 from src.domain.slide import Slide, has_slide_wrapper
 from src.services.image_tools import SearchImagesInput, search_images
-from src.services.tools import initialize_genie_conversation, query_genie_space
+from src.services.llm_admission_callback import LLMAdmissionCallback
+from src.services.output_safety_callback import (
+    OutputSafetyAbortCallback,
+    UnsafeOutputAbortError,
+    stream_abort_enabled,
+)
+from src.services.parallel_tool_executor import ParallelToolAgentExecutor
+from src.services.prompt_cache_usage import PromptCacheUsageCallback
+from src.services.tools import (
+    build_genie_result_tool,
+    initialize_genie_conversation,
+    query_genie_space,
+)
 from src.utils.html_safety import scan_html_for_unsafe_patterns
 from src.utils.html_utils import (
     extract_canvas_ids_from_script,
@@ -154,6 +168,32 @@ def _run_output_safety_gate(html_output, regenerate, session_id, on_retry=None):
     )
 
 
+def _invoke_with_safety_abort(agent_executor, agent_input, callbacks=(), session_id=None):
+    """Invoke the agent, stopping its LLM stream at the first unsafe pattern.
+
+    Returns the executor result. When the stream was stopped, ``output`` is the
+    text generated up to that point and ``safety_aborted`` is True: handing it
+    to :func:`_run_output_safety_gate` starts the corrective retry right away
+    instead of after the full completion. Steps of the stopped run are lost.
+    """
+    callbacks = list(callbacks)
+    if stream_abort_enabled():
+        callbacks.append(OutputSafetyAbortCallback())
+    config = {"callbacks": callbacks} if callbacks else None
+    try:
+        return agent_executor.invoke(agent_input, config=config)
+    except UnsafeOutputAbortError as abort:
+        logger.warning(
+            "Unsafe pattern in streamed LLM output; generation stopped early",
+            extra={
+                "session_id": session_id,
+                "findings": abort.findings,
+                "output_chars": len(abort.partial_output),
+            },
+        )
+        return {"output": abort.partial_output, "intermediate_steps": [], "safety_aborted": True}
+
+
 class GenieQueryInput(BaseModel):
     """Input schema for Genie query tool."""
 
@@ -214,6 +254,8 @@ class SlideGeneratorAgent:
         self._pre_built_model = pre_built_model
         self._pre_built_tools = pre_built_tools
         self._pre_built_prompts = pre_built_prompts
+        # {section: characters} of the system prompt, set by _create_prompt.
+        self._system_section_sizes: dict[str, int] = {}
 
         # When using pre-built components (factory path), get_settings() may fail
         # because the old profile tables are deprecated. Use defaults for the few
@@ -451,6 +493,10 @@ class SlideGeneratorAgent:
                 max_tokens=llm_config["max_tokens"],
                 top_p=llm_config["top_p"],
                 workspace_client=system_client,
+                callbacks=[
+                    PromptCacheUsageCallback(),
+                    LLMAdmissionCallback(llm_config["endpoint"]),
+                ],
             )
 
             logger.info(
@@ -591,7 +637,7 @@ class SlideGeneratorAgent:
         )
 
         logger.info("Tools created for session", extra={"session_id": session_id})
-        return [genie_tool, image_search_tool]
+        return [genie_tool, build_genie_result_tool(session_id), image_search_tool]
 
     def _create_prompt(self, prompts: dict) -> ChatPromptTemplate:
         """Create prompt template with system prompt from settings and chat history.
@@ -617,6 +663,10 @@ class SlideGeneratorAgent:
             full_system_prompt = prompts.get("system_prompt") or ""
             if not full_system_prompt:
                 raise AgentError("System prompt not found in configuration")
+            section_sizes = dict(
+                prompts.get("section_sizes") or {"system_prompt": len(full_system_prompt)}
+            )
+            prefix_hash = prompts.get("prefix_hash")
         else:
             # Legacy concatenation path (custom overrides / old settings_db)
             deck_prompt = prompts.get("deck_prompt") or ""
@@ -629,18 +679,17 @@ class SlideGeneratorAgent:
             if not slide_style:
                 raise AgentError("Slide style not found in configuration")
 
+            # Most-shared first, deck prompt last, so the prefix stays
+            # byte-stable across decks (see prompt_modules.PER_DECK_SECTIONS).
             prompt_parts = []
-
-            if deck_prompt:
-                prompt_parts.append(f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}")
-
-            if slide_style:
-                prompt_parts.append(slide_style.strip())
+            section_sizes = {}
 
             prompt_parts.append(system_prompt.rstrip())
+            section_sizes["base"] = len(prompt_parts[-1])
 
             if editing_prompt:
                 prompt_parts.append(editing_prompt.strip())
+                section_sizes["base"] += len(prompt_parts[-1])
 
             image_guidelines = prompts.get("image_guidelines") or ""
 
@@ -672,8 +721,21 @@ class SlideGeneratorAgent:
                 )
 
             prompt_parts.append(image_section)
+            section_sizes["images"] = len(image_section)
+
+            prompt_parts.append(slide_style.strip())
+            section_sizes["slide_style"] = len(prompt_parts[-1])
+            prefix_hash = prompt_prefix_hash("\n\n".join(prompt_parts))
+
+            if deck_prompt:
+                prompt_parts.append(f"PRESENTATION CONTEXT:\n{deck_prompt.strip()}")
+                section_sizes["deck_prompt"] = len(prompt_parts[-1])
+
             full_system_prompt = "\n\n".join(prompt_parts)
 
+        self._system_section_sizes = section_sizes
+        self._prompt_prefix_hash = prefix_hash
+
         # Escape curly braces — LangChain's f-string template interprets {var}
         full_system_prompt = full_system_prompt.replace("{", "{{").replace("}", "}}")
 
@@ -695,7 +757,7 @@ class SlideGeneratorAgent:
         )
         return prompt
 
-    def _create_agent_executor(self, tools: list[StructuredTool]) -> AgentExecutor:
+    def _create_agent_executor(self, tools: list[StructuredTool]) -> ParallelToolAgentExecutor:
         """
         Create agent executor with model, tools, and prompt.
 
@@ -724,7 +786,7 @@ class SlideGeneratorAgent:
             agent = create_tool_calling_agent(model, tools, prompt)
 
             # Create executor with intermediate steps enabled
-            agent_executor = AgentExecutor(
+            agent_executor = ParallelToolAgentExecutor(
                 agent=agent,
                 tools=tools,
                 return_intermediate_steps=True,
@@ -955,6 +1017,47 @@ class SlideGeneratorAgent:
                 return True
         return False
 
+    def _record_prompt_sections(
+        self,
+        span: Any,
+        session_id: str,
+        chat_history: ChatMessageHistory,
+        question: str,
+        full_question: str,
+    ) -> None:
+        """Trace, log and record the size of each part of this request's prompt.
+
+        System-prompt sections come from ``_create_prompt`` (tool schemas are not
+        counted); ``history``, ``slide_context`` and ``question`` are this
+        request's own. Feeds ``GET /api/admin/prompt-budget``.
+        """
+        sizes = dict(getattr(self, "_system_section_sizes", {}))
+        prefix_hash = getattr(self, "_prompt_prefix_hash", None)
+        sizes["history"] = sum(len(str(m.content)) for m in chat_history.messages)
+        sizes["slide_context"] = len(full_question) - len(question)
+        sizes["question"] = len(question)
+        history_tokens = chars_to_tokens(sizes["history"])
+        input_tokens = sum(chars_to_tokens(chars) for chars in sizes.values())
+
+        span.set_attribute("history_tokens", history_tokens)
+        span.set_attribute("input_tokens_estimate", input_tokens)
+        if prefix_hash:
+            span.set_attribute("prompt_prefix_hash", prefix_hash)
+        for name, chars in sizes.items():
+            span.set_attribute(f"prompt_chars.{name}", chars)
+        logger.info(
+            "Agent input size",
+            extra={
+                "session_id": session_id,
+                "history_messages": len(chat_history.messages),
+                "history_tokens": history_tokens,
+                "input_tokens_estimate": input_tokens,
+                "prompt_section_chars": sizes,
+                "prompt_prefix_hash": prefix_hash,
+            },
+        )
+        record_prompt_sections(sizes)
+
     def _validate_editing_response(self, llm_response: str) -> Tuple[bool, str]:
         """
         RC1: Validate that LLM response contains valid slide HTML.
@@ -1402,7 +1505,8 @@ class SlideGeneratorAgent:
             else:
                 span_cm = nullcontext(_NoopMlflowSpan())
 
-            with span_cm as span:
+            priority = LLMPriority.EDIT if editing_mode else LLMPriority.CHAT
+            with span_cm as span, llm_priority(priority):
                 # Set custom attributes including session metadata for filtering
                 span.set_attribute("question", question)
                 span.set_attribute("session_id", session_id)
@@ -1411,6 +1515,9 @@ class SlideGeneratorAgent:
                 span.set_attribute("model_endpoint", DEFAULT_CONFIG["llm"]["endpoint"])
                 span.set_attribute("message_count", session["message_count"])
                 span.set_attribute("mode", "edit" if editing_mode else "generate")
+                self._record_prompt_sections(
+                    span, session_id, chat_history, question, full_question
+                )
 
                 # Format input for agent with chat history
                 agent_input = {
@@ -1419,14 +1526,17 @@ class SlideGeneratorAgent:
                 }
 
                 # Invoke agent with session-specific executor
-                result = agent_executor.invoke(agent_input)
+                result = _invoke_with_safety_abort(
+                    agent_executor, agent_input, session_id=session_id
+                )
 
                 # Extract results
                 html_output = result["output"]
                 intermediate_steps = result.get("intermediate_steps", [])
 
-                # RC1: Validate response in editing mode and retry if invalid
-                if editing_mode:
+                # RC1: Validate response in editing mode and retry if invalid.
+                # A safety-stopped output goes straight to the safety gate below.
+                if editing_mode and not result.get("safety_aborted"):
                     is_valid, error_msg = self._validate_editing_response(html_output)
 
                     if not is_valid:
@@ -1443,22 +1553,24 @@ class SlideGeneratorAgent:
                             "Return ONLY <div class='slide'>...</div> elements with their content."
                         )
 
-                        retry_result = agent_executor.invoke(
+                        retry_result = _invoke_with_safety_abort(
+                            agent_executor,
                             {
                                 "input": retry_prompt,
                                 "chat_history": chat_history.messages,
-                            }
+                            },
+                            session_id=session_id,
                         )
                         html_output = retry_result["output"]
                         intermediate_steps = retry_result.get(
                             "intermediate_steps", intermediate_steps
                         )
 
-                        # Validate retry
+                        # Validate retry (a safety-stopped retry goes to the gate)
                         is_valid, error_msg = self._validate_editing_response(
                             html_output
                         )
-                        if not is_valid:
+                        if not is_valid and not retry_result.get("safety_aborted"):
                             logger.error(
                                 f"LLM failed to return valid slide HTML after retry: {error_msg}",
                                 extra={"session_id": session_id},
@@ -1480,8 +1592,10 @@ class SlideGeneratorAgent:
                         "<img>/<script> URLs other than the Chart.js/Tailwind CDNs. "
                         "Charts must use only data already provided."
                     )
-                    r = agent_executor.invoke(
-                        {"input": corrective, "chat_history": chat_history.messages}
+                    r = _invoke_with_safety_abort(
+                        agent_executor,
+                        {"input": corrective, "chat_history": chat_history.messages},
+                        session_id=session_id,
                     )
                     return r["output"]
 
@@ -1526,9 +1640,11 @@ class SlideGeneratorAgent:
                     self._validate_canvas_scripts_in_html(html_output)
                     parsed_output = {"html": html_output, "type": "full_deck"}
 
+                tool_time_saved = agent_executor.tool_stats["saved_seconds"]
                 metadata = {
                     "latency_seconds": latency,
                     "tool_calls": len(intermediate_steps),
+                    "tool_time_saved_seconds": tool_time_saved,
                     "timestamp": end_time.isoformat(),
                     "message_count": session["message_count"],
                     "mode": "edit" if editing_mode else "generate",
@@ -1539,6 +1655,7 @@ class SlideGeneratorAgent:
                 # Set span attributes
                 span.set_attribute("output_length", len(html_output))
                 span.set_attribute("tool_calls", len(intermediate_steps))
+                span.set_attribute("tool_time_saved_seconds", tool_time_saved)
                 span.set_attribute("latency_seconds", latency)
                 span.set_attribute("status", "success")
                 span.set_attribute("genie_conversation_id", session["genie_conversation_id"])
@@ -1656,7 +1773,8 @@ class SlideGeneratorAgent:
             else:
                 span_cm = nullcontext(_NoopMlflowSpan())
 
-            with span_cm as span:
+            priority = LLMPriority.EDIT if editing_mode else LLMPriority.CHAT
+            with span_cm as span, llm_priority(priority):
                 # Set custom attributes including session metadata for filtering
                 span.set_attribute("question", question)
                 span.set_attribute("session_id", session_id)
@@ -1666,6 +1784,9 @@ class SlideGeneratorAgent:
                 span.set_attribute("message_count", session["message_count"])
                 span.set_attribute("mode", "edit" if editing_mode else "generate")
                 span.set_attribute("streaming", True)
+                self._record_prompt_sections(
+                    span, session_id, chat_history, question, full_question
+                )
 
                 agent_input = {
                     "input": full_question,
@@ -1673,16 +1794,16 @@ class SlideGeneratorAgent:
                 }
 
                 # Invoke agent with callback handler passed via config
-                result = agent_executor.invoke(
-                    agent_input,
-                    config={"callbacks": [callback_handler]},
+                result = _invoke_with_safety_abort(
+                    agent_executor, agent_input, [callback_handler], session_id=session_id
                 )
 
                 html_output = result["output"]
                 intermediate_steps = result.get("intermediate_steps", [])
 
-                # RC1: Validate response in editing mode and retry if invalid
-                if editing_mode:
+                # RC1: Validate response in editing mode and retry if invalid.
+                # A safety-stopped output goes straight to the safety gate below.
+                if editing_mode and not result.get("safety_aborted"):
                     is_valid, error_msg = self._validate_editing_response(html_output)
 
                     if not is_valid:
@@ -1699,23 +1820,25 @@ class SlideGeneratorAgent:
                             "Return ONLY <div class='slide'>...</div> elements with their content."
                         )
 
-                        retry_result = agent_executor.invoke(
+                        retry_result = _invoke_with_safety_abort(
+                            agent_executor,
                             {
                                 "input": retry_prompt,
                                 "chat_history": chat_history.messages,
                             },
-                            config={"callbacks": [callback_handler]},
+                            [callback_handler],
+                            session_id=session_id,
                         )
                         html_output = retry_result["output"]
                         intermediate_steps = retry_result.get(
                             "intermediate_steps", intermediate_steps
                         )
 
-                        # Validate retry
+                        # Validate retry (a safety-stopped retry goes to the gate)
                         is_valid, error_msg = self._validate_editing_response(
                             html_output
                         )
-                        if not is_valid:
+                        if not is_valid and not retry_result.get("safety_aborted"):
                             logger.error(
                                 f"LLM failed to return valid slide HTML after retry: {error_msg}",
                                 extra={"session_id": session_id},
@@ -1734,9 +1857,11 @@ class SlideGeneratorAgent:
                         "<img>/<script> URLs other than the Chart.js/Tailwind CDNs. "
                         "Charts must use only data already provided."
                     )
-                    r = agent_executor.invoke(
+                    r = _invoke_with_safety_abort(
+                        agent_executor,
                         {"input": corrective, "chat_history": chat_history.messages},
-                        config={"callbacks": [callback_handler]},
+                        [callback_handler],
+                        session_id=session_id,
                     )
                     return r["output"]
 
@@ -1776,9 +1901,11 @@ class SlideGeneratorAgent:
                 else:
                     self._validate_canvas_scripts_in_html(html_output)
 
+                tool_time_saved = agent_executor.tool_stats["saved_seconds"]
                 metadata = {
                     "latency_seconds": latency,
                     "tool_calls": len(intermediate_steps),
+                    "tool_time_saved_seconds": tool_time_saved,
                     "timestamp": end_time.isoformat(),
                     "message_count": session["message_count"],
                     "mode": "edit" if editing_mode else "generate",
@@ -1787,6 +1914,7 @@ class SlideGeneratorAgent:
 
                 span.set_attribute("output_length", len(html_output))
                 span.set_attribute("tool_calls", len(intermediate_steps))
+                span.set_attribute("tool_time_saved_seconds", tool_time_saved)
                 span.set_attribute("latency_seconds", latency)
                 span.set_attribute("status", "success")
                 span.set_attribute("genie_conversation_id", session["genie_conversation_id"])
@@ -1826,7 +1954,7 @@ class SlideGeneratorAgent:
         self,
         tools: list[StructuredTool],
         callbacks: list[BaseCallbackHandler],
-    ) -> AgentExecutor:
+    ) -> ParallelToolAgentExecutor:
         """
         Create agent executor with callback handlers for streaming.
 
@@ -1850,7 +1978,7 @@ class SlideGeneratorAgent:
             prompt = self._create_prompt(prompts)
             agent = create_tool_calling_agent(model, tools, prompt)
 
-            agent_executor = AgentExecutor(
+            agent_executor = ParallelToolAgentExecutor(
                 agent=agent,
                 tools=tools,
                 callbacks=callbacks,
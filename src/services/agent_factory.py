@@ -10,7 +10,13 @@ The factory:
 4. Returns an agent object compatible with ChatService's interface
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 from langchain_core.tools import StructuredTool
@@ -19,10 +25,16 @@ from src.api.schemas.agent_config import (
     AgentConfig, GenieTool, MCPTool, VectorIndexTool, ModelEndpointTool, AgentBricksTool,
 )
 from src.core.defaults import DEFAULT_CONFIG, DEFAULT_SLIDE_STYLE
-from src.core.prompt_modules import build_editing_system_prompt, build_generation_system_prompt
+from src.core.prompt_metrics import prompt_prefix_hash, section_chars
+from src.core.prompt_modules import (
+    editing_prompt_sections,
+    generation_prompt_sections,
+    shared_prefix,
+)
 from src.services.image_tools import SearchImagesInput, search_images
 from src.services.tools import (
     GenieQueryInput,
+    build_genie_result_tool,
     build_genie_tool,
     build_vector_tool,
     build_mcp_tools,
@@ -30,6 +42,7 @@ from src.services.tools import (
     build_agent_bricks_tool,
     build_ds_asset_tool,
     initialize_genie_conversation,
+    is_degraded,
     query_genie_space,
 )
 
@@ -51,6 +64,8 @@ def _create_model():
     from databricks_langchain import ChatDatabricks
 
     from src.core.databricks_client import get_system_client
+    from src.services.llm_admission_callback import LLMAdmissionCallback
+    from src.services.prompt_cache_usage import PromptCacheUsageCallback
 
     llm_config = DEFAULT_CONFIG["llm"]
     system_client = get_system_client()
@@ -61,6 +76,7 @@ def _create_model():
         max_tokens=llm_config["max_tokens"],
         top_p=0.95,
         workspace_client=system_client,
+        callbacks=[PromptCacheUsageCallback(), LLMAdmissionCallback(llm_config["endpoint"])],
     )
 
     logger.info(
@@ -75,10 +91,104 @@ def _create_model():
     return model
 
 
+# Process-level memo of assembled prompts for design-system requests, keyed by
+# the design system's revision (see _prompt_cache_key). Bounded LRU; entries for a
+# superseded revision simply age out.
+_PROMPT_CACHE_MAX = 128
+_prompt_cache: "OrderedDict[tuple, dict[str, Optional[str]]]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+def clear_prompt_cache() -> None:
+    """Drop every memoized prompt (tests; a compiler hot-reload)."""
+    with _prompt_cache_lock:
+        _prompt_cache.clear()
+
+
+def _prompt_cache_key(config: AgentConfig, mode: str) -> Optional[tuple]:
+    """Cache key for a design-system prompt, or ``None`` when it is not cacheable.
+
+    Only design-system requests are memoized — that is where the cost is (the
+    uncapped compiled artifact, the currency check, the type-scale re-assertion,
+    template blocks). The revision comes from ONE narrow indexed read of
+    ``design_system.(updated_at, version)`` and the deck prompt's ``updated_at``;
+    every design-system edit (PUT, a lazy recompile, a soft delete) writes the row,
+    so an edit in ANY worker process moves the key. Templates are immutable after
+    import. A probe failure or an inactive system is not cached: the full path
+    then reaches — and logs — the same verdict it always has.
+    """
+    if config.design_system_id is None:
+        return None
+    try:
+        from src.core.database import get_db_session
+        from src.database.models import DesignSystem, SlideDeckPromptLibrary
+        from src.services.design_system_compiler import COMPILER_VERSION
+
+        with get_db_session() as db:
+            revision = (
+                db.query(DesignSystem.updated_at, DesignSystem.version)
+                .filter_by(id=config.design_system_id, is_active=True)
+                .first()
+            )
+            if revision is None:
+                return None
+            deck_revision = None
+            if config.deck_prompt_id is not None:
+                deck_revision = (
+                    db.query(SlideDeckPromptLibrary.updated_at)
+                    .filter_by(id=config.deck_prompt_id, is_active=True)
+                    .scalar()
+                )
+    except Exception as e:
+        logger.warning(f"Prompt cache revision probe failed; assembling uncached: {e}")
+        return None
+    return (
+        config.design_system_id,
+        revision[0],
+        revision[1],
+        config.template_id,
+        mode,
+        COMPILER_VERSION,
+        config.deck_prompt_id,
+        deck_revision,
+        config.system_prompt,
+        config.slide_editing_instructions,
+    )
+
+
 def _get_prompt_content(
     config: AgentConfig,
     mode: str = "generate",
-) -> dict[str, Optional[str]]:
+) -> dict[str, Any]:
+    """Resolve prompt content, memoized per design-system revision.
+
+    See :func:`_assemble_prompt_content` for the resolution rules and
+    :func:`_prompt_cache_key` for what a cached entry is keyed on. A warm request
+    skips the design-system / deck-prompt reads, the currency check and the
+    compile/re-assertion work. Callers get their own copy of the dict.
+    """
+    key = _prompt_cache_key(config, mode)
+    if key is not None:
+        with _prompt_cache_lock:
+            cached = _prompt_cache.get(key)
+            if cached is not None:
+                _prompt_cache.move_to_end(key)
+                return dict(cached)
+
+    prompts, resolved = _assemble_prompt_content(config, mode)
+    # A lookup that failed mid-assembly degraded to defaults; never pin that.
+    if key is not None and resolved:
+        with _prompt_cache_lock:
+            _prompt_cache[key] = dict(prompts)
+            while len(_prompt_cache) > _PROMPT_CACHE_MAX:
+                _prompt_cache.popitem(last=False)
+    return prompts
+
+
+def _assemble_prompt_content(
+    config: AgentConfig,
+    mode: str = "generate",
+) -> tuple[dict[str, Any], bool]:
     """Resolve prompt content from AgentConfig, falling back to library lookups
     and then to backend defaults.
 
@@ -98,13 +208,13 @@ def _get_prompt_content(
         design_system_id (if set) -> slide_style_id -> DEFAULT_SLIDE_STYLE.
     A selected design system contributes its ``compiled_style_content`` — the
     serialized artifact produced by ``design_system_compiler`` — which flows
-    through the identical ``build_generation_system_prompt`` seam as a legacy
+    through the identical ``generation_prompt_sections`` seam as a legacy
     ``style_content`` blob. A persisted artifact that predates the current
     compiler (missing/stale version marker — e.g. rows compiled before the frame
     guardrails existed) or was never compiled is lazily recompiled here from the
     row's persisted tokens/files/assets, so an active design system ALWAYS
     injects the current compiler's blocks (no batch backfill). A pinned
-    ``template_id`` (Phase 4) appends its SELECTED-TEMPLATE block to the injected
+    ``template_id`` (Phase 4) adds its SELECTED-TEMPLATE block after the injected
     text at assembly time only — an invalid pin is ignored with a log, and the
     persisted compiled artifact never carries it. When no design system is
     selected the legacy slide_style_id path is used unchanged, so the feature is
@@ -115,10 +225,15 @@ def _get_prompt_content(
         mode: ``"generate"`` or ``"edit"``
 
     Returns:
-        Dict with keys: system_prompt, slide_editing_instructions,
-        deck_prompt, slide_style, image_guidelines, pre_assembled
+        ``(prompts, resolved)``: a dict with keys system_prompt,
+        slide_editing_instructions, deck_prompt, slide_style, image_guidelines,
+        pre_assembled (plus section_sizes, ``{section: characters}``, and
+        prefix_hash, identifying the shared prompt prefix, on the pre-assembled
+        path); and False when a library lookup raised and was degraded
+        to a default (the result must not be memoized).
     """
     slide_style = DEFAULT_SLIDE_STYLE
+    resolved = True
     deck_prompt: Optional[str] = None
     image_guidelines: Optional[str] = None
     # True only when a design system actually resolves to compiled content — gates
@@ -128,10 +243,11 @@ def _get_prompt_content(
     # model-facing ``slide_style`` has them stripped, so the re-assertion reads
     # the region out of this copy instead.
     design_system_compiled: Optional[str] = None
-    # True only when a pinned template's block actually made it into the prompt —
-    # its own CSS title sizes then outrank the design system's ramp numbers in the
-    # late type-scale re-assertion.
-    template_pinned = False
+    # A pinned template's SELECTED-TEMPLATE block. Kept out of ``slide_style`` so
+    # the design system's own text stays in the prompt's shared (cacheable)
+    # prefix. When present, its CSS title sizes outrank the design system's ramp
+    # numbers in the late type-scale re-assertion.
+    template_block: Optional[str] = None
 
     # Resolve the slide-style source. A design system (if selected) takes
     # precedence over a legacy slide style; each degrades to DEFAULT_SLIDE_STYLE
@@ -170,12 +286,12 @@ def _get_prompt_content(
                     slide_style = strip_type_scale_region_markers(slide_style)
                     design_system_active = True
                     if config.template_id is not None:
-                        # A pinned template appends its SELECTED-TEMPLATE block
-                        # here, at prompt-assembly time — the persisted per-DS
-                        # compiled artifact stays template-agnostic. An invalid
-                        # pin (deleted, or another design system's template)
-                        # resolves to None inside the helpers (logged) and the
-                        # prompt is byte-identical to the no-template path.
+                        # A pinned template adds its SELECTED-TEMPLATE block at
+                        # prompt-assembly time — the persisted per-DS compiled
+                        # artifact stays template-agnostic. An invalid pin
+                        # (deleted, or another design system's template) resolves
+                        # to None inside the helpers (logged) and the prompt is
+                        # byte-identical to the no-template path.
                         from src.services.design_system_templates import (
                             build_selected_template_block,
                             get_template_for_generation,
@@ -184,20 +300,18 @@ def _get_prompt_content(
                         template = get_template_for_generation(
                             design_system, config.template_id
                         )
-                        block = (
+                        template_block = (
                             build_selected_template_block(template)
                             if template is not None
                             else None
-                        )
-                        if block:
-                            slide_style = f"{slide_style}\n\n{block}"
-                            template_pinned = True
+                        ) or None
                 else:
                     logger.warning(
                         "Design system not found, using default",
                         extra={"design_system_id": config.design_system_id},
                     )
         except Exception as e:
+            resolved = False
             logger.error(f"Failed to resolve design_system_id: {e}")
     # Resolve slide_style_id from library (legacy path — unchanged; used only when
     # no design system is selected).
@@ -243,6 +357,7 @@ def _get_prompt_content(
                         extra={"deck_prompt_id": config.deck_prompt_id},
                     )
         except Exception as e:
+            resolved = False
             logger.error(f"Failed to resolve deck_prompt_id: {e}")
 
     # --- Decide between modular assembly and legacy/override path ---
@@ -265,19 +380,20 @@ def _get_prompt_content(
             "slide_style": slide_style,
             "image_guidelines": image_guidelines,
             "pre_assembled": False,
-        }
+        }, resolved
 
     # No custom override — use modular prompt_modules assembly
     if mode == "edit":
-        assembled = build_editing_system_prompt(
+        sections = editing_prompt_sections(
             slide_style=slide_style,
             deck_prompt=deck_prompt,
             image_guidelines=image_guidelines,
+            template_block=template_block,
         )
     else:
-        # The compiled design system lands as prompt block #2, so its numeric
-        # title contract is restated LAST (salience: the model measurably fell
-        # back to its own heading sizes when the scale was only stated early).
+        # The compiled design system lands mid-prompt, so its numeric title
+        # contract is restated LAST (salience: the model measurably fell back
+        # to its own heading sizes when the scale was only stated early).
         # The numbers are read back out of the text about to be injected, so the
         # re-assertion can never drift from what the model is shown.
         type_scale_reassertion: Optional[str] = None
@@ -290,26 +406,30 @@ def _get_prompt_content(
             # Read the region out of the SENTINEL-BEARING copy: ``slide_style``
             # has had them stripped for the model.
             type_scale_block = extract_type_scale_block(design_system_compiled)
+            template_pinned = template_block is not None
             if type_scale_block or template_pinned:
                 type_scale_reassertion = build_type_scale_reassertion(
                     type_scale_block or "", template_pinned=template_pinned
                 )
-        assembled = build_generation_system_prompt(
+        sections = generation_prompt_sections(
             slide_style=slide_style,
             deck_prompt=deck_prompt,
             image_guidelines=image_guidelines,
             design_system_active=design_system_active,
             type_scale_reassertion=type_scale_reassertion,
+            template_block=template_block,
         )
 
     return {
-        "system_prompt": assembled,
+        "system_prompt": "\n\n".join(text for _, text in sections),
         "slide_editing_instructions": None,
         "deck_prompt": None,
         "slide_style": None,
         "image_guidelines": None,
         "pre_assembled": True,
-    }
+        "section_sizes": section_chars(sections),
+        "prefix_hash": prompt_prefix_hash(shared_prefix(sections)),
+    }, resolved
 
 
 def _design_system_is_active(design_system_id: int) -> bool:
@@ -353,6 +473,7 @@ def _design_system_is_active(design_system_id: int) -> bool:
 def _build_tools(
     config: AgentConfig,
     session_data: dict[str, Any],
+    config_tools: Optional[dict[int, list[StructuredTool]]] = None,
 ) -> list[StructuredTool]:
     """Build the list of LangChain tools from AgentConfig.
 
@@ -364,6 +485,9 @@ def _build_tools(
     Args:
         config: AgentConfig with tool definitions
         session_data: Session dict for Genie conversation state
+        config_tools: Already-built session-independent tools from
+            :func:`_build_config_tools` (e.g. from the component cache); built
+            here when omitted. Tool order is ``config.tools`` order either way.
 
     Returns:
         List of StructuredTool instances
@@ -406,12 +530,11 @@ def _build_tools(
     ):
         tools.append(build_ds_asset_tool(config.design_system_id))
 
-    genie_index = 0
-    vector_index = 0
-    model_index = 0
-    agent_index = 0
+    if config_tools is None:
+        config_tools = _build_config_tools(config)
 
-    for tool_entry in config.tools:
+    genie_index = 0
+    for position, tool_entry in enumerate(config.tools):
         if isinstance(tool_entry, GenieTool):
             genie_index += 1
             genie_tool = build_genie_tool(tool_entry, session_data, genie_index)
@@ -424,10 +547,36 @@ def _build_tools(
                     "tool_name": genie_tool.name,
                 },
             )
-        elif isinstance(tool_entry, VectorIndexTool):
+        else:
+            tools.extend(config_tools.get(position, []))
+
+    # One pager serves every Genie space's truncated results.
+    if genie_index:
+        tools.append(build_genie_result_tool(session_data.get("session_id")))
+
+    return tools
+
+
+def _build_config_tools(config: AgentConfig) -> dict[int, list[StructuredTool]]:
+    """Build the SESSION-INDEPENDENT tools in ``config.tools``, keyed by position.
+
+    Everything but Genie (whose tool is bound to the session's conversation id):
+    vector, MCP, model-endpoint and Agent Bricks tools depend only on their config
+    entry and resolve the user client at CALL time, so one build can serve every
+    request with the same config and user (see :func:`_get_agent_components`).
+    Building them is where the network goes — MCP tool discovery, vector index
+    column resolution.
+    """
+    built: dict[int, list[StructuredTool]] = {}
+    vector_index = 0
+    model_index = 0
+    agent_index = 0
+
+    for position, tool_entry in enumerate(config.tools):
+        if isinstance(tool_entry, VectorIndexTool):
             vector_index += 1
             vector_tool = build_vector_tool(tool_entry, vector_index)
-            tools.append(vector_tool)
+            built[position] = [vector_tool]
             logger.info(
                 "Added Vector Index tool",
                 extra={
@@ -437,7 +586,7 @@ def _build_tools(
             )
         elif isinstance(tool_entry, MCPTool):
             mcp_tools = build_mcp_tools(tool_entry)
-            tools.extend(mcp_tools)
+            built[position] = mcp_tools
             logger.info(
                 "Added MCP tools",
                 extra={
@@ -449,7 +598,7 @@ def _build_tools(
         elif isinstance(tool_entry, ModelEndpointTool):
             model_index += 1
             model_tool = build_model_endpoint_tool(tool_entry, model_index)
-            tools.append(model_tool)
+            built[position] = [model_tool]
             logger.info(
                 "Added Model Endpoint tool",
                 extra={
@@ -460,7 +609,7 @@ def _build_tools(
         elif isinstance(tool_entry, AgentBricksTool):
             agent_index += 1
             agent_tool = build_agent_bricks_tool(tool_entry, agent_index)
-            tools.append(agent_tool)
+            built[position] = [agent_tool]
             logger.info(
                 "Added Agent Bricks tool",
                 extra={
@@ -469,7 +618,96 @@ def _build_tools(
                 },
             )
 
-    return tools
+    return built
+
+
+# Process-level caches of the immutable agent components. The LLM client uses the
+# system client, so one model serves every user; the session-independent tools are
+# keyed by a fingerprint of the tool config plus the requesting user (tool
+# discovery runs with the user's permissions). Both expire so an MCP server's
+# changed tool list or a rotated client is picked up.
+_AGENT_COMPONENT_CACHE_MAX = 64
+AGENT_COMPONENT_CACHE_TTL_SECONDS = float(
+    os.getenv("AGENT_COMPONENT_CACHE_TTL_SECONDS", "600")
+)
+_ConfigTools = dict[int, list[StructuredTool]]
+_agent_component_cache: "OrderedDict[tuple, tuple[float, _ConfigTools]]" = OrderedDict()
+_agent_component_cache_lock = threading.Lock()
+_shared_model: Optional[tuple[float, Any]] = None
+
+
+def clear_agent_component_cache() -> None:
+    """Drop the cached model and every cached tool set (tests; after a client reset)."""
+    global _shared_model
+    with _agent_component_cache_lock:
+        _agent_component_cache.clear()
+        _shared_model = None
+
+
+def _tools_fingerprint(config: AgentConfig) -> str:
+    """Stable hash of ``config.tools`` — what the cached tools were built from."""
+    payload = json.dumps(
+        [tool.model_dump(mode="json") for tool in config.tools], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_shared_model() -> Any:
+    """The process-wide LLM client, rebuilt once the TTL lapses."""
+    global _shared_model
+    now = time.monotonic()
+    with _agent_component_cache_lock:
+        if _shared_model is not None and _shared_model[0] > now:
+            return _shared_model[1]
+
+    model = _create_model()
+    with _agent_component_cache_lock:
+        _shared_model = (now + AGENT_COMPONENT_CACHE_TTL_SECONDS, model)
+    return model
+
+
+def _get_agent_components(
+    config: AgentConfig,
+) -> tuple[Any, _ConfigTools, bool]:
+    """Return ``(model, config_tools, cache_hit)`` for this config and user.
+
+    Per-session state is NOT in here: the Genie tool, the design-system asset tool
+    (gated on a live ``is_active`` read), prompts (memoized separately, by design
+    system revision) and the executor's callbacks are all bound per request.
+    ``mode`` changes only the prompt, so it is not part of this key.
+
+    A tool set containing a build-time fallback (failed MCP discovery, unresolved
+    vector columns — see :func:`~src.services.tools.is_degraded`) is used for this
+    request but not cached, so the next request retries the lookup.
+    """
+    from src.core.user_context import get_current_user
+
+    model = _get_shared_model()
+    key = (_tools_fingerprint(config), get_current_user())
+    now = time.monotonic()
+    with _agent_component_cache_lock:
+        entry = _agent_component_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _agent_component_cache.move_to_end(key)
+            return model, entry[1], True
+
+    config_tools = _build_config_tools(config)
+    degraded = [
+        tool.name for tools in config_tools.values() for tool in tools if is_degraded(tool)
+    ]
+    if degraded:
+        logger.warning(
+            "Not caching agent tools: built with fallbacks",
+            extra={"degraded_tools": degraded},
+        )
+        return model, config_tools, False
+
+    with _agent_component_cache_lock:
+        _agent_component_cache[key] = (now + AGENT_COMPONENT_CACHE_TTL_SECONDS, config_tools)
+        _agent_component_cache.move_to_end(key)
+        while len(_agent_component_cache) > _AGENT_COMPONENT_CACHE_MAX:
+            _agent_component_cache.popitem(last=False)
+    return model, config_tools, False
 
 
 def build_agent_for_request(
@@ -510,11 +748,13 @@ def build_agent_for_request(
         },
     )
 
-    # 1. Create the LLM model
-    model = _create_model()
+    build_started = time.perf_counter()
+
+    # 1. The LLM model and session-independent tools (reused across requests)
+    model, config_tools, component_cache_hit = _get_agent_components(config)
 
-    # 2. Build tools from config
-    tools = _build_tools(config, session_data)
+    # 2. Bind the per-session tools around them
+    tools = _build_tools(config, session_data, config_tools)
 
     # 3. Resolve prompts (mode-aware)
     prompts = _get_prompt_content(config, mode=mode)
@@ -532,6 +772,8 @@ def build_agent_for_request(
             "session_id": session_data.get("session_id"),
             "tool_names": [t.name for t in tools],
             "mode": mode,
+            "build_ms": round((time.perf_counter() - build_started) * 1000, 1),
+            "component_cache_hit": component_cache_hit,
         },
     )
 
@@ -0,0 +1,224 @@
+"""Token-budgeted compaction of replayed chat history.
+
+Every ``llm_response`` persisted for a session carries complete slide HTML, so
+replaying the whole conversation makes each request re-send every earlier deck
+version — cost and latency grow with the square of the session length. Before
+the history reaches the agent, assistant turns outside a window of recent
+exchanges are replaced with a compact structural summary (slide titles and
+which slides changed); the most recent slide-bearing response stays verbatim
+because, outside edit mode, it is the LLM's only copy of the current deck.
+
+If the result still exceeds the token budget, the oldest exchanges are dropped
+(never one holding a protected message). Token counts are a characters/4 estimate — close
+enough for budgeting, and free (``prompt_metrics.estimate_tokens``).
+
+Configuration (environment):
+
+- ``CHAT_HISTORY_TOKEN_BUDGET``: estimated-token budget for replayed history
+  (default 24000; ``0`` disables compaction entirely).
+- ``CHAT_HISTORY_VERBATIM_TURNS``: number of most recent user/assistant
+  exchanges replayed verbatim (default 2).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from src.core.prompt_metrics import estimate_tokens
+from src.utils.html_utils import find_slide_roots
+from src.utils.slide_hash import compute_slide_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = 24000
+DEFAULT_VERBATIM_TURNS = 2
+
+# Longest slide title quoted in a summary.
+_TITLE_MAX_CHARS = 80
+# Longest non-slide assistant text (e.g. a clarification) kept when compacted.
+_TEXT_MAX_CHARS = 400
+
+SUMMARY_PREFIX = "[Earlier response compacted — slide HTML omitted."
+
+
+@dataclass(frozen=True)
+class CompactionStats:
+    """What :func:`compact_chat_history` did, for logging/tracing."""
+
+    messages_in: int
+    messages_out: int
+    tokens_in: int
+    tokens_out: int
+    summarized: int
+    dropped: int
+
+
+def token_budget() -> int:
+    """Configured history budget in estimated tokens (``0`` = unlimited)."""
+    return max(0, _int_env("CHAT_HISTORY_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET))
+
+
+def verbatim_turns() -> int:
+    """Configured number of recent exchanges replayed verbatim."""
+    return max(0, _int_env("CHAT_HISTORY_VERBATIM_TURNS", DEFAULT_VERBATIM_TURNS))
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", name, raw)
+        return default
+
+
+def estimate_messages_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Estimated tokens for a message list's string contents."""
+    return sum(estimate_tokens(_text(m)) for m in messages)
+
+
+def _text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+def _slides(html: str) -> List[tuple[str, str]]:
+    """``(title, content_hash)`` for each slide in ``html``; empty if none."""
+    if "slide" not in html:
+        return []
+    roots = find_slide_roots(BeautifulSoup(html, "html.parser"))
+    slides = []
+    for root in roots:
+        heading = root.find(["h1", "h2", "h3"])
+        title = " ".join((heading or root).get_text(" ", strip=True).split())
+        if len(title) > _TITLE_MAX_CHARS:
+            title = title[: _TITLE_MAX_CHARS - 1] + "…"
+        slides.append((title or "(untitled)", compute_slide_hash(str(root))))
+    return slides
+
+
+def summarize_assistant_turn(
+    content: str, previous_slides: Optional[List[tuple[str, str]]] = None
+) -> str:
+    """Compact structural summary of one assistant response.
+
+    Slide-bearing responses become their slide titles, plus which positions
+    differ from ``previous_slides`` (the last earlier slide-bearing response)
+    when there is one. Anything else is truncated to a short excerpt.
+    """
+    slides = _slides(content)
+    if not slides:
+        text = " ".join(content.split())
+        if len(text) <= _TEXT_MAX_CHARS:
+            return text
+        return text[: _TEXT_MAX_CHARS - 1] + "…"
+
+    titles = "; ".join(f"{i}. {title}" for i, (title, _) in enumerate(slides, 1))
+    lines = [f"{SUMMARY_PREFIX} Produced {len(slides)} slide(s): {titles}."]
+    if previous_slides:
+        if len(previous_slides) == len(slides):
+            changed = [
+                str(i)
+                for i, (new, old) in enumerate(zip(slides, previous_slides), 1)
+                if new[1] != old[1]
+            ]
+            lines.append(
+                f"Changed slides: {', '.join(changed)}." if changed else "No slides changed."
+            )
+        else:
+            lines.append(f"Slide count changed {len(previous_slides)} → {len(slides)}.")
+    return " ".join(lines) + "]"
+
+
+def compact_chat_history(
+    messages: Sequence[BaseMessage],
+    *,
+    budget: Optional[int] = None,
+    keep_turns: Optional[int] = None,
+) -> tuple[List[BaseMessage], CompactionStats]:
+    """Fit ``messages`` into the history token budget.
+
+    Args:
+        messages: Chronological Human/AI messages as hydrated from the DB.
+        budget: Estimated-token budget (defaults to :func:`token_budget`);
+            ``0`` returns the history unchanged.
+        keep_turns: Recent exchanges kept verbatim (defaults to
+            :func:`verbatim_turns`). An exchange starts at a human message.
+
+    Returns:
+        ``(compacted_messages, stats)``. Message order is preserved.
+    """
+    messages = list(messages)
+    budget = token_budget() if budget is None else budget
+    keep_turns = verbatim_turns() if keep_turns is None else keep_turns
+    tokens_in = estimate_messages_tokens(messages)
+
+    if budget <= 0 or tokens_in <= budget:
+        return messages, CompactionStats(
+            len(messages), len(messages), tokens_in, tokens_in, 0, 0
+        )
+
+    # Everything from the keep_turns-th most recent human message on is verbatim.
+    human_positions = [i for i, m in enumerate(messages) if isinstance(m, HumanMessage)]
+    if keep_turns and human_positions:
+        window_start = human_positions[-min(keep_turns, len(human_positions))]
+    else:
+        window_start = len(messages)
+
+    slide_info = {
+        i: _slides(_text(m)) for i, m in enumerate(messages) if isinstance(m, AIMessage)
+    }
+    latest_deck = max((i for i, s in slide_info.items() if s), default=None)
+    protected = set(range(window_start, len(messages)))
+    if latest_deck is not None:
+        protected.add(latest_deck)
+
+    compacted: List[tuple[int, BaseMessage]] = []
+    previous_slides: Optional[List[tuple[str, str]]] = None
+    summarized = 0
+    for i, message in enumerate(messages):
+        if i in protected or not isinstance(message, AIMessage):
+            compacted.append((i, message))
+        else:
+            summary = summarize_assistant_turn(_text(message), previous_slides)
+            compacted.append((i, AIMessage(content=summary)))
+            summarized += 1
+        if slide_info.get(i):
+            previous_slides = slide_info[i]
+
+    # Still over budget: drop the oldest exchanges (a human message and the
+    # assistant turns answering it) that hold no protected message, so the
+    # replay never opens with a dangling assistant turn.
+    exchanges: List[List[tuple[int, BaseMessage]]] = []
+    for entry in compacted:
+        if isinstance(entry[1], HumanMessage) or not exchanges:
+            exchanges.append([])
+        exchanges[-1].append(entry)
+    dropped = 0
+    total = sum(estimate_tokens(_text(m)) for _, m in compacted)
+    for exchange in exchanges:
+        if total <= budget:
+            break
+        if any(i in protected for i, _ in exchange):
+            continue
+        total -= sum(estimate_tokens(_text(m)) for _, m in exchange)
+        dropped += len(exchange)
+        exchange.clear()
+    compacted = [entry for exchange in exchanges for entry in exchange]
+
+    result = [m for _, m in compacted]
+    return result, CompactionStats(
+        messages_in=len(messages),
+        messages_out=len(result),
+        tokens_in=tokens_in,
+        tokens_out=total,
+        summarized=summarized,
+        dropped=dropped,
+    )
@@ -11,7 +11,9 @@ from databricks_langchain import ChatDatabricks
 from langchain_core.messages import HumanMessage
 
 from src.core.databricks_client import get_user_client
+from src.core.llm_admission import LLMPriority
 from src.core.settings_db import load_settings_from_database
+from src.services.llm_admission_callback import LLMAdmissionCallback
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +112,7 @@ class ConfigurationValidator:
                 temperature=llm_config["temperature"],
                 max_tokens=100,  # Small for test
                 top_p=llm_config["top_p"],
+                callbacks=[LLMAdmissionCallback(llm_config["endpoint"], LLMPriority.CHAT)],
             )
 
             # Send test message
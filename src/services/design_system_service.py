@@ -48,20 +48,32 @@ Guardrails: per-asset and per-bundle size limits are enforced against each entry
 declared *uncompressed* size BEFORE it is read into memory, so a decompression
 bomb is rejected rather than materialised.
 
+Memory: the import route hands the upload over as the spooled temporary file the
+multipart parser already wrote (``zip_file=``), never as one ``bytes`` blob, and
+asset rows are flushed to the database in batches of
+``ASSET_FLUSH_BATCH_BYTES`` with their bytes released from the session after
+each flush — so peak RSS tracks the largest batch, not the bundle.
+
 Everything here is brand-neutral engine code; no brand content is embedded.
 """
 from __future__ import annotations
 
 import base64
+import collections
+import contextlib
+import functools
 import io
 import json
 import logging
 import mimetypes
+import os
 import re
 import struct
 import unicodedata
+import weakref
 import zipfile
-from typing import Any, NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, NamedTuple, Optional
 
 from sqlalchemy.orm import Session, defer
 
@@ -78,6 +90,16 @@ from src.services.design_system_compiler import recompute_compiled_style_content
 logger = logging.getLogger(__name__)
 
 MANIFEST_FILENAME = "_ds_manifest.json"
+
+#: Asset bytes allowed to sit pending in the session before they are flushed to the
+#: database and released from the ORM objects (see :class:`_BatchedAssetWriter`).
+ASSET_FLUSH_BATCH_BYTES = 16 * 1024 * 1024
+
+#: Worker threads that decompress and probe bundle entries during an import
+#: (``DS_IMPORT_DECODE_WORKERS``; see :func:`_collect_assets_and_files`).
+IMPORT_DECODE_WORKERS = max(
+    1, int(os.getenv("DS_IMPORT_DECODE_WORKERS", str(min(4, os.cpu_count() or 1))))
+)
 DEFAULT_CSS_TOKEN_SOURCE = "colors_and_type.css"
 
 
@@ -611,10 +633,18 @@ class _SizeBudget:
     attacker-declared multi-GB manifest/CSS/asset is rejected rather than OOMing
     the worker — then re-check the actual decoded length as a backstop. The
     single running total spans the manifest, CSS sources, and all assets.
+
+    A read can also be split in two for a read that happens on another thread:
+    :meth:`reserve` (the declared-size check, in entry order, before dispatch) and
+    :meth:`charge` (the actual-length backstop, in entry order, after). Reserved
+    bytes count against the bundle cap until charged, so the verdict for every
+    entry is the one a sequential read would reach: a ``ZipFile`` read never yields
+    more than the declared size, and one yielding less fails its CRC check.
     """
 
     def __init__(self) -> None:
         self.total = 0
+        self._reserved = 0
 
     def read(self, zf: zipfile.ZipFile, name: str) -> bytes:
         """Size-checked read by entry name. Raises ``KeyError`` if absent."""
@@ -622,8 +652,17 @@ class _SizeBudget:
 
     def read_info(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
         """Size-checked read for an already-resolved :class:`zipfile.ZipInfo`."""
+        self.reserve(info)
+        return self.charge(info, zf.read(info))
+
+    def reserve(self, info: zipfile.ZipInfo) -> None:
+        """Declared-size check for an entry about to be read."""
         self._enforce(info.filename, info.file_size)
-        data = zf.read(info)
+        self._reserved += info.file_size
+
+    def charge(self, info: zipfile.ZipInfo, data: bytes) -> bytes:
+        """Count a reserved entry's actual bytes; returns ``data``."""
+        self._reserved -= info.file_size
         self.total += len(data)
         self._enforce(info.filename, 0)  # backstop: re-check actual cumulative
         if len(data) > MAX_ASSET_SIZE_BYTES:
@@ -639,7 +678,7 @@ class _SizeBudget:
                 f"Bundle entry '{name}' is too large: {pending} bytes "
                 f"(max {MAX_ASSET_SIZE_BYTES} per entry)."
             )
-        if self.total + pending > MAX_BUNDLE_SIZE_BYTES:
+        if self.total + self._reserved + pending > MAX_BUNDLE_SIZE_BYTES:
             raise DesignSystemImportError(
                 f"Bundle exceeds the maximum size of {MAX_BUNDLE_SIZE_BYTES} bytes."
             )
@@ -653,7 +692,8 @@ class _SizeBudget:
 def import_bundle(
     db: Session,
     *,
-    zip_bytes: bytes,
+    zip_bytes: Optional[bytes] = None,
+    zip_file: Optional[IO[bytes]] = None,
     user: Optional[str],
     name_override: Optional[str] = None,
     source_filename: Optional[str] = None,
@@ -665,6 +705,10 @@ def import_bundle(
     ``compiled_style_content``).
 
     Args:
+        zip_bytes / zip_file: the bundle, exactly one of them. ``zip_file`` is a
+            seekable binary file (the route passes the upload's spooled temporary
+            file) and is read in place — the archive is never copied into memory
+            whole. The importer owns its position for the duration of the call.
         warnings: optional collector. Pass a list to receive an
             :class:`BundleImportWarning` for every entry the import DROPPED without
             failing — the caller can then tell the user which files were ignored and
@@ -676,8 +720,11 @@ def import_bundle(
             violates a size limit (HTTP 400).
         DesignSystemNameConflictError: the resolved name already exists (HTTP 409).
     """
+    if (zip_bytes is None) == (zip_file is None):
+        raise TypeError("import_bundle() takes exactly one of zip_bytes or zip_file")
+    source = zip_file if zip_file is not None else io.BytesIO(zip_bytes)
     try:
-        zf = zipfile.ZipFile(io.BytesIO(zip_bytes))
+        zf = zipfile.ZipFile(source)
     except zipfile.BadZipFile as exc:
         raise DesignSystemImportError(f"Upload is not a valid .zip bundle: {exc}") from exc
 
@@ -729,54 +776,45 @@ def import_bundle(
         # reused for both token parsing and source-file retention (no double-charge).
         css_sources = _read_css_sources(zf, root_prefix, manifest, budget)
         tokens = _collect_tokens(manifest, _decode_css_texts(css_sources, warnings))
-        assets, files = _collect_assets_and_files(
-            zf, root_prefix, budget, css_sources, warnings
+
+        # Stored VERBATIM; the strip decides only whether the brand wrote a
+        # description at all (a whitespace-only one describes nothing, so it stays
+        # NULL). Same split as the token group and the name above — normalize the
+        # check, never the value.
+        raw_description = manifest.get("description")
+        description = (
+            raw_description
+            if isinstance(raw_description, str) and raw_description.strip()
+            else None
         )
+        design_system = DesignSystem(
+            name=name,
+            description=description,
+            created_by=user,
+            updated_by=user,
+            manifest_json=manifest,
+            font_mapping_json=build_font_mapping(manifest),
+            version=1,
+            published=False,
+            is_default=False,
+            is_active=True,
+        )
+        for token in tokens:
+            design_system.tokens.append(token)
+
+        # Rows are written as the collector produces them, in bounded batches (see
+        # _BatchedAssetWriter); the first batch flush — for a small bundle, the
+        # final one — is where the parent joins the session and is written too.
+        # The writes run under a SAVEPOINT: any refusal after a flush (a size
+        # limit, an unsafe entry found by the iterator) rolls back only the
+        # partial import, never anything else the caller has pending.
+        writer = _BatchedAssetWriter(db, design_system)
+        with db.begin_nested():
+            _collect_assets_and_files(zf, root_prefix, budget, css_sources, writer, warnings)
+            # Flush assigns primary keys so {{ds-asset:ID}} placeholders point at
+            # real ids and each asset-reference file row resolves its asset_id.
+            writer.finish()
 
-    # Stored VERBATIM; the strip decides only whether the brand wrote a description
-    # at all (a whitespace-only one describes nothing, so it stays NULL). Same split
-    # as the token group and the name above — normalize the check, never the value.
-    raw_description = manifest.get("description")
-    description = (
-        raw_description
-        if isinstance(raw_description, str) and raw_description.strip()
-        else None
-    )
-    design_system = DesignSystem(
-        name=name,
-        description=description,
-        created_by=user,
-        updated_by=user,
-        manifest_json=manifest,
-        font_mapping_json=build_font_mapping(manifest),
-        version=1,
-        published=False,
-        is_default=False,
-        is_active=True,
-    )
-    for token in tokens:
-        design_system.tokens.append(token)
-    for asset in assets:
-        design_system.assets.append(asset)
-    for ds_file in files:
-        design_system.files.append(ds_file)
-
-    db.add(design_system)
-    # Flush assigns primary keys so {{ds-asset:ID}} placeholders point at real ids
-    # and each asset-reference file row resolves its asset_id. It is also where the
-    # UNIQUE index on ``name`` first has to hold the value, so an unindexable name
-    # surfaces HERE — as the database's own error, translated into the 4xx the route
-    # already maps rather than escaping as an opaque 500.
-    try:
-        db.flush()
-    except Exception as exc:
-        translate_name_index_limit_error(exc, name=name)
-        # The pre-check above is not a lock: a CONCURRENT importer of the same name
-        # can have committed between that SELECT and this write, and then the partial
-        # unique index is what refuses us. Translated to the same 409 the sequential
-        # path returns, instead of escaping as an opaque 500.
-        translate_name_conflict_error(exc, name=name)
-        raise
     # Materialize addressable template entities (v1 Phase 4) AFTER the flush so
     # the rewritten layout's {{ds-asset:ID}} refs point at real asset ids. Local
     # import: design_system_templates imports this module for nothing, but the
@@ -785,7 +823,7 @@ def import_bundle(
 
     materialize_templates(design_system)
     recompute_compiled_style_content(design_system)
-    # The flush above normally raises first, but the index is only DEFINITELY
+    # The first flush normally raises first, but the index is only DEFINITELY
     # exercised at the commit (a deferrable constraint, a different flush order), so
     # the same translation guards both rather than assuming which one fires.
     try:
@@ -802,8 +840,8 @@ def import_bundle(
         design_system.name,
         design_system.id,
         len(tokens),
-        len(assets),
-        len(files),
+        writer.asset_count,
+        writer.file_count,
         len(design_system.templates),
     )
     return design_system
@@ -1642,11 +1680,14 @@ def _local_header_identity(
     not safe in general — a truly concurrent read, or a file object shared with anything
     outside this ``ZipFile``, could be moved out from under mid-read. It is safe for
     THIS importer's usage, and only because of four properties that hold together:
-    :func:`import_bundle` wraps the upload in a private :class:`io.BytesIO` that nothing
-    else holds a reference to; the whole-bundle scan runs to completion before any entry
+    :func:`import_bundle` reads either a private :class:`io.BytesIO` or the upload's
+    spooled temporary file, which the route hands over and does not touch again until
+    the import returns; the whole-bundle scan runs to completion before any entry
     is read; ``ZipFile.open``'s reader re-seeks to its own position before every read, so
-    a moved pointer cannot corrupt an open stream; and the asset reads are synchronous
-    ``zf.read`` calls with no interleaving. The position is restored afterwards anyway —
+    a moved pointer cannot corrupt an open stream; and the entry reads that DO run
+    concurrently (the import's decode workers) go through that reader, which holds the
+    archive's lock around each seek + read — the same lock this read takes. The
+    position is restored afterwards anyway —
     it costs one seek and removes the need for a reader of this function to know any of
     the above.
 
@@ -1654,9 +1695,43 @@ def _local_header_identity(
     callers treat as a refusal (:data:`_REASON_LOCAL_HEADER`) rather than as
     permission: an entry whose second name is unknown is not an entry with one name.
     """
+    # Each header is READ once per archive, however many gates judge it: the raw
+    # ``(name, extra)`` is memoized per ZipFile, and every gate still applies its own
+    # rules to it. Reading is what costs (a seek + read against a spooled file that
+    # may be on disk); judging is what the two gates must each do independently.
+    memo = _LOCAL_HEADER_MEMO.setdefault(zf, {})
+    if info.header_offset in memo:
+        return memo[info.header_offset]
+    result = _read_local_header_identity(zf, info)
+    memo[info.header_offset] = result
+    return result
+
+
+#: Per-archive memo of raw local-header reads, keyed by ``header_offset``. Weak on
+#: the ZipFile so an import's entries vanish with its archive.
+_LocalHeaderMemo = dict[int, Optional[tuple[str, bytes]]]
+_LOCAL_HEADER_MEMO: "weakref.WeakKeyDictionary[zipfile.ZipFile, _LocalHeaderMemo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _read_local_header_identity(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> "Optional[tuple[str, bytes]]":
+    """Uncached body of :func:`_local_header_identity` (one seek + read)."""
     fp = getattr(zf, "fp", None)
     if fp is None:
         return None
+    # The archive's own lock — the one ``ZipFile``'s shared-file reader holds around
+    # every seek + read — so a decode worker reading an entry cannot move the
+    # position between this seek and this read, nor this one between its.
+    with getattr(zf, "_lock", None) or contextlib.nullcontext():
+        return _read_local_header_identity_locked(zf, info, fp)
+
+
+def _read_local_header_identity_locked(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, fp: IO[bytes]
+) -> "Optional[tuple[str, bytes]]":
     try:
         resume_at = fp.tell()
         try:
@@ -2080,15 +2155,83 @@ def build_font_mapping(manifest: dict) -> Optional[dict]:
     }
 
 
+class _BatchedAssetWriter:
+    """Attaches imported rows to a new design system, writing asset bytes to the
+    database in bounded batches.
+
+    Once the pending asset bytes reach :data:`ASSET_FLUSH_BATCH_BYTES` the session
+    is flushed and each written asset's ``data`` attribute is expired, which drops
+    the session's reference to the bytes — nothing later in the import reads them
+    (templates and the compiler use ids, kinds and dimensions only), and a later
+    access would simply reload from the row. Source files (README / SKILL / CSS /
+    template HTML) keep their bytes: the template materializer reads them.
+    """
+
+    def __init__(self, db: Session, design_system: DesignSystem) -> None:
+        self._db = db
+        self._design_system = design_system
+        self._pending: list[DesignSystemAsset] = []
+        self._pending_bytes = 0
+        self.asset_count = 0
+        self.file_count = 0
+
+    def add_asset(self, asset: DesignSystemAsset, reference: DesignSystemFile) -> None:
+        self._design_system.assets.append(asset)
+        self._design_system.files.append(reference)
+        self.asset_count += 1
+        self.file_count += 1
+        self._pending.append(asset)
+        self._pending_bytes += asset.size_bytes or 0
+        if self._pending_bytes >= ASSET_FLUSH_BATCH_BYTES:
+            self._flush()
+
+    def add_file(self, ds_file: DesignSystemFile) -> None:
+        self._design_system.files.append(ds_file)
+        self.file_count += 1
+
+    def finish(self) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        # A flush is where the UNIQUE index on ``name`` first has to hold the value
+        # (the first one writes the parent row), so an unindexable name surfaces
+        # HERE — as the database's own error, translated into the 4xx the route
+        # already maps rather than escaping as an opaque 500. The pre-check in
+        # import_bundle is not a lock: a CONCURRENT importer of the same name can
+        # have committed between that SELECT and this write, and then the partial
+        # unique index is what refuses us — translated to the same 409 the
+        # sequential path returns.
+        name = self._design_system.name
+        self._db.add(self._design_system)
+        try:
+            self._db.flush()
+        except Exception as exc:
+            translate_name_index_limit_error(exc, name=name)
+            translate_name_conflict_error(exc, name=name)
+            raise
+        for asset in self._pending:
+            self._db.expire(asset, ["data"])
+        self._pending.clear()
+        self._pending_bytes = 0
+
+
 def _collect_assets_and_files(
     zf: zipfile.ZipFile,
     root_prefix: str,
     budget: "_SizeBudget",
     css_sources: "dict[str, bytes]",
+    writer: "_BatchedAssetWriter",
     warnings: "Optional[list[BundleImportWarning]]" = None,
-) -> tuple[list[DesignSystemAsset], list[DesignSystemFile]]:
+) -> None:
     """Read a bundle into asset rows + file rows in one safety-checked pass.
 
+    Rows go to ``writer`` as they are produced rather than being accumulated, so
+    asset bytes are flushed to the database in bounded batches instead of all
+    being held until the commit. Entries are decompressed and probed on
+    :data:`IMPORT_DECODE_WORKERS` threads, but rows, warnings and budget charges
+    are applied in the bundle's entry order either way — the compiler relies on
+    stable row order, and the size limits refuse the same entry they always did.
+
     - a DECLARED CSS token source (``css_sources``) -> a ``DesignSystemFile``
       SOURCE row using the bytes ALREADY read for parsing (never re-read/re-charged
       against the budget), so CSS is not double-counted; only declared sources are
@@ -2103,95 +2246,183 @@ def _collect_assets_and_files(
     One shared ``budget`` spans every read, so each stored byte counts once and the
     per-bundle cap holds.
     """
-    assets: list[DesignSystemAsset] = []
-    files: list[DesignSystemFile] = []
-
-    # No de-duplication here: ``_iter_safe_entries`` refuses a bundle in which two
-    # entries claim one canonical path, so every ``rel`` it yields is distinct. The
-    # first-wins skip this replaced was the thing that let zip order decide which of
-    # two colliding entries' bytes were stored.
-    for info, rel in _iter_safe_entries(zf, root_prefix, warnings):
-        # Declared CSS token source: retain from the already-read (and budgeted)
-        # bytes — no second read, no double-charge, and only declared sources.
-        if rel in css_sources:
-            data = css_sources[rel]
-            files.append(
-                DesignSystemFile(
-                    path=rel,
-                    kind="css",
-                    mime=_guess_mime(rel),
-                    data=data,
-                    size_bytes=len(data),
+    # Decompression and image probing — the CPU of an import — run on a small
+    # thread pool (zlib and Pillow release the GIL); everything with an ORDER runs
+    # here, in entry order. Each entry becomes one step in ``pipeline``: a callable
+    # that charges the budget, appends the warning, or hands the row to ``writer``
+    # exactly as the sequential loop did, the decode it waits on having been
+    # started up to a window of entries earlier. Iterator warnings are queued as
+    # steps too, so the warnings list comes out in the order a sequential pass
+    # writes it, and an error found while dispatching (a refusal, an over-budget
+    # entry) is raised only after the steps BEFORE it have run — an earlier
+    # entry's failure still wins.
+    pipeline: "collections.deque[Callable[[], None]]" = collections.deque()
+    window = IMPORT_DECODE_WORKERS * 2
+    entry_warnings: list[BundleImportWarning] = []
+
+    def queue_entry_warnings() -> None:
+        if warnings is not None:
+            for warning in entry_warnings:
+                pipeline.append(functools.partial(warnings.append, warning))
+        entry_warnings.clear()
+
+    def drain(keep: int = 0) -> None:
+        while len(pipeline) > keep:
+            pipeline.popleft()()
+
+    with ThreadPoolExecutor(
+        max_workers=IMPORT_DECODE_WORKERS, thread_name_prefix="ds-import"
+    ) as pool:
+        # No de-duplication here: ``_iter_safe_entries`` refuses a bundle in which
+        # two entries claim one canonical path, so every ``rel`` it yields is
+        # distinct. The first-wins skip this replaced was the thing that let zip
+        # order decide which of two colliding entries' bytes were stored.
+        entries = _iter_safe_entries(zf, root_prefix, entry_warnings)
+        while True:
+            try:
+                entry = next(entries, None)
+                queue_entry_warnings()
+                if entry is None:
+                    break
+                step = _dispatch_bundle_entry(
+                    pool, zf, entry, budget, css_sources, writer, warnings
                 )
-            )
-            continue
+            except Exception:
+                queue_entry_warnings()
+                drain()
+                raise
+            if step is not None:
+                pipeline.append(step)
+            drain(keep=window)
+        drain()
+
+
+class _DecodedEntry(NamedTuple):
+    """A bundle entry's bytes plus what the decode worker learned about them."""
+
+    data: bytes
+    mime: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+
+def _decode_bundle_entry(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, rel: str, *, probe: bool
+) -> _DecodedEntry:
+    """Decode worker: decompress one entry and, for an asset, resolve its type and
+    dimensions. ``mime`` is ``None`` for a template thumbnail whose content is not a
+    recognized raster. Pure — no budget, warnings or session access."""
+    data = zf.read(info)
+    if not probe:
+        return _DecodedEntry(data)
+    if _is_template_thumbnail(rel):
+        mime = _sniff_raster_mime(data)
+        if mime is None:
+            return _DecodedEntry(data)
+    else:
+        mime = _guess_mime(rel)
+    width, height = _image_dimensions(data, mime)
+    return _DecodedEntry(data, mime, width, height)
+
+
+def _dispatch_bundle_entry(
+    pool: ThreadPoolExecutor,
+    zf: zipfile.ZipFile,
+    entry: "tuple[zipfile.ZipInfo, str]",
+    budget: "_SizeBudget",
+    css_sources: "dict[str, bytes]",
+    writer: "_BatchedAssetWriter",
+    warnings: "Optional[list[BundleImportWarning]]",
+) -> "Optional[Callable[[], None]]":
+    """Classify one entry, start its decode, and return the in-order step that
+    stores it (``None`` for an entry that is not stored)."""
+    info, rel = entry
+
+    # Declared CSS token source: retain from the already-read (and budgeted)
+    # bytes — no second read, no double-charge, and only declared sources.
+    if rel in css_sources:
+        data = css_sources[rel]
+        return functools.partial(
+            writer.add_file,
+            DesignSystemFile(
+                path=rel,
+                kind="css",
+                mime=_guess_mime(rel),
+                data=data,
+                size_bytes=len(data),
+            ),
+        )
 
-        if not _should_skip(rel) or _is_template_preview(rel):
-            # Storable binary asset: assets/**, fonts/**, or a template folder's
-            # preview screenshot (kind ``template_shot`` — thumbnail material for
-            # the Phase 4 template picker, excluded from brand-asset search).
-            # Size-checked read: the declared size is validated BEFORE
-            # materialisation (bomb guard).
-            data = budget.read_info(zf, info)
-            kind = "template_shot" if _is_template_preview(rel) else _infer_asset_kind(rel)
-            if _is_template_thumbnail(rel):
-                # No extension to guess from, so the type comes from the CONTENT.
-                # Unrecognized bytes are REFUSED rather than stored as
-                # application/octet-stream: a thumbnail is served back to the
-                # browser, so its declared type has to be one we actually verified.
-                # Only THIS entry is dropped — a bundle import is one request, and
-                # one junk screenshot must not cost the whole upload.
-                sniffed = _sniff_raster_mime(data)
-                if sniffed is None:
-                    logger.warning(
-                        "Bundle entry '%s' is not a PNG/JPEG/GIF/WebP image "
-                        "(%d bytes); not stored as a template thumbnail",
-                        rel,
-                        len(data),
-                    )
-                    # A server-side log alone left the user believing the import was
-                    # complete; the same fact rides back on the response.
-                    if warnings is not None:
-                        warnings.append(
-                            BundleImportWarning(
-                                rel,
-                                "not a PNG, JPEG, GIF or WebP image "
-                                f"({len(data)} bytes); this template's thumbnail "
-                                "was not stored.",
-                            )
+    if not _should_skip(rel) or _is_template_preview(rel):
+        # Storable binary asset: assets/**, fonts/**, or a template folder's
+        # preview screenshot (kind ``template_shot`` — thumbnail material for
+        # the Phase 4 template picker, excluded from brand-asset search).
+        # Size-checked read: the declared size is validated BEFORE
+        # materialisation (bomb guard).
+        budget.reserve(info)
+        future = pool.submit(_decode_bundle_entry, zf, info, rel, probe=True)
+        kind = "template_shot" if _is_template_preview(rel) else _infer_asset_kind(rel)
+
+        def store_asset() -> None:
+            decoded = future.result()
+            data = budget.charge(info, decoded.data)
+            if decoded.mime is None:
+                # A template thumbnail has no extension to guess from, so the type
+                # comes from the CONTENT. Unrecognized bytes are REFUSED rather than
+                # stored as application/octet-stream: a thumbnail is served back to
+                # the browser, so its declared type has to be one we actually
+                # verified. Only THIS entry is dropped — a bundle import is one
+                # request, and one junk screenshot must not cost the whole upload.
+                logger.warning(
+                    "Bundle entry '%s' is not a PNG/JPEG/GIF/WebP image "
+                    "(%d bytes); not stored as a template thumbnail",
+                    rel,
+                    len(data),
+                )
+                # A server-side log alone left the user believing the import was
+                # complete; the same fact rides back on the response.
+                if warnings is not None:
+                    warnings.append(
+                        BundleImportWarning(
+                            rel,
+                            "not a PNG, JPEG, GIF or WebP image "
+                            f"({len(data)} bytes); this template's thumbnail "
+                            "was not stored.",
                         )
-                    continue
-                mime = sniffed
-            else:
-                mime = _guess_mime(rel)
-            width, height = _image_dimensions(data, mime)
+                    )
+                return
             asset = DesignSystemAsset(
                 kind=kind,
                 filename=_basename(rel),
-                mime=mime,
+                mime=decoded.mime,
                 data=data,
-                width=width,
-                height=height,
+                width=decoded.width,
+                height=decoded.height,
                 size_bytes=len(data),
             )
-            assets.append(asset)
             # Path-only reference — the bytes are NOT re-stored (no double-store).
-            files.append(
+            writer.add_asset(
+                asset,
                 DesignSystemFile(
                     path=rel,
                     kind="font" if kind == "font" else "asset",
-                    mime=mime,
+                    mime=decoded.mime,
                     data=None,
                     size_bytes=len(data),
                     asset=asset,
-                )
+                ),
             )
-            continue
 
-        source_kind = _classify_source_file(rel)
-        if source_kind:
-            data = budget.read_info(zf, info)
-            files.append(
+        return store_asset
+
+    source_kind = _classify_source_file(rel)
+    if source_kind:
+        budget.reserve(info)
+        future = pool.submit(_decode_bundle_entry, zf, info, rel, probe=False)
+
+        def store_source() -> None:
+            data = budget.charge(info, future.result().data)
+            writer.add_file(
                 DesignSystemFile(
                     path=rel,
                     kind=source_kind,
@@ -2201,7 +2432,8 @@ def _collect_assets_and_files(
                 )
             )
 
-    return assets, files
+        return store_source
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -2227,6 +2459,19 @@ def get_asset_base64(
     ``IS NULL`` filter matches no row and the asset is reported not-found. A deck
     with no active design system therefore resolves NO brand asset by bare id.
     """
+    data, mime = get_asset_bytes(db, asset_id, design_system_id=design_system_id)
+    return base64.b64encode(data).decode("utf-8"), mime
+
+
+def get_asset_bytes(
+    db: Session, asset_id: int, *, design_system_id: Optional[int]
+) -> tuple[bytes, str]:
+    """Return ``(raw_bytes, mime)`` for a stored design-system asset.
+
+    Same ``(id AND design_system_id)`` scoping — and the same fail-closed
+    ``design_system_id=None`` behaviour — as :func:`get_asset_base64`, for
+    callers that transform the bytes (font subsetting) before embedding them.
+    """
     asset = (
         db.query(DesignSystemAsset)
         .filter(
@@ -2239,7 +2484,7 @@ def get_asset_base64(
         raise ValueError(
             f"Design system asset {asset_id} not found in design system {design_system_id}"
         )
-    return base64.b64encode(asset.data).decode("utf-8"), asset.mime
+    return asset.data, asset.mime
 
 
 # ---------------------------------------------------------------------------
@@ -2265,8 +2510,11 @@ def _asset_search_sort_key(asset: Any) -> tuple[int, str, int]:
     ``asset`` is a ``DesignSystemAsset``; it is typed ``Any`` (as the compiler does
     for ORM records) so attribute reads aren't flagged against the SQLAlchemy
     ``Column`` descriptors — this repo runs mypy without the SQLAlchemy plugin.
+
+    The reference ranking: :func:`search_assets` orders in SQL with the same key
+    (see :func:`_asset_search_order_by`) and must agree with this one exactly.
     """
-    kind = (asset.kind or "").lower()
+    kind = asset.kind or ""
     try:
         rank = _ASSET_IMPORTANCE_ORDER.index(kind)
     except ValueError:
@@ -2274,11 +2522,75 @@ def _asset_search_sort_key(asset: Any) -> tuple[int, str, int]:
     return (rank, asset.filename or "", asset.id or 0)
 
 
+def _asset_search_matches(asset: Any, kind_l: Optional[str], query_l: Optional[str]) -> bool:
+    """The reference filter predicate (Python string semantics).
+
+    The stored ``kind`` is the importer's lowercase vocabulary and is compared
+    as-is, exactly as the SQL form does; ``kind_l`` is the folded argument.
+    """
+    asset_kind = asset.kind or ""
+    if asset_kind in _TOOL_EXCLUDED_ASSET_KINDS:
+        return False
+    if kind_l and asset_kind != kind_l:
+        return False
+    return not query_l or query_l in (asset.filename or "").lower()
+
+
+# Characters a LIKE pattern must escape to match literally.
+_LIKE_ESCAPE = "\\"
+_LIKE_SPECIAL = frozenset("%_\\")
+# ASCII letters some NON-ASCII character lowercases to in Python (U+0130 -> "i̇",
+# U+212A KELVIN SIGN -> "k"), so SQL's ASCII-only case folding would miss them.
+_LIKE_UNSAFE_ASCII = frozenset("ik")
+
+
+def _filename_like_pattern(query_l: str) -> tuple[str, bool]:
+    """Case-insensitive LIKE pattern for a lowercased filename substring query.
+
+    Returns ``(pattern, exact)``. SQL case folding (SQLite: ASCII only; PostgreSQL:
+    the database locale) is not Python's ``str.lower``, so only characters both
+    agree on are matched literally — ASCII other than ``i``/``k``. Every other
+    character becomes ``%``, which makes the pattern a SUPERSET of the Python
+    match (``exact`` False); the caller re-applies the Python predicate to it.
+    """
+    parts = []
+    exact = True
+    for ch in query_l:
+        if ch.isascii() and ch not in _LIKE_UNSAFE_ASCII:
+            parts.append(_LIKE_ESCAPE + ch if ch in _LIKE_SPECIAL else ch)
+        else:
+            exact = False
+            if not parts or parts[-1] != "%":
+                parts.append("%")
+    return "%" + "".join(parts) + "%", exact
+
+
+def _asset_search_order_by(db: Session) -> list:
+    """SQL form of :func:`_asset_search_sort_key`.
+
+    Filenames compare by CODE POINT like Python's ``str``: SQLite's default
+    ``BINARY`` collation over UTF-8 already does, PostgreSQL needs ``COLLATE "C"``
+    (its default collation is linguistic).
+    """
+    from sqlalchemy import case
+
+    rank = case(
+        {kind: i for i, kind in enumerate(_ASSET_IMPORTANCE_ORDER)},
+        value=DesignSystemAsset.kind,
+        else_=len(_ASSET_IMPORTANCE_ORDER),
+    )
+    filename = DesignSystemAsset.filename
+    if db.get_bind().dialect.name == "postgresql":
+        filename = filename.collate("C")
+    return [rank, filename, DesignSystemAsset.id]
+
+
 def search_assets(
     db: Session,
     design_system_id: int,
     query: Optional[str] = None,
     kind: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> list[DesignSystemAsset]:
     """Return a design system's brand IMAGE assets, optionally filtered + ranked.
 
@@ -2288,6 +2600,7 @@ def search_assets(
 
     - ``kind``: case-insensitive exact match on the asset kind.
     - ``query``: case-insensitive substring match on the filename.
+    - ``limit``: at most this many rows, the top of the ranking.
 
     When NEITHER filter is given, the full brand-image inventory is returned as a
     sensible RANKED default set (importance order: logo, lockup, icon,
@@ -2295,22 +2608,41 @@ def search_assets(
     yields useful assets. Results are ranked by that same order (then filename,
     id) in every case, so the output is deterministic. The binary ``data`` column
     is deferred — a metadata search never loads asset bytes.
+
+    Filtering, ranking and the limit run in SQL (indexed by ``(design_system_id,
+    kind)`` and, on PostgreSQL, a filename trigram index). The result is the one
+    :func:`_asset_search_matches` + :func:`_asset_search_sort_key` define: kinds
+    are the importer's lowercase ASCII vocabulary, and a query SQL cannot
+    case-fold the way Python does is matched loosely in SQL and re-checked here,
+    unlimited.
     """
-    rows = (
+    kind_l = kind.strip().lower() if kind else None
+    query_l = query.strip().lower() if query else None
+    if kind_l in _TOOL_EXCLUDED_ASSET_KINDS:
+        return []
+
+    # ``kind`` is compared RAW (never wrapped in lower()) so both predicates can
+    # use the (design_system_id, kind) index: the stored value is always one of
+    # the importer's lowercase kinds (_infer_asset_kind), and only the caller's
+    # argument needs folding.
+    q = (
         db.query(DesignSystemAsset)
         .filter(DesignSystemAsset.design_system_id == design_system_id)
+        .filter(DesignSystemAsset.kind.notin_(_TOOL_EXCLUDED_ASSET_KINDS))
         # Defer the bytea column: a metadata search never needs the asset bytes.
         # ``# type: ignore`` covers the SQLAlchemy Column-vs-attribute stubs gap
         # (this repo runs mypy without the SQLAlchemy plugin).
         .options(defer(DesignSystemAsset.data))  # type: ignore[arg-type]
-        .all()
     )
-    result = [a for a in rows if (a.kind or "").lower() not in _TOOL_EXCLUDED_ASSET_KINDS]
-    if kind:
-        kind_l = kind.strip().lower()
-        result = [a for a in result if (a.kind or "").lower() == kind_l]
-    if query:
-        query_l = query.strip().lower()
-        result = [a for a in result if query_l in (a.filename or "").lower()]
-    result.sort(key=_asset_search_sort_key)
-    return result
+    if kind_l:
+        q = q.filter(DesignSystemAsset.kind == kind_l)
+    exact = True
+    if query_l:
+        pattern, exact = _filename_like_pattern(query_l)
+        q = q.filter(DesignSystemAsset.filename.ilike(pattern, escape=_LIKE_ESCAPE))
+    q = q.order_by(*_asset_search_order_by(db))
+    if limit is not None and exact:
+        q = q.limit(limit)
+
+    result = [a for a in q.all() if _asset_search_matches(a, kind_l, query_l)]
+    return result if limit is None else result[:limit]
@@ -5,13 +5,19 @@ MLflow 3.x custom_prompt_judge API.
 """
 
 from src.services.evaluation.llm_judge import (
+    JUDGE_PROMPT_VERSION,
     LLMJudgeResult,
+    evaluate_batch_with_judge,
     evaluate_with_judge,
+    plan_judge_batches,
     RATING_SCORES,
 )
 
 __all__ = [
+    "JUDGE_PROMPT_VERSION",
     "LLMJudgeResult",
+    "evaluate_batch_with_judge",
     "evaluate_with_judge",
+    "plan_judge_batches",
     "RATING_SCORES",
 ]
@@ -17,20 +17,32 @@ MLflow Structure:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from src.core.defaults import DEFAULT_CONFIG
+from src.core.llm_admission import LLMPriority, allm_slot
 from src.core.mlflow_tracing import configure_tracing_environment, create_databricks_experiment
+from src.core.prompt_metrics import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Direct backend batching (evaluate_batch_with_judge): slides per judge call,
+# and the estimated prompt size a batch may reach. 1 disables batching.
+JUDGE_BATCH_MAX_SLIDES = int(os.getenv("JUDGE_BATCH_MAX_SLIDES", "8"))
+JUDGE_BATCH_TOKEN_BUDGET = int(os.getenv("JUDGE_BATCH_TOKEN_BUDGET", "48000"))
+
+# Direct judge prompts truncate the corpus and each slide to this many characters.
+_DIRECT_JUDGE_MAX_CHARS = 100_000
+
 
 # Rating type for feedback (RAG + unknown when source cannot support verification)
 RatingType = Literal["green", "amber", "red", "unknown"]
@@ -117,16 +129,7 @@ JUDGE_INSTRUCTIONS = (
 )
 
 
-_DIRECT_JUDGE_JSON_PROMPT = (
-    "You are verifying that a presentation slide accurately represents "
-    "source data.\n\n"
-    "Return **only** valid JSON (no markdown fences), one object with keys:\n"
-    '- "rating": one of "green", "amber", "red", "unknown"\n'
-    '- "explanation": 2-3 sentences of reasoning\n\n'
-    "## SOURCE DATA (Ground Truth)\n"
-    "{genie_data}\n\n"
-    "## SLIDE CONTENT (To Verify)\n"
-    "{slide_content}\n\n"
+_DIRECT_JUDGE_RULES = (
     "## Rules (summary)\n"
     "- green: numbers and claims match source (formatting differences OK).\n"
     "- amber: mostly correct, minor issues or omissions.\n"
@@ -140,6 +143,45 @@ _DIRECT_JUDGE_JSON_PROMPT = (
 )
 
 
+_DIRECT_JUDGE_JSON_PROMPT = (
+    "You are verifying that a presentation slide accurately represents "
+    "source data.\n\n"
+    "Return **only** valid JSON (no markdown fences), one object with keys:\n"
+    '- "rating": one of "green", "amber", "red", "unknown"\n'
+    '- "explanation": 2-3 sentences of reasoning\n\n'
+    "## SOURCE DATA (Ground Truth)\n"
+    "{genie_data}\n\n"
+    "## SLIDE CONTENT (To Verify)\n"
+    "{slide_content}\n\n"
+) + _DIRECT_JUDGE_RULES
+
+
+# Several slides judged against one copy of the source data (Direct backend,
+# see evaluate_batch_with_judge). Slides are listed as "### SLIDE <id>".
+_DIRECT_JUDGE_BATCH_JSON_PROMPT = (
+    "You are verifying that presentation slides accurately represent "
+    "source data. Judge **each** slide below on its own against the same source data.\n\n"
+    "Return **only** valid JSON (no markdown fences), one object with key "
+    '"results": a list with exactly one entry per slide, each an object with keys:\n'
+    '- "slide_id": the id after "### SLIDE"\n'
+    '- "rating": one of "green", "amber", "red", "unknown"\n'
+    '- "explanation": 2-3 sentences of reasoning\n\n'
+    "## SOURCE DATA (Ground Truth)\n"
+    "{genie_data}\n\n"
+    "## SLIDES (To Verify)\n"
+    "{slides}\n\n"
+) + _DIRECT_JUDGE_RULES
+
+
+# Identifies the judge prompts. Cached verdicts are keyed on it (see
+# src/services/verification_cache.py), so editing either prompt retires them.
+JUDGE_PROMPT_VERSION = hashlib.sha256(
+    "\0".join(
+        (JUDGE_INSTRUCTIONS, _DIRECT_JUDGE_JSON_PROMPT, _DIRECT_JUDGE_BATCH_JSON_PROMPT)
+    ).encode("utf-8")
+).hexdigest()[:16]
+
+
 def _collect_exception_messages(exc: BaseException) -> str:
     """Flatten exception message text across ``__cause__`` and ``__context__`` chains."""
     parts: list[str] = []
@@ -213,11 +255,11 @@ def _evaluate_with_judge_direct_llm(
     from langchain_core.messages import HumanMessage
 
     from src.core.databricks_client import get_system_client
+    from src.services.llm_admission_callback import LLMAdmissionCallback
 
     llm_config = DEFAULT_CONFIG["llm"]
-    max_chars = 100_000
-    gd = genie_data[:max_chars]
-    sc = slide_content[:max_chars]
+    gd = genie_data[:_DIRECT_JUDGE_MAX_CHARS]
+    sc = slide_content[:_DIRECT_JUDGE_MAX_CHARS]
     prompt = _DIRECT_JUDGE_JSON_PROMPT.format(genie_data=gd, slide_content=sc)
 
     chat = ChatDatabricks(
@@ -226,6 +268,7 @@ def _evaluate_with_judge_direct_llm(
         max_tokens=min(2048, int(llm_config.get("max_tokens", 4096))),
         top_p=0.95,
         workspace_client=get_system_client(),
+        callbacks=[LLMAdmissionCallback(model, LLMPriority.VERIFICATION)],
     )
     resp = chat.invoke([HumanMessage(content=prompt)])
     text = (getattr(resp, "content", None) or "").strip()
@@ -385,10 +428,13 @@ async def evaluate_with_judge(
 
         # Run evaluation using mlflow.genai.evaluate() - THIS creates Evaluation Runs
         try:
-            eval_result = mlflow.genai.evaluate(
-                data=eval_data,
-                scorers=[accuracy_judge],
-            )
+            # The judge's model call happens inside MLflow; hold one admission
+            # slot for the whole evaluation.
+            async with allm_slot(model, LLMPriority.VERIFICATION):
+                eval_result = mlflow.genai.evaluate(
+                    data=eval_data,
+                    scorers=[accuracy_judge],
+                )
         except Exception as eval_exc:
             if _mlflow_evaluate_should_use_direct_fallback(eval_exc):
                 logger.warning(
@@ -490,3 +536,186 @@ async def evaluate_with_judge(
             error=True,
             error_message=str(e),
         )
+
+
+# -- Direct backend: several slides per judge call --------------------------
+
+
+def plan_judge_batches(
+    genie_data: str,
+    slides: Sequence[Tuple[str, str]],
+    token_budget: int = JUDGE_BATCH_TOKEN_BUDGET,
+    max_slides: int = JUDGE_BATCH_MAX_SLIDES,
+) -> List[List[str]]:
+    """Group ``(key, slide_html)`` pairs into batches for :func:`evaluate_batch_with_judge`.
+
+    Slides are packed in order while the estimated prompt (one copy of the
+    corpus plus every slide in the batch) stays within ``token_budget`` and
+    the batch within ``max_slides``. A slide that does not fit next to any
+    other gets a batch of its own (judged with the single-slide prompt).
+    """
+    base = estimate_tokens(
+        _DIRECT_JUDGE_BATCH_JSON_PROMPT.format(
+            genie_data=genie_data[:_DIRECT_JUDGE_MAX_CHARS], slides=""
+        )
+    )
+    batches: List[List[str]] = []
+    current: List[str] = []
+    used = base
+    for key, html in slides:
+        cost = estimate_tokens(_format_batch_slide(key, html[:_DIRECT_JUDGE_MAX_CHARS]))
+        if current and (len(current) >= max_slides or used + cost > token_budget):
+            batches.append(current)
+            current, used = [], base
+        current.append(key)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _format_batch_slide(slide_id: str, slide_html: str) -> str:
+    return f"### SLIDE {slide_id}\n{slide_html}\n\n"
+
+
+def _parse_batch_judge_response(text: str, slide_ids: Sequence[str]) -> Dict[str, Tuple[str, str]]:
+    """``{slide_id: (rating, explanation)}`` for every well-formed entry of a batch reply.
+
+    Entries with an unknown id or an invalid rating are dropped; an unparsable
+    reply yields ``{}``. Callers judge whatever is missing one slide at a time.
+    """
+    raw = text.strip()
+    if raw.startswith("```"):
+        raw = re.sub(r"^```(?:json)?\s*", "", raw, flags=re.IGNORECASE)
+        raw = re.sub(r"\s*```\s*$", "", raw)
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return {}
+    entries = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+    wanted = set(slide_ids)
+    parsed: Dict[str, Tuple[str, str]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        slide_id = str(entry.get("slide_id", "")).strip()
+        rating = str(entry.get("rating", "")).strip().lower()
+        if slide_id in wanted and slide_id not in parsed and rating in RATING_SCORES:
+            parsed[slide_id] = (rating, str(entry.get("explanation", "")).strip())
+    return parsed
+
+
+def _evaluate_batch_direct_llm(
+    genie_data: str, slides: Sequence[Tuple[str, str]], model: str
+) -> Dict[str, Tuple[str, str]]:
+    """One ChatDatabricks call judging every slide in ``slides``; returns the parsed entries."""
+    from databricks_langchain import ChatDatabricks
+    from langchain_core.messages import HumanMessage
+
+    from src.core.databricks_client import get_system_client
+    from src.services.llm_admission_callback import LLMAdmissionCallback
+
+    llm_config = DEFAULT_CONFIG["llm"]
+    prompt = _DIRECT_JUDGE_BATCH_JSON_PROMPT.format(
+        genie_data=genie_data[:_DIRECT_JUDGE_MAX_CHARS],
+        slides="".join(
+            _format_batch_slide(slide_id, html[:_DIRECT_JUDGE_MAX_CHARS])
+            for slide_id, html in slides
+        ),
+    )
+    chat = ChatDatabricks(
+        endpoint=model,
+        temperature=0.2,
+        # ~200 tokens of rating + explanation per slide.
+        max_tokens=min(
+            int(llm_config.get("max_tokens", 4096)), max(2048, 256 * len(slides))
+        ),
+        top_p=0.95,
+        workspace_client=get_system_client(),
+        callbacks=[LLMAdmissionCallback(model, LLMPriority.VERIFICATION)],
+    )
+    resp = chat.invoke([HumanMessage(content=prompt)])
+    text = (getattr(resp, "content", None) or "").strip()
+    return _parse_batch_judge_response(text, [slide_id for slide_id, _ in slides])
+
+
+async def evaluate_batch_with_judge(
+    genie_data: str,
+    slides: Mapping[str, str],
+    model: str = DEFAULT_CONFIG["llm"]["endpoint"],
+) -> Dict[str, LLMJudgeResult]:
+    """Judge several slides in one Direct-backend call against one copy of ``genie_data``.
+
+    ``slides`` maps a caller key to slide HTML. Slides the batch reply does
+    not rate (malformed JSON, missing or invalid entries, or a failed call)
+    are judged one at a time with the single-slide Direct prompt, so every
+    key gets a result. Only for the Direct backend: MLflow evaluation runs
+    stay one slide per run.
+    """
+
+    async def judge_one(key: str) -> LLMJudgeResult:
+        try:
+            return await asyncio.to_thread(
+                _evaluate_with_judge_direct_llm,
+                genie_data, slides[key], model, time.time(), None,
+            )
+        except Exception as e:
+            logger.error(f"LLM judge evaluation failed: {e}", exc_info=True)
+            return LLMJudgeResult(
+                score=0,
+                explanation=f"Evaluation failed: {str(e)}",
+                issues=[{"type": "error", "detail": str(e)}],
+                rating="error",
+                duration_ms=0,
+                error=True,
+                error_message=str(e),
+            )
+
+    start_time = time.time()
+    keys = list(slides)
+    if len(keys) == 1:
+        return {keys[0]: await judge_one(keys[0])}
+
+    # Short positional ids keep the reply small and unambiguous.
+    ids = {str(n): key for n, key in enumerate(keys, start=1)}
+    try:
+        parsed = await asyncio.to_thread(
+            _evaluate_batch_direct_llm,
+            genie_data,
+            [(slide_id, slides[key]) for slide_id, key in ids.items()],
+            model,
+        )
+    except Exception as e:
+        logger.warning(
+            "LLM judge batch call failed; judging %d slides one by one: %s", len(keys), e
+        )
+        parsed = {}
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    results: Dict[str, LLMJudgeResult] = {
+        ids[slide_id]: LLMJudgeResult(
+            score=RATING_SCORES[rating],
+            explanation=explanation,
+            issues=[],
+            rating=rating,
+            duration_ms=duration_ms,
+        )
+        for slide_id, (rating, explanation) in parsed.items()
+    }
+
+    missing = [key for key in keys if key not in results]
+    if missing:
+        logger.warning(
+            "LLM judge batch reply rated %d of %d slides; judging the rest one by one",
+            len(results),
+            len(keys),
+        )
+        for key, result in zip(missing, await asyncio.gather(*map(judge_one, missing))):
+            results[key] = result
+    else:
+        logger.info(
+            "LLM judge batch completed: slides=%d duration_ms=%d", len(keys), duration_ms
+        )
+    return results
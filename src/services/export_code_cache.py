@@ -0,0 +1,334 @@
+"""Content-addressed cache of generated per-slide export code.
+
+The LLM-backed converters (``html_to_pptx``, and later Google Slides) generate
+one code snippet per slide on every export. A snippet depends only on the
+slide's HTML, the bytes of the assets it places, the prompt it was generated
+from and the model endpoint, so it is cached under a digest of exactly those
+(:func:`slide_cache_key`) and an unchanged slide skips code generation on the
+next export. Any input change produces a new key — rows are never invalidated,
+only superseded.
+
+Only snippets the converter jail reports as having produced their slide are
+stored; a snippet that was rejected by the import allowlist, raised, or fell
+back to a placeholder is never pinned.
+
+Two tiers:
+
+- ``export_code_cache`` table (shared by every app worker; the source of truth).
+- Optional local-disk tier under ``EXPORT_CODE_CACHE_DIR``: read first, filled
+  from table hits and writes, so a warm worker skips the database round trip.
+
+Configuration (environment):
+
+- ``EXPORT_CODE_CACHE_ENABLED``: ``false`` disables lookups and writes
+  (default ``true``).
+- ``EXPORT_CODE_CACHE_DIR``: directory for the disk tier (unset = table only).
+
+Every cache failure is logged and swallowed: the cache can make an export
+faster, never fail it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+TARGET_PPTX = "pptx"
+TARGET_GSLIDES = "gslides"
+
+
+def cache_enabled() -> bool:
+    """Whether the export code cache is switched on (``EXPORT_CODE_CACHE_ENABLED``)."""
+    return os.getenv("EXPORT_CODE_CACHE_ENABLED", "true").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def prompt_version(*prompts: str) -> str:
+    """Short digest identifying a set of prompt texts.
+
+    Editing a prompt default changes the version and therefore every key built
+    from it, so stale snippets are simply never looked up again.
+    """
+    digest = hashlib.sha256()
+    for prompt in prompts:
+        digest.update((prompt or "").encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def asset_hashes(assets_dir: str, filenames: Iterable[str]) -> List[str]:
+    """``"name:sha256"`` for each asset file, in the given order.
+
+    Names are included because the generated code refers to assets by name;
+    a missing file hashes as ``"name:-"``.
+    """
+    hashes = []
+    for name in filenames:
+        try:
+            data = (Path(assets_dir) / name).read_bytes()
+        except OSError:
+            hashes.append(f"{name}:-")
+            continue
+        hashes.append(f"{name}:{hashlib.sha256(data).hexdigest()}")
+    return hashes
+
+
+def slide_cache_key(
+    target: str,
+    html: str,
+    assets: Sequence[str],
+    prompt_version: str,
+    model_endpoint: str,
+) -> str:
+    """Digest of everything a generated slide snippet depends on.
+
+    The HTML is hashed exactly rather than through ``compute_slide_hash``: that
+    normalisation folds case and whitespace, but generated code copies slide
+    text verbatim, so a re-cased heading must miss.
+    """
+    payload = json.dumps(
+        [
+            target,
+            hashlib.sha256((html or "").encode("utf-8")).hexdigest(),
+            list(assets),
+            prompt_version,
+            model_endpoint,
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def slide_content_hash(html: str, assets: Sequence[str]) -> str:
+    """Digest of a slide's own content: its exact HTML and asset hashes.
+
+    Unlike :func:`slide_cache_key` it leaves out the target, prompt and model,
+    so it identifies what a built page shows — the Google Slides converter
+    keeps it per page to tell which pages a re-export can leave untouched.
+    """
+    payload = json.dumps(
+        [hashlib.sha256((html or "").encode("utf-8")).hexdigest(), list(assets)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def prepared_slide_keys(
+    target: str,
+    slide_inputs: Sequence[Sequence],
+    prompt_version: str,
+    model_endpoint: str,
+) -> List[str]:
+    """:func:`slide_cache_key` for each converter-prepared slide.
+
+    ``slide_inputs`` holds the converters' ``(html, chart_files, content_files,
+    assets_dir)`` tuples. Asset file names are deterministic
+    (``chart_<canvas id>.png``, ``content_image_<n>.<ext>``), so a snippet
+    cached for one export references the same files in the next.
+    """
+    return [
+        slide_cache_key(
+            target,
+            html,
+            asset_hashes(assets_dir, [*chart_files, *content_files]),
+            prompt_version,
+            model_endpoint,
+        )
+        for html, chart_files, content_files, assets_dir in slide_inputs
+    ]
+
+
+class SlideCodeCache:
+    """Two-tier (disk, table) store of slide snippets for one export target.
+
+    Args:
+        target: Converter the snippets belong to (``TARGET_PPTX``, ...).
+        session_factory: Callable returning a DB session; defaults to the app
+            session factory.
+        disk_dir: Root of the disk tier; ``None`` disables it.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        session_factory: Optional[Callable[[], Session]] = None,
+        disk_dir: Optional[str] = None,
+    ):
+        self.target = target
+        self._session_factory = session_factory
+        self.disk_dir = Path(disk_dir) / target if disk_dir else None
+
+    @classmethod
+    def from_env(cls, target: str) -> Optional["SlideCodeCache"]:
+        """Cache configured from the environment, or ``None`` when disabled."""
+        if not cache_enabled():
+            return None
+        return cls(target, disk_dir=os.getenv("EXPORT_CODE_CACHE_DIR") or None)
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from src.core.database import get_session_local
+
+            self._session_factory = get_session_local()
+        return self._session_factory()
+
+    # -- disk tier -------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.py"
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logger.warning("Export code cache: unreadable disk entry %s", path, exc_info=True)
+            return None
+
+    def _disk_put(self, key: str, code: str) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial file.
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(code)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Export code cache: disk write failed for %s", path, exc_info=True)
+
+    # -- public API -------------------------------------------------------------
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """``{key: code}`` for every key with a cached snippet."""
+        wanted = list(dict.fromkeys(k for k in keys if k))
+        found: Dict[str, str] = {}
+        for key in wanted:
+            code = self._disk_get(key)
+            if code is not None:
+                found[key] = code
+        missing = [k for k in wanted if k not in found]
+        if not missing:
+            return found
+
+        from src.database.models import ExportCodeCacheEntry
+
+        try:
+            db = self._session()
+            try:
+                rows = (
+                    db.query(ExportCodeCacheEntry.cache_key, ExportCodeCacheEntry.code)
+                    .filter(
+                        ExportCodeCacheEntry.target == self.target,
+                        ExportCodeCacheEntry.cache_key.in_(missing),
+                    )
+                    .all()
+                )
+                if rows:
+                    (
+                        db.query(ExportCodeCacheEntry)
+                        .filter(
+                            ExportCodeCacheEntry.target == self.target,
+                            ExportCodeCacheEntry.cache_key.in_([r.cache_key for r in rows]),
+                        )
+                        .update(
+                            {
+                                ExportCodeCacheEntry.hit_count: ExportCodeCacheEntry.hit_count + 1,
+                                ExportCodeCacheEntry.last_used_at: datetime.utcnow(),
+                            },
+                            synchronize_session=False,
+                        )
+                    )
+                    db.commit()
+            finally:
+                db.close()
+        except Exception:
+            logger.warning("Export code cache lookup failed", exc_info=True)
+            return found
+
+        for row in rows:
+            found[row.cache_key] = row.code
+            self._disk_put(row.cache_key, row.code)
+        return found
+
+    def put_many(
+        self,
+        entries: Mapping[str, str],
+        *,
+        prompt_version: str,
+        model_endpoint: str,
+    ) -> int:
+        """Store ``{key: code}`` snippets; returns how many new rows were written.
+
+        Keys already present (another worker got there first) are left as-is.
+        """
+        entries = {k: v for k, v in entries.items() if k and v}
+        if not entries:
+            return 0
+        for key, code in entries.items():
+            self._disk_put(key, code)
+
+        from src.database.models import ExportCodeCacheEntry
+
+        written = 0
+        try:
+            db = self._session()
+            try:
+                existing = {
+                    key
+                    for (key,) in db.query(ExportCodeCacheEntry.cache_key).filter(
+                        ExportCodeCacheEntry.target == self.target,
+                        ExportCodeCacheEntry.cache_key.in_(list(entries)),
+                    )
+                }
+                new = [
+                    ExportCodeCacheEntry(
+                        target=self.target,
+                        cache_key=key,
+                        code=code,
+                        prompt_version=prompt_version,
+                        model_endpoint=model_endpoint,
+                    )
+                    for key, code in entries.items()
+                    if key not in existing
+                ]
+                try:
+                    db.add_all(new)
+                    db.commit()
+                    written = len(new)
+                except IntegrityError:
+                    # A concurrent export stored some of the same keys (same
+                    # content); retry row by row so the rest still land.
+                    db.rollback()
+                    for row in new:
+                        db.add(row)
+                        try:
+                            db.commit()
+                            written += 1
+                        except IntegrityError:
+                            db.rollback()
+            finally:
+                db.close()
+        except Exception:
+            logger.warning("Export code cache write failed", exc_info=True)
+        return written
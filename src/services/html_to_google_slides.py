@@ -5,17 +5,30 @@ import ast
 import asyncio
 import base64
 import logging
+import os
 import re
 import shutil
 import tempfile
+import threading
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from databricks.sdk import WorkspaceClient
 
+from src.core.llm_admission import LLMPriority, admitted_call
 from src.services.converter_jail.codeprep import _fix_apostrophe_strings
+from src.services.export_code_cache import (
+    TARGET_GSLIDES,
+    SlideCodeCache,
+    asset_hashes,
+    prepared_slide_keys,
+    prompt_version,
+    slide_content_hash,
+)
 from src.services.google_slides_auth import GoogleSlidesAuth, GoogleSlidesAuthError
 from src.services.google_slides_prompts_defaults import (
     DEFAULT_GSLIDES_SYSTEM_PROMPT,
@@ -27,13 +40,23 @@ logger = logging.getLogger(__name__)
 # Max HTML length passed to the LLM on first generation and on retry (must match).
 GSLIDES_HTML_PROMPT_MAX = 25000
 
-# Cap on concurrent LLM code-generation calls during parallel phase.
+# Cap on one export's concurrent LLM code-generation calls during the parallel
+# phase. The endpoint-wide limit across all callers is src.core.llm_admission.
 MAX_CONCURRENT_LLM = 5
 
 # Retry settings for Google Slides API 429 (rate limit) errors.
 _RETRY_MAX_ATTEMPTS = 5
 _RETRY_BASE_DELAY = 5  # seconds
 
+# Most requests sent in one batchUpdate call (see _AdaptiveBatchExecutor).
+_MAX_BATCH_REQUESTS = 100
+
+# Slides API write quota each user's token bucket paces batchUpdate calls to
+# (the default per-user quota is 60 write requests per minute), and how many
+# calls may go out back to back before pacing starts.
+_WRITE_REQUESTS_PER_MINUTE = int(os.getenv("GSLIDES_WRITE_REQUESTS_PER_MINUTE", "60"))
+_WRITE_BURST = int(os.getenv("GSLIDES_WRITE_BURST", "10"))
+
 # SDR-4437 PR-5: safe basename for a tellr-asset:// filename. No path
 # separators, no leading dot-dot — a plain asset filename only. Both the
 # schema gate (_validate_requests) and the uploader (_upload_and_substitute_assets)
@@ -47,18 +70,91 @@ def _is_rate_limit_error(exc: Exception) -> bool:
     return "429" in msg and ("quota" in msg.lower() or "rate" in msg.lower())
 
 
-def _retry_api_call(fn, *, label: str = "API call"):
-    """Execute *fn()* with exponential backoff on 429 rate-limit errors.
+class _TokenBucket:
+    """Thread-safe token bucket pacing Slides API calls under a per-minute quota.
+
+    Each call takes one token; tokens refill at ``rate_per_minute / 60`` per
+    second up to ``burst``. A caller that finds the bucket empty reserves the
+    next token (the balance goes negative) and sleeps until it is due, so
+    concurrent callers queue in order instead of all waking at once.
+    ``rate_per_minute <= 0`` disables pacing.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int) -> None:
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns seconds waited."""
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self) -> None:
+        """Back every caller off after a 429: owe a full burst before the next call."""
+        if self._rate <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - self._capacity
+
+
+#: One write bucket per Google user: the quota is per user, so every export a
+#: user runs in this process shares one bucket, and users never slow each other.
+_write_limiters: Dict[str, _TokenBucket] = {}
+_write_limiters_lock = threading.Lock()
+
+
+def _write_limiter(user_identity: Optional[str]) -> _TokenBucket:
+    """The Slides write bucket for ``user_identity`` (unknown users share one)."""
+    key = user_identity or ""
+    with _write_limiters_lock:
+        bucket = _write_limiters.get(key)
+        if bucket is None:
+            bucket = _write_limiters[key] = _TokenBucket(
+                _WRITE_REQUESTS_PER_MINUTE, _WRITE_BURST
+            )
+        return bucket
+
+
+def _retry_api_call(fn, *, label: str = "API call", limiter: Optional[_TokenBucket] = None):
+    """Execute *fn()*, retrying 429 rate-limit errors.
 
-    Non-429 errors are raised immediately.  After ``_RETRY_MAX_ATTEMPTS``
-    consecutive 429 failures the last exception is re-raised.
+    With a ``limiter`` every attempt first takes a token from it, and a 429
+    penalizes the bucket instead of sleeping here, so the backoff is shared
+    with every other caller pacing on the same quota. Without one, 429s back
+    off exponentially. Non-429 errors are raised immediately; after
+    ``_RETRY_MAX_ATTEMPTS`` consecutive 429 failures the last exception is
+    re-raised.
     """
     for attempt in range(_RETRY_MAX_ATTEMPTS):
+        if limiter is not None:
+            limiter.acquire()
         try:
             return fn()
         except Exception as exc:
             if not _is_rate_limit_error(exc):
                 raise
+            if limiter is not None:
+                logger.warning(
+                    "%s hit rate limit (attempt %d/%d) — backing off: %s",
+                    label, attempt + 1, _RETRY_MAX_ATTEMPTS, exc,
+                )
+                limiter.penalize()
+                continue
             delay = _RETRY_BASE_DELAY * (2 ** attempt)
             logger.warning(
                 "%s hit rate limit (attempt %d/%d) — retrying in %ds: %s",
@@ -66,6 +162,8 @@ def _retry_api_call(fn, *, label: str = "API call"):
             )
             time.sleep(delay)
     # Final attempt — let any exception propagate.
+    if limiter is not None:
+        limiter.acquire()
     return fn()
 
 
@@ -169,6 +267,8 @@ class _SkipTracker:
 
     def __init__(self) -> None:
         self._failed_ids: set = set()
+        #: Requests that failed on their own and were dropped from the slide.
+        self.dropped = 0
 
     def mark_failed(self, requests: list) -> None:
         """Record objectIds of any create-* requests in *requests* as failed."""
@@ -179,6 +279,16 @@ class _SkipTracker:
                     if obj_id:
                         self._failed_ids.add(obj_id)
 
+    def mark_dropped(self, req: dict) -> None:
+        """Record that *req* failed even when sent alone and was skipped."""
+        self.dropped += 1
+        self.mark_failed([req])
+
+    @property
+    def had_failures(self) -> bool:
+        """Whether any request failed, i.e. the slide may be missing content."""
+        return bool(self._failed_ids) or self.dropped > 0
+
     def should_skip(self, req: dict) -> bool:
         """Return True if *req* targets an objectId whose creation failed."""
         for inner in req.values():
@@ -189,106 +299,179 @@ class _SkipTracker:
 
 
 # ---------------------------------------------------------------------------
-# Chunked batchUpdate proxy
+# Adaptive batchUpdate execution
 # ---------------------------------------------------------------------------
 
-class _ChunkedBatchUpdateRequest:
-    """Deferred batchUpdate call that executes in chunks with per-request retry.
-
-    On a chunk failure the wrapper:
-    1. Logs the chunk index and error for easy debugging.
-    2. Marks any ``create*`` requests in the failed chunk via ``_SkipTracker``.
-    3. Retries each request in the chunk individually.
-    4. On individual failure → logs + skips; continues to the next request.
-
-    This ensures a single bad request drops only itself, not everything that
-    follows in the same batchUpdate call or subsequent calls.
+#: One request queued for _AdaptiveBatchExecutor: the tracker of the slide it
+#: belongs to, that slide's number (for logs) and the request itself.
+_BatchItem = Tuple[_SkipTracker, Any, dict]
+
+
+class _AdaptiveBatchExecutor:
+    """Send batchUpdate requests in as few API calls as possible.
+
+    Requests go out in batches of up to ``max_batch``. A batchUpdate is
+    atomic — a rejected call applied nothing — so on failure the batch is
+    split in half and each half re-sent, recursing until the offending request
+    is alone; it is then dropped and recorded on its slide's ``_SkipTracker``,
+    and requests targeting an object whose creation was dropped are skipped
+    from then on. A clean slide costs one call per ``max_batch`` requests and
+    each bad request roughly ``2 * log2(batch)`` more, where fixed chunks of
+    four cost a call per four requests plus a retry of every request in a
+    failed chunk.
+
+    Every call takes a token from ``limiter``, the Slides write bucket of the
+    user the presentation belongs to (default: the bucket shared by unknown
+    users, see :func:`_write_limiter`).
+    Items carry their own tracker, so one batch can hold several slides'
+    requests (see :func:`_coalesce_slide_batches`).
     """
 
     def __init__(
         self,
         resource,
         presentation_id: str,
-        requests: list,
-        chunk_size: int,
-        slide_num,
-        tracker: _SkipTracker,
+        max_batch: int = _MAX_BATCH_REQUESTS,
+        limiter: Optional[_TokenBucket] = None,
     ) -> None:
         self._resource = resource
         self._presentation_id = presentation_id
-        self._requests = _filter_requests(requests)
-        self._chunk_size = chunk_size
-        self._slide_num = slide_num
-        self._tracker = tracker
+        self._max_batch = max(1, max_batch)
+        self._limiter = limiter if limiter is not None else _write_limiter(None)
+        #: batchUpdate calls made (including retries of rejected batches).
+        self.calls = 0
+
+    def run(self, items: List[_BatchItem]):
+        """Execute ``items`` in order; returns the last successful response."""
+        last_result = None
+        for i in range(0, len(items), self._max_batch):
+            result = self._send(items[i:i + self._max_batch])
+            if result is not None:
+                last_result = result
+        return last_result
 
-    def _do_batch(self, reqs: list):
-        label = f"Slide {self._slide_num} batchUpdate ({len(reqs)} reqs)"
+    def _do_batch(self, reqs: list, slides: str):
+        self.calls += 1
         return _retry_api_call(
             lambda: self._resource.batchUpdate(
                 presentationId=self._presentation_id,
                 body={"requests": reqs},
             ).execute(),
-            label=label,
+            label=f"Slide {slides} batchUpdate ({len(reqs)} reqs)",
+            limiter=self._limiter,
         )
 
-    def execute(self):
-        requests = [r for r in self._requests if not self._tracker.should_skip(r)]
-        if not requests:
+    def _send(self, items: List[_BatchItem]):
+        items = [item for item in items if not item[0].should_skip(item[2])]
+        if not items:
             return None
+        slide_nums = list(dict.fromkeys(str(slide_num) for _t, slide_num, _r in items))
+        slides = slide_nums[0] if len(slide_nums) == 1 else f"{slide_nums[0]}–{slide_nums[-1]}"
+        try:
+            return self._do_batch([req for _t, _s, req in items], slides)
+        except Exception as exc:
+            if len(items) == 1 or _is_rate_limit_error(exc):
+                # Alone and still rejected, or the quota stayed exhausted
+                # through every retry (bisecting would only add calls).
+                for tracker, slide_num, req in items:
+                    logger.warning(
+                        "Slide %s request (%s) failed — skipping: %s",
+                        slide_num, next(iter(req.keys()), "unknown"), exc,
+                    )
+                    tracker.mark_dropped(req)
+                return None
+            logger.info(
+                "Slide %s batchUpdate of %d requests failed — bisecting. Error: %s",
+                slides, len(items), exc,
+            )
+            mid = len(items) // 2
+            left = self._send(items[:mid])
+            right = self._send(items[mid:])
+            return right if right is not None else left
 
-        total_chunks = max(1, (len(requests) + self._chunk_size - 1) // self._chunk_size)
-        last_result = None
 
-        for chunk_idx, i in enumerate(range(0, len(requests), self._chunk_size)):
-            chunk = [r for r in requests[i:i + self._chunk_size]
-                     if not self._tracker.should_skip(r)]
-            if not chunk:
-                continue
+def _request_object_ids(requests: list) -> set:
+    """``objectId`` values the requests create or target."""
+    ids = set()
+    for req in requests:
+        for inner in req.values():
+            if isinstance(inner, dict) and inner.get("objectId"):
+                ids.add(inner["objectId"])
+    return ids
 
-            chunk_num = chunk_idx + 1
-            req_range = f"{i + 1}–{i + len(chunk)}"
-            logger.info(
-                "Slide %s batchUpdate: chunk %d/%d (requests %s)",
-                self._slide_num, chunk_num, total_chunks, req_range,
-            )
 
-            try:
-                last_result = self._do_batch(chunk)
-            except Exception as exc:
-                logger.warning(
-                    "Slide %s chunk %d/%d failed — retrying individually. Error: %s",
-                    self._slide_num, chunk_num, total_chunks, exc,
-                )
-                self._tracker.mark_failed(chunk)
+def _coalesce_slide_batches(slides: list, max_batch: int = _MAX_BATCH_REQUESTS) -> list:
+    """Group consecutive ``(slide_num, requests, ...)`` entries into shared batches.
 
-                for req_idx, req in enumerate(chunk):
-                    if self._tracker.should_skip(req):
-                        continue
-                    req_type = next(iter(req.keys()), "unknown")
-                    try:
-                        last_result = self._do_batch([req])
-                        logger.debug(
-                            "Slide %s chunk %d req %d (%s) succeeded individually",
-                            self._slide_num, chunk_num, req_idx + 1, req_type,
-                        )
-                    except Exception as req_exc:
-                        logger.warning(
-                            "Slide %s chunk %d req %d (%s) failed — skipping: %s",
-                            self._slide_num, chunk_num, req_idx + 1, req_type, req_exc,
-                        )
-                        self._tracker.mark_failed([req])
+    Slides build their own pages, so their requests are independent unless two
+    snippets picked the same ``objectId`` (ids are presentation-wide): such a
+    slide starts a new group, so the clash fails on its own instead of forcing
+    the combined batch to be bisected. Groups stay within ``max_batch``
+    requests; a slide larger than that forms its own group.
+    """
+    groups: list = []
+    current: list = []
+    current_ids: set = set()
+    size = 0
+    for slide in slides:
+        requests = slide[1]
+        ids = _request_object_ids(requests)
+        if current and (ids & current_ids or size + len(requests) > max_batch):
+            groups.append(current)
+            current, current_ids, size = [], set(), 0
+        current.append(slide)
+        current_ids |= ids
+        size += len(requests)
+    if current:
+        groups.append(current)
+    return groups
 
-        return last_result
+
+class _ChunkedBatchUpdateRequest:
+    """Deferred batchUpdate call executed through :class:`_AdaptiveBatchExecutor`.
+
+    A single bad request drops only itself, not everything that follows in the
+    same batchUpdate call or subsequent calls.
+    """
+
+    def __init__(
+        self,
+        resource,
+        presentation_id: str,
+        requests: list,
+        chunk_size: int,
+        slide_num,
+        tracker: _SkipTracker,
+        limiter: Optional[_TokenBucket] = None,
+    ) -> None:
+        self._resource = resource
+        self._presentation_id = presentation_id
+        self._requests = _filter_requests(requests)
+        self._chunk_size = chunk_size
+        self._slide_num = slide_num
+        self._tracker = tracker
+        self._limiter = limiter
+
+    def execute(self):
+        executor = _AdaptiveBatchExecutor(
+            self._resource, self._presentation_id, max_batch=self._chunk_size,
+            limiter=self._limiter,
+        )
+        return executor.run([(self._tracker, self._slide_num, r) for r in self._requests])
 
 
 class _ChunkedPresentations:
     """Proxy for the presentations resource that returns chunked batchUpdate objects."""
 
-    def __init__(self, resource, chunk_size: int, slide_num, tracker: _SkipTracker) -> None:
+    def __init__(
+        self, resource, chunk_size: int, slide_num, tracker: _SkipTracker,
+        limiter: Optional[_TokenBucket] = None,
+    ) -> None:
         self._resource = resource
         self._chunk_size = chunk_size
         self._slide_num = slide_num
         self._tracker = tracker
+        self._limiter = limiter
 
     def batchUpdate(self, presentationId: str, body: dict):  # noqa: N802
         return _ChunkedBatchUpdateRequest(
@@ -298,6 +481,7 @@ class _ChunkedPresentations:
             self._chunk_size,
             self._slide_num,
             self._tracker,
+            self._limiter,
         )
 
     def __getattr__(self, name):
@@ -309,14 +493,18 @@ class _ChunkedSlidesService:
 
     Intercepts ``presentations().batchUpdate(...)`` calls and routes them
     through ``_ChunkedBatchUpdateRequest`` so that large request lists are
-    executed in small, fault-isolated chunks.
+    executed in batches of at most ``chunk_size`` with fault isolation.
     """
 
-    def __init__(self, service, chunk_size: int = 4, slide_num=None) -> None:
+    def __init__(
+        self, service, chunk_size: int = _MAX_BATCH_REQUESTS, slide_num=None,
+        tracker: Optional[_SkipTracker] = None, limiter: Optional[_TokenBucket] = None,
+    ) -> None:
         self._service = service
         self._chunk_size = chunk_size
         self._slide_num = slide_num
-        self._tracker = _SkipTracker()
+        self._tracker = tracker if tracker is not None else _SkipTracker()
+        self._limiter = limiter
 
     def presentations(self):
         return _ChunkedPresentations(
@@ -324,12 +512,101 @@ class _ChunkedSlidesService:
             self._chunk_size,
             self._slide_num,
             self._tracker,
+            self._limiter,
         )
 
     def __getattr__(self, name):
         return getattr(self._service, name)
 
 
+# ---------------------------------------------------------------------------
+# Incremental re-export: keep unchanged pages, rebuild only what changed
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _PageSyncPlan:
+    """Outcome of :func:`_plan_page_sync` for one re-export."""
+
+    # Page objectId each slide ends up on, in deck order.
+    page_ids: List[str]
+    # True where the page is new (created blank) and must be built.
+    rebuild: List[bool]
+    # Structural batchUpdate requests (delete, create, reorder), in order.
+    requests: List[dict] = field(default_factory=list)
+    deleted: int = 0
+
+
+def _plan_page_sync(
+    slide_hashes: List[str],
+    page_map: List[List[str]],
+    live_page_ids: List[str],
+) -> _PageSyncPlan:
+    """Plan the page changes that turn a previous export into the current deck.
+
+    ``page_map`` is the previous export's ``[content hash, page objectId]``
+    list; ``live_page_ids`` the presentation's pages as they are now (the user
+    may have deleted some). A slide whose hash matches a still-live mapped page
+    keeps that page — duplicates pair up in deck order. Every other slide gets a
+    new blank page, and mapped pages no slide claims are deleted. Pages the
+    converter did not create (the leading title page of a fresh presentation,
+    anything the user added) are left alone; the deck is laid out after a
+    leading unmanaged page, if there is one.
+    """
+    live = set(live_page_ids)
+    managed = {page_id for _hash, page_id in page_map if page_id in live}
+    available: Dict[str, deque] = {}
+    for content_hash, page_id in page_map:
+        if page_id in live:
+            available.setdefault(content_hash, deque()).append(page_id)
+
+    page_ids: List[str] = []
+    rebuild: List[bool] = []
+    for content_hash in slide_hashes:
+        pool = available.get(content_hash)
+        if pool:
+            page_ids.append(pool.popleft())
+            rebuild.append(False)
+        else:
+            page_ids.append(f"slide_{uuid.uuid4().hex[:12]}")
+            rebuild.append(True)
+
+    kept = {page_id for page_id, new in zip(page_ids, rebuild) if not new}
+    requests: List[dict] = [
+        {"deleteObject": {"objectId": page_id}}
+        for page_id in live_page_ids
+        if page_id in managed and page_id not in kept
+    ]
+    deleted = len(requests)
+    order = [page_id for page_id in live_page_ids if page_id not in managed or page_id in kept]
+    first_index = 1 if live_page_ids and live_page_ids[0] not in managed else 0
+
+    # Place slides front to back. Everything before ``target`` is already in
+    # its final position, so a kept page is always at or after it.
+    for i, (page_id, new) in enumerate(zip(page_ids, rebuild)):
+        target = first_index + i
+        if new:
+            requests.append({"createSlide": {
+                "objectId": page_id,
+                "insertionIndex": target,
+                "slideLayoutReference": {"predefinedLayout": "BLANK"},
+            }})
+            order.insert(target, page_id)
+        elif order.index(page_id) != target:
+            requests.append({"updateSlidesPosition": {
+                "slideObjectIds": [page_id],
+                "insertionIndex": target,
+            }})
+            order.remove(page_id)
+            order.insert(target, page_id)
+
+    return _PageSyncPlan(
+        page_ids=page_ids,
+        rebuild=rebuild,
+        requests=requests,
+        deleted=deleted,
+    )
+
+
 # ---------------------------------------------------------------------------
 
 class GoogleSlidesConversionError(Exception):
@@ -341,13 +618,21 @@ class HtmlToGoogleSlidesConverter:
 
     DEFAULT_MODEL = "databricks-claude-sonnet-4-5"
 
+    code_cache: Optional[SlideCodeCache] = None
+    #: Google user the export writes as; picks the Slides write quota bucket.
+    user_identity: Optional[str] = None
+
     def __init__(
         self,
         workspace_client: Optional[WorkspaceClient] = None,
         model_endpoint: Optional[str] = None,
         google_auth: Optional[GoogleSlidesAuth] = None,
+        code_cache: Optional[SlideCodeCache] = None,
+        user_identity: Optional[str] = None,
     ):
         self.model_endpoint = model_endpoint or self.DEFAULT_MODEL
+        self.code_cache = code_cache or SlideCodeCache.from_env(TARGET_GSLIDES)
+        self.user_identity = user_identity
 
         if workspace_client:
             self.ws_client = workspace_client
@@ -361,6 +646,10 @@ class HtmlToGoogleSlidesConverter:
         self.USER_PROMPT = DEFAULT_GSLIDES_USER_PROMPT
         logger.info("Google Slides converter initialized", extra={"model": self.model_endpoint})
 
+    @property
+    def _write_limiter(self) -> _TokenBucket:
+        return _write_limiter(self.user_identity)
+
     # -- Public API --------------------------------------------------------
 
     async def convert_slide_deck(
@@ -371,23 +660,39 @@ class HtmlToGoogleSlidesConverter:
         progress_callback: Optional[Callable] = None,
         existing_presentation_id: Optional[str] = None,
         on_presentation_created: Optional[Callable[[str, str], None]] = None,
-    ) -> Dict[str, str]:
+        existing_page_map: Optional[List[List[str]]] = None,
+    ) -> Dict[str, Any]:
         """Convert HTML slides to a Google Slides presentation.
 
         Uses a two-phase approach:
-          Phase 1 — Prepare assets + parallel LLM code generation
+          Phase 1 — Prepare assets + parallel LLM code generation (slides whose
+                    inputs are unchanged since an earlier export reuse the
+                    cached code instead)
           Phase 2 — Sequential Google Slides API execution
 
+        Re-exporting to a presentation this converter built (both
+        ``existing_presentation_id`` and its ``existing_page_map`` given) syncs
+        it in place: pages whose content is unchanged are kept and moved into
+        order, only new or changed slides are built, and stale pages are
+        deleted. Without a page map — or if the presentation is gone — a fresh
+        presentation is created.
+
         Args:
             slides: HTML strings for each slide.
             title: Presentation title.
             chart_images_per_slide: Chart images keyed by canvas ID, per slide.
             progress_callback: Optional ``(current, total, status)`` callback.
-            existing_presentation_id: Optional ID of an existing presentation
-                to overwrite instead of creating a new one.
+            existing_presentation_id: Optional ID of the presentation a
+                previous export of this deck produced.
             on_presentation_created: Optional callback ``(pres_id, url)``
                 fired as soon as the presentation exists in Drive, before
                 any slides are processed.
+            existing_page_map: ``page_map`` returned by that previous export.
+
+        Returns:
+            ``presentation_id``, ``presentation_url`` and ``page_map`` — the
+            ``[slide content hash, page objectId]`` list to pass back as
+            ``existing_page_map`` next time.
         """
         total = len(slides)
         print(f"[GSLIDES_CONVERTER] Converting {total} slides to Google Slides "
@@ -399,27 +704,6 @@ class HtmlToGoogleSlidesConverter:
         except GoogleSlidesAuthError as exc:
             raise GoogleSlidesConversionError(f"Auth failed: {exc}") from exc
 
-        if existing_presentation_id:
-            logger.info(
-                "Ignoring existing presentation %s — creating fresh",
-                existing_presentation_id,
-            )
-
-        try:
-            pres_id = self._create_presentation(slides_service, title)
-        except Exception as exc:
-            raise GoogleSlidesConversionError(
-                f"Failed to create presentation: {exc}"
-            ) from exc
-
-        # Fire early URL callback so the user can open the deck immediately
-        url = f"https://docs.google.com/presentation/d/{pres_id}/edit"
-        if on_presentation_created:
-            try:
-                on_presentation_created(pres_id, url)
-            except Exception:
-                logger.warning("on_presentation_created callback failed", exc_info=True)
-
         # ── Phase 1: Prepare assets + parallel LLM code generation ────────
         if progress_callback:
             try:
@@ -434,43 +718,134 @@ class HtmlToGoogleSlidesConverter:
                 chart_imgs = chart_images_per_slide[i - 1]
             prepared = self._prepare_slide(html_str, chart_imgs, i)
             slide_inputs.append(prepared)
+        slide_hashes = [
+            slide_content_hash(html_str, asset_hashes(assets_dir, [*chart_files, *content_files]))
+            for html_str, chart_files, content_files, assets_dir in slide_inputs
+        ]
+
+        sync: Optional[_PageSyncPlan] = None
+        if existing_presentation_id and existing_page_map:
+            sync = self._sync_existing_presentation(
+                slides_service, drive_service, existing_presentation_id, title,
+                slide_hashes, existing_page_map,
+            )
+        elif existing_presentation_id:
+            logger.info(
+                "No page map for existing presentation %s — creating fresh",
+                existing_presentation_id,
+            )
+
+        if sync is not None:
+            pres_id = existing_presentation_id
+        else:
+            try:
+                pres_id = self._create_presentation(slides_service, title)
+            except Exception as exc:
+                raise GoogleSlidesConversionError(
+                    f"Failed to create presentation: {exc}"
+                ) from exc
+
+        # Fire early URL callback so the user can open the deck immediately
+        url = f"https://docs.google.com/presentation/d/{pres_id}/edit"
+        if on_presentation_created:
+            try:
+                on_presentation_created(pres_id, url)
+            except Exception:
+                logger.warning("on_presentation_created callback failed", exc_info=True)
+
+        # Slides that need their page built: all of them, or only the new and
+        # changed ones when syncing in place.
+        to_build = [i for i in range(total) if sync is None or sync.rebuild[i]]
+        codegen_total = len(to_build)
+
+        cache_keys = self._slide_cache_keys(slide_inputs)
+        cached: Dict[str, str] = {}
+        if self.code_cache is not None and to_build:
+            cached = await asyncio.to_thread(
+                self.code_cache.get_many, [cache_keys[i] for i in to_build],
+            )
+        codes: List[Optional[str]] = [None] * total
+        for i in to_build:
+            codes[i] = cached.get(cache_keys[i]) if cache_keys[i] else None
+        misses = [i for i in to_build if codes[i] is None]
+        hits = codegen_total - len(misses)
+
+        def _ready_message(ready: int) -> str:
+            if hits:
+                return (
+                    f"Generating code: {ready}/{codegen_total} slides ready ({hits} cached)…"
+                )
+            return f"Generating code: {ready}/{codegen_total} slides ready…"
 
-        def _on_codegen_progress(completed: int, codegen_total: int) -> None:
+        def _on_codegen_progress(completed: int, _misses_total: int) -> None:
             if progress_callback:
                 try:
                     progress_callback(
-                        completed, codegen_total,
-                        f"Generating code: {completed}/{codegen_total} slides ready…",
+                        completed + hits, codegen_total, _ready_message(completed + hits),
                     )
                 except Exception:
                     pass
 
+        if sync is not None and progress_callback:
+            try:
+                progress_callback(
+                    0, codegen_total,
+                    f"{total - codegen_total} unchanged slides kept; "
+                    f"rebuilding {codegen_total}…",
+                )
+            except Exception:
+                pass
+        if hits:
+            _on_codegen_progress(0, len(misses))
+
         t0 = time.time()
-        codes = await self._generate_all_codes(slide_inputs, on_codegen_progress=_on_codegen_progress)
+        if misses:
+            generated = await self._generate_all_codes(
+                [slide_inputs[i] for i in misses], on_codegen_progress=_on_codegen_progress,
+            )
+            for i, code in zip(misses, generated):
+                codes[i] = code
         logger.info(
             "Parallel codegen complete",
-            extra={"total_slides": total, "duration_s": f"{time.time() - t0:.1f}"},
+            extra={
+                "total_slides": total,
+                "built_slides": codegen_total,
+                "cached_slides": hits,
+                "duration_s": f"{time.time() - t0:.1f}",
+            },
         )
 
-        # ── Phase 2a: create all slide pages (host-side; page_ids known up front)
-        page_ids = []
-        for i in range(1, total + 1):
-            page_id = f"slide_{uuid.uuid4().hex[:12]}"
-            try:
-                _retry_api_call(
-                    lambda _pid=pres_id, _pg=page_id: slides_service.presentations().batchUpdate(
-                        presentationId=_pid,
-                        body={"requests": [{"createSlide": {
-                            "objectId": _pg,
-                            "slideLayoutReference": {"predefinedLayout": "BLANK"},
-                        }}]},
-                    ).execute(),
-                    label=f"createSlide {i}/{total}",
-                )
-                page_ids.append(page_id)
-            except Exception:
-                logger.error("Failed to create slide %d after retries", i, exc_info=True)
-                page_ids.append(None)
+        # ── Phase 2a: pages to build (host-side; page_ids known up front).
+        # ``page_ids`` holds the page each slide's code fills (None = nothing to
+        # build); ``final_page_ids`` the page each slide ends up on.
+        if sync is not None:
+            final_page_ids: List[Optional[str]] = list(sync.page_ids)
+            page_ids = [
+                page_id if rebuild else None
+                for page_id, rebuild in zip(sync.page_ids, sync.rebuild)
+            ]
+        else:
+            # One batchUpdate for every page; a rejected createSlide only
+            # loses its own page.
+            new_page_ids = [f"slide_{uuid.uuid4().hex[:12]}" for _ in range(total)]
+            trackers = [_SkipTracker() for _ in range(total)]
+            _AdaptiveBatchExecutor(
+                slides_service.presentations(), pres_id, limiter=self._write_limiter,
+            ).run([
+                (trackers[i], i + 1, {"createSlide": {
+                    "objectId": page_id,
+                    "slideLayoutReference": {"predefinedLayout": "BLANK"},
+                }})
+                for i, page_id in enumerate(new_page_ids)
+            ])
+            page_ids = []
+            for i, (page_id, tracker) in enumerate(zip(new_page_ids, trackers), 1):
+                if tracker.had_failures:
+                    logger.error("Failed to create slide %d", i)
+                    page_ids.append(None)
+                else:
+                    page_ids.append(page_id)
+            final_page_ids = list(page_ids)
 
         # ── Phase 2b: emit all batchUpdate requests inside the jail (no network)
         import json as _json
@@ -494,7 +869,16 @@ class HtmlToGoogleSlidesConverter:
             _shutil.rmtree(job_dir, ignore_errors=True)
         by_index = {e["index"]: e for e in emitted}
 
-        # ── Phase 2c: execute per slide on the host (validate, upload, chunked)
+        # ── Phase 2c: validate + upload per slide on the host, then execute.
+        # Consecutive slides share batchUpdate calls (_coalesce_slide_batches).
+        # Snippets whose requests the jail emitted cleanly and the host executed
+        # without dropping a single request are worth caching.
+        verified: Dict[str, str] = {}
+        # Slides that ended up on a fallback page: not mapped by content, so
+        # the next re-export rebuilds them.
+        fell_back: set = set()
+        # (slide number, host-ready requests, tracker, code to cache if clean)
+        ready: List[Tuple[int, list, _SkipTracker, Optional[str]]] = []
         for i, (code, (html_str, chart_files, content_files, assets_dir)) in enumerate(
             zip(codes, slide_inputs), 1,
         ):
@@ -507,32 +891,61 @@ class HtmlToGoogleSlidesConverter:
             if requests is None:
                 logger.warning("Slide %d: no emitted requests, adding fallback", i)
                 self._add_fallback(slides_service, pres_id, page_id, i)
-            else:
-                err = self._execute_slide_requests(
-                    requests, slides_service, drive_service, pres_id, page_id,
-                    assets_dir, i,
+                fell_back.add(i - 1)
+                continue
+
+            prepared, err = self._prepare_slide_requests(requests, drive_service, assets_dir, i)
+            clean_code = None if entry.get("error") else code
+            if err is not None:
+                fixed = await self._retry_with_error(
+                    code, err, html_str, chart_files, content_files,
                 )
-                if err is not None:
-                    fixed = await self._retry_with_error(
-                        code, err, html_str, chart_files, content_files,
-                    )
-                    retry_err = "no-retry-code"
-                    if fixed:
-                        retry_requests = self._emit_single_slide(fixed, html_str, assets_dir, page_id)
-                        if retry_requests is not None:
-                            retry_err = self._execute_slide_requests(
-                                retry_requests, slides_service, drive_service,
-                                pres_id, page_id, assets_dir, i,
-                            )
-                    if retry_err is not None:
-                        logger.warning("Slide %d: all attempts failed, fallback", i)
-                        self._add_fallback(slides_service, pres_id, page_id, i)
+                if fixed:
+                    retry_requests = self._emit_single_slide(fixed, html_str, assets_dir, page_id)
+                    if retry_requests is not None:
+                        prepared, err = self._prepare_slide_requests(
+                            retry_requests, drive_service, assets_dir, i,
+                        )
+                if prepared is None:
+                    logger.warning("Slide %d: all attempts failed, fallback", i)
+                    self._add_fallback(slides_service, pres_id, page_id, i)
+                    fell_back.add(i - 1)
+                    continue
+                clean_code = fixed
+            ready.append((i, prepared, _SkipTracker(), clean_code))
 
+        executor = _AdaptiveBatchExecutor(
+            slides_service.presentations(), pres_id, limiter=self._write_limiter,
+        )
+        for group in _coalesce_slide_batches(ready):
+            executor.run([
+                (tracker, i, req)
+                for i, requests, tracker, _code in group
+                for req in _filter_requests(requests)
+            ])
+            for i, _requests, tracker, clean_code in group:
+                if clean_code and not tracker.had_failures:
+                    verified[cache_keys[i - 1]] = clean_code
             if progress_callback:
+                last = group[-1][0]
                 try:
-                    progress_callback(i, total, f"Building slide {i}/{total}…")
+                    progress_callback(last, total, f"Building slide {last}/{total}…")
                 except Exception:
                     pass
+        logger.info(
+            "Slides built",
+            extra={"slides": len(ready), "batch_update_calls": executor.calls},
+        )
+
+        if self.code_cache is not None:
+            # A cache hit that ran cleanly again needs no rewrite.
+            fresh = {key: code for key, code in verified.items() if key and key not in cached}
+            if fresh:
+                await asyncio.to_thread(
+                    self.code_cache.put_many, fresh,
+                    prompt_version=self._prompt_version(),
+                    model_endpoint=self.model_endpoint,
+                )
 
         # Best-effort Drive cleanup of uploaded asset files (generated code never did this).
         for file_id in getattr(self, "_uploaded_file_ids", []):
@@ -542,61 +955,72 @@ class HtmlToGoogleSlidesConverter:
                 logger.debug("Asset cleanup failed for %s", file_id, exc_info=True)
 
         print(f"[GSLIDES_CONVERTER] Done: {url}")
-        return {"presentation_id": pres_id, "presentation_url": url}
+        page_map = [
+            ["" if i in fell_back else content_hash, page_id]
+            for i, (content_hash, page_id) in enumerate(zip(slide_hashes, final_page_ids))
+            if page_id is not None
+        ]
+        return {"presentation_id": pres_id, "presentation_url": url, "page_map": page_map}
 
     # -- Presentation reuse ------------------------------------------------
 
-    def _try_reuse_presentation(
-        self, slides_service, presentation_id: str, title: str,
-    ) -> Optional[str]:
-        """Try to reuse an existing presentation by clearing all its slides.
-
-        Returns the presentation_id on success, or None if the presentation
-        is inaccessible (deleted, permission revoked, etc.).
+    def _sync_existing_presentation(
+        self,
+        slides_service,
+        drive_service,
+        presentation_id: str,
+        title: str,
+        slide_hashes: List[str],
+        page_map: List[List[str]],
+    ) -> Optional["_PageSyncPlan"]:
+        """Bring an earlier export's pages into line with the deck, in place.
+
+        Reads the presentation's current pages, plans the structural changes
+        (:func:`_plan_page_sync`) and applies them in one atomic
+        ``batchUpdate``. Returns the plan, or None if the presentation is
+        inaccessible (deleted, permission revoked, etc.) or the update was
+        rejected — the caller then builds a fresh presentation.
         """
         try:
-            pres = slides_service.presentations().get(
-                presentationId=presentation_id,
-            ).execute()
-
-            existing_slides = pres.get("slides", [])
-            print(
-                f"[GSLIDES_CONVERTER] Reusing presentation {presentation_id} "
-                f"– clearing {len(existing_slides)} existing slides"
-            )
-
-            # Delete all existing slides
-            if existing_slides:
-                delete_requests = [
-                    {"deleteObject": {"objectId": s["objectId"]}}
-                    for s in existing_slides
-                ]
-                slides_service.presentations().batchUpdate(
+            pres = _retry_api_call(
+                lambda: slides_service.presentations().get(
                     presentationId=presentation_id,
-                    body={"requests": delete_requests},
-                ).execute()
-
-            # Update title if different
-            current_title = pres.get("title", "")
-            if current_title != title:
-                try:
-                    drive_service = self.auth.build_drive_service()
-                    drive_service.files().update(
-                        fileId=presentation_id,
-                        body={"name": title},
-                    ).execute()
-                except Exception:
-                    logger.debug("Could not update presentation title", exc_info=True)
-
-            return presentation_id
-
+                ).execute(),
+                label="Read existing presentation",
+            )
+            live_page_ids = [s["objectId"] for s in pres.get("slides", [])]
+            plan = _plan_page_sync(slide_hashes, page_map, live_page_ids)
+            if plan.requests:
+                _retry_api_call(
+                    lambda: slides_service.presentations().batchUpdate(
+                        presentationId=presentation_id,
+                        body={"requests": plan.requests},
+                    ).execute(),
+                    label="Sync existing presentation pages",
+                    limiter=self._write_limiter,
+                )
         except Exception as exc:
             logger.warning(
-                "Cannot reuse existing presentation %s: %s — creating new one",
+                "Cannot sync existing presentation %s: %s — creating new one",
                 presentation_id, exc,
             )
             return None
 
+        print(
+            f"[GSLIDES_CONVERTER] Syncing presentation {presentation_id}: "
+            f"{plan.rebuild.count(False)} pages kept, {plan.rebuild.count(True)} to build, "
+            f"{plan.deleted} deleted"
+        )
+
+        if pres.get("title", "") != title:
+            try:
+                drive_service.files().update(
+                    fileId=presentation_id, body={"name": title},
+                ).execute()
+            except Exception:
+                logger.debug("Could not update presentation title", exc_info=True)
+        return plan
+
     # -- Presentation creation via native API --------------------------------
 
     def _create_presentation(
@@ -618,19 +1042,12 @@ class HtmlToGoogleSlidesConverter:
         default_slide = pres["slides"][0]
         default_page_id = default_slide["objectId"]
 
-        # Remove default "Click to add title/subtitle" placeholders.
+        # Remove default "Click to add title/subtitle" placeholders (sent in
+        # the same batchUpdate as the title slide content below).
         delete_requests = [
             {"deleteObject": {"objectId": el["objectId"]}}
             for el in default_slide.get("pageElements", [])
         ]
-        if delete_requests:
-            _retry_api_call(
-                lambda: slides_service.presentations().batchUpdate(
-                    presentationId=pres_id,
-                    body={"requests": delete_requests},
-                ).execute(),
-                label="Clear default placeholders",
-            )
 
         emu = lambda inches: int(inches * 914400)  # noqa: E731
         def _rgb(hex_str):
@@ -646,6 +1063,7 @@ class HtmlToGoogleSlidesConverter:
         body_id = f"info_body_{uuid.uuid4().hex[:8]}"
 
         requests = [
+            *delete_requests,
             {"updatePageProperties": {
                 "objectId": default_page_id,
                 "pageProperties": {"pageBackgroundFill": {"solidFill": {"color": {"rgbColor": white}}}},
@@ -699,6 +1117,7 @@ class HtmlToGoogleSlidesConverter:
                 body={"requests": requests},
             ).execute(),
             label="Build title slide",
+            limiter=self._write_limiter,
         )
 
         print(f"[GSLIDES_CONVERTER] Created presentation: {pres_id}")
@@ -709,6 +1128,24 @@ class HtmlToGoogleSlidesConverter:
 
     # -- Slide prep / parallel codegen / execution helpers --------------------
 
+    def _prompt_version(self) -> str:
+        """Version of the code-generation prompts, as used in code cache keys.
+
+        Both prompts default to ``google_slides_prompts_defaults``, so editing
+        those defaults retires every cached snippet.
+        """
+        return prompt_version(self.SYSTEM_PROMPT, self.USER_PROMPT)
+
+    def _slide_cache_keys(
+        self, slide_inputs: List[Tuple[str, List[str], List[str], str]],
+    ) -> List[Optional[str]]:
+        """Code cache key per prepared slide (all ``None`` when caching is off)."""
+        if self.code_cache is None:
+            return [None] * len(slide_inputs)
+        return prepared_slide_keys(
+            TARGET_GSLIDES, slide_inputs, self._prompt_version(), self.model_endpoint,
+        )
+
     def _prepare_slide(
         self, html_str: str, client_chart_images: Optional[Dict[str, str]], slide_num: int,
     ) -> Tuple[str, List[str], List[str], str]:
@@ -824,16 +1261,20 @@ class HtmlToGoogleSlidesConverter:
         """Synchronous LLM call — core implementation used by both async and threaded paths."""
         start = time.time()
         try:
-            resp = self.llm_client.chat.completions.create(
-                model=self.model_endpoint,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-                max_tokens=16384,
-                timeout=300,
-                extra_body={"thinking": {"type": "enabled", "budget_tokens": thinking_budget}},
+            resp = admitted_call(
+                self.model_endpoint,
+                LLMPriority.EXPORT,
+                lambda: self.llm_client.chat.completions.create(
+                    model=self.model_endpoint,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.2,
+                    max_tokens=16384,
+                    timeout=300,
+                    extra_body={"thinking": {"type": "enabled", "budget_tokens": thinking_budget}},
+                ),
             )
             duration = time.time() - start
             logger.info("LLM call completed", extra={"duration_s": f"{duration:.1f}"})
@@ -845,8 +1286,11 @@ class HtmlToGoogleSlidesConverter:
             return None
 
     async def _call_llm(self, system_prompt, user_prompt, thinking_budget: int = 10240):
-        """Async wrapper — delegates to _call_llm_sync."""
-        return self._call_llm_sync(system_prompt, user_prompt, thinking_budget)
+        """Async wrapper — runs _call_llm_sync in a worker thread, since it may
+        wait for admission (see ``src.core.llm_admission``)."""
+        return await asyncio.to_thread(
+            self._call_llm_sync, system_prompt, user_prompt, thinking_budget,
+        )
 
     @staticmethod
     def _classify_error(error_msg: str, original_code: str) -> dict:
@@ -1241,17 +1685,32 @@ class HtmlToGoogleSlidesConverter:
             req["createImage"]["url"] = cache[filename]
         return requests
 
+    def _prepare_slide_requests(self, requests, drive_service, assets_dir, slide_num):
+        """Validate → upload+substitute. Returns ``(requests, None)`` ready to
+        execute, or ``(None, error string)``."""
+        try:
+            self._validate_requests(requests)
+            return self._upload_and_substitute_assets(
+                requests, drive_service, assets_dir,
+            ), None
+        except Exception as exc:
+            logger.warning("Slide %d host preparation failed", slide_num, exc_info=True)
+            return None, str(exc)
+
     def _execute_slide_requests(self, requests, slides_service, drive_service,
-                                pres_id, page_id, assets_dir, slide_num):
-        """Validate → upload+substitute → execute through _ChunkedSlidesService.
-        Returns None on success, error string on failure."""
+                                pres_id, page_id, assets_dir, slide_num, tracker=None):
+        """Validate → upload+substitute → execute one slide through
+        _ChunkedSlidesService. Returns None on success, error string on
+        failure. Requests that fail along the way are recorded on ``tracker``
+        when given."""
         try:
             self._validate_requests(requests)
             requests = self._upload_and_substitute_assets(
                 requests, drive_service, assets_dir,
             )
             wrapped = _ChunkedSlidesService(
-                slides_service, chunk_size=4, slide_num=slide_num,
+                slides_service, slide_num=slide_num, tracker=tracker,
+                limiter=self._write_limiter,
             )
             wrapped.presentations().batchUpdate(
                 presentationId=pres_id, body={"requests": requests},
@@ -1343,6 +1802,7 @@ class HtmlToGoogleSlidesConverter:
         """Add a simple placeholder text box when all code-gen attempts fail."""
         eid = f"fallback_{uuid.uuid4().hex[:8]}"
         try:
+            self._write_limiter.acquire()
             slides_service.presentations().batchUpdate(
                 presentationId=pres_id,
                 body={"requests": [
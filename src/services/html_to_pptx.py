@@ -13,6 +13,13 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from databricks.sdk import WorkspaceClient
 
+from src.core.llm_admission import LLMPriority, admitted_call
+from src.services.export_code_cache import (
+    TARGET_PPTX,
+    SlideCodeCache,
+    prepared_slide_keys,
+    prompt_version,
+)
 from src.services.pptx_prompts_defaults import (
     DEFAULT_SYSTEM_PROMPT,
     DEFAULT_USER_PROMPT_TEMPLATE,
@@ -26,6 +33,7 @@ logger = logging.getLogger(__name__)
 # Lives under src/assets/ so it's included in Databricks Apps deployments.
 PLACEHOLDER_PPTX_PATH = Path(__file__).resolve().parent.parent / "assets" / "placeholder.pptx"
 
+# Per-export codegen fan-out; the endpoint-wide limit is src.core.llm_admission.
 MAX_CONCURRENT_LLM = 5
 
 
@@ -45,24 +53,30 @@ class HtmlToPptxConverterV3:
         model_endpoint: LLM model endpoint name
         ws_client: Databricks workspace client
         llm_client: OpenAI-compatible client for LLM calls
+        code_cache: Store of previously generated slide code (``None`` = off)
     """
     
     # Model configuration
     DEFAULT_MODEL = "databricks-claude-sonnet-4-5"
-    
+
+    code_cache: Optional[SlideCodeCache] = None
 
     def __init__(
         self,
         workspace_client: Optional[WorkspaceClient] = None,
         model_endpoint: Optional[str] = None,
+        code_cache: Optional[SlideCodeCache] = None,
     ):
         """Initialize V3 converter.
         
         Args:
             workspace_client: Databricks client (optional, uses singleton if not provided)
             model_endpoint: LLM model name (default: databricks-claude-sonnet-4-5)
+            code_cache: Slide code cache (default: configured from the environment,
+                see ``src/services/export_code_cache.py``)
         """
         self.model_endpoint = model_endpoint or self.DEFAULT_MODEL
+        self.code_cache = code_cache or SlideCodeCache.from_env(TARGET_PPTX)
         
         # Use provided client or get singleton from databricks_client
         if workspace_client:
@@ -97,7 +111,9 @@ class HtmlToPptxConverterV3:
         """Convert multiple HTML slides to PowerPoint deck.
 
         Uses a two-phase approach:
-          Phase 1 — Prepare assets + parallel LLM code generation
+          Phase 1 — Prepare assets + parallel LLM code generation (slides whose
+                    inputs are unchanged since an earlier export reuse the
+                    cached code instead)
           Phase 2 — Sequential execution against a single Presentation object
 
         Args:
@@ -138,21 +154,43 @@ class HtmlToPptxConverterV3:
             prepared = self._prepare_slide(html_str, chart_imgs, i)
             slide_inputs.append(prepared)
 
+        cache_keys = self._slide_cache_keys(slide_inputs)
+        cached: Dict[str, str] = {}
+        if self.code_cache is not None:
+            cached = await asyncio.to_thread(self.code_cache.get_many, cache_keys)
+        codes: List[Optional[str]] = [cached.get(key) if key else None for key in cache_keys]
+        misses = [i for i, code in enumerate(codes) if code is None]
+        hits = total - len(misses)
+
+        def _ready_message(ready: int) -> str:
+            if hits:
+                return f"Generating code: {ready}/{total} slides ready ({hits} cached)…"
+            return f"Generating code: {ready}/{total} slides ready…"
+
         def _on_codegen_progress(completed: int, codegen_total: int) -> None:
             if progress_callback:
                 try:
-                    progress_callback(
-                        completed, codegen_total,
-                        f"Generating code: {completed}/{codegen_total} slides ready…",
-                    )
+                    progress_callback(completed + hits, total, _ready_message(completed + hits))
                 except Exception:
                     pass
 
+        if hits:
+            _on_codegen_progress(0, len(misses))
+
         t0 = time.time()
-        codes = await self._generate_all_codes(slide_inputs, on_codegen_progress=_on_codegen_progress)
+        if misses:
+            generated = await self._generate_all_codes(
+                [slide_inputs[i] for i in misses], on_codegen_progress=_on_codegen_progress,
+            )
+            for i, code in zip(misses, generated):
+                codes[i] = code
         logger.info(
             "Parallel codegen complete",
-            extra={"total_slides": total, "duration_s": f"{time.time() - t0:.1f}"},
+            extra={
+                "total_slides": total,
+                "cached_slides": hits,
+                "duration_s": f"{time.time() - t0:.1f}",
+            },
         )
 
         # FAIL LOUDLY. If codegen produced nothing for EVERY slide, the jail's
@@ -183,10 +221,24 @@ class HtmlToPptxConverterV3:
         # to_thread: _run_pptx_conversion blocks on proc.wait for the whole
         # deck; convert_slide_deck is async (awaited by the sync route), so the
         # jail wait must come off the event loop.
-        await asyncio.to_thread(
+        slide_results = await asyncio.to_thread(
             self._run_pptx_conversion, codes, slide_inputs, output_path,
             progress_cb=_relay,
         )
+        if self.code_cache is not None and slide_results:
+            # Only freshly generated snippets the jail ran to a real slide are
+            # cached — never one that was rejected, raised or fell back.
+            verified = {
+                cache_keys[i]: codes[i]
+                for i in misses
+                if i < len(slide_results) and slide_results[i] and codes[i]
+            }
+            if verified:
+                await asyncio.to_thread(
+                    self.code_cache.put_many, verified,
+                    prompt_version=self._prompt_version(),
+                    model_endpoint=self.model_endpoint,
+                )
         logger.info(
             "PowerPoint deck created",
             extra={"path": output_path, "slide_count": total},
@@ -260,6 +312,20 @@ class HtmlToPptxConverterV3:
     
     # -- Slide prep / parallel codegen / execution helpers --------------------
 
+    def _prompt_version(self) -> str:
+        """Version of the multi-slide prompts, as used in code cache keys."""
+        return prompt_version(self.MULTI_SLIDE_SYSTEM_PROMPT, self.MULTI_SLIDE_USER_PROMPT)
+
+    def _slide_cache_keys(
+        self, slide_inputs: List[Tuple[str, List[str], List[str], str]],
+    ) -> List[Optional[str]]:
+        """Code cache key per prepared slide (all ``None`` when caching is off)."""
+        if self.code_cache is None:
+            return [None] * len(slide_inputs)
+        return prepared_slide_keys(
+            TARGET_PPTX, slide_inputs, self._prompt_version(), self.model_endpoint,
+        )
+
     def _prepare_slide(
         self, html_str: str, client_chart_images: Optional[Dict[str, str]], slide_num: int,
     ) -> Tuple[str, List[str], List[str], str]:
@@ -442,9 +508,11 @@ class HtmlToPptxConverterV3:
             logger.warning("Could not read the jail manifest back", exc_info=True)
             return min(len(codes), len(slide_inputs))
 
-    def _run_pptx_conversion(self, codes, slide_inputs, output_path, progress_cb=None) -> None:
+    def _run_pptx_conversion(self, codes, slide_inputs, output_path, progress_cb=None) -> tuple:
         """Build the job dir and run the jailed PPTX runner. Raises
-        PPTXConversionError on jail failure/timeout."""
+        PPTXConversionError on jail failure/timeout.
+
+        Returns the runner's per-slide outcomes (``JailResult.slide_results``)."""
         import shutil as _shutil
 
         from src.services.converter_jail import run_pptx_jail
@@ -515,26 +583,31 @@ class HtmlToPptxConverterV3:
                     "back to empty placeholders, so the deck carries no content. Check "
                     "the converter logs for the per-slide failures."
                 )
+        return result.slide_results
 
     def _call_llm_sync(self, system_prompt: str, user_prompt: str) -> Optional[str]:
         """Synchronous LLM call — core implementation used by both async and threaded paths."""
         start = time.time()
         try:
-            response = self.llm_client.chat.completions.create(
-                model=self.model_endpoint,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=16384,
-                timeout=300,
-                extra_body={
-                    "thinking": {
-                        "type": "enabled",
-                        "budget_tokens": 10240,
-                    }
-                },
+            response = admitted_call(
+                self.model_endpoint,
+                LLMPriority.EXPORT,
+                lambda: self.llm_client.chat.completions.create(
+                    model=self.model_endpoint,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.2,
+                    max_tokens=16384,
+                    timeout=300,
+                    extra_body={
+                        "thinking": {
+                            "type": "enabled",
+                            "budget_tokens": 10240,
+                        }
+                    },
+                ),
             )
             duration = time.time() - start
             logger.info("LLM call completed", extra={"duration_s": f"{duration:.1f}"})
@@ -548,8 +621,9 @@ class HtmlToPptxConverterV3:
             return None
 
     async def _call_llm(self, system_prompt: str, user_prompt: str) -> Optional[str]:
-        """Async wrapper — delegates to _call_llm_sync."""
-        return self._call_llm_sync(system_prompt, user_prompt)
+        """Async wrapper — runs _call_llm_sync in a worker thread, since it may
+        wait for admission (see ``src.core.llm_admission``)."""
+        return await asyncio.to_thread(self._call_llm_sync, system_prompt, user_prompt)
     
     @staticmethod
     def _extract_text_content(content) -> str:
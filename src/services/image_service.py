@@ -1,9 +1,15 @@
 """Image upload, thumbnail generation, and retrieval service."""
 import base64
 import logging
+import multiprocessing
+import os
+import threading
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from io import BytesIO
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from PIL import Image as PILImage
 from sqlalchemy import String, cast
@@ -11,13 +17,24 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Query, Session
 
 from src.database.models.image import ImageAsset
+from src.utils.thumbnail_render import render_thumbnail
 
 logger = logging.getLogger(__name__)
 
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-THUMBNAIL_SIZE = (150, 150)
 ALLOWED_TYPES = {"image/png", "image/jpeg", "image/gif", "image/svg+xml"}
 
+THUMBNAIL_STATUS_PENDING = "pending"
+THUMBNAIL_STATUS_READY = "ready"
+THUMBNAIL_STATUS_FAILED = "failed"
+
+# Off-request thumbnail rendering. Pillow decode + LANCZOS resize holds the GIL
+# for hundreds of ms on large PNGs / animated GIFs, so renders run in a small
+# process pool. A byte budget on *decoded* pixels (w * h * 4) caps how much
+# memory concurrent renders can pin, independent of the worker count.
+THUMBNAIL_WORKERS = max(1, int(os.getenv("IMAGE_THUMBNAIL_WORKERS", "2")))
+DECODE_BUDGET_BYTES = max(1, int(os.getenv("IMAGE_DECODE_BUDGET_MB", "256"))) * 1024 * 1024
+
 
 def upload_image(
     db: Session,
@@ -28,12 +45,17 @@ def upload_image(
     tags: Optional[List[str]] = None,
     description: Optional[str] = None,
     category: str = "content",
+    defer_thumbnail: bool = False,
 ) -> ImageAsset:
     """
     Upload an image: validate, generate thumbnail, save to database.
 
     All data (metadata + raw bytes + thumbnail) stored in a single DB row.
     No external storage dependencies.
+
+    With ``defer_thumbnail=True`` the row is saved with ``thumbnail_status =
+    'pending'`` and no thumbnail; the caller hands the bytes to
+    :func:`schedule_thumbnail`, which renders off-request and fills it in.
     """
     # 1. Validate (fail fast, no side effects)
     if mime_type not in ALLOWED_TYPES:
@@ -55,8 +77,15 @@ def upload_image(
                 "Please rename the file or delete the existing image first."
             )
 
-    # 2. Generate thumbnail (in-memory, no side effects)
-    thumbnail_b64 = _generate_thumbnail(file_content, mime_type)
+    # 2. Generate thumbnail (in-memory, no side effects) unless deferred.
+    #    SVGs need no rendering, so they are ready immediately either way.
+    if mime_type == "image/svg+xml":
+        thumbnail_b64, thumbnail_status = None, THUMBNAIL_STATUS_READY
+    elif defer_thumbnail:
+        thumbnail_b64, thumbnail_status = None, THUMBNAIL_STATUS_PENDING
+    else:
+        thumbnail_b64 = render_thumbnail(file_content, mime_type)
+        thumbnail_status = THUMBNAIL_STATUS_READY
 
     # 3. Save everything to database
     image_uuid = str(uuid.uuid4())
@@ -69,6 +98,7 @@ def upload_image(
         size_bytes=len(file_content),
         image_data=file_content,
         thumbnail_base64=thumbnail_b64,
+        thumbnail_status=thumbnail_status,
         tags=tags or [],
         description=description or "",
         category=category,
@@ -188,39 +218,252 @@ def delete_image(db: Session, token: str, user: str) -> None:
     logger.info(f"Soft-deleted image: {image.filename} (id={image.id})")
 
 
-def _generate_thumbnail(content: bytes, mime_type: str) -> Optional[str]:
+# --- Off-request thumbnail pipeline ---
+
+
+class _DecodeBudget:
+    """Counting byte budget bounding the decoded pixel memory of in-flight renders.
+
+    A single render larger than the whole budget is still admitted when nothing
+    else is in flight, so an oversized image degrades to serial, never deadlocks.
     """
-    Generate 150x150 thumbnail as base64 data URI.
 
-    - For raster images: resize with Pillow, maintain aspect ratio
-    - For animated GIFs: extract first frame
-    - For SVGs: return None (render as-is in UI, they scale natively)
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes: int) -> None:
+        with self._cond:
+            while self._in_use and self._in_use + nbytes > self._limit:
+                self._cond.wait()
+            self._in_use += nbytes
+
+    def release(self, nbytes: int) -> None:
+        with self._cond:
+            self._in_use -= nbytes
+            self._cond.notify_all()
+
+
+_decode_budget = _DecodeBudget(DECODE_BUDGET_BYTES)
+_pool_lock = threading.Lock()
+_process_pool: Optional[ProcessPoolExecutor] = None
+_dispatch_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            # spawn, not fork: the app's threads (DB pools, token refresh,
+            # the dispatch threads themselves) hold locks a forked child
+            # would inherit mid-acquire.
+            _process_pool = ProcessPoolExecutor(
+                max_workers=THUMBNAIL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _reset_process_pool() -> None:
+    """Drop a broken pool (a worker died) so the next render starts a fresh one."""
+    global _process_pool
+    with _pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_dispatch_pool() -> ThreadPoolExecutor:
+    """Threads that wait on the process pool and persist results.
+
+    Sized to the process pool so batches fan out across every render worker
+    without queuing unbounded threads behind the decode budget.
     """
+    global _dispatch_pool
+    with _pool_lock:
+        if _dispatch_pool is None:
+            _dispatch_pool = ThreadPoolExecutor(
+                max_workers=THUMBNAIL_WORKERS, thread_name_prefix="image-thumbnail"
+            )
+        return _dispatch_pool
+
+
+def shutdown_thumbnail_pool() -> None:
+    """Stop the thumbnail workers (app shutdown). Pending renders are cancelled."""
+    global _process_pool, _dispatch_pool
+    with _pool_lock:
+        pools = (_dispatch_pool, _process_pool)
+        _dispatch_pool = _process_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _estimate_decode_bytes(content: bytes, mime_type: str) -> int:
+    """Decoded RGBA size of the first frame, from the header only (no pixel decode)."""
     if mime_type == "image/svg+xml":
-        return None
+        return len(content)
+    try:
+        with PILImage.open(BytesIO(content)) as img:
+            width, height = img.size
+        return max(len(content), width * height * 4)
+    except Exception:
+        return len(content)
+
+
+def _render_thumbnail_off_request(content: bytes, mime_type: str) -> Optional[str]:
+    """Render a thumbnail in the process pool, inside the decode budget.
+
+    A broken pool (a worker died — possibly on this very image) is replaced and
+    the render retried once on the fresh pool. Never decoded in-process: an
+    image that kills its worker twice raises ``BrokenProcessPool`` and is
+    marked failed by the caller.
+    """
+    nbytes = _estimate_decode_bytes(content, mime_type)
+    _decode_budget.acquire(nbytes)
+    try:
+        for attempt in range(2):
+            try:
+                # render_thumbnail lives outside src.services so a spawned
+                # worker unpickles it without importing the agent stack.
+                return _get_process_pool().submit(render_thumbnail, content, mime_type).result()
+            except BrokenProcessPool:
+                _reset_process_pool()
+                if attempt:
+                    raise
+                logger.warning("Thumbnail process pool broke; retrying on a fresh pool")
+    finally:
+        _decode_budget.release(nbytes)
+
+
+def _render_and_store_thumbnail(
+    image_id: int,
+    content: bytes,
+    mime_type: str,
+    session_factory: Optional[Callable[[], Session]],
+) -> str:
+    """Render one thumbnail and write it (plus its status) onto the image row."""
+    try:
+        thumbnail_b64 = _render_thumbnail_off_request(content, mime_type)
+        thumbnail_status = THUMBNAIL_STATUS_READY
+    except Exception as e:
+        logger.warning(f"Thumbnail generation failed for image id={image_id}: {e}")
+        thumbnail_b64, thumbnail_status = None, THUMBNAIL_STATUS_FAILED
+
+    if session_factory is None:
+        from src.core.database import get_session_local
+
+        session_factory = get_session_local()
+    db = session_factory()
+    try:
+        image = db.get(ImageAsset, image_id)
+        if image is not None:
+            image.thumbnail_base64 = thumbnail_b64
+            image.thumbnail_status = thumbnail_status
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to store thumbnail for image id={image_id}: {e}", exc_info=True)
+        thumbnail_status = THUMBNAIL_STATUS_FAILED
+    finally:
+        db.close()
+    return thumbnail_status
+
+
+def schedule_thumbnail(
+    image_id: int,
+    content: bytes,
+    mime_type: str,
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> Future:
+    """Render and persist an image's thumbnail off-request.
 
-    img = PILImage.open(BytesIO(content))
+    Pairs with ``upload_image(..., defer_thumbnail=True)``. Calls for several
+    images run in parallel (up to ``IMAGE_THUMBNAIL_WORKERS``), bounded by the
+    decoded-pixel budget. ``session_factory`` defaults to the app session
+    factory; routes pass one bound to their request's engine.
 
-    # For animated GIFs, use first frame
-    if mime_type == "image/gif" and hasattr(img, "n_frames") and img.n_frames > 1:
-        img.seek(0)
+    Returns:
+        Future resolving to the final ``thumbnail_status``.
+    """
+    return _get_dispatch_pool().submit(
+        _render_and_store_thumbnail, image_id, content, mime_type, session_factory
+    )
 
-    # Convert palette/CMYK to RGB(A)
-    if img.mode not in ("RGB", "RGBA"):
-        img = img.convert("RGBA" if "A" in (img.mode or "") else "RGB")
 
-    # Resize maintaining aspect ratio
-    img.thumbnail(THUMBNAIL_SIZE, PILImage.Resampling.LANCZOS)
+def _rerender_stored_thumbnail(
+    image_id: int,
+    claimed_before: datetime,
+    session_factory: Callable[[], Session],
+) -> Optional[str]:
+    """Claim a stale ``pending`` row and render its thumbnail from the stored bytes.
 
-    # Encode as PNG (supports transparency) or JPEG
-    buffer = BytesIO()
-    if img.mode == "RGBA":
-        img.save(buffer, format="PNG")
-        thumb_mime = "image/png"
-    else:
-        img.save(buffer, format="JPEG", quality=85)
-        thumb_mime = "image/jpeg"
+    The claim is a conditional update of ``updated_at``: when several app
+    workers sweep at boot, only the first one to reach a row renders it.
+    Returns the final status, or ``None`` if the row was claimed elsewhere.
+    """
+    db = session_factory()
+    try:
+        claimed = (
+            db.query(ImageAsset)
+            .filter(
+                ImageAsset.id == image_id,
+                ImageAsset.thumbnail_status == THUMBNAIL_STATUS_PENDING,
+                ImageAsset.updated_at < claimed_before,
+            )
+            .update({ImageAsset.updated_at: datetime.utcnow()}, synchronize_session=False)
+        )
+        db.commit()
+        if not claimed:
+            return None
+        row = (
+            db.query(ImageAsset.image_data, ImageAsset.mime_type)
+            .filter(ImageAsset.id == image_id)
+            .one()
+        )
+    finally:
+        db.close()
+    return _render_and_store_thumbnail(image_id, row.image_data, row.mime_type, session_factory)
+
+
+def reschedule_pending_thumbnails(
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> List[Future]:
+    """Re-queue renders for rows a previous process left ``pending``.
+
+    Shutdown cancels queued renders and a crash or restart drops in-flight
+    ones, leaving their rows ``pending`` forever. Called once at app startup:
+    every active row still ``pending`` and last touched before now is
+    rendered again from its stored original.
 
-    buffer.seek(0)
-    b64 = base64.b64encode(buffer.read()).decode("utf-8")
-    return f"data:{thumb_mime};base64,{b64}"
+    Returns:
+        One future per row found (each resolves to the final status, or
+        ``None`` when another worker claimed the row first).
+    """
+    if session_factory is None:
+        from src.core.database import get_session_local
+
+        session_factory = get_session_local()
+    started_at = datetime.utcnow()
+    db = session_factory()
+    try:
+        image_ids = [
+            image_id
+            for (image_id,) in db.query(ImageAsset.id).filter(
+                ImageAsset.thumbnail_status == THUMBNAIL_STATUS_PENDING,
+                ImageAsset.is_active.is_(True),
+                ImageAsset.updated_at < started_at,
+            )
+        ]
+    finally:
+        db.close()
+
+    if image_ids:
+        logger.info(f"Re-rendering {len(image_ids)} thumbnails left pending by a restart")
+    return [
+        _get_dispatch_pool().submit(
+            _rerender_stored_thumbnail, image_id, started_at, session_factory
+        )
+        for image_id in image_ids
+    ]
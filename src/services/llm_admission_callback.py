@@ -0,0 +1,73 @@
+"""LLM callback admitting LangChain model calls through the endpoint governor.
+
+Attached to ChatDatabricks models. Each call waits for admission
+(``src.core.llm_admission``) when it starts and frees its slot when it ends or
+fails; a rate-limit failure pauses the endpoint's admissions for every caller.
+Blocking in ``on_chat_model_start`` is what delays the request: LangChain runs
+synchronous handlers before sending it.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from src.core.llm_admission import (
+    EndpointGovernor,
+    LLMPriority,
+    current_priority,
+    get_governor,
+    is_rate_limit_error,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LLMAdmissionCallback(BaseCallbackHandler):
+    """Hold an admission slot on ``endpoint`` for each model call.
+
+    Args:
+        endpoint: Serving endpoint the model calls.
+        priority: Fixed priority for the model's calls; ``None`` uses the
+            enclosing :func:`~src.core.llm_admission.llm_priority` block
+            (chat by default).
+    """
+
+    def __init__(self, endpoint: str, priority: Optional[LLMPriority] = None) -> None:
+        self.endpoint = endpoint
+        self.priority = priority
+        self._held: Dict[UUID, EndpointGovernor] = {}
+        self._lock = threading.Lock()
+
+    def _admit(self, run_id: UUID) -> None:
+        governor = get_governor(self.endpoint)
+        governor.acquire(current_priority() if self.priority is None else self.priority)
+        with self._lock:
+            self._held[run_id] = governor
+
+    def _release(self, run_id: UUID) -> Optional[EndpointGovernor]:
+        with self._lock:
+            governor = self._held.pop(run_id, None)
+        if governor is not None:
+            governor.release()
+        return governor
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, run_id: UUID,
+                            **kwargs: Any) -> None:
+        self._admit(run_id)
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, run_id: UUID,
+                     **kwargs: Any) -> None:
+        self._admit(run_id)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        governor = self._release(run_id)
+        if governor is not None:
+            governor.record_success()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        governor = self._release(run_id)
+        if governor is not None and is_rate_limit_error(error):
+            governor.record_rate_limited()
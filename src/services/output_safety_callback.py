@@ -0,0 +1,98 @@
+"""LLM callback that stops a generation as soon as it emits an unsafe pattern.
+
+The output safety gate (``agent._run_output_safety_gate``) checks the finished
+output, so a forbidden construct written early in a long deck used to cost the
+whole completion before the corrective regeneration could even start. This
+callback feeds every streamed token to an
+:class:`~src.utils.html_safety.IncrementalSafetyScanner` and raises
+:class:`UnsafeOutputAbortError` on the first finding; ``raise_error`` makes
+LangChain propagate it, which closes the model stream. The caller hands the
+partial output to the gate, whose batch scan finds the same pattern and
+starts the corrective retry at once.
+
+Only runs whose text contains markup are scanned: tool-calling turns carry
+short reasoning prose, which never reaches the gate, while the slide HTML
+run does.
+
+Configuration (environment):
+
+- ``OUTPUT_SAFETY_STREAM_ABORT``: ``false`` disables the early abort; the
+  gate then sees the full output as before (default ``true``).
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from src.utils.html_safety import IncrementalSafetyScanner
+
+logger = logging.getLogger(__name__)
+
+_MARKUP_RE = re.compile(r"<[A-Za-z!]")
+
+
+def stream_abort_enabled() -> bool:
+    """Whether unsafe generations are stopped mid-stream (``OUTPUT_SAFETY_STREAM_ABORT``)."""
+    return os.getenv("OUTPUT_SAFETY_STREAM_ABORT", "true").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+class UnsafeOutputAbortError(Exception):
+    """Raised from the token stream when the output contains an unsafe pattern.
+
+    Attributes:
+        findings: Scanner findings that triggered the abort.
+        partial_output: Text generated up to the abort.
+    """
+
+    def __init__(self, findings: List[str], partial_output: str):
+        super().__init__("LLM output stopped early: unsafe pattern detected")
+        self.findings = findings
+        self.partial_output = partial_output
+
+
+class OutputSafetyAbortCallback(BaseCallbackHandler):
+    """Scan streamed tokens per LLM run; raise :class:`UnsafeOutputAbortError` on a finding."""
+
+    raise_error = True
+
+    def __init__(self) -> None:
+        self._scanners: Dict[Optional[UUID], IncrementalSafetyScanner] = {}
+        self._armed: set = set()
+        self._lock = threading.Lock()
+
+    def on_llm_new_token(
+        self, token: str, *, run_id: Optional[UUID] = None, **kwargs: Any
+    ) -> None:
+        if not token or not isinstance(token, str):
+            return
+        with self._lock:
+            scanner = self._scanners.setdefault(run_id, IncrementalSafetyScanner())
+        findings = scanner.feed(token)
+        if run_id not in self._armed:
+            if not _MARKUP_RE.search(scanner.text):
+                return
+            self._armed.add(run_id)
+            # Findings settled before the run looked like HTML count too.
+            findings = scanner.findings
+        if findings:
+            raise UnsafeOutputAbortError(findings, scanner.text)
+
+    def on_llm_end(self, response: Any, *, run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._forget(run_id)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: Optional[UUID] = None, **kwargs: Any
+    ) -> None:
+        self._forget(run_id)
+
+    def _forget(self, run_id: Optional[UUID]) -> None:
+        with self._lock:
+            self._scanners.pop(run_id, None)
+        self._armed.discard(run_id)
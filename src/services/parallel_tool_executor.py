@@ -0,0 +1,217 @@
+"""Agent executor that runs one turn's independent tool calls concurrently.
+
+LangChain's ``AgentExecutor`` runs the tool calls of a model turn one after
+another, so a turn that asks two Genie spaces and a vector index waits for
+the sum of their latencies. :class:`ParallelToolAgentExecutor` runs them on a
+bounded thread pool instead:
+
+- Calls to **different** tools run concurrently, at most
+  ``AGENT_MAX_PARALLEL_TOOLS`` at a time (default 4, ``1`` disables).
+  Repeated calls to the **same** tool stay sequential: they share that
+  tool's state, e.g. one Genie conversation.
+- Each worker runs in a copy of the caller's context
+  (``contextvars.copy_context``), so the request's user client, identity
+  and LLM priority resolve inside tools exactly as they do sequentially.
+- Observations are returned to the model in the order it asked for them.
+  Callback handlers that implement ``ordered_tool_runs(run_ids)`` (the
+  streaming handler) receive tool start and end events in that order too.
+- The time saved (summed tool time minus wall-clock time) is kept in
+  :attr:`ParallelToolAgentExecutor.tool_stats` for the agent's span and
+  metadata.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Iterator, Optional
+
+from langchain_classic.agents import AgentExecutor
+from langchain_classic.agents.tools import InvalidTool
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import CallbackManagerForChainRun
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+MAX_PARALLEL_TOOLS = int(os.getenv("AGENT_MAX_PARALLEL_TOOLS", "4"))
+
+# Placeholder observation: the action is run later by _run_actions.
+_DEFERRED = object()
+
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """``AgentExecutor`` whose tool calls within one model turn run concurrently."""
+
+    max_parallel_tools: int = MAX_PARALLEL_TOOLS
+
+    _tool_stats: dict = PrivateAttr(
+        default_factory=lambda: {
+            "parallel_batches": 0,
+            "tool_seconds": 0.0,
+            "wall_seconds": 0.0,
+            "saved_seconds": 0.0,
+        }
+    )
+    _stats_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def tool_stats(self) -> dict:
+        """Totals over every parallel batch this executor has run."""
+        with self._stats_lock:
+            return {k: round(v, 3) for k, v in self._tool_stats.items()}
+
+    def _iter_next_step(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        inputs: dict[str, str],
+        intermediate_steps: list[tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Iterator[AgentFinish | AgentAction | AgentStep]:
+        # The base class plans, yields the turn's actions, then "performs"
+        # each one; _perform_agent_action below only defers them so the whole
+        # turn can be run together.
+        deferred: list[AgentAction] = []
+        for item in super()._iter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            if isinstance(item, AgentStep) and item.observation is _DEFERRED:
+                deferred.append(item.action)
+            else:
+                yield item
+        if deferred:
+            yield from self._run_actions(deferred, name_to_tool_map, color_mapping, run_manager)
+
+    def _perform_agent_action(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        agent_action: AgentAction,
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> AgentStep:
+        return AgentStep(action=agent_action, observation=_DEFERRED)
+
+    def _run_actions(
+        self,
+        actions: list[AgentAction],
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        run_manager: Optional[CallbackManagerForChainRun],
+    ) -> Iterator[AgentStep]:
+        by_tool: "OrderedDict[str, list[int]]" = OrderedDict()
+        for i, action in enumerate(actions):
+            by_tool.setdefault(action.tool, []).append(i)
+
+        run_ids = [uuid.uuid4() for _ in actions]
+        for action in actions:
+            if run_manager:
+                run_manager.on_agent_action(action, color="green")
+
+        if len(by_tool) < 2 or self.max_parallel_tools < 2:
+            for action, run_id in zip(actions, run_ids):
+                yield AgentStep(
+                    action=action,
+                    observation=self._run_tool(
+                        action, run_id, name_to_tool_map, color_mapping, run_manager
+                    ),
+                )
+            return
+
+        observations: list[Any] = [None] * len(actions)
+        errors: list[Optional[BaseException]] = [None] * len(actions)
+        durations = [0.0] * len(actions)
+
+        def run_group(indices: list[int]) -> None:
+            for i in indices:
+                started = time.monotonic()
+                try:
+                    observations[i] = self._run_tool(
+                        actions[i], run_ids[i], name_to_tool_map, color_mapping, run_manager
+                    )
+                except BaseException as e:  # re-raised below, in call order
+                    errors[i] = e
+                    return
+                finally:
+                    durations[i] = time.monotonic() - started
+
+        handlers = run_manager.handlers if run_manager else []
+        started = time.monotonic()
+        with ExitStack() as ordered:
+            for handler in handlers:
+                order = getattr(handler, "ordered_tool_runs", None)
+                if order is not None:
+                    ordered.enter_context(order(run_ids))
+            workers = min(self.max_parallel_tools, len(by_tool))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent-tool") as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run_group, indices)
+                    for indices in by_tool.values()
+                ]
+                for future in futures:
+                    future.result()
+        wall = time.monotonic() - started
+        self._record(len(actions), sum(durations), wall)
+
+        for action, observation, error in zip(actions, observations, errors):
+            if error is not None:
+                raise error
+            yield AgentStep(action=action, observation=observation)
+
+    def _run_tool(
+        self,
+        agent_action: AgentAction,
+        run_id: uuid.UUID,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        run_manager: Optional[CallbackManagerForChainRun],
+    ) -> Any:
+        """Run one tool call (``AgentExecutor._perform_agent_action`` minus the announcement)."""
+        tool_run_kwargs = self._action_agent.tool_run_logging_kwargs()
+        callbacks = run_manager.get_child() if run_manager else None
+        tool = name_to_tool_map.get(agent_action.tool)
+        if tool is None:
+            return InvalidTool().run(
+                {
+                    "requested_tool_name": agent_action.tool,
+                    "available_tool_names": list(name_to_tool_map.keys()),
+                },
+                verbose=self.verbose,
+                color=None,
+                callbacks=callbacks,
+                run_id=run_id,
+                **tool_run_kwargs,
+            )
+        if tool.return_direct:
+            tool_run_kwargs["llm_prefix"] = ""
+        return tool.run(
+            agent_action.tool_input,
+            verbose=self.verbose,
+            color=color_mapping[agent_action.tool],
+            callbacks=callbacks,
+            run_id=run_id,
+            **tool_run_kwargs,
+        )
+
+    def _record(self, calls: int, tool_seconds: float, wall_seconds: float) -> None:
+        saved = max(0.0, tool_seconds - wall_seconds)
+        with self._stats_lock:
+            self._tool_stats["parallel_batches"] += 1
+            self._tool_stats["tool_seconds"] += tool_seconds
+            self._tool_stats["wall_seconds"] += wall_seconds
+            self._tool_stats["saved_seconds"] += saved
+        logger.info(
+            "Ran tool calls concurrently",
+            extra={
+                "tool_calls": calls,
+                "tool_seconds": round(tool_seconds, 2),
+                "wall_seconds": round(wall_seconds, 2),
+                "saved_seconds": round(saved, 2),
+            },
+        )
@@ -0,0 +1,59 @@
+"""LLM callback reporting serving-endpoint prompt-cache use.
+
+Attached to the agent's ChatDatabricks model. After every call it reads the
+usage block the endpoint returned and, when that includes cached input tokens,
+logs them and records them for ``GET /api/admin/prompt-budget``. Endpoints
+that do not report cache use are silently skipped.
+"""
+
+import logging
+from typing import Any, Iterator, Mapping
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.core.prompt_metrics import cache_usage, record_cache_usage
+
+logger = logging.getLogger(__name__)
+
+
+def _usage_blocks(response: LLMResult) -> Iterator[Mapping[str, Any]]:
+    """Candidate usage blocks: the call's ``llm_output``, then per-message ones."""
+    llm_output = response.llm_output or {}
+    for key in ("token_usage", "usage"):
+        if isinstance(llm_output.get(key), Mapping):
+            yield llm_output[key]
+    # ChatDatabricks passes the endpoint's raw usage dict as llm_output itself.
+    if llm_output:
+        yield llm_output
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            if message is None:
+                continue
+            if getattr(message, "usage_metadata", None):
+                yield message.usage_metadata
+            metadata = getattr(message, "response_metadata", None) or {}
+            if metadata.get("usage"):
+                yield metadata["usage"]
+
+
+class PromptCacheUsageCallback(BaseCallbackHandler):
+    """Record cached-input-token counts reported by the serving endpoint."""
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for usage in _usage_blocks(response):
+            counts = cache_usage(usage)
+            if counts is None:
+                continue
+            input_tokens, cached_tokens = counts
+            record_cache_usage(input_tokens, cached_tokens)
+            logger.info(
+                "LLM prompt cache usage",
+                extra={
+                    "input_tokens": input_tokens,
+                    "cached_input_tokens": cached_tokens,
+                    "run_id": str(kwargs.get("run_id") or ""),
+                },
+            )
+            return
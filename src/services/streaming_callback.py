@@ -3,19 +3,38 @@
 This callback handler:
 1. Emits SSE events to a queue for real-time streaming to the client
 2. Persists all messages to the database for conversation history
+
+Tool events are tracked per LangChain ``run_id``: the agent may run several
+tool calls of one turn concurrently (``parallel_tool_executor``), and
+:meth:`StreamingCallbackHandler.ordered_tool_runs` then keeps their
+``tool_call`` and ``tool_result`` messages in the order the model asked for
+them rather than the order the tools happened to finish.
+
+Slides are also streamed before the LLM finishes: every token is fed to an
+:class:`~src.utils.html_utils.IncrementalSlideScanner`, and each slide root
+whose closing tag has arrived is emitted as a ``slide_ready`` event carrying
+provisional HTML. The parse of the complete output (``complete`` event)
+stays authoritative; ``slide_ready`` events are neither persisted nor
+replayed by the polling endpoint.
 """
 
 import json
 import logging
 import queue
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
+from uuid import UUID
 
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
 from src.api.schemas.streaming import StreamEvent, StreamEventType
+from src.services.output_safety_callback import UnsafeOutputAbortError
 from src.utils.html_safety import scan_html_for_unsafe_patterns
+from src.utils.html_utils import IncrementalSlideScanner
 
 if TYPE_CHECKING:
     from src.api.services.session_manager import SessionManager
@@ -23,6 +42,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _OrderedGate:
+    """Emits events for a known sequence of tool runs in that sequence."""
+
+    def __init__(self, run_ids: List[UUID]):
+        self._order = list(run_ids)
+        self._members = set(run_ids)
+        self._next = 0
+        self._held: Dict[UUID, Callable[[], None]] = {}
+
+    def submit(self, run_id: Optional[UUID], emit: Callable[[], None]) -> bool:
+        """Hold ``emit`` until every earlier run has emitted; False if not a member."""
+        if run_id not in self._members:
+            return False
+        self._held[run_id] = emit
+        while self._next < len(self._order) and self._order[self._next] in self._held:
+            self._held.pop(self._order[self._next])()
+            self._next += 1
+        return True
+
+    def flush(self) -> None:
+        """Emit whatever is still held (runs that never reported are skipped)."""
+        for run_id in self._order[self._next:]:
+            emit = self._held.pop(run_id, None)
+            if emit is not None:
+                emit()
+        self._next = len(self._order)
+
+
 class StreamingCallbackHandler(BaseCallbackHandler):
     """Callback that emits SSE events AND persists messages to database.
 
@@ -54,7 +101,16 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         self.session_id = session_id
         self.request_id = request_id
         self._session_manager = None
-        self._current_tool_name: Optional[str] = None
+        self._tool_names: Dict[Optional[UUID], str] = {}
+        self._order_lock = threading.RLock()
+        self._start_gate: Optional[_OrderedGate] = None
+        self._end_gate: Optional[_OrderedGate] = None
+        self._started = time.perf_counter()
+        self._slide_run_id: Optional[UUID] = None
+        self._slide_scanner = IncrementalSlideScanner()
+        self._slides_in_run = 0
+        self._slides_streamed = 0
+        self._first_slide_ms: Optional[int] = None
 
     @property
     def session_manager(self) -> "SessionManager":
@@ -64,6 +120,63 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             self._session_manager = get_session_manager()
         return self._session_manager
 
+    def on_llm_new_token(
+        self, token: str, *, run_id: Optional[UUID] = None, **kwargs: Any
+    ) -> None:
+        """Feed a streamed token to the slide scanner; emit slides it completes.
+
+        Each LLM run (a retry or a safety-gate rebuild is a new run) gets a
+        fresh scanner, so ``slide_index`` restarts at 0 for its output.
+
+        Args:
+            token: Newly generated text
+            run_id: LangChain run id of the LLM call
+            **kwargs: Additional arguments from LangChain
+        """
+        if run_id != self._slide_run_id:
+            self._slide_run_id = run_id
+            self._slide_scanner = IncrementalSlideScanner()
+            self._slides_in_run = 0
+        if not isinstance(token, str):
+            return
+        for html in self._slide_scanner.feed(token):
+            self._emit_slide_ready(html)
+
+    def _emit_slide_ready(self, html: str) -> None:
+        index = self._slides_in_run
+        self._slides_in_run += 1
+        # Same gate as on_llm_end: unsafe output is rebuilt, never shown.
+        if scan_html_for_unsafe_patterns(html):
+            logger.warning(
+                "Skipping slide_ready for unsafe slide HTML",
+                extra={"session_id": self.session_id, "slide_index": index},
+            )
+            return
+
+        self._slides_streamed += 1
+        if self._first_slide_ms is None:
+            self._first_slide_ms = round((time.perf_counter() - self._started) * 1000)
+            logger.info(
+                "First slide streamed",
+                extra={"session_id": self.session_id, "first_slide_ms": self._first_slide_ms},
+            )
+        self.event_queue.put(
+            StreamEvent(type=StreamEventType.SLIDE_READY, slide_index=index, slide_html=html)
+        )
+
+    def slide_stream_stats(self) -> Dict[str, Any]:
+        """Time to first slide and slides streamed, or ``{}`` if none were.
+
+        ``first_slide_ms`` is measured from handler creation (the start of the
+        request's agent run).
+        """
+        if not self._slides_streamed:
+            return {}
+        return {
+            "first_slide_ms": self._first_slide_ms,
+            "slides_streamed": self._slides_streamed,
+        }
+
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Handle LLM completion - emit assistant message.
 
@@ -166,10 +279,42 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             )
             self.event_queue.put(event)
 
+    @contextmanager
+    def ordered_tool_runs(self, run_ids: List[UUID]) -> Iterator[None]:
+        """Emit the tool events of ``run_ids`` in that order while the block runs.
+
+        Used by the agent executor around a batch of concurrent tool calls.
+        Calls start and end in any order; their ``tool_call`` messages follow
+        ``run_ids`` order, and so do their ``tool_result`` messages. Events
+        still held when the block exits (a run that raised before starting)
+        are flushed in order.
+        """
+        with self._order_lock:
+            self._start_gate = _OrderedGate(run_ids)
+            self._end_gate = _OrderedGate(run_ids)
+        try:
+            yield
+        finally:
+            with self._order_lock:
+                start_gate, end_gate = self._start_gate, self._end_gate
+                self._start_gate = self._end_gate = None
+                start_gate.flush()
+                end_gate.flush()
+
+    def _emit_in_order(
+        self, stage: str, run_id: Optional[UUID], emit: Callable[[], None]
+    ) -> None:
+        with self._order_lock:
+            gate = self._start_gate if stage == "start" else self._end_gate
+            if gate is None or not gate.submit(run_id, emit):
+                emit()
+
     def on_tool_start(
         self,
         serialized: Dict[str, Any],
         input_str: str,
+        *,
+        run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> None:
         """Handle tool invocation start.
@@ -177,10 +322,12 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         Args:
             serialized: Serialized tool information
             input_str: Tool input as string
+            run_id: LangChain run id of this tool call
             **kwargs: Additional arguments from LangChain
         """
         tool_name = serialized.get("name", "unknown")
-        self._current_tool_name = tool_name
+        with self._order_lock:
+            self._tool_names[run_id] = tool_name
         logger.info("on_tool_start called", extra={"tool_name": tool_name, "input_str": input_str[:100] if input_str else ""})
 
         # Parse tool input - handle JSON, Python dict strings, and plain strings
@@ -206,6 +353,11 @@ class StreamingCallbackHandler(BaseCallbackHandler):
                     # Plain string, use as query
                     tool_input = {"query": input_str}
 
+        self._emit_in_order(
+            "start", run_id, lambda: self._emit_tool_call(tool_name, tool_input)
+        )
+
+    def _emit_tool_call(self, tool_name: str, tool_input: Dict[str, Any]) -> None:
         # Persist to database
         try:
             msg = self.session_manager.add_message(
@@ -235,13 +387,21 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             extra={"tool_name": tool_name, "message_id": message_id},
         )
 
-    def on_tool_end(self, output: str, **kwargs: Any) -> None:
+    def on_tool_end(
+        self, output: str, *, run_id: Optional[UUID] = None, **kwargs: Any
+    ) -> None:
         """Handle tool completion.
 
         Args:
             output: Tool output as string
+            run_id: LangChain run id of this tool call
             **kwargs: Additional arguments from LangChain
         """
+        with self._order_lock:
+            tool_name = self._tool_names.pop(run_id, None)
+        self._emit_in_order("end", run_id, lambda: self._emit_tool_result(tool_name, output))
+
+    def _emit_tool_result(self, tool_name: Optional[str], output: str) -> None:
         # Truncate long outputs for display
         preview = output[:500] + "..." if len(output) > 500 else output
 
@@ -252,7 +412,7 @@ class StreamingCallbackHandler(BaseCallbackHandler):
                 role="tool",
                 content=preview,
                 message_type="tool_result",
-                metadata={"tool_name": self._current_tool_name, "full_length": len(output)},
+                metadata={"tool_name": tool_name, "full_length": len(output)},
                 request_id=self.request_id,
             )
             message_id = msg.get("id")
@@ -263,7 +423,7 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         # Emit SSE event
         event = StreamEvent(
             type=StreamEventType.TOOL_RESULT,
-            tool_name=self._current_tool_name,
+            tool_name=tool_name,
             tool_output=preview,
             message_id=message_id,
         )
@@ -274,8 +434,6 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             extra={"output_length": len(output), "message_id": message_id},
         )
 
-        self._current_tool_name = None
-
     def on_chain_error(self, error: Exception, **kwargs: Any) -> None:
         """Handle chain/agent error.
 
@@ -283,6 +441,11 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             error: Exception that occurred
             **kwargs: Additional arguments from LangChain
         """
+        if isinstance(error, UnsafeOutputAbortError):
+            # Not a failure: the agent hands the partial output to the safety
+            # gate, which regenerates it (see output_safety_callback).
+            return
+
         error_message = str(error)
 
         # Emit error event (don't persist errors to message history)
@@ -297,29 +460,35 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             extra={"error": error_message},
         )
 
-    def on_tool_error(self, error: Exception, **kwargs: Any) -> None:
+    def on_tool_error(
+        self, error: Exception, *, run_id: Optional[UUID] = None, **kwargs: Any
+    ) -> None:
         """Handle tool execution error.
 
         Args:
             error: Exception from tool execution
+            run_id: LangChain run id of this tool call
             **kwargs: Additional arguments from LangChain
         """
+        with self._order_lock:
+            tool_name = self._tool_names.pop(run_id, None)
+        self._emit_in_order("end", run_id, lambda: self._emit_tool_error(tool_name, error))
+
+    def _emit_tool_error(self, tool_name: Optional[str], error: Exception) -> None:
         error_message = f"Tool error: {str(error)}"
 
         event = StreamEvent(
             type=StreamEventType.ERROR,
             error=error_message,
-            tool_name=self._current_tool_name,
+            tool_name=tool_name,
         )
         self.event_queue.put(event)
 
         logger.error(
             "Emitted tool error event",
-            extra={"error": error_message, "tool_name": self._current_tool_name},
+            extra={"error": error_message, "tool_name": tool_name},
         )
 
-        self._current_tool_name = None
-
     def emit_notice(self, content: str) -> None:
         """Emit a mid-stream informational assistant message (persist + stream).
 
@@ -6,10 +6,13 @@ module structure.
 """
 
 from src.services.tools.agent_bricks_tool import build_agent_bricks_tool
+from src.services.tools.build_status import is_degraded, mark_degraded
 from src.services.tools.ds_asset_tool import SearchBrandAssetsInput, build_ds_asset_tool
 from src.services.tools.genie_tool import (
     GenieQueryInput,
+    GenieResultPageInput,
     GenieToolError,
+    build_genie_result_tool,
     build_genie_tool,
     initialize_genie_conversation,
     query_genie_space,
@@ -23,8 +26,10 @@ __all__ = [
     "initialize_genie_conversation",
     "query_genie_space",
     "build_genie_tool",
+    "build_genie_result_tool",
     "GenieToolError",
     "GenieQueryInput",
+    "GenieResultPageInput",
     # Vector search
     "build_vector_tool",
     # MCP
@@ -36,4 +41,7 @@ __all__ = [
     # Design-system brand assets
     "build_ds_asset_tool",
     "SearchBrandAssetsInput",
+    # Build-time fallbacks
+    "is_degraded",
+    "mark_degraded",
 ]
@@ -0,0 +1,26 @@
+"""Build-time status flags on constructed tools.
+
+Some builders fall back to a usable-but-degraded tool when a build-time lookup
+fails (MCP tool discovery, vector index column resolution) instead of failing
+the request. The fallback is marked in the tool's LangChain ``metadata`` so a
+caller that reuses built tools across requests (the agent factory's component
+cache) can tell a transient failure apart from a real result and not pin it.
+"""
+
+from typing import Any
+
+_DEGRADED_KEY = "tellr_build_degraded"
+
+
+def mark_degraded(tool: Any, reason: str) -> Any:
+    """Flag ``tool`` as a build-time fallback; returns the tool."""
+    metadata = dict(tool.metadata or {})
+    metadata[_DEGRADED_KEY] = reason
+    tool.metadata = metadata
+    return tool
+
+
+def is_degraded(tool: Any) -> bool:
+    """Whether ``tool`` was built as a fallback (see :func:`mark_degraded`)."""
+    metadata = getattr(tool, "metadata", None)
+    return isinstance(metadata, dict) and bool(metadata.get(_DEGRADED_KEY))
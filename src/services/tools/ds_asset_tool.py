@@ -21,6 +21,11 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+#: Most rows one ``search_brand_assets`` call returns — the top of the importance
+#: ranking. A bundle can ship hundreds of icons; the model narrows with ``query``
+#: / ``kind`` rather than paging.
+BRAND_ASSET_SEARCH_LIMIT = 50
+
 
 class SearchBrandAssetsInput(BaseModel):
     """Input schema for the ``search_brand_assets`` tool."""
@@ -67,9 +72,16 @@ def build_ds_asset_tool(design_system_id: int) -> StructuredTool:
         from src.services import design_system_service
 
         with get_db_session() as db:
+            # One row past the limit tells us whether the result was truncated.
             assets = design_system_service.search_assets(
-                db, design_system_id, query=query, kind=kind
+                db,
+                design_system_id,
+                query=query,
+                kind=kind,
+                limit=BRAND_ASSET_SEARCH_LIMIT + 1,
             )
+            truncated = len(assets) > BRAND_ASSET_SEARCH_LIMIT
+            assets = assets[:BRAND_ASSET_SEARCH_LIMIT]
             # Build rows INSIDE the session (avoid DetachedInstanceError), reading
             # only metadata columns — never the deferred asset bytes.
             rows = [
@@ -93,9 +105,13 @@ def build_ds_asset_tool(design_system_id: int) -> StructuredTool:
                     "assets": [],
                 }
             )
-        return json.dumps(
-            {"message": f"Found {len(rows)} brand asset(s).", "assets": rows}
-        )
+        message = f"Found {len(rows)} brand asset(s)."
+        if truncated:
+            message = (
+                f"Showing the top {len(rows)} brand assets; narrow with `query` or "
+                "`kind` to see others."
+            )
+        return json.dumps({"message": message, "assets": rows})
 
     return StructuredTool.from_function(
         func=_search_brand_assets,
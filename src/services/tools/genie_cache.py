@@ -0,0 +1,186 @@
+"""In-process cache of Genie query results.
+
+A Genie query (``start_conversation_and_wait`` / ``create_message_and_wait``
+plus one result fetch per attachment) takes 10-60s, and the agent often
+re-asks near-identical questions across edits of the same deck. Results are
+cached under ``(space_id, user, normalized query)``:
+
+- **Space** — different spaces answer the same words from different data.
+- **User** — Genie runs the generated SQL with the caller's Unity Catalog
+  permissions, so one user's rows are never served to another. Calls with no
+  known user are not cached.
+- **Normalized query** — case, whitespace and trailing punctuation are
+  ignored (:func:`normalize_query`).
+
+Each entry records the SQL Genie ran and when the result was fetched, so a
+hit can tell the agent how fresh its data is.
+
+Configuration (environment):
+
+- ``GENIE_RESULT_CACHE_ENABLED``: ``true`` turns the cache on (default
+  ``false`` — opt in per deployment).
+- ``GENIE_RESULT_CACHE_TTL_SECONDS``: entry lifetime (default 900).
+- ``GENIE_RESULT_CACHE_MAX_BYTES``: total size of cached text before the
+  least recently used entries are evicted (default 32 MiB).
+
+A Genie tool whose profile config sets ``cache_results: false`` never reads
+or writes the cache, for spaces whose data must always be queried live.
+The cache is per worker process.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+GENIE_RESULT_CACHE_TTL_SECONDS = float(os.getenv("GENIE_RESULT_CACHE_TTL_SECONDS", "900"))
+GENIE_RESULT_CACHE_MAX_BYTES = int(
+    os.getenv("GENIE_RESULT_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def cache_enabled() -> bool:
+    """Whether the Genie result cache is switched on (``GENIE_RESULT_CACHE_ENABLED``)."""
+    return os.getenv("GENIE_RESULT_CACHE_ENABLED", "false").strip().lower() in (
+        "1", "true", "yes", "on",
+    )
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing ``?.!`` from ``query``."""
+    return _WHITESPACE.sub(" ", query).strip().rstrip("?.! ").lower()
+
+
+@dataclass(frozen=True)
+class GenieCacheEntry:
+    """One cached Genie answer."""
+
+    message: str
+    data: str
+    sql: Optional[str]
+    conversation_id: str
+    fetched_at: float
+    expires_at: float
+    results: list = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.message) + len(self.data) + len(self.sql or "")
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+_CacheKey = tuple[str, str, str]
+
+
+class GenieResultCache:
+    """TTL + byte-bounded LRU of :class:`GenieCacheEntry`."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = GENIE_RESULT_CACHE_TTL_SECONDS,
+        max_bytes: int = GENIE_RESULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[_CacheKey, GenieCacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(space_id: str, user: str, query: str) -> _CacheKey:
+        return (space_id, user, normalize_query(query))
+
+    def get(self, space_id: str, user: str, query: str) -> Optional[GenieCacheEntry]:
+        """The live entry for this question, or None."""
+        key = self._key(space_id, user, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        space_id: str,
+        user: str,
+        query: str,
+        *,
+        message: str,
+        data: str,
+        sql: Optional[str],
+        conversation_id: str,
+        results: Optional[list] = None,
+    ) -> None:
+        """Store an answer, evicting least recently used entries over ``max_bytes``."""
+        now = time.time()
+        entry = GenieCacheEntry(
+            message=message,
+            data=data,
+            sql=sql,
+            conversation_id=conversation_id,
+            fetched_at=now,
+            expires_at=now + self.ttl_seconds,
+            results=results or [],
+        )
+        if entry.size > self.max_bytes:
+            return
+        key = self._key(space_id, user, query)
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, space_id: str, user: str, query: str) -> None:
+        """Drop the entry for this question, if any."""
+        with self._lock:
+            self._pop(self._key(space_id, user, query))
+
+    def _pop(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_cache = GenieResultCache()
+
+
+def get_genie_result_cache() -> GenieResultCache:
+    """The process-wide Genie result cache."""
+    return _cache
@@ -0,0 +1,385 @@
+"""Shaping of Genie query results for the agent.
+
+A Genie attachment can return tens of thousands of rows. Pushed into the
+prompt as one CSV string, that result also lands in ``session_messages`` and
+is replayed on every verification. Instead each attachment is shaped into a
+bounded block:
+
+- a header with the row and column counts and the column types,
+- per-column summary statistics computed over **all** rows (numeric
+  min/max/mean, date and text ranges, distinct counts, nulls),
+- the first rows as CSV, within ``GENIE_RESULT_MAX_ROWS`` rows and
+  ``GENIE_RESULT_MAX_BYTES`` bytes (always at least one row: cells of a row
+  that is over budget on its own are clipped and marked as truncated),
+- a truncation note naming a ``result_id`` when rows were left out.
+
+A truncated result is kept server-side (:class:`GenieResultStore`) under its
+``result_id`` so the agent can page through the rest with the
+``read_genie_result`` tool. Stored results are scoped to the user who ran the
+query, expire after ``GENIE_RESULT_STORE_TTL_SECONDS`` (default 3600) and are
+evicted least recently used beyond ``GENIE_RESULT_STORE_MAX_BYTES`` (default
+64 MiB). The store is per worker process.
+
+CSV is written row by row with :mod:`csv`, so the cost of shaping is one pass
+over the rows and no DataFrame is built.
+"""
+
+import csv
+import io
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+GENIE_RESULT_MAX_ROWS = int(os.getenv("GENIE_RESULT_MAX_ROWS", "200"))
+GENIE_RESULT_MAX_BYTES = int(os.getenv("GENIE_RESULT_MAX_BYTES", "16384"))
+GENIE_RESULT_STORE_TTL_SECONDS = float(os.getenv("GENIE_RESULT_STORE_TTL_SECONDS", "3600"))
+GENIE_RESULT_STORE_MAX_BYTES = int(
+    os.getenv("GENIE_RESULT_STORE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+# Rows a single read_genie_result call may return.
+MAX_PAGE_ROWS = 500
+
+# Appended to a cell clipped so that an over-budget row still fits.
+CELL_TRUNCATED_MARKER = "...[cell truncated]"
+# Smallest share of the byte budget a clipped cell keeps.
+_MIN_CLIPPED_CELL_BYTES = 64
+
+# Distinct values tracked per text column before reporting "N+".
+_MAX_DISTINCT = 1000
+
+_NUMERIC_TYPES = frozenset(
+    {"BYTE", "SHORT", "INT", "INTEGER", "LONG", "BIGINT", "FLOAT", "DOUBLE", "DECIMAL"}
+)
+_ORDERED_TYPES = frozenset({"DATE", "TIMESTAMP", "TIMESTAMP_NTZ"})
+
+
+@dataclass
+class ShapedResult:
+    """One Genie attachment, shaped for the agent."""
+
+    text: str
+    columns: list[str]
+    row_count: int
+    shown_rows: int
+    sql: Optional[str] = None
+    result_id: Optional[str] = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.shown_rows < self.row_count
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "result_id": self.result_id,
+            "columns": self.columns,
+            "row_count": self.row_count,
+            "shown_rows": self.shown_rows,
+            "truncated": self.truncated,
+            "sql": self.sql,
+        }
+
+
+# -- CSV and statistics ------------------------------------------------------
+
+
+def _write_csv(
+    columns: Sequence[str], rows: Sequence[Sequence[Any]], max_rows: int, max_bytes: int
+) -> tuple[str, int]:
+    """CSV of the header and as many leading ``rows`` as fit. Returns (csv, rows written).
+
+    At least one row is always written: if the first row alone is over budget,
+    its long cells are clipped and marked with :data:`CELL_TRUNCATED_MARKER`,
+    so a page always moves the paging offset forward.
+    """
+    line_buf = io.StringIO()
+    writer = csv.writer(line_buf, lineterminator="\n")
+
+    def line(values: Sequence[Any]) -> str:
+        line_buf.seek(0)
+        line_buf.truncate()
+        writer.writerow(values)
+        return line_buf.getvalue()
+
+    parts = [line(columns)]
+    used = len(parts[0].encode("utf-8"))
+    written = 0
+    for row in rows[:max_rows]:
+        text = line(row)
+        size = len(text.encode("utf-8"))
+        if used + size > max_bytes:
+            break
+        parts.append(text)
+        used += size
+        written += 1
+    if not written and rows and max_rows > 0:
+        row = rows[0]
+        budget = max(_MIN_CLIPPED_CELL_BYTES, (max_bytes - used) // max(1, len(row)))
+        parts.append(line([_clip_cell(value, budget) for value in row]))
+        written = 1
+    return "".join(parts).rstrip("\n"), written
+
+
+def _clip_cell(value: Any, max_bytes: int) -> Any:
+    if value is None:
+        return value
+    encoded = str(value).encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return value
+    return encoded[:max_bytes].decode("utf-8", errors="ignore") + CELL_TRUNCATED_MARKER
+
+
+def _fmt_number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+@dataclass
+class _ColumnStats:
+    name: str
+    type_name: str
+    nulls: int = 0
+    numeric: bool = True
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    total: float = 0.0
+    count: int = 0
+    low: Optional[str] = None
+    high: Optional[str] = None
+    distinct: set = field(default_factory=set)
+
+    def add(self, value: Any) -> None:
+        if value is None or value == "":
+            self.nulls += 1
+            return
+        text = str(value)
+        self.count += 1
+        if self.numeric:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                self.numeric = False
+            else:
+                self.minimum = number if self.minimum is None else min(self.minimum, number)
+                self.maximum = number if self.maximum is None else max(self.maximum, number)
+                self.total += number
+        self.low = text if self.low is None else min(self.low, text)
+        self.high = text if self.high is None else max(self.high, text)
+        if len(self.distinct) <= _MAX_DISTINCT:
+            self.distinct.add(text)
+
+    def summary(self) -> str:
+        parts = []
+        if self.count and self.numeric and self.type_name not in _ORDERED_TYPES:
+            parts.append(
+                f"min {_fmt_number(self.minimum)}, max {_fmt_number(self.maximum)}, "
+                f"mean {_fmt_number(self.total / self.count)}"
+            )
+        elif self.count and self.type_name in _ORDERED_TYPES:
+            parts.append(f"{self.low} .. {self.high}")
+        elif self.count:
+            distinct = len(self.distinct)
+            shown = f"{_MAX_DISTINCT}+" if distinct > _MAX_DISTINCT else str(distinct)
+            parts.append(f"{shown} distinct")
+        if self.nulls:
+            parts.append(f"{self.nulls} null")
+        return f"- {self.name}: {', '.join(parts) or 'no values'}"
+
+
+def _column_stats(
+    columns: Sequence[str], types: Sequence[str], rows: Sequence[Sequence[Any]]
+) -> tuple[list[_ColumnStats], int]:
+    """Statistics per column over every row, and the approximate size of the rows."""
+    stats = [
+        _ColumnStats(name, type_name, numeric=type_name in _NUMERIC_TYPES or not type_name)
+        for name, type_name in zip(columns, types)
+    ]
+    size = 0
+    for row in rows:
+        for column, value in zip(stats, row):
+            column.add(value)
+            size += len(str(value)) if value is not None else 0
+    return stats, size
+
+
+# -- server-side store -------------------------------------------------------
+
+
+@dataclass
+class _StoredResult:
+    user: Optional[str]
+    columns: list[str]
+    rows: list
+    sql: Optional[str]
+    size: int
+    expires_at: float
+
+
+class GenieResultStore:
+    """Full results of truncated attachments, by ``result_id`` (TTL + byte-bounded LRU)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = GENIE_RESULT_STORE_TTL_SECONDS,
+        max_bytes: int = GENIE_RESULT_STORE_MAX_BYTES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._results: "OrderedDict[str, _StoredResult]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(
+        self,
+        user: Optional[str],
+        columns: list[str],
+        rows: list,
+        sql: Optional[str],
+        size: int,
+    ) -> Optional[str]:
+        """Keep a result and return its id, or None if it exceeds the whole budget."""
+        if size > self.max_bytes:
+            return None
+        result_id = f"gr-{uuid.uuid4().hex[:12]}"
+        stored = _StoredResult(
+            user=user,
+            columns=columns,
+            rows=rows,
+            sql=sql,
+            size=size,
+            expires_at=time.time() + self.ttl_seconds,
+        )
+        with self._lock:
+            self._results[result_id] = stored
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._results.popitem(last=False)
+                self._bytes -= evicted.size
+        return result_id
+
+    def get(self, result_id: str, user: Optional[str]) -> Optional[_StoredResult]:
+        """The stored result if it exists, has not expired and belongs to ``user``."""
+        with self._lock:
+            stored = self._results.get(result_id)
+            if stored is None:
+                return None
+            if stored.expires_at <= time.time():
+                del self._results[result_id]
+                self._bytes -= stored.size
+                return None
+            if stored.user != user:
+                return None
+            self._results.move_to_end(result_id)
+            return stored
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._bytes = 0
+
+
+_store = GenieResultStore()
+
+
+def get_genie_result_store() -> GenieResultStore:
+    """The process-wide store of truncated Genie results."""
+    return _store
+
+
+# -- shaping and paging ------------------------------------------------------
+
+
+def shape_statement_response(
+    statement_response: dict[str, Any],
+    *,
+    index: int = 1,
+    sql: Optional[str] = None,
+    user: Optional[str] = None,
+    max_rows: int = GENIE_RESULT_MAX_ROWS,
+    max_bytes: int = GENIE_RESULT_MAX_BYTES,
+) -> ShapedResult:
+    """Shape one attachment's ``statement_response`` into a bounded text block.
+
+    Rows that do not fit are stored under a ``result_id`` owned by ``user``.
+    """
+    manifest = statement_response.get("manifest") or {}
+    schema_columns = (manifest.get("schema") or {}).get("columns") or []
+    columns = [c["name"] for c in schema_columns]
+    types = [(c.get("type_name") or "").upper() for c in schema_columns]
+    rows = (statement_response.get("result") or {}).get("data_array") or []
+
+    lines = [f"Result {index}: {len(rows)} rows x {len(columns)} columns"]
+    total = manifest.get("total_row_count")
+    if manifest.get("truncated") and total:
+        lines[0] += f" (Genie returned the first {len(rows)} of {total})"
+    lines.append(
+        "Columns: "
+        + ", ".join(f"{name} ({t})" if t else name for name, t in zip(columns, types))
+    )
+
+    stats, size = _column_stats(columns, types, rows)
+    if rows:
+        lines.append("Summary:")
+        lines.extend(column.summary() for column in stats)
+
+    body, shown = _write_csv(columns, rows, max_rows, max_bytes)
+    lines.append(body)
+
+    result_id = None
+    if shown < len(rows):
+        result_id = get_genie_result_store().put(user, columns, rows, sql, size)
+        if result_id:
+            lines.append(
+                f"[Showing rows 1-{shown} of {len(rows)}. Call read_genie_result with "
+                f'result_id="{result_id}" and offset={shown} for more rows, only if needed.]'
+            )
+        else:
+            lines.append(f"[Showing rows 1-{shown} of {len(rows)}; the rest is too large to keep.]")
+        logger.info(
+            "Genie result truncated",
+            extra={"rows": len(rows), "shown_rows": shown, "result_id": result_id},
+        )
+
+    return ShapedResult(
+        text="\n".join(lines),
+        columns=columns,
+        row_count=len(rows),
+        shown_rows=shown,
+        sql=sql,
+        result_id=result_id,
+    )
+
+
+def read_result_page(
+    result_id: str,
+    offset: int = 0,
+    limit: int = GENIE_RESULT_MAX_ROWS,
+    *,
+    user: Optional[str] = None,
+    max_bytes: int = GENIE_RESULT_MAX_BYTES,
+) -> str:
+    """Rows ``offset`` .. ``offset + limit`` of a stored result as CSV with a position note."""
+    stored = get_genie_result_store().get(result_id, user)
+    if stored is None:
+        return (
+            f"No Genie result {result_id!r} is available (it may have expired); "
+            "query Genie again."
+        )
+    total = len(stored.rows)
+    offset = max(0, offset)
+    if offset >= total:
+        return f"Result {result_id} has {total} rows; offset {offset} is past the end."
+    limit = max(1, min(limit, MAX_PAGE_ROWS))
+    body, shown = _write_csv(stored.columns, stored.rows[offset:], limit, max_bytes)
+    end = offset + shown
+    note = f"[Rows {offset + 1}-{end} of {total}."
+    note += f" Next: offset={end}.]" if end < total else " End of result.]"
+    return f"{body}\n{note}"
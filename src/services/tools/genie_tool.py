@@ -9,13 +9,21 @@ import logging
 import time
 from typing import Any, Optional
 
-import pandas as pd
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from src.api.schemas.agent_config import GenieTool
 from src.core.databricks_client import get_user_client
 from src.core.settings_db import get_settings
+from src.core.user_context import get_current_user
+from src.services.tools.genie_cache import cache_enabled, get_genie_result_cache
+from src.services.tools.genie_results import (
+    GENIE_RESULT_MAX_ROWS,
+    MAX_PAGE_ROWS,
+    get_genie_result_store,
+    read_result_page,
+    shape_statement_response,
+)
 from src.utils.spotlight import spotlight
 
 logger = logging.getLogger(__name__)
@@ -33,6 +41,29 @@ class GenieQueryInput(BaseModel):
     query: str = Field(description="Natural language question")
 
 
+class GenieResultPageInput(BaseModel):
+    """Input schema for paging through a truncated Genie result."""
+
+    result_id: str = Field(description="result_id from a truncated Genie result")
+    offset: int = Field(default=0, ge=0, description="First row to return (0-based)")
+    limit: int = Field(
+        default=GENIE_RESULT_MAX_ROWS,
+        ge=1,
+        le=MAX_PAGE_ROWS,
+        description="Number of rows to return",
+    )
+
+
+def _stored_results_live(results: list, user: str) -> bool:
+    """Whether every ``result_id`` in a cached answer is still in the result store."""
+    store = get_genie_result_store()
+    return all(
+        store.get(r["result_id"], user) is not None
+        for r in results
+        if isinstance(r, dict) and r.get("result_id")
+    )
+
+
 def initialize_genie_conversation(space_id: Optional[str] = None) -> str:
     """
     Initialize a Genie conversation with a placeholder message.
@@ -100,6 +131,7 @@ def query_genie_space(
     conversation_id: Optional[str] = None,
     max_retries: int = 2,
     space_id: Optional[str] = None,
+    cache_results: bool = True,
 ) -> dict[str, Any]:
     """
     Query Databricks Genie space for data using natural language or SQL.
@@ -111,12 +143,21 @@ def query_genie_space(
         query: Natural language question
         conversation_id: Optional conversation ID (not currently used with start_conversation_and_wait)
         max_retries: Maximum number of retries if query fails (default: 2)
+        cache_results: Allow the Genie result cache for this call (see
+            ``genie_cache``; the cache must also be enabled for the deployment)
 
     Returns:
         Dictionary containing:
             - message: Plain text message from Genie (may be empty string)
-            - data: JSON string of the data (None if no attachment)
+            - data: Every data attachment shaped by ``genie_results`` (schema,
+              summary statistics, bounded CSV, truncation note); empty string
+              if there is none
             - conversation_id: ID for the conversation
+            - sql: SQL Genie ran for the data (None if none)
+            - results: Per-attachment metadata (row counts, ``result_id`` of
+              truncated results for ``read_genie_result``)
+            - cached: True if the answer came from the result cache
+            - fetched_at: Unix time the data was fetched from Genie
 
     Raises:
         GenieToolError: If query execution fails after all retries
@@ -149,6 +190,38 @@ def query_genie_space(
 
     logger.info("Querying Genie space", extra=extra_info)
 
+    # Results are cached per user: Genie runs the SQL with the caller's
+    # permissions, so an anonymous call is never cached.
+    cache = get_genie_result_cache()
+    cache_user = get_current_user() if cache_results and cache_enabled() else None
+    if cache_user:
+        entry = cache.get(space_id, cache_user, query)
+        if entry is not None and not _stored_results_live(entry.results, cache_user):
+            # The result store evicted rows this answer points at; serving it
+            # would hand the agent a result_id that can no longer be paged.
+            logger.info(
+                "Cached Genie answer references evicted results, re-querying",
+                extra={"space_id": space_id},
+            )
+            cache.invalidate(space_id, cache_user, query)
+            entry = None
+        if entry is not None:
+            logger.info(
+                "Genie query served from cache",
+                extra={"space_id": space_id, "age_s": round(entry.age_seconds)},
+            )
+            return {
+                "message": entry.message,
+                "data": entry.data,
+                # The caller's conversation stays current; without one, the
+                # conversation the entry came from (same user, same space).
+                "conversation_id": conversation_id or entry.conversation_id,
+                "sql": entry.sql,
+                "results": entry.results,
+                "cached": True,
+                "fetched_at": entry.fetched_at,
+            }
+
     attempt = 0
     last_error = None
 
@@ -168,28 +241,34 @@ def query_genie_space(
             message_id = response.message_id
 
 
-            # Extract attachments (data results)
+            # Shape every attachment (data results) and keep every text part
             attachments = response.attachments
-            data = ''
-            message_content = ''
+            shaped = []
+            texts = []
             for attachment in attachments:
                 if attachment.query:
+                    attachment_sql = getattr(attachment.query, "query", None)
                     attachment_response = client.genie.get_message_attachment_query_result(
                         space_id=space_id,
                         conversation_id=conversation_id,
                         message_id=message_id,
                         attachment_id=attachment.attachment_id,
                     )
-                    # Extract data and columns from response
-                    response_dict = attachment_response.as_dict()["statement_response"]
-                    columns = [_["name"] for _ in response_dict["manifest"]["schema"]["columns"]]
-                    data_array = response_dict.get("result", {}).get("data_array", [])
-                    # Create DataFrame and convert to records
-                    df = pd.DataFrame(data_array, columns=columns)
-                    data = df.to_csv(index=False)
+                    shaped.append(
+                        shape_statement_response(
+                            attachment_response.as_dict()["statement_response"],
+                            index=len(shaped) + 1,
+                            sql=attachment_sql if isinstance(attachment_sql, str) else None,
+                            user=get_current_user(),
+                        )
+                    )
                 if attachment.text:
-                    message_content = attachment.text
+                    texts.append(attachment.text)
 
+            data = "\n\n".join(result.text for result in shaped)
+            message_content = "\n\n".join(texts)
+            sql = ";\n".join(result.sql for result in shaped if result.sql) or None
+            results = [result.as_dict() for result in shaped]
 
             if attempt > 0:
                 logger.info(
@@ -205,14 +284,32 @@ def query_genie_space(
                 extra={
                     "has_message": bool(message_content),
                     "has_data": bool(data),
+                    "attachments": len(shaped),
+                    "truncated": sum(result.truncated for result in shaped),
                     "conversation_id": conversation_id,
                 },
             )
 
+            if cache_user and (data or message_content):
+                cache.put(
+                    space_id,
+                    cache_user,
+                    query,
+                    message=message_content,
+                    data=data,
+                    sql=sql,
+                    conversation_id=conversation_id,
+                    results=results,
+                )
+
             return {
                 "message": message_content,
                 "data": data,
-                "conversation_id": conversation_id
+                "conversation_id": conversation_id,
+                "sql": sql,
+                "results": results,
+                "cached": False,
+                "fetched_at": time.time(),
             }
 
         except Exception as e:
@@ -284,9 +381,19 @@ def build_genie_tool(
                 logger.error(f"Failed to initialize Genie conversation: {e}")
                 raise
 
-        result = query_genie_space(query, conversation_id, space_id=genie_config.space_id)
+        result = query_genie_space(
+            query,
+            conversation_id,
+            space_id=genie_config.space_id,
+            cache_results=genie_config.cache_results,
+        )
 
         response_parts = []
+        if result.get("cached"):
+            age_min = int((time.time() - result["fetched_at"]) // 60)
+            response_parts.append(
+                f"(Cached Genie result fetched {age_min} min ago for the same question.)"
+            )
         if result.get("message"):
             response_parts.append(f"Genie response: {result['message']}")
         if result.get("data"):
@@ -322,3 +429,29 @@ def build_genie_tool(
         description=description,
         args_schema=GenieQueryInput,
     )
+
+
+def build_genie_result_tool(session_id: Optional[str] = None) -> StructuredTool:
+    """Build the ``read_genie_result`` tool for paging through truncated Genie results.
+
+    Registered once alongside the Genie query tools; results are only
+    readable by the user whose query produced them.
+    """
+
+    def _read_genie_result(
+        result_id: str, offset: int = 0, limit: int = GENIE_RESULT_MAX_ROWS
+    ) -> str:
+        page = read_result_page(result_id, offset, limit, user=get_current_user())
+        return spotlight("genie", page, session_id=session_id)
+
+    return StructuredTool.from_function(
+        func=_read_genie_result,
+        name="read_genie_result",
+        description=(
+            "Read more rows of a Genie result that was truncated. Genie results show a "
+            "summary of every column plus the first rows; use this tool only when the "
+            "slides need specific rows beyond those shown, with the result_id and offset "
+            "given in the truncation note."
+        ),
+        args_schema=GenieResultPageInput,
+    )
@@ -0,0 +1,368 @@
+"""Long-lived MCP sessions shared across tool calls.
+
+Opening an MCP session costs a TLS handshake, workspace auth and the MCP
+``initialize`` round trip. ``DatabricksMCPClient`` pays all of that on every
+``call_tool`` / ``list_tools`` because it wraps each one in ``asyncio.run``.
+:class:`MCPConnectionManager` keeps sessions open instead:
+
+- One daemon thread runs an asyncio loop that owns every session. Callers on
+  any thread submit work with ``run_coroutine_threadsafe`` and wait for it
+  with a timeout, so FastAPI's loop and the agent's worker threads are never
+  blocked on a foreign loop.
+- Sessions are keyed by ``(server_url, sha256(token))``. A session carries
+  the credentials it was opened with, so users never share one.
+- Each session is held open by its own task (the transport's task group must
+  be entered and exited by the same task). It is closed after
+  ``MCP_SESSION_IDLE_SECONDS`` (default 300) without calls.
+- A call that fails on a reused session is retried once on a freshly opened
+  one: the old connection may have been dropped by the proxy. Errors the
+  server returns (``McpError``) and failures on a fresh session are raised.
+- At most ``MCP_MAX_CONCURRENT_PER_SERVER`` (default 4) calls run against one
+  server at a time, across all users.
+- ``list_tools`` results are cached per session key for
+  ``MCP_LIST_TOOLS_TTL_SECONDS`` (default 300). An expired list is still
+  returned while a background refresh fetches the new one, so building an
+  agent only waits on discovery the first time a user meets a server.
+
+The manager is per worker process.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    from mcp.shared.exceptions import McpError
+except ImportError:  # mcp not installed: build_mcp_tools reports it
+    McpError = ()  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+MCP_SESSION_IDLE_SECONDS = float(os.getenv("MCP_SESSION_IDLE_SECONDS", "300"))
+MCP_MAX_CONCURRENT_PER_SERVER = int(os.getenv("MCP_MAX_CONCURRENT_PER_SERVER", "4"))
+MCP_LIST_TOOLS_TTL_SECONDS = float(os.getenv("MCP_LIST_TOOLS_TTL_SECONDS", "300"))
+
+# How often idle sessions and long-expired tool lists are swept.
+_SWEEP_INTERVAL_SECONDS = 30.0
+
+SessionKey = tuple[str, str]
+
+# (server_url, host, token) -> async context manager yielding an initialized session
+SessionOpener = Callable[[str, str, str], Any]
+
+
+def session_key(server_url: str, token: Optional[str]) -> SessionKey:
+    """Pool key for ``server_url`` and the caller's token (never the token itself)."""
+    digest = hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+    return (server_url, digest[:32])
+
+
+def _open_databricks_session(server_url: str, host: str, token: str) -> Any:
+    """Open a session through the Databricks MCP proxy with the caller's token."""
+    # _open_mcp_session is private, but it is the helper DatabricksMCPClient
+    # itself uses, and it hides the transport differences between mcp 1.x and 2.x.
+    from databricks.sdk import WorkspaceClient
+    from databricks_mcp.mcp import _open_mcp_session
+    from databricks_mcp.oauth_provider import DatabricksOAuthClientProvider
+
+    ws_client = WorkspaceClient(host=host, token=token, auth_type="pat")
+    return _open_mcp_session(server_url, DatabricksOAuthClientProvider(ws_client))
+
+
+def _tool_dicts(tools: Any) -> list[dict]:
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description or "",
+            "input_schema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
+        }
+        for tool in tools
+    ]
+
+
+class _PooledSession:
+    """One open session, held by a task for as long as it is pooled."""
+
+    def __init__(self, context_manager: Any) -> None:
+        self.session: Any = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._hold(context_manager))
+
+    async def _hold(self, context_manager: Any) -> None:
+        try:
+            async with context_manager as session:
+                self.session = session
+                self._ready.set_result(None)
+                await self._closing.wait()
+        except BaseException as e:
+            if not self._ready.done():
+                if isinstance(e, asyncio.CancelledError):
+                    self._ready.cancel()
+                else:
+                    self._ready.set_exception(e)
+            else:
+                logger.info("MCP session ended: %s", e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def wait_ready(self) -> None:
+        # Shielded: a caller that gives up must not abort an open others await.
+        await asyncio.shield(self._ready)
+
+    @property
+    def alive(self) -> bool:
+        return not self._task.done() and not self._closing.is_set()
+
+    def close(self) -> None:
+        self._closing.set()
+
+    async def wait_closed(self) -> None:
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPConnectionManager:
+    """Pool of initialized MCP sessions owned by one background event loop."""
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float = MCP_SESSION_IDLE_SECONDS,
+        max_concurrent_per_server: int = MCP_MAX_CONCURRENT_PER_SERVER,
+        list_tools_ttl_seconds: float = MCP_LIST_TOOLS_TTL_SECONDS,
+        opener: Optional[SessionOpener] = None,
+    ) -> None:
+        self.idle_seconds = idle_seconds
+        self.max_concurrent_per_server = max(1, max_concurrent_per_server)
+        self.list_tools_ttl_seconds = list_tools_ttl_seconds
+        self._opener = opener or _open_databricks_session
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # The fields below are only touched on the manager's loop.
+        self._sessions: dict[SessionKey, _PooledSession] = {}
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._tool_lists: dict[SessionKey, tuple[float, list[dict]]] = {}  # (fetched_at, tools)
+        self._refreshing: set[SessionKey] = set()
+        self._stats = {
+            "sessions_opened": 0,
+            "sessions_reused": 0,
+            "reconnects": 0,
+            "idle_evictions": 0,
+            "list_tools_hits": 0,
+            "list_tools_misses": 0,
+        }
+
+    # -- public, thread-safe -------------------------------------------------
+
+    def call_tool(
+        self,
+        server_url: str,
+        host: str,
+        token: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+        timeout: float = 120.0,
+    ) -> Any:
+        """Call ``tool_name`` on a pooled session. Returns the MCP ``CallToolResult``."""
+        return self._submit(
+            self._with_session(
+                server_url, host, token, lambda s: s.call_tool(tool_name, arguments)
+            ),
+            timeout,
+        )
+
+    def list_tools(
+        self, server_url: str, host: str, token: str, timeout: float = 60.0
+    ) -> list[dict]:
+        """Tool definitions (name, description, input_schema), cached per user and server."""
+        return self._submit(self._list_tools(server_url, host, token), timeout)
+
+    def stats(self) -> dict:
+        loop = self._loop
+        if loop is None:
+            return {**self._stats, "open_sessions": 0}
+        return self._submit(self._snapshot(), 5.0)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close every session and stop the loop thread (app shutdown)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("Failed to close MCP sessions cleanly: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+
+    # -- loop plumbing -------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name="mcp-sessions", daemon=True
+                )
+                thread.start()
+                asyncio.run_coroutine_threadsafe(self._sweep_forever(), loop)
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _submit(self, coro: Awaitable[Any], timeout: float) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    # -- on the loop ---------------------------------------------------------
+
+    async def _with_session(
+        self,
+        server_url: str,
+        host: str,
+        token: str,
+        operation: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        key = session_key(server_url, token)
+        limit = self._limits.get(server_url)
+        if limit is None:
+            limit = self._limits[server_url] = asyncio.Semaphore(self.max_concurrent_per_server)
+        async with limit:
+            for attempt in range(2):
+                pooled, fresh = await self._acquire(key, server_url, host, token)
+                pooled.in_flight += 1
+                try:
+                    return await operation(pooled.session)
+                except McpError:
+                    raise
+                except Exception as e:
+                    self._discard(key, pooled)
+                    if fresh or attempt:
+                        raise
+                    self._stats["reconnects"] += 1
+                    logger.info("Reconnecting MCP session after failure: %s", e)
+                finally:
+                    pooled.in_flight -= 1
+                    pooled.last_used = time.monotonic()
+
+    async def _acquire(
+        self, key: SessionKey, server_url: str, host: str, token: str
+    ) -> tuple[_PooledSession, bool]:
+        """The pooled session for ``key``, opening one if needed. Returns (session, fresh)."""
+        pooled = self._sessions.get(key)
+        fresh = pooled is None or not pooled.alive
+        if fresh:
+            pooled = _PooledSession(self._opener(server_url, host, token))
+            self._sessions[key] = pooled
+            self._stats["sessions_opened"] += 1
+            logger.info("Opening MCP session", extra={"server_url": server_url})
+        else:
+            self._stats["sessions_reused"] += 1
+        try:
+            await pooled.wait_ready()
+        except Exception:
+            self._discard(key, pooled)
+            raise
+        return pooled, fresh
+
+    def _discard(self, key: SessionKey, pooled: _PooledSession) -> None:
+        if self._sessions.get(key) is pooled:
+            del self._sessions[key]
+        pooled.close()
+
+    async def _list_tools(self, server_url: str, host: str, token: str) -> list[dict]:
+        key = session_key(server_url, token)
+        cached = self._tool_lists.get(key)
+        if cached is not None:
+            self._stats["list_tools_hits"] += 1
+            fetched_at, tools = cached
+            expired = time.monotonic() - fetched_at >= self.list_tools_ttl_seconds
+            if expired and key not in self._refreshing:
+                self._refreshing.add(key)
+                asyncio.create_task(self._refresh_tools(key, server_url, host, token))
+            return tools
+        self._stats["list_tools_misses"] += 1
+        return await self._fetch_tools(key, server_url, host, token)
+
+    async def _fetch_tools(
+        self, key: SessionKey, server_url: str, host: str, token: str
+    ) -> list[dict]:
+        result = await self._with_session(server_url, host, token, lambda s: s.list_tools())
+        tools = _tool_dicts(result.tools)
+        self._tool_lists[key] = (time.monotonic(), tools)
+        return tools
+
+    async def _refresh_tools(
+        self, key: SessionKey, server_url: str, host: str, token: str
+    ) -> None:
+        try:
+            await self._fetch_tools(key, server_url, host, token)
+        except Exception as e:
+            # Keep serving the previous list; the next call tries again.
+            logger.warning("Failed to refresh MCP tool list: %s", e)
+        finally:
+            self._refreshing.discard(key)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(_SWEEP_INTERVAL_SECONDS)
+            self._sweep()
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        for key, pooled in list(self._sessions.items()):
+            if not pooled.alive:
+                self._discard(key, pooled)
+            elif pooled.in_flight == 0 and now - pooled.last_used >= self.idle_seconds:
+                self._discard(key, pooled)
+                self._stats["idle_evictions"] += 1
+        # Tool lists nobody has asked for in a while are dropped rather than refreshed.
+        stale_after = self.list_tools_ttl_seconds + self.idle_seconds
+        for key, (fetched_at, _) in list(self._tool_lists.items()):
+            if now - fetched_at >= stale_after:
+                del self._tool_lists[key]
+
+    async def _snapshot(self) -> dict:
+        return {**self._stats, "open_sessions": len(self._sessions)}
+
+    async def _close_all(self) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for pooled in sessions:
+            pooled.close()
+        await asyncio.gather(*(p.wait_closed() for p in sessions))
+
+
+_manager = MCPConnectionManager()
+
+
+def get_mcp_connection_manager() -> MCPConnectionManager:
+    """The process-wide MCP connection manager."""
+    return _manager
+
+
+def shutdown_mcp_sessions() -> None:
+    """Close pooled MCP sessions (app shutdown). No-op if none were opened."""
+    _manager.close()
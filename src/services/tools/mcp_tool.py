@@ -4,9 +4,9 @@ MCP (Model Context Protocol) server tool execution module.
 Creates LangChain tools that connect to external MCP servers through
 the Databricks MCP proxy using Unity Catalog connections.
 
-Uses DatabricksMCPClient which handles the MCP Streamable HTTP transport
-protocol internally. Thread isolation is required because DatabricksMCPClient
-uses asyncio.run() internally, which conflicts with FastAPI's event loop.
+Calls and tool discovery run on long-lived sessions owned by
+:class:`~src.services.tools.mcp_sessions.MCPConnectionManager`, whose
+background event loop keeps them off FastAPI's loop.
 
 The ``databricks-mcp`` package is imported lazily -- if not installed,
 ``build_mcp_tools`` raises a clear error at tool-build time rather than
@@ -23,6 +23,8 @@ from pydantic import Field, create_model
 
 from src.api.schemas.agent_config import MCPTool
 from src.core.databricks_client import get_user_client
+from src.services.tools.build_status import mark_degraded
+from src.services.tools.mcp_sessions import get_mcp_connection_manager
 
 logger = logging.getLogger(__name__)
 
@@ -34,129 +36,66 @@ class MCPToolError(Exception):
 
 
 # ---------------------------------------------------------------------------
-# Thread-isolated helpers (DatabricksMCPClient uses asyncio.run internally)
+# Result and error mapping
 # ---------------------------------------------------------------------------
 
-def _call_mcp_in_clean_thread(
-    server_url: str,
-    tool_name: str,
-    arguments: dict[str, Any],
-    host: str,
-    token: str,
-) -> str:
-    """
-    Call MCP tool in a completely clean thread with no event loop.
+def _format_result(response: Any) -> str:
+    """Render an MCP ``CallToolResult`` as a JSON string."""
+    result = None
+    if hasattr(response, "content") and response.content:
+        texts = []
+        for item in response.content:
+            if hasattr(item, "text"):
+                texts.append(item.text)
+            elif isinstance(item, str):
+                texts.append(item)
+        result = "\n".join(texts) if texts else str(response.content)
+    elif hasattr(response, "data"):
+        result = response.data
+    else:
+        result = str(response)
+
+    if isinstance(result, str):
+        try:
+            json.loads(result)
+            return result
+        except json.JSONDecodeError:
+            return json.dumps({"result": result})
+    return json.dumps({"result": result})
+
+
+def _tool_error(error: Exception) -> MCPToolError:
+    """Map a transport or server failure to an :class:`MCPToolError`."""
+    # The MCP transport wraps errors in ExceptionGroup (Python 3.11+)
+    sub = error
+    while isinstance(sub, ExceptionGroup) and sub.exceptions:
+        sub = sub.exceptions[0]
+    error_msg = str(sub)
+    if "403" in error_msg or "Forbidden" in error_msg:
+        return MCPToolError(
+            "Permission denied for MCP connection. "
+            "Ensure you have USE CONNECTION permission on this UC HTTP connection."
+        )
+    logger.error("MCP tool call failed: %s", sub, exc_info=error)
+    return MCPToolError(f"MCP tool call failed: {sub}")
 
-    DatabricksMCPClient uses asyncio.run() internally, which requires
-    no existing event loop. Running in a thread ensures isolation.
 
-    Returns JSON string for compatibility.
-    """
+def _require_mcp() -> None:
     try:
-        from databricks_mcp import DatabricksMCPClient
-        from databricks.sdk import WorkspaceClient
+        import databricks_mcp  # noqa: F401
     except ImportError:
         raise MCPToolError(
             "databricks-mcp package not installed. "
             "Install with: pip install databricks-mcp"
         )
 
-    logger.info("Calling MCP tool: %s at %s", tool_name, server_url)
-
-    try:
-        # Create a fresh workspace client in this thread
-        ws_client = WorkspaceClient(host=host, token=token, auth_type="pat")
-
-        mcp_client = DatabricksMCPClient(
-            server_url=server_url,
-            workspace_client=ws_client,
-        )
-
-        # Call the tool - this uses asyncio.run() internally
-        response = mcp_client.call_tool(tool_name, arguments)
-
-        # Parse the response
-        result = None
-        if hasattr(response, "content") and response.content:
-            texts = []
-            for item in response.content:
-                if hasattr(item, "text"):
-                    texts.append(item.text)
-                elif isinstance(item, str):
-                    texts.append(item)
-            result = "\n".join(texts) if texts else str(response.content)
-        elif hasattr(response, "data"):
-            result = response.data
-        else:
-            result = str(response)
-
-        logger.info("MCP tool %s completed successfully", tool_name)
-
-        # Return as JSON string
-        if isinstance(result, str):
-            try:
-                json.loads(result)
-                return result
-            except json.JSONDecodeError:
-                return json.dumps({"result": result})
-        else:
-            return json.dumps({"result": result})
-
-    except ExceptionGroup as eg:
-        # DatabricksMCPClient wraps errors in ExceptionGroup (Python 3.11+)
-        sub = eg.exceptions[0] if eg.exceptions else eg
-        error_msg = str(sub)
-        if "403" in error_msg or "Forbidden" in error_msg:
-            raise MCPToolError(
-                "Permission denied for MCP connection. "
-                "Ensure you have USE CONNECTION permission on this UC HTTP connection."
-            ) from eg
-        logger.error("MCP tool call failed: %s", sub, exc_info=True)
-        raise MCPToolError(f"MCP tool call failed: {sub}") from eg
-
-    except Exception as e:
-        logger.error("MCP tool call failed: %s", e, exc_info=True)
-        raise MCPToolError(f"MCP tool call failed: {e}") from e
-
-
-def _list_mcp_in_clean_thread(
-    server_url: str,
-    host: str,
-    token: str,
-) -> list[dict]:
-    """List MCP tools in a clean thread with no event loop."""
-    try:
-        from databricks_mcp import DatabricksMCPClient
-        from databricks.sdk import WorkspaceClient
-    except ImportError:
-        return []
-
-    try:
-        ws_client = WorkspaceClient(host=host, token=token, auth_type="pat")
-
-        mcp_client = DatabricksMCPClient(
-            server_url=server_url,
-            workspace_client=ws_client,
-        )
-
-        mcp_tools = mcp_client.list_tools()
-
-        tools = []
-        for tool in mcp_tools:
-            tools.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description or "",
-                    "input_schema": tool.inputSchema
-                    if hasattr(tool, "inputSchema")
-                    else {},
-                }
-            )
-        return tools
 
-    except Exception as e:
-        logger.warning("Failed to list MCP tools: %s", e)
-        return []
+def _server_for(connection_name: str) -> tuple[str, str, str]:
+    """(server_url, host, token) for a UC connection, as the current user."""
+    client = get_user_client()
+    host = client.config.host
+    token = client.config.token
+    return f"{host}/api/2.0/mcp/external/{connection_name}", host, token
 
 
 # ---------------------------------------------------------------------------
@@ -171,9 +110,9 @@ def call_mcp_tool(
     """
     Call a tool on an MCP server via Databricks MCP proxy.
 
-    Uses DatabricksMCPClient which handles the MCP Streamable HTTP
-    transport protocol. Runs in a separate thread to avoid asyncio
-    conflicts with FastAPI.
+    Runs on a pooled, already-initialized session
+    (:mod:`~src.services.tools.mcp_sessions`), so repeated calls skip the
+    TLS, auth and MCP handshake.
 
     Args:
         connection_name: Unity Catalog connection name for the MCP server
@@ -189,36 +128,29 @@ def call_mcp_tool(
     logger.info("Calling MCP tool: %s via connection: %s", tool_name, connection_name)
 
     try:
-        client = get_user_client()
-        host = client.config.host
-        token = client.config.token
-
-        server_url = f"{host}/api/2.0/mcp/external/{connection_name}"
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                _call_mcp_in_clean_thread,
-                server_url,
-                tool_name,
-                arguments,
-                host,
-                token,
-            )
-            return future.result(timeout=120)
-
+        _require_mcp()
+        server_url, host, token = _server_for(connection_name)
+        response = get_mcp_connection_manager().call_tool(
+            server_url, host, token, tool_name, arguments, timeout=120
+        )
     except MCPToolError:
         raise
     except concurrent.futures.TimeoutError:
         raise MCPToolError("MCP tool call timed out after 120 seconds")
     except Exception as e:
-        logger.error("MCP tool call failed: %s", e, exc_info=True)
-        raise MCPToolError(f"MCP tool call failed: {e}") from e
+        raise _tool_error(e) from e
+
+    logger.info("MCP tool %s completed successfully", tool_name)
+    return _format_result(response)
 
 
 def list_mcp_tools(connection_name: str) -> list[dict]:
     """
     List available tools from an MCP server via Databricks proxy.
 
+    Lists are cached per user and server by the connection manager; an
+    expired list is returned while it is refreshed in the background.
+
     Args:
         connection_name: Unity Catalog connection name for the MCP server
 
@@ -226,16 +158,9 @@ def list_mcp_tools(connection_name: str) -> list[dict]:
         List of tool definitions (each a dict with name, description, input_schema)
     """
     try:
-        client = get_user_client()
-        host = client.config.host
-        token = client.config.token
-        server_url = f"{host}/api/2.0/mcp/external/{connection_name}"
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                _list_mcp_in_clean_thread, server_url, host, token
-            )
-            return future.result(timeout=60)
+        _require_mcp()
+        server_url, host, token = _server_for(connection_name)
+        return get_mcp_connection_manager().list_tools(server_url, host, token, timeout=60)
 
     except Exception as e:
         logger.warning("Failed to list MCP tools: %s", e)
@@ -259,7 +184,9 @@ def build_mcp_tools(config: MCPTool) -> list[StructuredTool]:
         config: MCPTool config with connection_name, server_name, description
 
     Returns:
-        List of LangChain StructuredTool instances
+        List of LangChain StructuredTool instances. When discovery fails or finds
+        nothing, the single generic ``search`` fallback is marked degraded
+        (:func:`~src.services.tools.build_status.mark_degraded`).
     """
     connection_name = config.connection_name
     base_description = config.description
@@ -281,7 +208,8 @@ def build_mcp_tools(config: MCPTool) -> list[StructuredTool]:
         logger.warning("Could not discover MCP tools: %s", e)
 
     # If no tools discovered, create a generic search tool
-    if not tool_configs:
+    discovery_failed = not tool_configs
+    if discovery_failed:
         tool_configs = [
             {
                 "name": "search",
@@ -369,6 +297,8 @@ def build_mcp_tools(config: MCPTool) -> list[StructuredTool]:
             description=tool_description or f"Call {mcp_tool_name} on {config.server_name}",
             args_schema=InputSchema,
         )
+        if discovery_failed:
+            mark_degraded(tool, "mcp_discovery")
         tools.append(tool)
 
     logger.info("Created %d MCP tools from %s", len(tools), config.server_name)
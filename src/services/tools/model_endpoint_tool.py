@@ -17,7 +17,8 @@ cached in-memory with a 1-hour TTL. If detection fails, falls back to trial-and-
 across all three formats.
 
 All calls go through the SDK's api_client.do() which handles authentication
-(PAT, OAuth, service principal) and retries.
+(PAT, OAuth, service principal) and retries. Each query is timed per endpoint
+(``src.core.http_transport.timed``).
 """
 
 import json
@@ -30,6 +31,7 @@ from pydantic import BaseModel, Field
 
 from src.api.schemas.agent_config import ModelEndpointTool
 from src.core.databricks_client import get_user_client
+from src.core.http_transport import timed
 from src.utils.spotlight import spotlight
 
 logger = logging.getLogger(__name__)
@@ -282,7 +284,8 @@ def build_model_endpoint_tool(
     endpoint_name = config.endpoint_name
 
     def _wrapper(query: str) -> str:
-        result = _query_model_endpoint(endpoint_name=endpoint_name, query=query)
+        with timed("serving", endpoint_name):
+            result = _query_model_endpoint(endpoint_name=endpoint_name, query=query)
         return spotlight(f"model:{endpoint_name}", result)
 
     tool_name = "query_model_endpoint" if index == 1 else f"query_model_endpoint_{index}"
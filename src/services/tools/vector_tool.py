@@ -4,21 +4,39 @@ Vector search tool execution module.
 Creates LangChain tools for querying Databricks Vector Search indexes
 using the SDK's ``vector_search_indexes.query_index()`` method with
 on-behalf-of authentication.
+
+Results are cached in-process for ``VECTOR_SEARCH_CACHE_TTL_SECONDS``
+(default 300, ``0`` disables) under ``(index, user, query, columns, k)``, at
+most ``VECTOR_SEARCH_CACHE_MAX_ENTRIES`` (default 512) entries, least
+recently used first out. The user is part of the key because the index is
+queried with the caller's Unity Catalog permissions; calls with no known
+user are not cached. Each query is timed per index
+(``src.core.http_transport.timed``).
 """
 
 import json
 import logging
-from typing import Any
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from src.api.schemas.agent_config import VectorIndexTool
 from src.core.databricks_client import get_user_client
+from src.core.http_transport import timed
+from src.core.user_context import get_current_user
+from src.services.tools.build_status import mark_degraded
 from src.utils.spotlight import spotlight
 
 logger = logging.getLogger(__name__)
 
+VECTOR_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("VECTOR_SEARCH_CACHE_TTL_SECONDS", "300"))
+VECTOR_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("VECTOR_SEARCH_CACHE_MAX_ENTRIES", "512"))
+
 
 class VectorSearchError(Exception):
     """Raised when vector search fails."""
@@ -26,6 +44,67 @@ class VectorSearchError(Exception):
     pass
 
 
+_CacheKey = tuple[str, str, str, tuple[str, ...], int]
+
+
+class VectorSearchCache:
+    """TTL + LRU of formatted search results, by (index, user, query, columns, k)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = VECTOR_SEARCH_CACHE_TTL_SECONDS,
+        max_entries: int = VECTOR_SEARCH_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[_CacheKey, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: _CacheKey) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: _CacheKey, result: str) -> None:
+        with self._lock:
+            self._entries[key] = (result, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache = VectorSearchCache()
+
+
+def get_vector_search_cache() -> VectorSearchCache:
+    """The process-wide vector search result cache."""
+    return _cache
+
+
 class VectorSearchInput(BaseModel):
     """Input schema for vector search tool."""
 
@@ -71,16 +150,27 @@ def _search_vector_index(
         },
     )
 
+    cache = get_vector_search_cache()
+    user = get_current_user()
+    cache_key = None
+    if user and cache.enabled:
+        cache_key = (index_name, user, query, tuple(columns), num_results)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Vector search served from cache", extra={"index": index_name})
+            return cached
+
     try:
         # Get user client at query time for OBO authentication
         client = get_user_client()
 
-        response = client.vector_search_indexes.query_index(
-            index_name=index_name,
-            columns=columns,
-            query_text=query,
-            num_results=num_results,
-        )
+        with timed("vector", index_name):
+            response = client.vector_search_indexes.query_index(
+                index_name=index_name,
+                columns=columns,
+                query_text=query,
+                num_results=num_results,
+            )
 
         # Format results from the SDK response
         formatted_results = []
@@ -102,10 +192,13 @@ def _search_vector_index(
             extra={"result_count": len(formatted_results)},
         )
 
-        return json.dumps({
+        result = json.dumps({
             "results": formatted_results,
             "count": len(formatted_results),
         })
+        if cache_key is not None:
+            cache.put(cache_key, result)
+        return result
 
     except VectorSearchError:
         raise
@@ -126,11 +219,14 @@ def build_vector_tool(config: VectorIndexTool, index: int = 1) -> StructuredTool
         index: 1-based index for unique tool naming when multiple vector tools
 
     Returns:
-        LangChain StructuredTool instance
+        LangChain StructuredTool instance, marked degraded
+        (:func:`~src.services.tools.build_status.mark_degraded`) when the
+        index's columns could not be resolved and the fallback column is used.
     """
     index_name = config.index_name
     columns = config.columns
     default_num_results = config.num_results
+    columns_resolved = True
 
     # If no columns specified (user selected "all"), resolve from index metadata
     if not columns:
@@ -151,6 +247,7 @@ def build_vector_tool(config: VectorIndexTool, index: int = 1) -> StructuredTool
         except Exception as e:
             logger.warning("Failed to resolve columns for %s, using fallback: %s", index_name, e)
             columns = ["content"]
+            columns_resolved = False
 
     # Build a custom input schema that uses the config's default num_results
     input_schema = type(
@@ -188,9 +285,12 @@ def build_vector_tool(config: VectorIndexTool, index: int = 1) -> StructuredTool
         "Returns a list of matching results with relevance scores."
     )
 
-    return StructuredTool.from_function(
+    tool = StructuredTool.from_function(
         func=_search_wrapper,
         name=tool_name,
         description=description,
         args_schema=input_schema,
     )
+    if not columns_resolved:
+        mark_degraded(tool, "vector_columns")
+    return tool
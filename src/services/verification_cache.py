@@ -0,0 +1,323 @@
+"""Content-addressed cache of LLM-judge verification results.
+
+A judge verdict depends only on the slide, the source data it is checked
+against and the judge itself, yet ``evaluate_with_judge`` ran again whenever
+a slide was re-verified, a deck was duplicated or a version was restored:
+``verification_map`` is per deck and keyed by slide alone. Verdicts are
+therefore also stored in the global ``verification_cache`` table under a
+digest of exactly those inputs (:func:`verification_cache_key`):
+
+- the normalised slide hash (``compute_slide_hash``),
+- sha256 of the source corpus sent to the judge,
+- the judge backend (``mlflow`` / ``direct``),
+- the judge prompt version (``JUDGE_PROMPT_VERSION``) and model endpoint.
+
+Any input change produces a new key — rows are never invalidated, only
+superseded or purged (``DELETE /api/admin/verification-cache``). Failed judge
+calls (``error`` results) are never stored.
+
+Configuration (environment):
+
+- ``VERIFICATION_CACHE_ENABLED``: ``false`` disables lookups and writes
+  (default ``true``).
+
+Every cache failure is logged and swallowed: the cache can make verification
+faster, never fail it. Hit/miss counters are per worker process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session-specific fields that are not part of the verdict.
+_SESSION_FIELDS = ("genie_conversation_id",)
+
+
+def cache_enabled() -> bool:
+    """Whether the verification cache is switched on (``VERIFICATION_CACHE_ENABLED``)."""
+    return os.getenv("VERIFICATION_CACHE_ENABLED", "true").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
+def corpus_hash(genie_data: str) -> str:
+    """sha256 hex of the source corpus exactly as sent to the judge."""
+    return hashlib.sha256((genie_data or "").encode("utf-8")).hexdigest()
+
+
+def verification_cache_key(
+    slide_hash: str,
+    corpus_digest: str,
+    judge_backend: str,
+    prompt_version: str,
+    model_endpoint: str,
+) -> str:
+    """Digest of everything a judge verdict depends on."""
+    payload = json.dumps(
+        [slide_hash, corpus_digest, judge_backend, prompt_version, model_endpoint],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VerificationCache:
+    """Table-backed store of judge verdicts for one judge configuration.
+
+    Args:
+        judge_backend: Normalised judge backend the verdicts come from.
+        corpus_digest: :func:`corpus_hash` of the source corpus.
+        prompt_version: Judge prompt version.
+        model_endpoint: Judge model serving endpoint.
+        session_factory: Callable returning a DB session; defaults to the app
+            session factory.
+    """
+
+    def __init__(
+        self,
+        judge_backend: str,
+        corpus_digest: str,
+        prompt_version: str,
+        model_endpoint: str,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.judge_backend = judge_backend
+        self.corpus_digest = corpus_digest
+        self.prompt_version = prompt_version
+        self.model_endpoint = model_endpoint
+        self._session_factory = session_factory
+
+    @classmethod
+    def for_judge(
+        cls, judge_backend: str, genie_data: str
+    ) -> Optional["VerificationCache"]:
+        """Cache for the app's judge against ``genie_data``, or ``None`` when disabled."""
+        if not cache_enabled():
+            return None
+        from src.core.defaults import DEFAULT_CONFIG
+        from src.core.settings_db import normalize_llm_judge_backend
+        from src.services.evaluation import JUDGE_PROMPT_VERSION
+
+        return cls(
+            normalize_llm_judge_backend(judge_backend),
+            corpus_hash(genie_data),
+            JUDGE_PROMPT_VERSION,
+            DEFAULT_CONFIG["llm"]["endpoint"],
+        )
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from src.core.database import get_session_local
+
+            self._session_factory = get_session_local()
+        return self._session_factory()
+
+    def key(self, slide_hash: str) -> str:
+        """Cache key of ``slide_hash`` under this judge configuration."""
+        return verification_cache_key(
+            slide_hash,
+            self.corpus_digest,
+            self.judge_backend,
+            self.prompt_version,
+            self.model_endpoint,
+        )
+
+    def get_many(self, slide_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """``{slide_hash: verification}`` for every slide with a cached verdict."""
+        keys = {self.key(h): h for h in dict.fromkeys(slide_hashes) if h}
+        if not keys:
+            return {}
+
+        from src.database.models import VerificationCacheEntry
+
+        try:
+            db = self._session()
+            try:
+                rows = (
+                    db.query(VerificationCacheEntry.cache_key, VerificationCacheEntry.result)
+                    .filter(VerificationCacheEntry.cache_key.in_(list(keys)))
+                    .all()
+                )
+                if rows:
+                    (
+                        db.query(VerificationCacheEntry)
+                        .filter(
+                            VerificationCacheEntry.cache_key.in_([r.cache_key for r in rows])
+                        )
+                        .update(
+                            {
+                                VerificationCacheEntry.hit_count: (
+                                    VerificationCacheEntry.hit_count + 1
+                                ),
+                                VerificationCacheEntry.last_used_at: datetime.utcnow(),
+                            },
+                            synchronize_session=False,
+                        )
+                    )
+                    db.commit()
+            finally:
+                db.close()
+        except Exception:
+            logger.warning("Verification cache lookup failed", exc_info=True)
+            _stats.record(lookups=len(keys), errors=1)
+            return {}
+
+        found = {}
+        for row in rows:
+            try:
+                found[keys[row.cache_key]] = json.loads(row.result)
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("Verification cache: unreadable entry %s", row.cache_key[:12])
+        _stats.record(lookups=len(keys), hits=len(found))
+        return found
+
+    def put_many(self, verifications: Mapping[str, Dict[str, Any]]) -> int:
+        """Store ``{slide_hash: verification}``; returns how many new rows were written.
+
+        Error results are skipped, and keys already present (another worker
+        got there first) are left as-is.
+        """
+        entries = {
+            self.key(h): (h, {k: v for k, v in result.items() if k not in _SESSION_FIELDS})
+            for h, result in verifications.items()
+            if h and result and not result.get("error")
+        }
+        if not entries:
+            return 0
+
+        from src.database.models import VerificationCacheEntry
+
+        written = 0
+        try:
+            db = self._session()
+            try:
+                existing = {
+                    key
+                    for (key,) in db.query(VerificationCacheEntry.cache_key).filter(
+                        VerificationCacheEntry.cache_key.in_(list(entries))
+                    )
+                }
+                new = [
+                    VerificationCacheEntry(
+                        cache_key=key,
+                        slide_hash=slide_hash,
+                        corpus_hash=self.corpus_digest,
+                        judge_backend=self.judge_backend,
+                        prompt_version=self.prompt_version,
+                        model_endpoint=self.model_endpoint,
+                        result=json.dumps(result),
+                    )
+                    for key, (slide_hash, result) in entries.items()
+                    if key not in existing
+                ]
+                try:
+                    db.add_all(new)
+                    db.commit()
+                    written = len(new)
+                except IntegrityError:
+                    # A concurrent verification stored some of the same keys
+                    # (same verdict inputs); retry row by row so the rest land.
+                    db.rollback()
+                    for row in new:
+                        db.add(row)
+                        try:
+                            db.commit()
+                            written += 1
+                        except IntegrityError:
+                            db.rollback()
+            finally:
+                db.close()
+        except Exception:
+            logger.warning("Verification cache write failed", exc_info=True)
+            _stats.record(errors=1)
+        _stats.record(writes=written)
+        return written
+
+
+# -- metrics and admin -------------------------------------------------------
+
+
+class _CacheStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {"lookups": 0, "hits": 0, "writes": 0, "errors": 0}
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, n in counts.items():
+                self._counts[name] += n
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["lookups"]
+        return {
+            **counts,
+            "misses": lookups - counts["hits"],
+            "hit_rate": round(counts["hits"] / lookups, 3) if lookups else None,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in self._counts:
+                self._counts[name] = 0
+
+
+_stats = _CacheStats()
+
+
+def verification_cache_report(db: Session) -> Dict[str, Any]:
+    """This worker's lookup/hit counters plus row and lifetime hit counts per backend."""
+    from src.database.models import VerificationCacheEntry
+
+    rows = (
+        db.query(
+            VerificationCacheEntry.judge_backend,
+            func.count(VerificationCacheEntry.id),
+            func.coalesce(func.sum(VerificationCacheEntry.hit_count), 0),
+        )
+        .group_by(VerificationCacheEntry.judge_backend)
+        .all()
+    )
+    return {
+        "enabled": cache_enabled(),
+        "worker": _stats.snapshot(),
+        "entries": {backend: {"rows": n, "hits": int(hits)} for backend, n, hits in rows},
+    }
+
+
+def purge_verification_cache(
+    db: Session,
+    judge_backend: Optional[str] = None,
+    prompt_version: Optional[str] = None,
+) -> int:
+    """Delete cached verdicts, optionally only one backend's / prompt version's.
+
+    Returns the number of rows deleted.
+    """
+    from src.database.models import VerificationCacheEntry
+
+    query = db.query(VerificationCacheEntry)
+    if judge_backend:
+        query = query.filter(VerificationCacheEntry.judge_backend == judge_backend)
+    if prompt_version:
+        query = query.filter(VerificationCacheEntry.prompt_version == prompt_version)
+    deleted = query.delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def clear_verification_cache_stats() -> None:
+    """Reset this worker's counters (tests)."""
+    _stats.clear()
@@ -9,6 +9,7 @@ The two resolvers are intentionally orthogonal: this one only ever touches
 ``{{ds-asset:ID}}`` and never ``{{image:ID}}`` (and vice-versa), because the two
 tables have independent id sequences.
 """
+import base64
 import logging
 import re
 from typing import Optional
@@ -16,11 +17,20 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from src.services import design_system_service
+from src.utils import font_subset
 
 logger = logging.getLogger(__name__)
 
 DS_ASSET_PLACEHOLDER_PATTERN = re.compile(r"\{\{ds-asset:(\d+)\}\}")
 
+# An ``@font-face { ... }`` rule. Font handles are only ever wired here (see
+# ``design_system_compiler._font_assets_section``), so this is the one context
+# where a ds-asset is known to be a font and may be subset. The body admits the
+# handle's own ``{{...}}`` braces but no other nesting.
+_FONT_FACE_RE = re.compile(
+    r"@font-face\s*\{(?:[^{}]|\{\{ds-asset:\d+\}\})*\}", re.IGNORECASE
+)
+
 
 def substitute_ds_asset_placeholders(
     html: str, db: Session, *, design_system_id: Optional[int]
@@ -54,6 +64,49 @@ def substitute_ds_asset_placeholders(
     return DS_ASSET_PLACEHOLDER_PATTERN.sub(replace_match, html)
 
 
+def substitute_font_face_ds_assets(
+    css: str,
+    db: Session,
+    *,
+    design_system_id: Optional[int],
+    codepoints: frozenset,
+) -> str:
+    """Resolve ``{{ds-asset:ID}}`` handles inside ``@font-face`` rules to data
+    URIs of font SUBSETS covering ``codepoints``.
+
+    Scoping is identical to :func:`substitute_ds_asset_placeholders` (fetches go
+    through ``get_asset_bytes`` with the mandatory ``design_system_id``). A
+    handle whose font cannot be subset is left in place for the regular
+    resolver, which embeds the full font — subsetting only ever fails open.
+    """
+    if not css or "{{ds-asset:" not in css or design_system_id is None:
+        return css
+
+    def replace_handle(match: "re.Match[str]") -> str:
+        asset_id = int(match.group(1))
+        try:
+            subset = font_subset.get_subset(
+                design_system_id,
+                asset_id,
+                codepoints,
+                lambda: design_system_service.get_asset_bytes(
+                    db, asset_id, design_system_id=design_system_id
+                )[0],
+            )
+        except Exception as e:
+            logger.warning(f"Font subset skipped for {{{{ds-asset:{asset_id}}}}}: {e}")
+            subset = None
+        if subset is None:
+            return match.group(0)
+        data, mime = subset
+        return f"data:{mime};base64,{base64.b64encode(data).decode('utf-8')}"
+
+    def replace_rule(rule: "re.Match[str]") -> str:
+        return DS_ASSET_PLACEHOLDER_PATTERN.sub(replace_handle, rule.group(0))
+
+    return _FONT_FACE_RE.sub(replace_rule, css)
+
+
 # Deck-level string fields (siblings of per-slide ``html``) that can carry a
 # ``{{ds-asset:ID}}`` reference. Per the deck_json schema — "slides array, css,
 # external_scripts, scripts" (see ``database/models/session.py``) — these are the
@@ -80,9 +133,24 @@ def substitute_deck_dict_ds_assets(
     mandatory). A generated deck can only legitimately reference assets of that
     system; any foreign handle — e.g. one echoed from a crafted pinned template's
     HTML — is left unresolved rather than leaking another system's bytes.
+
+    Brand fonts in ``@font-face`` rules are embedded as subsets restricted to
+    the glyphs the deck's slides use (``src.utils.font_subset``) when the
+    optional subsetting stage is enabled; anything it cannot subset falls back
+    to the full font.
     """
     if not deck_dict:
         return deck_dict
+    if font_subset.subsetting_enabled() and design_system_id is not None:
+        codepoints = None
+        for field in _DECK_DS_ASSET_FIELDS:
+            value = deck_dict.get(field)
+            if value and "{{ds-asset:" in value and "@font-face" in value.lower():
+                if codepoints is None:
+                    codepoints = font_subset.deck_codepoints(deck_dict)
+                deck_dict[field] = substitute_font_face_ds_assets(
+                    value, db, design_system_id=design_system_id, codepoints=codepoints
+                )
     for slide in deck_dict.get("slides") or []:
         html = slide.get("html", "")
         if "{{ds-asset:" in html:
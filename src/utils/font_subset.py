@@ -0,0 +1,186 @@
+"""Per-deck subsetting of design-system brand fonts.
+
+A design system's fonts are wired into the deck ``css`` as ``@font-face``
+``src: url('{{ds-asset:ID}}')`` and resolved to base64 data URIs on every
+response and export. Brand fonts run 200KB-1MB per weight, so the deck payload
+is dominated by glyphs the deck never draws. This module produces a subset of a
+font restricted to the glyphs the deck text actually uses (plus printable
+ASCII, so small edits and chart labels keep rendering), cached per
+``(design_system_id, asset_id, glyph-set hash)``.
+
+Subsetting is OPTIONAL and always fails open to the full font:
+
+- ``fontTools`` is imported lazily; when it is not installed the full font is
+  served. WOFF2 output also needs ``brotli`` (both come with the declared
+  ``fonttools[woff]`` dependency); without it the subset is WOFF and a warning
+  is logged once.
+- A subset that loses any codepoint the original font mapped (for the requested
+  text) is discarded in favour of the full font.
+- ``DS_FONT_SUBSETTING=false`` disables the stage entirely.
+"""
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+#: Always kept in every subset: printable ASCII. Cheap (~95 glyphs) and it keeps
+#: client-side text edits, numbers and chart labels in the brand face.
+_BASE_CODEPOINTS = frozenset(range(0x20, 0x7F))
+
+#: Upper bound on cached subset bytes (process-level LRU).
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_FONT_MIMES = {"woff2": "font/woff2", "woff": "font/woff"}
+
+
+def subsetting_enabled() -> bool:
+    """Whether the font subsetting stage runs (``DS_FONT_SUBSETTING``, default on)."""
+    return os.getenv("DS_FONT_SUBSETTING", "true").strip().lower() not in ("0", "false", "no")
+
+
+def deck_codepoints(deck_dict: dict) -> frozenset:
+    """Codepoints of the visible text in a deck's slides, plus printable ASCII."""
+    chars: set = set()
+    for slide in deck_dict.get("slides") or []:
+        html = slide.get("html") or ""
+        if html:
+            chars.update(BeautifulSoup(html, "html.parser").get_text())
+    return frozenset(ord(ch) for ch in chars if not ch.isspace()) | _BASE_CODEPOINTS
+
+
+def glyph_set_hash(codepoints: frozenset) -> str:
+    """Stable hash of a codepoint set — the cache key's glyph component."""
+    payload = ",".join(str(cp) for cp in sorted(codepoints)).encode("ascii")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class _SubsetCache:
+    """Thread-safe LRU of built subsets, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: "OrderedDict[tuple, Optional[tuple[bytes, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            if key not in self._entries:
+                return None, False
+            self._entries.move_to_end(key)
+            return self._entries[key], True
+
+    def put(self, key: tuple, value: Optional[tuple[bytes, str]]) -> None:
+        size = len(value[0]) if value else 0
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted[0]) if evicted else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_cache = _SubsetCache(_CACHE_MAX_BYTES)
+
+
+def clear_cache() -> None:
+    """Drop every cached subset (tests, or after a design-system re-import)."""
+    _cache.clear()
+
+
+_brotli_warned = False
+
+
+def _output_flavor() -> str:
+    global _brotli_warned
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        if not _brotli_warned:
+            _brotli_warned = True
+            logger.warning(
+                "brotli is not installed; brand font subsets are emitted as WOFF "
+                "instead of WOFF2 (install fonttools[woff])"
+            )
+        return "woff"
+    return "woff2"
+
+
+def subset_font(data: bytes, codepoints: frozenset) -> Optional[tuple[bytes, str]]:
+    """Subset a font to ``codepoints``.
+
+    Returns ``(font_bytes, mime)`` or ``None`` when the full font should be
+    served instead: fontTools missing, the font unparseable, or the subset
+    dropping a codepoint the original maps.
+    """
+    try:
+        from fontTools import subset as ft_subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return None
+
+    try:
+        font = TTFont(io.BytesIO(data), lazy=False)
+        original_cmap = font.getBestCmap() or {}
+        wanted = {cp for cp in codepoints if cp in original_cmap}
+
+        options = ft_subset.Options()
+        options.flavor = _output_flavor()
+        options.layout_features = ["*"]
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+        subsetter = ft_subset.Subsetter(options=options)
+        subsetter.populate(unicodes=wanted)
+        subsetter.subset(font)
+
+        if not wanted.issubset((font.getBestCmap() or {}).keys()):
+            return None
+        out = io.BytesIO()
+        font.flavor = options.flavor
+        font.save(out)
+    except Exception as e:
+        logger.warning(f"Font subsetting failed; serving full font: {e}")
+        return None
+
+    subset_bytes = out.getvalue()
+    if len(subset_bytes) >= len(data):
+        return None
+    return subset_bytes, _FONT_MIMES[options.flavor]
+
+
+def get_subset(
+    design_system_id: int,
+    asset_id: int,
+    codepoints: frozenset,
+    load_font: Callable[[], bytes],
+) -> Optional[tuple[bytes, str]]:
+    """Cached :func:`subset_font`, keyed by ``(design_system_id, asset_id, glyph hash)``.
+
+    ``load_font`` fetches the full font bytes and is only called on a miss, so a
+    warm deck render never reads the font blob. A ``None`` result (serve the
+    full font) is cached too, so an unsubsettable font is not re-parsed on
+    every response.
+    """
+    key = (design_system_id, asset_id, glyph_set_hash(codepoints))
+    value, hit = _cache.get(key)
+    if hit:
+        return value
+    value = subset_font(load_font(), codepoints)
+    _cache.put(key, value)
+    return value
@@ -7,7 +7,7 @@ data: URIs), so any hit is off-path.
 """
 
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 # Content-Security-Policy for rendered slide documents. MUST stay in sync with
 # the frontend builder's SLIDE_CSP (frontend/src/services/slideDocument.ts):
@@ -110,6 +110,13 @@ _EXTERNAL_SRC = re.compile(
 )
 
 
+def _external_finding(match: "re.Match[str]") -> Optional[str]:
+    url = match.group(1) or match.group(2)
+    if url and not url.lower().startswith(_ALLOWED_SCRIPT_HOSTS):
+        return f"external resource src: {url}"
+    return None
+
+
 def scan_html_for_unsafe_patterns(html: str) -> List[str]:
     """Return a list of human-readable findings; empty list means clean."""
     if not html:
@@ -122,8 +129,90 @@ def scan_html_for_unsafe_patterns(html: str) -> List[str]:
             findings.append(f"unsafe pattern: {label}")
 
     for match in _EXTERNAL_SRC.finditer(html):
-        url = match.group(1) or match.group(2)
-        if url and not url.lower().startswith(_ALLOWED_SCRIPT_HOSTS):
-            findings.append(f"external resource src: {url}")
+        finding = _external_finding(match)
+        if finding:
+            findings.append(finding)
 
     return findings
+
+
+# Characters of already-scanned text re-read with each new chunk, so a pattern
+# split across tokens is still seen whole. Patterns confined to one tag
+# (``[^>]*``) additionally re-read from the start of a still-open tag, however
+# long it is (e.g. an ``<img>`` with a large data: URI before ``onerror=``).
+_STREAM_OVERLAP_CHARS = 512
+
+
+class IncrementalSafetyScanner:
+    """:func:`scan_html_for_unsafe_patterns` over text that arrives in chunks.
+
+    Each :meth:`feed` scans only an overlapping window at the end of the text.
+    A match is accepted only once at least one character follows it: a
+    trailing ``\b`` (``XMLHttpRequest``) or a URL capture cannot be settled
+    earlier. Every finding :meth:`feed` reports is therefore also a finding of
+    the batch scan on the final text, which is what makes aborting the
+    generation on it safe; :meth:`finish` returns exactly the batch findings.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._scanned = 0
+        self._labels: set = set()
+        # (start, finding or None) of accepted external-resource matches.
+        self._external: List[Tuple[int, Optional[str]]] = []
+        self._external_end = 0
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add ``chunk``; return findings that became certain with it."""
+        if not chunk:
+            return []
+        self._text += chunk
+        return self._scan(final=False)
+
+    def finish(self) -> List[str]:
+        """Settle matches at the very end; return all findings, batch-scan order."""
+        self._scan(final=True)
+        return self.findings
+
+    @property
+    def findings(self) -> List[str]:
+        """Findings so far, in the order :func:`scan_html_for_unsafe_patterns` lists them."""
+        labels = [f"unsafe pattern: {label}" for label, _ in _PATTERNS if label in self._labels]
+        return labels + [finding for _, finding in self._external if finding]
+
+    def _scan(self, final: bool) -> List[str]:
+        text = self.text
+        start = max(0, self._scanned - _STREAM_OVERLAP_CHARS)
+        tag_open = text.rfind("<", 0, self._scanned)
+        if tag_open != -1 and text.find(">", tag_open, self._scanned) == -1:
+            # Back up to the first "<" after the last ">" (a run of unclosed "<").
+            tag_open = text.find("<", text.rfind(">", 0, tag_open) + 1)
+            start = min(start, tag_open)
+        limit = len(text) if final else len(text) - 1
+
+        new: List[str] = []
+        for label, pattern in _PATTERNS:
+            if label in self._labels:
+                continue
+            match = pattern.search(text, start)
+            if match is not None and match.end() <= limit:
+                self._labels.add(label)
+                new.append(f"unsafe pattern: {label}")
+
+        for match in _EXTERNAL_SRC.finditer(text, max(start, self._external_end)):
+            if match.end() > limit:
+                break
+            finding = _external_finding(match)
+            self._external.append((match.start(), finding))
+            self._external_end = match.end()
+            if finding:
+                new.append(finding)
+
+        # Matches not yet accepted may still end past here: keep them in the window.
+        self._scanned = len(text) if final else limit
+        return new
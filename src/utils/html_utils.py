@@ -95,6 +95,172 @@ def _promote_through_slide_wrapper(root: Tag) -> Tag:
         root = parent
 
 
+# Elements that never take a closing tag, so never open a scope.
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+# Elements whose content is raw text: a "<div" inside a chart script is not markup.
+_RAW_TEXT_TAGS = frozenset({"script", "style", "textarea", "title"})
+_TAG_RE = re.compile(r"<(/?)([A-Za-z][\w:-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>")
+_CLASS_ATTR_RE = re.compile(
+    r"""(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+# How far an unterminated "<tag ..." may run before it is treated as text.
+_MAX_PENDING_TAG_CHARS = 8192
+
+
+class _OpenElement:
+    __slots__ = ("name", "start", "slide", "in_slide", "children", "held")
+
+    def __init__(self, name: str, start: int, slide: bool, in_slide: bool):
+        self.name = name
+        self.start = start
+        self.slide = slide
+        self.in_slide = in_slide
+        self.children = 0
+        # (start, end) of a completed slide root waiting to see whether this
+        # element is a sole-child wrapper it should be promoted through.
+        self.held: Tuple[int, int] | None = None
+
+
+class IncrementalSlideScanner:
+    """Recognises completed slide roots in HTML that arrives in chunks.
+
+    Applies the rules of :func:`find_slide_roots` to a token stream: a slide is
+    the outermost element carrying the ``slide`` class token, promoted through
+    sole-child ``section``/``article`` wrappers, and is reported once its
+    closing tag has arrived. Script/style bodies and comments are skipped, so
+    markup inside a chart script is never mistaken for a slide.
+
+    Output is provisional: a slide left unclosed when the stream ends is never
+    reported, and the final parse of the complete output stays authoritative.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[_OpenElement] = []
+        self._raw_text: str | None = None
+        self._ready: List[str] = []
+
+    def feed(self, text: str) -> List[str]:
+        """Add ``text`` and return the HTML of every slide root it completed."""
+        if text:
+            self._buffer += text
+            self._scan()
+        ready, self._ready = self._ready, []
+        return ready
+
+    def _scan(self) -> None:
+        buf = self._buffer
+        while True:
+            if self._raw_text is not None:
+                match = re.compile(rf"</{self._raw_text}\s*>", re.IGNORECASE).search(
+                    buf, self._pos
+                )
+                if match is None:
+                    # Rescan only the tail an end tag could have started in.
+                    self._pos = max(self._pos, len(buf) - len(self._raw_text) - 16)
+                    break
+                self._raw_text = None
+                self._close(match.group(0)[2:-1].strip().lower(), match.start(), match.end())
+                self._pos = match.end()
+                continue
+
+            lt = buf.find("<", self._pos)
+            if lt == -1:
+                self._pos = len(buf)
+                break
+            if buf.startswith("<!--", lt):
+                end = buf.find("-->", lt + 4)
+                if end == -1:
+                    self._pos = lt
+                    break
+                self._pos = end + 3
+                continue
+            if buf.startswith("<!", lt) or buf.startswith("<?", lt):
+                end = buf.find(">", lt)
+                if end == -1:
+                    self._pos = lt
+                    break
+                self._pos = end + 1
+                continue
+
+            match = _TAG_RE.match(buf, lt)
+            if match is None:
+                rest = buf[lt + 1 : lt + 3]
+                might_be_tag = (
+                    rest == ""
+                    or rest[0].isalpha()
+                    or (rest[0] == "/" and (len(rest) == 1 or rest[1].isalpha()))
+                )
+                if might_be_tag and len(buf) - lt < _MAX_PENDING_TAG_CHARS:
+                    self._pos = lt  # wait for the rest of the tag
+                    break
+                self._pos = lt + 1
+                continue
+
+            closing, name, attrs = match.group(1), match.group(2).lower(), match.group(3)
+            self._pos = match.end()
+            if closing:
+                self._close(name, lt, match.end())
+            else:
+                self._open(name, attrs, lt, self_closing=attrs.rstrip().endswith("/"))
+
+        if not self._stack and self._raw_text is None:
+            self._buffer = buf[self._pos :]
+            self._pos = 0
+
+    def _open(self, name: str, attrs: str, start: int, self_closing: bool) -> None:
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            parent.children += 1
+            if parent.held is not None and parent.children > 1:
+                # The held slide has a sibling: its parent is no wrapper.
+                self._emit(*parent.held)
+                parent.held = None
+        if name in _VOID_TAGS or self_closing:
+            return
+        class_match = _CLASS_ATTR_RE.search(attrs)
+        classes = ""
+        if class_match:
+            classes = next(g for g in class_match.groups() if g is not None)
+        in_slide = parent is not None and (parent.slide or parent.in_slide)
+        self._stack.append(_OpenElement(name, start, "slide" in classes.split(), in_slide))
+        if name in _RAW_TEXT_TAGS:
+            self._raw_text = name
+
+    def _close(self, name: str, start: int, end: int) -> None:
+        if not any(element.name == name for element in self._stack):
+            return  # stray end tag
+        while self._stack:
+            element = self._stack.pop()
+            # Elements left open inside this one end where it ends (lenient HTML).
+            element_end = end if element.name == name else start
+            self._complete(element, element_end)
+            if element.name == name:
+                return
+
+    def _complete(self, element: _OpenElement, end: int) -> None:
+        if element.held is not None:
+            span = (element.start, end) if element.children == 1 else None
+        elif element.slide and not element.in_slide:
+            span = (element.start, end)
+        else:
+            span = None
+        if span is None:
+            return
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None and parent.name in SLIDE_WRAPPER_TAGS and parent.children == 1:
+            parent.held = span
+        else:
+            self._emit(*span)
+
+    def _emit(self, start: int, end: int) -> None:
+        self._ready.append(self._buffer[start:end])
+
+
 def extract_canvas_ids_from_html(html_content: str) -> List[str]:
     """Collect canvas ids defined within arbitrary HTML content."""
 
@@ -12,8 +12,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from src.core.settings_db import get_settings
-
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -92,6 +90,10 @@ def setup_logging(settings=None) -> None:
         settings: Optional settings object (will use get_settings() if not provided)
     """
     if settings is None:
+        # Imported here so ``src.utils`` stays free of ``src.core`` (and the
+        # Databricks SDK): thumbnail render workers import it on spawn.
+        from src.core.settings_db import get_settings
+
         settings = get_settings()
 
     log_config = settings.logging
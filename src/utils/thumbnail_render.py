@@ -0,0 +1,52 @@
+"""Thumbnail rendering for image uploads.
+
+Kept to the standard library and Pillow: the image service runs
+:func:`render_thumbnail` in spawn-context worker processes, which import this
+module on first use. Anything heavier here (``src.services`` pulls in the
+agent, LangChain and MLflow) would be paid by every fresh worker.
+"""
+import base64
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image as PILImage
+
+THUMBNAIL_SIZE = (150, 150)
+
+
+def render_thumbnail(content: bytes, mime_type: str) -> Optional[str]:
+    """
+    Generate 150x150 thumbnail as base64 data URI.
+
+    - For raster images: resize with Pillow, maintain aspect ratio
+    - For animated GIFs: extract first frame
+    - For SVGs: return None (render as-is in UI, they scale natively)
+    """
+    if mime_type == "image/svg+xml":
+        return None
+
+    img = PILImage.open(BytesIO(content))
+
+    # For animated GIFs, use first frame
+    if mime_type == "image/gif" and hasattr(img, "n_frames") and img.n_frames > 1:
+        img.seek(0)
+
+    # Convert palette/CMYK to RGB(A)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in (img.mode or "") else "RGB")
+
+    # Resize maintaining aspect ratio
+    img.thumbnail(THUMBNAIL_SIZE, PILImage.Resampling.LANCZOS)
+
+    # Encode as PNG (supports transparency) or JPEG
+    buffer = BytesIO()
+    if img.mode == "RGBA":
+        img.save(buffer, format="PNG")
+        thumb_mime = "image/png"
+    else:
+        img.save(buffer, format="JPEG", quality=85)
+        thumb_mime = "image/jpeg"
+
+    buffer.seek(0)
+    b64 = base64.b64encode(buffer.read()).decode("utf-8")
+    return f"data:{thumb_mime};base64,{b64}"
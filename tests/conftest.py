@@ -47,6 +47,23 @@ def clear_settings_cache():
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_agent_factory_caches():
+    """
+    Clear the agent factory's process-level caches before each test.
+
+    Test databases reuse ids and tests patch the tool builders, so a prompt or
+    tool set cached by one test must not answer another's.
+    """
+    from src.services.agent_factory import clear_agent_component_cache, clear_prompt_cache
+
+    clear_prompt_cache()
+    clear_agent_component_cache()
+    yield
+    clear_prompt_cache()
+    clear_agent_component_cache()
+
+
 @pytest.fixture
 def mock_env_vars() -> Generator[dict[str, str], None, None]:
     """
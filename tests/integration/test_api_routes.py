@@ -6,6 +6,8 @@ Services are mocked to isolate route testing from business logic.
 Run: pytest tests/integration/test_api_routes.py -v
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
@@ -109,6 +111,7 @@ def mock_session_manager(test_db):
          patch("src.api.routes.slides.get_session_manager") as mock_slides, \
          patch("src.api.routes.sessions.get_session_manager") as mock_sessions, \
          patch("src.api.routes.verification.get_session_manager") as mock_verify, \
+         patch("src.api.services.deck_verification.get_session_manager") as mock_deck, \
          patch("src.api.routes._authz.get_session_manager") as mock_authz, \
          patch("src.api.routes.chat.get_current_user", return_value="test@local.dev"), \
          patch("src.api.routes.slides.get_current_user", return_value="test@local.dev"), \
@@ -136,6 +139,7 @@ def mock_session_manager(test_db):
         mock_slides.return_value = manager
         mock_sessions.return_value = manager
         mock_verify.return_value = manager
+        mock_deck.return_value = manager
         mock_authz.return_value = manager
         yield manager
 
@@ -991,6 +995,8 @@ class TestVerificationEndpoints:
             "src.api.routes.verification._check_deck_permission_for_session",
             lambda *a, **k: None,
         )
+        # Judge calls are mocked per test; keep verdicts out of the shared cache.
+        monkeypatch.setenv("VERIFICATION_CACHE_ENABLED", "false")
 
     def test_verify_slide_success(self, client, mock_session_manager):
         """POST /api/verification/{index} triggers verification."""
@@ -1017,8 +1023,8 @@ class TestVerificationEndpoints:
         mock_settings.llm_judge_backend = "mlflow"
 
         # Mock the evaluate_with_judge function
-        with patch("src.api.routes.verification.get_settings", return_value=mock_settings):
-            with patch("src.api.routes.verification.evaluate_with_judge") as mock_eval:
+        with patch("src.api.services.deck_verification.get_settings", return_value=mock_settings):
+            with patch("src.api.services.deck_verification.evaluate_with_judge") as mock_eval:
                 mock_result = MagicMock()
                 mock_result.score = 0.95
                 mock_result.rating = "excellent"
@@ -1119,7 +1125,7 @@ class TestVerificationEndpoints:
         mock_session_manager.save_verification.return_value = None
 
         with patch("src.utils.slide_hash.compute_slide_hash", return_value="hash456"):
-            with patch("src.api.routes.verification.evaluate_with_judge") as mock_eval:
+            with patch("src.api.services.deck_verification.evaluate_with_judge") as mock_eval:
                 response = client.post(
                     "/api/verification/0",
                     json={"session_id": "test-123"},
@@ -1131,6 +1137,68 @@ class TestVerificationEndpoints:
         assert "No substantive source data" in data["explanation"]
         mock_eval.assert_not_called()
 
+    def test_verify_deck_streams_per_slide_results(self, client, mock_session_manager):
+        """POST /api/verification/deck judges new slides once and streams progress."""
+        mock_session_manager.get_session.return_value = {
+            "session_id": "test-123",
+            "genie_conversation_id": "genie-1",
+        }
+        mock_session_manager.get_slide_deck.return_value = {
+            "slides": [
+                {"html": "<div>A</div>", "content_hash": "ha", "verification": None},
+                {
+                    "html": "<div>B</div>",
+                    "content_hash": "hb",
+                    "verification": {"rating": "green", "score": 90, "error": False},
+                },
+            ],
+        }
+        mock_session_manager.get_messages.return_value = [
+            {
+                "role": "tool",
+                "message_type": "tool_result",
+                "content": "Query result: Sales = $100",
+                "metadata": {"tool_name": "query_genie"},
+            }
+        ]
+        mock_session_manager.get_experiment_id.return_value = "exp-123"
+
+        mock_result = MagicMock(
+            score=0.95, rating="excellent", explanation="ok", issues=[], duration_ms=5,
+            trace_id=None, error=False, error_message=None,
+        )
+        mock_settings = MagicMock(llm_judge_backend="mlflow")
+        with patch("src.api.services.deck_verification.get_settings", return_value=mock_settings):
+            with patch(
+                "src.api.services.deck_verification.evaluate_with_judge",
+                return_value=mock_result,
+            ) as mock_eval:
+                response = client.post(
+                    "/api/verification/deck", json={"session_id": "test-123"}
+                )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert [e["type"] for e in events] == ["slide", "slide", "complete"]
+        assert mock_eval.call_count == 1
+        mock_session_manager.save_verifications.assert_called_once()
+        assert list(mock_session_manager.save_verifications.call_args.args[1]) == ["ha"]
+
+    def test_verify_deck_no_slides(self, client, mock_session_manager):
+        """POST /api/verification/deck returns 404 when the session has no slides."""
+        mock_session_manager.get_session.return_value = {"session_id": "test-123"}
+        mock_session_manager.get_slide_deck.return_value = None
+
+        response = client.post("/api/verification/deck", json={"session_id": "test-123"})
+
+        assert response.status_code == 404
+        assert "No slides found" in response.json()["detail"]
+
     @pytest.mark.skip(reason="MLflow mocking requires complex setup - mlflow is imported inside function")
     def test_submit_feedback_success(self, client, mock_session_manager):
         """POST /api/verification/{index}/feedback records feedback."""
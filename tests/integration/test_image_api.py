@@ -10,6 +10,7 @@ from sqlalchemy.pool import StaticPool
 from src.api.main import app
 from src.core.database import Base, get_db
 from src.database.models.image import ImageAsset
+from src.services import image_service
 from tests.unit.conftest_images import create_test_image
 
 
@@ -37,15 +38,29 @@ def db_session(db_engine):
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, monkeypatch):
     def override_get_db():
         try:
             yield db_session
         finally:
             pass
+
+    # Uploads render thumbnails off-request; let them land before the
+    # per-test database is dropped.
+    scheduled = []
+    schedule = image_service.schedule_thumbnail
+
+    def tracking_schedule(*args, **kwargs):
+        future = schedule(*args, **kwargs)
+        scheduled.append(future)
+        return future
+
+    monkeypatch.setattr(image_service, "schedule_thumbnail", tracking_schedule)
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
         yield c
+        for future in scheduled:
+            future.result(timeout=60)
     app.dependency_overrides.clear()
 
 
@@ -77,7 +92,8 @@ class TestUploadEndpoint:
         assert data["category"] == "branding"
         assert data["tags"] == ["logo"]
         assert data["id"] is not None
-        assert data["thumbnail_base64"] is not None
+        # Thumbnails render off-request; the upload returns once the original is stored.
+        assert data["thumbnail_status"] in ("pending", "ready")
 
     def test_upload_rejects_invalid_type(self, client):
         response = client.post(
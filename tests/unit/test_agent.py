@@ -163,8 +163,9 @@ class TestSlideGeneratorAgent:
             # Create tools for the session
             tools = agent_with_mocks._create_tools_for_session(session_id)
 
-            assert len(tools) == 2
+            assert len(tools) == 3
             genie_tool = next(t for t in tools if t.name == "query_genie_space")
+            assert any(t.name == "read_genie_result" for t in tools)
             assert "Genie" in genie_tool.description
             assert any(t.name == "search_images" for t in tools)
     
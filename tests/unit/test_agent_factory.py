@@ -499,8 +499,8 @@ def test_multiple_genie_tools(default_prompts):
 
     tools = _build_tools(config, session_data)
 
-    # search_images + 2 genie tools
-    assert len(tools) == 3
+    # search_images + 2 genie tools + one shared result pager
+    assert len(tools) == 4
     genie_tools = [t for t in tools if "query_genie_space" in t.name]
     assert len(genie_tools) == 2
     # Unique names
@@ -672,8 +672,8 @@ class TestBrandAssetToolRegistration:
             AgentBricksTool(type="agent_bricks", endpoint_name="hr-bot"),
         ])
         tools = _build_tools(config, {})
-        # 1 image search + 5 tool types = 6
-        assert len(tools) == 6
+        # 1 image search + 5 tool types + the Genie result pager = 7
+        assert len(tools) == 7
 
 
 class TestBrandAssetToolRequiresAnActiveDesignSystem:
@@ -804,3 +804,214 @@ class TestBrandAssetToolRequiresAnActiveDesignSystem:
             names = [t.name for t in _build_tools(AgentConfig(design_system_id=7), {})]
         assert "search_brand_assets" not in names
         assert "search_images" in names
+
+
+class TestPromptCache:
+    """Design-system prompts are memoized per (design system revision, template,
+    mode, compiler version, deck prompt) and re-assembled after any edit."""
+
+    session = TestBrandAssetToolRequiresAnActiveDesignSystem.session
+    _db = staticmethod(TestBrandAssetToolRequiresAnActiveDesignSystem._db)
+
+    @staticmethod
+    def _make_ds(session):
+        from src.database.models.design_system import DesignSystem, DesignSystemToken
+        from src.services.design_system_compiler import recompute_compiled_style_content
+
+        ds = DesignSystem(name="Cached DS", is_active=True)
+        ds.tokens.append(DesignSystemToken(group="core", name="primary", value="#123456"))
+        session.add(ds)
+        session.flush()
+        recompute_compiled_style_content(ds)
+        session.commit()
+        return ds
+
+    def _prompt(self, session, config, mode="generate"):
+        from src.services import agent_factory
+
+        with self._db(session), patch.object(
+            agent_factory,
+            "_assemble_prompt_content",
+            wraps=agent_factory._assemble_prompt_content,
+        ) as assemble:
+            prompts = agent_factory._get_prompt_content(config, mode=mode)
+        return prompts, assemble.call_count
+
+    def test_warm_request_skips_assembly(self, session):
+        from src.api.schemas.agent_config import AgentConfig
+
+        ds = self._make_ds(session)
+        config = AgentConfig(design_system_id=ds.id)
+        first, cold_calls = self._prompt(session, config)
+        second, warm_calls = self._prompt(session, config)
+
+        assert (cold_calls, warm_calls) == (1, 0)
+        assert second == first
+        assert "#123456" in second["system_prompt"]
+
+    def test_edit_invalidates(self, session):
+        from src.api.schemas.agent_config import AgentConfig
+        from src.services.design_system_compiler import recompute_compiled_style_content
+
+        ds = self._make_ds(session)
+        config = AgentConfig(design_system_id=ds.id)
+        self._prompt(session, config)
+
+        ds.tokens[0].value = "#abcdef"
+        ds.version += 1
+        recompute_compiled_style_content(ds)
+        session.commit()
+        prompts, calls = self._prompt(session, config)
+
+        assert calls == 1
+        assert "#abcdef" in prompts["system_prompt"]
+
+    def test_mode_is_part_of_the_key(self, session):
+        from src.api.schemas.agent_config import AgentConfig
+
+        ds = self._make_ds(session)
+        config = AgentConfig(design_system_id=ds.id)
+        generate, _ = self._prompt(session, config, mode="generate")
+        edit, calls = self._prompt(session, config, mode="edit")
+
+        assert calls == 1
+        assert edit["system_prompt"] != generate["system_prompt"]
+
+    def test_soft_deleted_design_system_is_not_served_from_cache(self, session):
+        from src.api.schemas.agent_config import AgentConfig
+
+        ds = self._make_ds(session)
+        config = AgentConfig(design_system_id=ds.id)
+        cached, _ = self._prompt(session, config)
+        ds.is_active = False
+        session.commit()
+        prompts, calls = self._prompt(session, config)
+
+        assert calls == 1
+        assert "#123456" not in prompts["system_prompt"]
+
+    def test_degraded_assembly_is_not_cached(self, session):
+        from src.api.schemas.agent_config import AgentConfig
+        from src.services import agent_factory
+
+        ds = self._make_ds(session)
+        config = AgentConfig(design_system_id=ds.id)
+        with patch(
+            "src.services.design_system_compiler.ensure_compiled_style_content_current",
+            side_effect=RuntimeError("boom"),
+        ):
+            self._prompt(session, config)
+        assert not agent_factory._prompt_cache
+
+
+class TestAgentComponentCache:
+    """Model and session-independent tools are reused across requests."""
+
+    def _build(self, config, session_data, default_prompts, *, mcp=None):
+        from src.services.agent_factory import build_agent_for_request
+
+        mcp_tool = mcp
+        if mcp_tool is None:
+            mcp_tool = MagicMock()
+            mcp_tool.name = "mcp_conn_search"
+        with patch("src.services.agent_factory._create_model") as mock_model, \
+             patch("src.services.agent_factory._get_prompt_content") as mock_prompts, \
+             patch("src.services.agent_factory.build_mcp_tools") as mock_build_mcp, \
+             patch("src.services.agent_factory.build_genie_tool") as mock_genie, \
+             patch("src.services.agent.get_settings"), \
+             patch("src.services.agent.get_databricks_client"):
+            mock_model.return_value = MagicMock()
+            mock_prompts.return_value = default_prompts
+            mock_build_mcp.return_value = [mcp_tool]
+
+            def genie_tool(entry, data, index):
+                tool = MagicMock()
+                tool.name = f"query_genie_space_{index}"
+                return tool
+
+            mock_genie.side_effect = genie_tool
+            agent = build_agent_for_request(config, session_data)
+        return agent, mock_model, mock_build_mcp, mock_genie
+
+    def _config(self):
+        from src.api.schemas.agent_config import AgentConfig, GenieTool, MCPTool
+
+        return AgentConfig(tools=[
+            GenieTool(type="genie", space_id="s1", space_name="Sales"),
+            MCPTool(type="mcp", connection_name="conn", server_name="Srv"),
+        ])
+
+    def test_warm_build_skips_model_and_tool_discovery(self, default_prompts):
+        config = self._config()
+        first, model_1, mcp_1, _ = self._build(config, {"session_id": "a"}, default_prompts)
+        second, model_2, mcp_2, genie_2 = self._build(config, {"session_id": "b"}, default_prompts)
+
+        assert (model_1.call_count, mcp_1.call_count) == (1, 1)
+        assert (model_2.call_count, mcp_2.call_count) == (0, 0)
+        assert second._pre_built_model is first._pre_built_model
+        # Genie is bound to the request's own session data every time
+        assert genie_2.call_args[0][1] == {"session_id": "b"}
+        assert [t.name for t in second.tools] == [t.name for t in first.tools]
+
+    def test_other_user_or_config_misses(self, default_prompts):
+        from src.api.schemas.agent_config import AgentConfig, MCPTool
+        from src.core.user_context import set_current_user
+
+        config = self._config()
+        set_current_user("alice@example.com")
+        try:
+            self._build(config, {}, default_prompts)
+            set_current_user("bob@example.com")
+            _, _, mcp_bob, _ = self._build(config, {}, default_prompts)
+        finally:
+            set_current_user(None)
+        other = AgentConfig(tools=[MCPTool(type="mcp", connection_name="other", server_name="Srv")])
+        _, _, mcp_other, _ = self._build(other, {}, default_prompts)
+
+        assert mcp_bob.call_count == 1
+        assert mcp_other.call_count == 1
+
+    def test_entries_expire(self, default_prompts, monkeypatch):
+        from src.services import agent_factory
+
+        monkeypatch.setattr(agent_factory, "AGENT_COMPONENT_CACHE_TTL_SECONDS", 0)
+        config = self._config()
+        self._build(config, {}, default_prompts)
+        _, model, _, _ = self._build(config, {}, default_prompts)
+
+        assert model.call_count == 1
+
+    def test_model_is_shared_across_users(self, default_prompts):
+        from src.core.user_context import set_current_user
+
+        config = self._config()
+        set_current_user("alice@example.com")
+        try:
+            alice, _, _, _ = self._build(config, {}, default_prompts)
+            set_current_user("bob@example.com")
+            bob, model_bob, mcp_bob, _ = self._build(config, {}, default_prompts)
+        finally:
+            set_current_user(None)
+
+        assert model_bob.call_count == 0
+        assert bob._pre_built_model is alice._pre_built_model
+        assert mcp_bob.call_count == 1
+
+    def test_degraded_tools_are_not_cached(self, default_prompts):
+        from langchain_core.tools import StructuredTool
+
+        from src.services.tools import mark_degraded
+
+        fallback = mark_degraded(
+            StructuredTool.from_function(
+                func=lambda query: query, name="mcp_conn_search", description="search"
+            ),
+            "mcp_discovery",
+        )
+        config = self._config()
+        self._build(config, {}, default_prompts, mcp=fallback)
+        _, _, mcp_retry, _ = self._build(config, {}, default_prompts)
+        _, _, mcp_warm, _ = self._build(config, {}, default_prompts)
+
+        assert mcp_retry.call_count == 1
+        assert mcp_warm.call_count == 0
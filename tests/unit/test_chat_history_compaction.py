@@ -0,0 +1,121 @@
+"""Tests for token-budgeted chat history compaction."""
+
+from unittest.mock import MagicMock, patch
+
+from langchain_community.chat_message_histories import ChatMessageHistory
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.services.chat_history_compaction import (
+    SUMMARY_PREFIX,
+    compact_chat_history,
+    estimate_messages_tokens,
+    summarize_assistant_turn,
+)
+
+
+def _deck(*titles, body="x" * 2000):
+    return "".join(
+        f"<div class='slide'><h1>{title}</h1><p>{body}</p></div>" for title in titles
+    )
+
+
+def _session(turns):
+    """Human/AI pairs: each turn is (question, assistant_content)."""
+    messages = []
+    for question, answer in turns:
+        messages.append(HumanMessage(content=question))
+        messages.append(AIMessage(content=answer))
+    return messages
+
+
+class TestSummarizeAssistantTurn:
+    def test_lists_slide_titles(self):
+        summary = summarize_assistant_turn(_deck("Intro", "Revenue"))
+        assert summary.startswith(SUMMARY_PREFIX)
+        assert "1. Intro; 2. Revenue" in summary
+        assert "<div" not in summary
+
+    def test_reports_changed_positions(self):
+        before = _deck("Intro", "Revenue", "Outlook")
+        after = _deck("Intro", "Revenue Q3", "Outlook")
+        from src.services.chat_history_compaction import _slides
+
+        assert "Changed slides: 2." in summarize_assistant_turn(after, _slides(before))
+
+    def test_plain_text_is_truncated_not_summarized(self):
+        assert summarize_assistant_turn("Add or replace?") == "Add or replace?"
+        assert len(summarize_assistant_turn("word " * 500)) <= 400
+
+
+class TestCompactChatHistory:
+    def test_under_budget_is_unchanged(self):
+        messages = _session([("make slides", _deck("Intro"))])
+        result, stats = compact_chat_history(messages, budget=100_000, keep_turns=2)
+        assert result == messages
+        assert stats.summarized == stats.dropped == 0
+
+    def test_old_turns_summarized_recent_and_latest_deck_verbatim(self):
+        messages = _session([
+            ("make slides", _deck("Intro", "Revenue")),
+            ("change revenue", _deck("Intro", "Revenue Q3")),
+            ("which slide is longest?", "Slide 2."),
+            ("thanks", "You're welcome."),
+        ])
+        result, stats = compact_chat_history(messages, budget=1500, keep_turns=2)
+
+        assert [type(m) for m in result] == [type(m) for m in messages]
+        assert result[1].content.startswith(SUMMARY_PREFIX)
+        # Latest deck is outside the verbatim window but stays authoritative.
+        assert result[3].content == messages[3].content
+        assert result[4:] == messages[4:]
+        assert stats.summarized == 1
+        assert stats.tokens_out < stats.tokens_in
+
+    def test_over_budget_drops_oldest_whole_exchanges(self):
+        messages = _session([(f"q{i} " + "y" * 400, "plain answer " * 40) for i in range(6)])
+        result, stats = compact_chat_history(messages, budget=300, keep_turns=1)
+
+        assert stats.dropped > 0
+        assert stats.tokens_out <= 300
+        assert isinstance(result[0], HumanMessage)
+        assert result[-2:] == messages[-2:]
+        assert estimate_messages_tokens(result) == stats.tokens_out
+
+    def test_budget_zero_disables(self):
+        messages = _session([("q", _deck("A", "B")), ("q2", _deck("A", "C"))])
+        result, _ = compact_chat_history(messages, budget=0, keep_turns=0)
+        assert result == messages
+
+    def test_tokens_sent_grow_linearly_not_quadratically(self):
+        """Twenty full-deck edits replay only the latest deck plus summaries."""
+        turns = [(f"edit {i}", _deck("Intro", f"Revenue v{i}", "Outlook")) for i in range(20)]
+        messages = _session(turns)
+        result, stats = compact_chat_history(messages, budget=4000, keep_turns=1)
+
+        full_decks = [m for m in result if isinstance(m, AIMessage) and "<div" in m.content]
+        assert len(full_decks) == 1
+        assert stats.tokens_out < stats.tokens_in / 5
+
+
+def test_hydration_applies_budget(monkeypatch):
+    from src.api.services.chat_service import ChatService
+
+    monkeypatch.setenv("CHAT_HISTORY_TOKEN_BUDGET", "2000")
+    monkeypatch.setenv("CHAT_HISTORY_VERBATIM_TURNS", "1")
+    rows = []
+    for i in range(5):
+        rows.append({"role": "user", "content": f"edit {i}", "message_type": "user_query"})
+        rows.append({
+            "role": "assistant",
+            "content": _deck("Intro", f"Revenue v{i}"),
+            "message_type": "llm_response",
+        })
+    sm = MagicMock()
+    sm.get_messages.return_value = rows
+    history = ChatMessageHistory()
+    with patch("src.api.services.chat_service.get_session_manager", return_value=sm):
+        count = ChatService.__new__(ChatService)._hydrate_chat_history("s1", history)
+
+    assert count == len(history.messages)
+    assert history.messages[-1].content == rows[-1]["content"]
+    assert history.messages[1].content.startswith(SUMMARY_PREFIX)
@@ -174,3 +174,23 @@ def test_migration_is_idempotent(sqlite_engine):
         assert count == 1
         rows = conn.execute(text("SELECT google_credentials_encrypted FROM config_profiles")).fetchall()
         assert all(r[0] is None for r in rows)
+
+
+# ---------------------------------------------------------------------------
+# Test: brand-asset search index is added to pre-existing tables
+# ---------------------------------------------------------------------------
+
+def test_migration_adds_design_system_asset_kind_index(sqlite_engine):
+    Base.metadata.create_all(bind=sqlite_engine)
+    with sqlite_engine.connect() as conn:
+        conn.execute(text("DROP INDEX ix_design_system_asset_ds_kind"))
+        conn.commit()
+
+    _run_migrations(sqlite_engine, schema=None)
+    _run_migrations(sqlite_engine, schema=None)
+
+    indexes = {
+        ix["name"]: ix["column_names"]
+        for ix in inspect(sqlite_engine).get_indexes("design_system_asset")
+    }
+    assert indexes["ix_design_system_asset_ds_kind"] == ["design_system_id", "kind"]
@@ -0,0 +1,189 @@
+"""Tests for whole-deck verification (one load, hash reuse, bounded judge concurrency)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.services import deck_verification
+from src.api.services.deck_verification import verify_deck
+
+_CORPUS = [
+    {
+        "role": "tool",
+        "message_type": "tool_result",
+        "content": "revenue | 2024\n1200000 | 2024",
+        "metadata": {"tool_name": "query_genie"},
+    }
+]
+
+_DONE = {"score": 90, "rating": "green", "explanation": "ok", "issues": [], "error": False}
+
+
+def _slide(html, verification=None):
+    return {"html": html, "content_hash": f"h-{html}", "verification": verification}
+
+
+@pytest.fixture(autouse=True)
+def _no_verification_cache(monkeypatch):
+    # Cache behaviour is covered in test_verification_cache.py.
+    monkeypatch.setenv("VERIFICATION_CACHE_ENABLED", "false")
+
+
+@pytest.fixture
+def manager():
+    manager = MagicMock()
+    manager.get_session.return_value = {"genie_conversation_id": "conv-1"}
+    manager.get_messages.return_value = _CORPUS
+    manager.get_experiment_id.return_value = "exp-1"
+    with patch.object(deck_verification, "get_session_manager", return_value=manager):
+        yield manager
+
+
+class FakeJudge:
+    def __init__(self, delay=0.01, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, genie_data, slide_content, experiment_id, judge_backend):
+        self.calls.append(slide_content)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        failed = slide_content in self.fail
+        return SimpleNamespace(
+            score=0 if failed else 95,
+            rating="error" if failed else "green",
+            explanation="",
+            issues=[],
+            duration_ms=10,
+            trace_id=None,
+            error=failed,
+            error_message="boom" if failed else None,
+        )
+
+
+async def _collect(session_id="s1", **kwargs):
+    return [event async for event in verify_deck(session_id, **kwargs)]
+
+
+def _run(judge, **kwargs):
+    settings = SimpleNamespace(llm_judge_backend="mlflow")
+    with patch.object(deck_verification, "evaluate_with_judge", judge), patch.object(
+        deck_verification, "get_settings", return_value=settings
+    ):
+        return asyncio.run(_collect(**kwargs))
+
+
+def test_deck_is_loaded_once_and_saved_in_one_write(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide(f"s{i}") for i in range(5)]}
+    judge = FakeJudge()
+
+    events = _run(judge)
+
+    assert manager.get_slide_deck.call_count == 1
+    assert manager.get_messages.call_count == 1
+    manager.save_verifications.assert_called_once()
+    saved = manager.save_verifications.call_args.args[1]
+    assert set(saved) == {f"h-s{i}" for i in range(5)}
+    assert sorted(e["slide_index"] for e in events if e["type"] == "slide") == list(range(5))
+    assert events[-1]["type"] == "complete"
+    assert events[-1]["judge_calls"] == 5
+
+
+def test_existing_results_and_duplicate_slides_are_not_rejudged(manager):
+    manager.get_slide_deck.return_value = {
+        "slides": [_slide("a", _DONE), _slide("b"), _slide("b"), _slide("c", {"error": True})]
+    }
+    judge = FakeJudge()
+
+    events = _run(judge)
+
+    assert sorted(judge.calls) == ["b", "c"]
+    slide_events = {e["slide_index"]: e for e in events if e["type"] == "slide"}
+    assert slide_events[0]["cached"] is True
+    assert slide_events[1]["verification"] == slide_events[2]["verification"]
+    assert events[-1]["reused"] == 1
+    assert events[-1]["verified"] == 3
+
+
+def test_force_rejudges_everything(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide("a", _DONE)]}
+    judge = FakeJudge()
+
+    _run(judge, force=True)
+
+    assert judge.calls == ["a"]
+
+
+def test_judge_concurrency_is_capped(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide(f"s{i}") for i in range(8)]}
+    judge = FakeJudge(delay=0.05)
+
+    _run(judge, max_concurrency=3)
+
+    assert judge.peak == 3
+
+
+def test_failed_judge_calls_are_counted(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide("a"), _slide("b")]}
+
+    events = _run(FakeJudge(fail={"b"}))
+
+    assert events[-1]["failed"] == 1
+
+
+def test_no_source_data_skips_the_judge(manager):
+    manager.get_messages.return_value = []
+    manager.get_slide_deck.return_value = {"slides": [_slide("a"), _slide("b")]}
+    judge = FakeJudge()
+
+    events = _run(judge)
+
+    assert judge.calls == []
+    assert {e["verification"]["rating"] for e in events if e["type"] == "slide"} == {"unknown"}
+    assert len(manager.save_verifications.call_args.args[1]) == 2
+
+
+def test_fully_verified_deck_makes_no_writes(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide("a", _DONE)]}
+
+    events = _run(FakeJudge())
+
+    manager.get_messages.assert_not_called()
+    manager.save_verifications.assert_not_called()
+    assert events[-1]["judge_calls"] == 0
+
+
+def test_partial_results_are_saved_when_cancelled(manager):
+    manager.get_slide_deck.return_value = {"slides": [_slide("a"), _slide("b")]}
+    settings = SimpleNamespace(llm_judge_backend="mlflow")
+
+    async def first_then_stop():
+        stream = verify_deck("s1", max_concurrency=1)
+        async for event in stream:
+            if event["type"] == "slide":
+                break
+        await stream.aclose()
+
+    with patch.object(deck_verification, "evaluate_with_judge", FakeJudge()), patch.object(
+        deck_verification, "get_settings", return_value=settings
+    ):
+        asyncio.run(first_then_stop())
+
+    manager.save_verifications.assert_called_once()
+    assert len(manager.save_verifications.call_args.args[1]) == 1
+
+
+def test_empty_deck_raises_lookup_error(manager):
+    manager.get_slide_deck.return_value = None
+
+    with pytest.raises(LookupError):
+        _run(FakeJudge())
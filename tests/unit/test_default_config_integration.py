@@ -5,7 +5,7 @@ all consumers (agent, chat_service, llm_judge, config_validator) read LLM parame
 from DEFAULT_CONFIG["llm"] in src/core/defaults.py.
 """
 import inspect
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -29,6 +29,8 @@ def test_agent_create_model_uses_default_config():
         mock_db_client.return_value = MagicMock()
 
         from src.services.agent import SlideGeneratorAgent
+        from src.services.llm_admission_callback import LLMAdmissionCallback
+        from src.services.prompt_cache_usage import PromptCacheUsageCallback
         agent = SlideGeneratorAgent()
 
         # Call _create_model
@@ -42,7 +44,12 @@ def test_agent_create_model_uses_default_config():
             max_tokens=llm_config["max_tokens"],
             top_p=llm_config["top_p"],
             workspace_client=mock_system_client.return_value,
+            callbacks=[ANY, ANY],
         )
+        cache_callback, admission_callback = mock_chat.call_args.kwargs["callbacks"]
+        assert isinstance(cache_callback, PromptCacheUsageCallback)
+        assert isinstance(admission_callback, LLMAdmissionCallback)
+        assert admission_callback.endpoint == llm_config["endpoint"]
 
 
 def test_llm_judge_default_model_uses_default_config():
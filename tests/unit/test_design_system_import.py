@@ -38,6 +38,7 @@ from tests.unit.conftest_design_system import (
     make_bundle_zip,
     make_declared_size_bundle_zip,
     make_zip64_header_offset_archive,
+    png_bytes,
     webp_bytes,
 )
 
@@ -155,6 +156,169 @@ class TestImportHappyPath:
         assert ds.name == "Renamed DS"
 
 
+# ---------------------------------------------------------------------------
+# Streaming import: spooled file source + batched asset flushes
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingImport:
+    def test_file_source_imports_like_bytes(self, session, tmp_path):
+        from src.services.design_system_service import import_bundle
+
+        path = tmp_path / "bundle.zip"
+        path.write_bytes(make_bundle_zip())
+        with open(path, "rb") as fh:
+            ds = import_bundle(session, zip_file=fh, user="u")
+
+        assert ds.name == "Acme Design System"
+        assert {a.filename for a in ds.assets} >= {"acme-sans.woff2", "logo.svg"}
+        assert ds.compiled_style_content
+
+    @pytest.mark.parametrize("kwargs", [{}, {"zip_bytes": b"x", "zip_file": io.BytesIO(b"x")}])
+    def test_exactly_one_source_is_required(self, session, kwargs):
+        from src.services.design_system_service import import_bundle
+
+        with pytest.raises(TypeError):
+            import_bundle(session, user="u", **kwargs)
+
+    def test_assets_are_flushed_in_batches_and_released(self, session, monkeypatch):
+        from src.database.models.design_system import DesignSystemAsset
+        from src.services import design_system_service
+        from src.services.design_system_service import import_bundle
+
+        monkeypatch.setattr(design_system_service, "ASSET_FLUSH_BATCH_BYTES", 1)
+        flushes, released = [], []
+        real_flush, real_expire = session.flush, session.expire
+        monkeypatch.setattr(
+            session, "flush", lambda *a, **kw: (flushes.append(1), real_flush(*a, **kw))
+        )
+
+        def expire(obj, attrs=None):
+            released.append((obj.filename, tuple(attrs or ())))
+            real_expire(obj, attrs)
+
+        monkeypatch.setattr(session, "expire", expire)
+
+        ds = import_bundle(session, zip_bytes=make_bundle_zip(), user="u")
+
+        # One flush per asset (batch of 1 byte) plus the final one.
+        assert len(flushes) > len(ds.assets)
+        # Each flushed asset's bytes are released from the session ...
+        assert sorted(released) == sorted((a.filename, ("data",)) for a in ds.assets)
+        # ... and reload from the row on access.
+        logo = next(a for a in ds.assets if a.filename == "logo.svg")
+        assert session.get(DesignSystemAsset, logo.id).data == SVG_LOGO
+
+    def test_refusal_after_a_batch_flush_leaves_nothing_behind(self, session, monkeypatch):
+        from src.services import design_system_service
+        from src.services.design_system_service import DesignSystemImportError, import_bundle
+
+        monkeypatch.setattr(design_system_service, "ASSET_FLUSH_BATCH_BYTES", 1)
+
+        def refuse(self):
+            # Every asset has been flushed by now (1-byte batches).
+            raise DesignSystemImportError("late refusal")
+
+        monkeypatch.setattr(design_system_service._BatchedAssetWriter, "finish", refuse)
+
+        with pytest.raises(DesignSystemImportError):
+            import_bundle(session, zip_bytes=make_bundle_zip(), user="u")
+        assert session.query(DesignSystem).count() == 0
+
+    def test_refusal_keeps_the_callers_pending_work(self, session, monkeypatch):
+        from src.services import design_system_service
+        from src.services.design_system_service import DesignSystemImportError, import_bundle
+
+        monkeypatch.setattr(design_system_service, "ASSET_FLUSH_BATCH_BYTES", 1)
+        monkeypatch.setattr(
+            design_system_service._BatchedAssetWriter,
+            "finish",
+            lambda self: (_ for _ in ()).throw(DesignSystemImportError("late refusal")),
+        )
+        session.add(DesignSystem(name="Caller's own row"))
+
+        with pytest.raises(DesignSystemImportError):
+            import_bundle(session, zip_bytes=make_bundle_zip(), user="u")
+        session.commit()
+
+        assert [ds.name for ds in session.query(DesignSystem)] == ["Caller's own row"]
+
+
+class TestParallelDecode:
+    """Entries decode on worker threads; rows, warnings and limits stay in entry order."""
+
+    def _files(self):
+        files = {f"assets/icons/icon-{i:02d}.png": png_bytes(4 + i, 4) for i in range(12)}
+        files["templates/corporate/.thumbnail"] = b"not an image"
+        files["assets/.hidden"] = b"dotfile"
+        files["fonts/acme-sans.woff2"] = b"OTTO synthetic-font-bytes"
+        return files
+
+    def _slow_first_decode(self, monkeypatch):
+        """Make the FIRST entry's decode finish last."""
+        import time
+
+        from src.services import design_system_service
+
+        real = design_system_service._decode_bundle_entry
+
+        def decode(zf, info, rel, *, probe):
+            if rel.endswith("icon-00.png"):
+                time.sleep(0.2)
+            return real(zf, info, rel, probe=probe)
+
+        monkeypatch.setattr(design_system_service, "_decode_bundle_entry", decode)
+
+    def _outcome(self, session, monkeypatch, workers):
+        from src.services import design_system_service
+        from src.services.design_system_service import import_bundle
+
+        monkeypatch.setattr(design_system_service, "IMPORT_DECODE_WORKERS", workers)
+        warnings = []
+        ds = import_bundle(
+            session,
+            zip_bytes=make_bundle_zip(files=self._files()),
+            user="u",
+            name_override=f"Parallel {workers}",
+            warnings=warnings,
+        )
+        rows = [(a.filename, a.kind, a.mime, a.width, a.height) for a in ds.assets]
+        return rows, [f.path for f in ds.files], warnings
+
+    def test_parallel_matches_sequential(self, session, monkeypatch):
+        self._slow_first_decode(monkeypatch)
+        sequential = self._outcome(session, monkeypatch, workers=1)
+        parallel = self._outcome(session, monkeypatch, workers=4)
+
+        assert parallel == sequential
+        rows, _, warnings = parallel
+        assert [r[0] for r in rows][:12] == [f"icon-{i:02d}.png" for i in range(12)]
+        assert rows[0][3:] == (4, 4)
+        assert [w.path for w in warnings] == [
+            "templates/corporate/.thumbnail",
+            "assets/.hidden",
+        ]
+
+    def test_budget_refuses_the_same_entry(self, session, monkeypatch):
+        from src.services import design_system_service
+        from src.services.design_system_service import DesignSystemImportError, import_bundle
+
+        bundle = make_bundle_zip(files=self._files())
+        with zipfile.ZipFile(io.BytesIO(bundle)) as zf:
+            sizes = [i.file_size for i in zf.infolist()]
+        # Room for everything but the last few icons.
+        monkeypatch.setattr(design_system_service, "MAX_BUNDLE_SIZE_BYTES", sum(sizes[:10]))
+
+        messages = []
+        for workers in (1, 4):
+            monkeypatch.setattr(design_system_service, "IMPORT_DECODE_WORKERS", workers)
+            warnings = []
+            with pytest.raises(DesignSystemImportError, match="maximum size") as exc_info:
+                import_bundle(session, zip_bytes=bundle, user="u", warnings=warnings)
+            messages.append((str(exc_info.value), warnings))
+        assert messages[0] == messages[1]
+
+
 # ---------------------------------------------------------------------------
 # Validation / malformed bundles -> clear errors
 # ---------------------------------------------------------------------------
@@ -188,3 +188,90 @@ class TestSearchAssets:
         ])
         rows = [a.filename for a in search_assets(session, ds.id)]
         assert rows == ["logo.svg", "product.png"]  # logo ranked first, unknown last
+
+
+class TestSqlRankingMatchesPython:
+    """Filtering + ranking run in SQL; the result must equal the Python reference
+    (``_asset_search_matches`` + ``_asset_search_sort_key``) exactly."""
+
+    _TRICKY = _ASSETS + [
+        _asset("photo", "Zeta.png"),
+        _asset("logo", "Logo-Upper.svg"),
+        _asset("logo", "logo_under.svg"),
+        _asset("icon", "100%-icon.svg"),
+        _asset("icon", "ÉCLAIR-icon.svg"),
+        _asset("icon", "éclair-icon.svg"),
+        _asset("lockup", "\u0130con-lockup.svg"),  # İ lowercases to "i̇" in Python
+        _asset("illustration", "\u212aite.png"),  # KELVIN SIGN lowercases to "k"
+    ]
+
+    def _reference(self, session, ds_id, query=None, kind=None):
+        from src.database.models.design_system import DesignSystemAsset
+        from src.services.design_system_service import (
+            _asset_search_matches,
+            _asset_search_sort_key,
+        )
+
+        kind_l = kind.strip().lower() if kind else None
+        query_l = query.strip().lower() if query else None
+        rows = session.query(DesignSystemAsset).filter_by(design_system_id=ds_id).all()
+        rows = [a for a in rows if _asset_search_matches(a, kind_l, query_l)]
+        return [a.id for a in sorted(rows, key=_asset_search_sort_key)]
+
+    @pytest.mark.parametrize(
+        "query,kind",
+        [
+            (None, None),
+            ("logo", None),
+            ("LOGO", "logo"),
+            ("_", None),
+            ("%", None),
+            ("éclair", None),
+            ("ÉCLAIR", None),
+            ("icon", None),
+            ("kite", None),
+            (None, "Icon"),
+            ("nothing-matches", None),
+        ],
+    )
+    def test_identical_to_python_reference(self, session, query, kind):
+        from src.services.design_system_service import search_assets
+
+        ds = _make_ds(session, name="Acme", assets=self._TRICKY)
+        got = [a.id for a in search_assets(session, ds.id, query=query, kind=kind)]
+        assert got == self._reference(session, ds.id, query=query, kind=kind)
+
+    @pytest.mark.parametrize("query", [None, "icon", "éclair"])
+    def test_limit_is_the_top_of_the_ranking(self, session, query):
+        from src.services.design_system_service import search_assets
+
+        ds = _make_ds(session, name="Acme", assets=self._TRICKY)
+        full = [a.id for a in search_assets(session, ds.id, query=query)]
+        assert [a.id for a in search_assets(session, ds.id, query=query, limit=3)] == full[:3]
+
+    def test_kind_filter_uses_both_index_columns(self, session):
+        """The kind predicates compare the raw column, so the index serves them."""
+        from sqlalchemy import event
+
+        from src.services.design_system_service import search_assets
+
+        ds = _make_ds(session, name="Acme", assets=self._TRICKY)
+        statements = []
+        engine = session.get_bind()
+
+        def capture(conn, cursor, statement, params, context, executemany):
+            if "FROM design_system_asset" in statement:
+                statements.append((statement, params))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            search_assets(session, ds.id, kind="icon")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        statement, params = statements[-1]
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple(params)
+        ).fetchall()
+        detail = " ".join(str(row[-1]) for row in plan)
+        assert "ix_design_system_asset_ds_kind (design_system_id=? AND kind=?)" in detail
@@ -131,6 +131,19 @@ class TestBuildDsAssetTool:
             out = json.loads(tool.func())
         assert "brand.woff2" not in {r["filename"] for r in out["assets"]}
 
+    def test_results_capped_at_the_limit(self, session, monkeypatch):
+        from src.services.tools import build_ds_asset_tool, ds_asset_tool
+
+        monkeypatch.setattr(ds_asset_tool, "BRAND_ASSET_SEARCH_LIMIT", 2)
+        ds = _make_ds(session, name="Acme", assets=[
+            _img("icon", "icon-c.svg"), _img("logo", "logo.svg"), _img("icon", "icon-a.svg"),
+        ])
+        tool = build_ds_asset_tool(ds.id)
+        with _patched_db(session):
+            out = json.loads(tool.func())
+        assert [r["filename"] for r in out["assets"]] == ["logo.svg", "icon-a.svg"]
+        assert "narrow" in out["message"]
+
     def test_description_carries_literal_token_and_trigger(self, session):
         from src.services.tools import build_ds_asset_tool
 
@@ -93,10 +93,11 @@ def mock_langchain_components():
     with patch("src.services.agent.ChatDatabricks") as mock_chat, patch(
         "src.services.agent.create_tool_calling_agent"
     ) as mock_create_agent, patch(
-        "src.services.agent.AgentExecutor"
+        "src.services.agent.ParallelToolAgentExecutor"
     ) as mock_executor_class:
         # Create a mock executor instance
         mock_executor_instance = Mock()
+        mock_executor_instance.tool_stats = {"saved_seconds": 0.0}
         mock_executor_class.return_value = mock_executor_instance
         mock_chat.return_value = Mock()
 
@@ -908,9 +909,9 @@ class TestGracefulDegradation:
             result = agent.create_session()
             session_id = result["session_id"]
 
-            # Get tools - genie + image search
+            # Get tools - genie + result pager + image search
             tools = agent._create_tools_for_session(session_id)
-            assert len(tools) == 2
+            assert len(tools) == 3
 
             # The tool wrapper propagates GenieToolError directly
             # (not converted to ToolExecutionError)
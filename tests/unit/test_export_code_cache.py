@@ -0,0 +1,152 @@
+"""Unit tests for the content-addressed export code cache."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import Base
+from src.database.models import ExportCodeCacheEntry
+from src.services.export_code_cache import (
+    TARGET_GSLIDES,
+    TARGET_PPTX,
+    SlideCodeCache,
+    asset_hashes,
+    prompt_version,
+    slide_cache_key,
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def _key(html="<p>x</p>", assets=(), version="v1", model="m"):
+    return slide_cache_key(TARGET_PPTX, html, list(assets), version, model)
+
+
+class TestSlideCacheKey:
+    def test_identical_inputs_share_a_key(self):
+        assert _key() == _key()
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"html": "<p>X</p>"},  # re-cased text: generated code copies text verbatim
+            {"assets": ["chart_a.png:abc"]},
+            {"version": "v2"},
+            {"model": "other-endpoint"},
+        ],
+    )
+    def test_any_input_change_changes_the_key(self, change):
+        assert _key(**change) != _key()
+
+    def test_target_is_part_of_the_key(self):
+        assert slide_cache_key(TARGET_GSLIDES, "<p>x</p>", [], "v1", "m") != _key()
+
+    def test_prompt_version_tracks_every_prompt(self):
+        assert prompt_version("a", "b") == prompt_version("a", "b")
+        assert prompt_version("a", "b") != prompt_version("a", "c")
+        # Boundaries between prompts are significant.
+        assert prompt_version("ab", "c") != prompt_version("a", "bc")
+
+    def test_asset_hashes_follow_file_bytes(self, tmp_path):
+        (tmp_path / "chart_a.png").write_bytes(b"one")
+        before = asset_hashes(str(tmp_path), ["chart_a.png", "missing.png"])
+        (tmp_path / "chart_a.png").write_bytes(b"two")
+        after = asset_hashes(str(tmp_path), ["chart_a.png", "missing.png"])
+
+        assert before[0] != after[0]
+        assert before[1] == after[1] == "missing.png:-"
+
+
+class TestSlideCodeCache:
+    def test_round_trip_through_the_table(self, session_factory):
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=session_factory)
+
+        written = cache.put_many({"k1": "code one"}, prompt_version="v1", model_endpoint="m")
+
+        assert written == 1
+        assert cache.get_many(["k1", "k2"]) == {"k1": "code one"}
+
+    def test_hits_are_counted(self, session_factory):
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=session_factory)
+        cache.put_many({"k1": "code"}, prompt_version="v1", model_endpoint="m")
+
+        cache.get_many(["k1"])
+        cache.get_many(["k1"])
+
+        db = session_factory()
+        try:
+            assert db.query(ExportCodeCacheEntry).one().hit_count == 2
+        finally:
+            db.close()
+
+    def test_targets_do_not_share_entries(self, session_factory):
+        SlideCodeCache(TARGET_PPTX, session_factory=session_factory).put_many(
+            {"k1": "pptx code"}, prompt_version="v1", model_endpoint="m"
+        )
+
+        assert SlideCodeCache(TARGET_GSLIDES, session_factory=session_factory).get_many(
+            ["k1"]
+        ) == {}
+
+    def test_existing_keys_are_not_rewritten(self, session_factory):
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=session_factory)
+        cache.put_many({"k1": "first"}, prompt_version="v1", model_endpoint="m")
+
+        written = cache.put_many(
+            {"k1": "second", "k2": "new"}, prompt_version="v1", model_endpoint="m"
+        )
+
+        assert written == 1
+        assert cache.get_many(["k1", "k2"]) == {"k1": "first", "k2": "new"}
+
+    def test_disk_tier_answers_without_the_table(self, session_factory, tmp_path):
+        SlideCodeCache(
+            TARGET_PPTX, session_factory=session_factory, disk_dir=str(tmp_path)
+        ).put_many({"k1": "code"}, prompt_version="v1", model_endpoint="m")
+
+        def no_db():
+            raise AssertionError("disk hit must not query the table")
+
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=no_db, disk_dir=str(tmp_path))
+        assert cache.get_many(["k1"]) == {"k1": "code"}
+
+    def test_table_hits_fill_the_disk_tier(self, session_factory, tmp_path):
+        SlideCodeCache(TARGET_PPTX, session_factory=session_factory).put_many(
+            {"k1": "code"}, prompt_version="v1", model_endpoint="m"
+        )
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=session_factory, disk_dir=str(tmp_path))
+
+        cache.get_many(["k1"])
+
+        assert list(tmp_path.rglob("k1.py"))[0].read_text() == "code"
+
+    def test_database_errors_degrade_to_a_miss(self):
+        def broken():
+            raise RuntimeError("database unavailable")
+
+        cache = SlideCodeCache(TARGET_PPTX, session_factory=broken)
+
+        assert cache.get_many(["k1"]) == {}
+        assert cache.put_many({"k1": "code"}, prompt_version="v1", model_endpoint="m") == 0
+
+    def test_disabled_by_environment(self, monkeypatch):
+        monkeypatch.setenv("EXPORT_CODE_CACHE_ENABLED", "false")
+        assert SlideCodeCache.from_env(TARGET_PPTX) is None
+
+        monkeypatch.setenv("EXPORT_CODE_CACHE_ENABLED", "true")
+        monkeypatch.setenv("EXPORT_CODE_CACHE_DIR", "/tmp/tellr-code-cache")
+        cache = SlideCodeCache.from_env(TARGET_PPTX)
+        assert cache is not None
+        assert str(cache.disk_dir).endswith("pptx")
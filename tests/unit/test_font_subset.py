@@ -0,0 +1,183 @@
+"""Unit tests for per-deck brand font subsetting (``src.utils.font_subset``).
+
+Fonts are built in-memory with fontTools' FontBuilder — SYNTHETIC, no real
+brand font files.
+"""
+import base64
+import io
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import src.database.models  # noqa: F401 - register models with Base.metadata
+from src.core.database import Base
+from src.utils import font_subset
+
+pytest.importorskip("fontTools")
+
+
+def _build_font(chars: str) -> bytes:
+    """A TrueType font with one square glyph per character in ``chars``."""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    names = [".notdef"] + [f"g{ord(ch):04X}" for ch in chars]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap({ord(ch): f"g{ord(ch):04X}" for ch in chars})
+    glyphs = {}
+    for name in names:
+        pen = TTGlyphPen(None)
+        pen.moveTo((100, 0))
+        pen.lineTo((100, 700))
+        pen.lineTo((500, 700))
+        pen.lineTo((500, 0))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({name: (600, 100) for name in names})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Synthetic", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    buf = io.BytesIO()
+    fb.save(buf)
+    return buf.getvalue()
+
+
+_ALL_CHARS = "".join(chr(cp) for cp in range(0x20, 0x7F)) + "".join(
+    chr(cp) for cp in range(0xC0, 0x250)
+)
+
+
+@pytest.fixture
+def full_font() -> bytes:
+    return _build_font(_ALL_CHARS)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    font_subset.clear_cache()
+    yield
+    font_subset.clear_cache()
+
+
+def _cmap(data: bytes) -> set:
+    from fontTools.ttLib import TTFont
+
+    return set(TTFont(io.BytesIO(data)).getBestCmap())
+
+
+class TestSubsetFont:
+    def test_subset_is_smaller_and_keeps_requested_glyphs(self, full_font):
+        codepoints = font_subset.deck_codepoints({"slides": [{"html": "<h1>Ünïcödé</h1>"}]})
+        result = font_subset.subset_font(full_font, codepoints)
+        assert result is not None
+        data, mime = result
+        assert mime in ("font/woff2", "font/woff")
+        assert len(data) < len(full_font)
+        kept = _cmap(data)
+        assert {ord(ch) for ch in "Ünïcödé"} <= kept
+        assert ord("Ā") not in kept  # unused extended-Latin glyph dropped
+
+    def test_printable_ascii_always_kept(self, full_font):
+        codepoints = font_subset.deck_codepoints({"slides": []})
+        data, _ = font_subset.subset_font(full_font, codepoints)
+        assert set(range(0x21, 0x7F)) <= _cmap(data)
+
+    def test_unparseable_font_falls_back_to_full(self):
+        assert font_subset.subset_font(b"not a font", frozenset({65})) is None
+
+
+class TestSubsetCache:
+    def test_cache_hit_skips_loader(self, full_font):
+        codepoints = frozenset({65, 66})
+        loads = []
+
+        def load():
+            loads.append(1)
+            return full_font
+
+        first = font_subset.get_subset(1, 7, codepoints, load)
+        second = font_subset.get_subset(1, 7, codepoints, load)
+        assert first == second
+        assert len(loads) == 1
+
+    def test_different_glyph_sets_are_distinct_entries(self, full_font):
+        a = font_subset.get_subset(1, 7, frozenset({65}), lambda: full_font)
+        b = font_subset.get_subset(1, 7, frozenset({0xC0}), lambda: full_font)
+        assert a != b
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as s:
+        yield s
+    engine.dispose()
+
+
+def _make_font_asset(session, data: bytes):
+    from src.database.models.design_system import DesignSystem, DesignSystemAsset
+
+    ds = DesignSystem(name="Font DS")
+    ds.assets.append(
+        DesignSystemAsset(
+            kind="font", filename="brand.ttf", mime="font/ttf", data=data, size_bytes=len(data)
+        )
+    )
+    session.add(ds)
+    session.commit()
+    session.refresh(ds)
+    return ds.id, ds.assets[0]
+
+
+class TestDeckFontSubstitution:
+    def _deck(self, asset_id: int) -> dict:
+        return {
+            "css": (
+                "@font-face { font-family: 'Brand'; "
+                f"src: url('{{{{ds-asset:{asset_id}}}}}'); }}"
+            ),
+            "slides": [{"html": "<div class='slide'><h1>Quarterly</h1></div>"}],
+        }
+
+    def test_deck_css_gets_subset_font(self, session, full_font):
+        from src.utils.ds_asset_utils import substitute_deck_dict_ds_assets
+
+        ds_id, asset = _make_font_asset(session, full_font)
+        deck = substitute_deck_dict_ds_assets(self._deck(asset.id), session, design_system_id=ds_id)
+        assert "{{ds-asset:" not in deck["css"]
+        uri = deck["css"].split("url('", 1)[1].split("'", 1)[0]
+        assert uri.startswith("data:font/woff")
+        embedded = base64.b64decode(uri.split(",", 1)[1])
+        assert len(embedded) < len(full_font)
+
+    def test_disabled_embeds_full_font(self, session, full_font, monkeypatch):
+        from src.utils.ds_asset_utils import substitute_deck_dict_ds_assets
+
+        monkeypatch.setenv("DS_FONT_SUBSETTING", "false")
+        ds_id, asset = _make_font_asset(session, full_font)
+        deck = substitute_deck_dict_ds_assets(self._deck(asset.id), session, design_system_id=ds_id)
+        expected = base64.b64encode(full_font).decode("utf-8")
+        assert f"data:font/ttf;base64,{expected}" in deck["css"]
+
+    def test_foreign_design_system_is_not_resolved(self, session, full_font):
+        from src.utils.ds_asset_utils import substitute_deck_dict_ds_assets
+
+        ds_id, asset = _make_font_asset(session, full_font)
+        deck = substitute_deck_dict_ds_assets(
+            self._deck(asset.id), session, design_system_id=ds_id + 999
+        )
+        assert f"{{{{ds-asset:{asset.id}}}}}" in deck["css"]
+
+
+def test_woff2_when_brotli_is_available(full_font):
+    pytest.importorskip("brotli")
+    _, mime = font_subset.subset_font(full_font, frozenset({65}))
+    assert mime == "font/woff2"
@@ -0,0 +1,185 @@
+"""Tests for Genie result shaping, the server-side result store and paging."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.user_context import set_current_user
+from src.services.tools.genie_results import (
+    CELL_TRUNCATED_MARKER,
+    GenieResultStore,
+    get_genie_result_store,
+    read_result_page,
+    shape_statement_response,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_store():
+    get_genie_result_store().clear()
+    yield
+    get_genie_result_store().clear()
+
+
+def _statement(rows, columns=(("region", "STRING"), ("sales", "LONG"), ("day", "DATE"))):
+    return {
+        "manifest": {
+            "schema": {"columns": [{"name": n, "type_name": t} for n, t in columns]},
+        },
+        "result": {"data_array": rows},
+    }
+
+
+def _rows(n):
+    return [[f"r{i % 3}", str(i), f"2024-01-{1 + i % 28:02d}"] for i in range(n)]
+
+
+class TestShapeStatementResponse:
+    def test_small_result_is_shown_whole(self):
+        shaped = shape_statement_response(_statement(_rows(3)), sql="SELECT 1")
+
+        assert not shaped.truncated
+        assert shaped.result_id is None
+        assert shaped.text.splitlines()[:2] == [
+            "Result 1: 3 rows x 3 columns",
+            "Columns: region (STRING), sales (LONG), day (DATE)",
+        ]
+        assert shaped.text.endswith("r2,2,2024-01-03")
+        assert shaped.as_dict()["sql"] == "SELECT 1"
+
+    def test_summary_covers_every_row(self):
+        shaped = shape_statement_response(_statement(_rows(1000)), max_rows=5)
+
+        assert "- region: 3 distinct" in shaped.text
+        assert "- sales: min 0, max 999, mean 499.5" in shaped.text
+        assert "- day: 2024-01-01 .. 2024-01-28" in shaped.text
+
+    def test_nulls_are_counted(self):
+        shaped = shape_statement_response(_statement([["a", None, None], ["b", "2", None]]))
+
+        assert "- sales: min 2, max 2, mean 2, 1 null" in shaped.text
+        assert "- day: 2 null" in shaped.text
+
+    def test_row_cap_truncates_and_stores_full_result(self):
+        shaped = shape_statement_response(_statement(_rows(50)), max_rows=10, user="alice")
+
+        assert shaped.truncated
+        assert shaped.shown_rows == 10
+        assert shaped.result_id
+        assert f'result_id="{shaped.result_id}" and offset=10' in shaped.text
+        assert len(shaped.text.split("region,sales,day\n")[1].splitlines()) == 11  # rows + note
+
+    def test_byte_cap_truncates(self):
+        shaped = shape_statement_response(_statement(_rows(1000)), max_rows=1000, max_bytes=200)
+
+        assert shaped.truncated
+        csv_part = shaped.text.split("region,sales,day")[1].rsplit("\n[", 1)[0]
+        assert len(("region,sales,day" + csv_part).encode()) <= 200
+
+    def test_missing_result_key_is_empty(self):
+        statement = {"manifest": {"schema": {"columns": [{"name": "c"}]}}, "result": {}}
+
+        shaped = shape_statement_response(statement)
+
+        assert shaped.row_count == 0
+        assert shaped.text == "Result 1: 0 rows x 1 columns\nColumns: c\nc"
+
+
+class TestPaging:
+    def test_pages_through_stored_rows(self):
+        shaped = shape_statement_response(_statement(_rows(25)), max_rows=10, user="alice")
+
+        page = read_result_page(shaped.result_id, 10, 10, user="alice")
+
+        lines = page.splitlines()
+        assert lines[0] == "region,sales,day"
+        assert lines[1].startswith("r1,10,")
+        assert lines[-1] == "[Rows 11-20 of 25. Next: offset=20.]"
+        last = read_result_page(shaped.result_id, 20, 10, user="alice")
+        assert last.splitlines()[-1] == "[Rows 21-25 of 25. End of result.]"
+
+    def test_other_users_cannot_read(self):
+        shaped = shape_statement_response(_statement(_rows(25)), max_rows=10, user="alice")
+
+        assert "No Genie result" in read_result_page(shaped.result_id, 10, user="bob")
+
+    def test_offset_past_end(self):
+        shaped = shape_statement_response(_statement(_rows(25)), max_rows=10, user="alice")
+
+        assert "past the end" in read_result_page(shaped.result_id, 30, user="alice")
+
+    def test_over_budget_row_is_clipped_and_paging_moves_forward(self):
+        rows = [["r0", "x" * 20_000, "2024-01-01"], ["r1", "1", "2024-01-02"], ["r2", "2", "d"]]
+
+        shaped = shape_statement_response(_statement(rows), user="alice", max_bytes=1000)
+        page = read_result_page(shaped.result_id, 0, user="alice", max_bytes=1000)
+        rest = read_result_page(shaped.result_id, 1, user="alice", max_bytes=1000)
+
+        assert shaped.shown_rows == 1
+        assert f'result_id="{shaped.result_id}" and offset=1' in shaped.text
+        assert CELL_TRUNCATED_MARKER in shaped.text
+        assert page.splitlines()[-1] == "[Rows 1-1 of 3. Next: offset=1.]"
+        assert len(page.encode()) < 2000
+        assert rest.splitlines()[-1] == "[Rows 2-3 of 3. End of result.]"
+
+    def test_store_expires_and_evicts(self):
+        store = GenieResultStore(ttl_seconds=60, max_bytes=10)
+        first = store.put("u", ["c"], [["12345"]], None, 5)
+        second = store.put("u", ["c"], [["12345"]], None, 5)
+        third = store.put("u", ["c"], [["12345"]], None, 5)
+
+        assert store.get(first, "u") is None
+        assert store.get(second, "u") is not None
+        with patch("src.services.tools.genie_results.time.time", return_value=10**12):
+            assert store.get(third, "u") is None
+
+
+def test_query_genie_space_keeps_every_attachment():
+    """Every data and text attachment survives, not just the last one."""
+    from src.services.tools.genie_tool import query_genie_space
+
+    client = Mock()
+    response = Mock(conversation_id="conv-1", message_id="msg-1")
+    first, second = Mock(attachment_id="a1"), Mock(attachment_id="a2")
+    first.query.query = "SELECT region"
+    first.text = "By region"
+    second.query.query = "SELECT day"
+    second.text = "By day"
+    response.attachments = [first, second]
+    client.genie.create_message_and_wait.return_value = response
+    results = {
+        "a1": _statement([["EMEA"]], columns=(("region", "STRING"),)),
+        "a2": _statement([["2024-01-01"]], columns=(("day", "DATE"),)),
+    }
+    client.genie.get_message_attachment_query_result.side_effect = (
+        lambda **kw: Mock(as_dict=lambda: {"statement_response": results[kw["attachment_id"]]})
+    )
+
+    set_current_user("alice")
+    try:
+        with patch("src.services.tools.genie_tool.get_user_client", return_value=client):
+            result = query_genie_space("q", "conv-1", space_id="space")
+    finally:
+        set_current_user(None)
+
+    assert "Result 1: 1 rows x 1 columns" in result["data"]
+    assert "Result 2: 1 rows x 1 columns" in result["data"]
+    assert result["message"] == "By region\n\nBy day"
+    assert result["sql"] == "SELECT region;\nSELECT day"
+    assert [r["row_count"] for r in result["results"]] == [1, 1]
+
+
+def test_read_genie_result_tool_is_user_scoped():
+    from src.services.tools.genie_tool import build_genie_result_tool
+
+    shaped = shape_statement_response(_statement(_rows(25)), max_rows=10, user="alice")
+    tool = build_genie_result_tool("session-1")
+
+    set_current_user("alice")
+    try:
+        output = tool.invoke({"result_id": shaped.result_id, "offset": 10, "limit": 5})
+    finally:
+        set_current_user(None)
+
+    assert output.startswith('<untrusted-data source="genie">')
+    assert "[Rows 11-15 of 25. Next: offset=15.]" in output
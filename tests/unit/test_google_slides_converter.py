@@ -340,3 +340,473 @@ class TestParallelCodegen:
         assert latest_start < earliest_end, (
             "Expected parallel dispatch: all calls should start before any finishes"
         )
+
+
+class _FakeSlidesApi:
+    """Slides service double that applies structural page requests to a list."""
+
+    def __init__(self, pages=(), title="Presentation", reject=()):
+        self.pages = list(pages)
+        self.title = title
+        # objectIds whose requests the API rejects (failing the whole batch).
+        self.reject = set(reject)
+        self.batches = []
+
+    def presentations(self):
+        return self
+
+    def get(self, presentationId):  # noqa: N803
+        from unittest.mock import MagicMock
+
+        call = MagicMock()
+        call.execute.return_value = {
+            "title": self.title,
+            "slides": [{"objectId": page_id} for page_id in self.pages],
+        }
+        return call
+
+    def batchUpdate(self, presentationId, body):  # noqa: N802, N803
+        from unittest.mock import MagicMock
+
+        call = MagicMock()
+        call.execute.side_effect = lambda: self._apply(body["requests"])
+        return call
+
+    def _apply(self, requests):
+        if any(inner.get("objectId") in self.reject
+               for request in requests for inner in request.values()):
+            raise Exception("400 Invalid requests")
+        self.batches.append(requests)
+        for request in requests:
+            if "deleteObject" in request:
+                self.pages.remove(request["deleteObject"]["objectId"])
+            elif "createSlide" in request:
+                create = request["createSlide"]
+                self.pages.insert(create.get("insertionIndex", len(self.pages)),
+                                  create["objectId"])
+            elif "updateSlidesPosition" in request:
+                move = request["updateSlidesPosition"]
+                (page_id,) = move["slideObjectIds"]
+                # insertionIndex refers to the arrangement before the move.
+                index = move["insertionIndex"]
+                if self.pages.index(page_id) < index:
+                    index -= 1
+                self.pages.remove(page_id)
+                self.pages.insert(index, page_id)
+        return {}
+
+
+
+@pytest.fixture(autouse=True)
+def _no_write_pacing(monkeypatch):
+    """Tests must not wait on the Slides write quota."""
+    import src.services.html_to_google_slides as g
+
+    monkeypatch.setattr(g, "_WRITE_REQUESTS_PER_MINUTE", 0)
+    monkeypatch.setattr(g, "_write_limiters", {})
+
+
+# -----------------------------------------------------------------------
+# Slide code cache
+# -----------------------------------------------------------------------
+
+class TestSlideCodeCache:
+    """Only snippets that ran cleanly end to end are reused on the next push."""
+
+    _CODE = "def build_slide_requests(html_str, assets_dir, page_id):\n    return []\n"
+
+    class _MemoryCache:
+        def __init__(self):
+            self.entries = {}
+
+        def get_many(self, keys):
+            return {k: self.entries[k] for k in keys if k in self.entries}
+
+        def put_many(self, entries, *, prompt_version, model_endpoint):
+            self.entries.update(entries)
+            return len(entries)
+
+    @staticmethod
+    def _fake_jail(job_dir, requests_out):
+        import json
+
+        from src.services.converter_jail.jail import JailResult
+
+        manifest = json.loads((Path(job_dir) / "manifest.json").read_text())
+        emitted = [
+            {
+                "index": s["index"],
+                "requests": [{"createShape": {
+                    "objectId": f"s{s['index']}",
+                    "elementProperties": {"pageObjectId": s["page_id"]},
+                }}] if s["has_code"] else None,
+                "error": None,
+            }
+            for s in manifest["slides"]
+        ]
+        Path(requests_out).write_text(json.dumps(emitted))
+        return JailResult(returncode=0, timed_out=False)
+
+    @staticmethod
+    def _prepare(requests, drive_service, assets_dir, slide_num):
+        return requests, None
+
+    def _convert(self, converter, slides, progress=None):
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        with patch.object(converter, "_create_presentation", return_value="PRES"), patch(
+            "src.services.converter_jail.run_gslides_jail", side_effect=self._fake_jail
+        ), patch.object(converter, "_prepare_slide_requests", side_effect=self._prepare):
+            converter.auth = MagicMock()
+            # Slide 2's shape is rejected: the slide "succeeds" overall but
+            # one of its requests was dropped.
+            converter.auth.build_slides_service.return_value = _FakeSlidesApi(reject={"s1"})
+            callback = (lambda *a: progress.append(a)) if progress is not None else None
+            return asyncio.run(
+                converter.convert_slide_deck(slides, progress_callback=callback)
+            )
+
+    def test_clean_slides_are_reused_and_dropped_requests_are_not(self):
+        from unittest.mock import MagicMock
+
+        converter = _make_gslides_converter()
+        converter.SYSTEM_PROMPT = "sys"
+        converter.USER_PROMPT = "{html_content}{screenshot_note}"
+        converter.model_endpoint = "test-model"
+        converter.code_cache = self._MemoryCache()
+        converter._generate_code_sync = MagicMock(return_value=self._CODE)
+        slides = ["<div>one</div>", "<div>two</div>"]
+
+        self._convert(converter, slides)
+        assert converter._generate_code_sync.call_count == 2
+        assert len(converter.code_cache.entries) == 1
+
+        progress = []
+        self._convert(converter, slides, progress)
+
+        # Slide 1 came from the cache; slide 2 (which dropped a request) was regenerated.
+        assert converter._generate_code_sync.call_count == 3
+        assert converter._generate_code_sync.call_args[0][0] == "<div>two</div>"
+        assert any("1 cached" in message for _, _, message in progress)
+
+    def test_prompt_change_retires_cached_code(self, tmp_path):
+        converter = _make_gslides_converter()
+        converter.SYSTEM_PROMPT = "sys"
+        converter.USER_PROMPT = "{html_content}{screenshot_note}"
+        converter.model_endpoint = "test-model"
+        converter.code_cache = self._MemoryCache()
+        inputs = [("<div>one</div>", [], [], str(tmp_path))]
+        before = converter._slide_cache_keys(inputs)
+
+        converter.SYSTEM_PROMPT = "sys, revised"
+
+        assert converter._slide_cache_keys(inputs) != before
+
+
+class TestSkipTrackerFailures:
+    def test_a_failed_chunk_is_recorded(self):
+        from unittest.mock import MagicMock
+
+        from src.services.html_to_google_slides import _ChunkedSlidesService, _SkipTracker
+
+        resource = MagicMock()
+
+        def _batch(presentationId, body):  # noqa: N803
+            call = MagicMock()
+            if any("insertText" in r for r in body["requests"]):
+                call.execute.side_effect = Exception("400 invalid request")
+            return call
+
+        resource.presentations.return_value.batchUpdate.side_effect = _batch
+        tracker = _SkipTracker()
+        service = _ChunkedSlidesService(resource, chunk_size=4, slide_num=1, tracker=tracker)
+
+        service.presentations().batchUpdate(presentationId="P", body={"requests": [
+            {"createShape": {"objectId": "a"}},
+            {"insertText": {"objectId": "a", "text": "hi"}},
+        ]}).execute()
+
+        assert tracker.had_failures
+
+    def test_a_clean_run_records_no_failures(self):
+        from unittest.mock import MagicMock
+
+        from src.services.html_to_google_slides import _ChunkedSlidesService, _SkipTracker
+
+        tracker = _SkipTracker()
+        service = _ChunkedSlidesService(MagicMock(), chunk_size=4, slide_num=1, tracker=tracker)
+
+        service.presentations().batchUpdate(presentationId="P", body={"requests": [
+            {"createShape": {"objectId": "a"}},
+        ]}).execute()
+
+        assert not tracker.had_failures
+
+
+# -----------------------------------------------------------------------
+# Incremental re-export (page sync)
+# -----------------------------------------------------------------------
+
+class TestPlanPageSync:
+    @staticmethod
+    def _apply(live, plan):
+        api = _FakeSlidesApi(live)
+        api._apply(plan.requests)
+        return api.pages
+
+    def test_unchanged_deck_needs_no_requests(self):
+        from src.services.html_to_google_slides import _plan_page_sync
+
+        plan = _plan_page_sync(["a", "b"], [["a", "p1"], ["b", "p2"]], ["title", "p1", "p2"])
+
+        assert plan.page_ids == ["p1", "p2"]
+        assert plan.rebuild == [False, False]
+        assert plan.requests == []
+
+    def test_reorder_insert_and_delete(self):
+        from src.services.html_to_google_slides import _plan_page_sync
+
+        live = ["title", "p1", "p2", "p3", "user_page"]
+        page_map = [["a", "p1"], ["b", "p2"], ["c", "p3"]]
+
+        plan = _plan_page_sync(["c", "new", "a"], page_map, live)
+
+        assert plan.rebuild == [False, True, False]
+        assert plan.deleted == 1
+        new_page = plan.page_ids[1]
+        # The title page and the user's own page are never touched.
+        assert self._apply(live, plan) == ["title", "p3", new_page, "p1", "user_page"]
+
+    def test_duplicates_pair_up_and_missing_pages_are_rebuilt(self):
+        from src.services.html_to_google_slides import _plan_page_sync
+
+        # p2 was deleted by hand since the last export.
+        live = ["p1", "p3"]
+        page_map = [["a", "p1"], ["a", "p2"], ["b", "p3"]]
+
+        plan = _plan_page_sync(["a", "a", "b"], page_map, live)
+
+        assert plan.page_ids[0] == "p1" and plan.page_ids[2] == "p3"
+        assert plan.rebuild == [False, True, False]
+        assert self._apply(live, plan) == plan.page_ids
+
+
+class TestIncrementalReexport:
+    _CODE = TestSlideCodeCache._CODE
+
+    def _convert(self, converter, api, slides, page_map=None):
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        converter.auth = MagicMock()
+        converter.auth.build_slides_service.return_value = api
+        batches_before = len(getattr(api, "batches", []))
+        with patch.object(converter, "_create_presentation", return_value="PRES"), patch(
+            "src.services.converter_jail.run_gslides_jail",
+            side_effect=TestSlideCodeCache._fake_jail,
+        ), patch.object(
+            converter, "_prepare_slide_requests", side_effect=TestSlideCodeCache._prepare,
+        ):
+            result = asyncio.run(converter.convert_slide_deck(
+                slides,
+                existing_presentation_id="PRES" if page_map else None,
+                existing_page_map=page_map,
+            ))
+        new_batches = api.batches[batches_before:]
+        built = [
+            request["createShape"]["elementProperties"]["pageObjectId"]
+            for batch in new_batches for request in batch if "createShape" in request
+        ]
+        return result, built
+
+    def _converter(self):
+        from unittest.mock import MagicMock
+
+        converter = _make_gslides_converter()
+        converter.SYSTEM_PROMPT = "sys"
+        converter.USER_PROMPT = "{html_content}{screenshot_note}"
+        converter.model_endpoint = "test-model"
+        converter.code_cache = None
+        converter._generate_code_sync = MagicMock(return_value=self._CODE)
+        return converter
+
+    def test_only_changed_slides_are_rebuilt(self):
+        converter = self._converter()
+        api = _FakeSlidesApi(["title"])
+        first, built = self._convert(converter, api, ["<div>one</div>", "<div>two</div>"])
+        assert len(built) == 2
+        kept_page = first["page_map"][0][1]
+
+        second, built = self._convert(
+            converter, api, ["<div>one</div>", "<div>TWO</div>"], first["page_map"],
+        )
+
+        assert converter._generate_code_sync.call_count == 3
+        assert converter._generate_code_sync.call_args[0][0] == "<div>TWO</div>"
+        assert second["presentation_id"] == "PRES"
+        assert second["page_map"][0] == first["page_map"][0]
+        assert built == [second["page_map"][1][1]]
+        assert api.pages == ["title", kept_page, second["page_map"][1][1]]
+
+    def test_missing_presentation_falls_back_to_a_fresh_one(self):
+        from unittest.mock import MagicMock
+
+        converter = self._converter()
+        api = _FakeSlidesApi()
+        api.get = MagicMock(side_effect=Exception("404"))
+
+        result, built = self._convert(converter, api, ["<div>one</div>"], [["x", "gone"]])
+
+        assert len(built) == 1
+        assert result["page_map"][0][1] == built[0]
+
+
+# -----------------------------------------------------------------------
+# Adaptive batchUpdate execution and write pacing
+# -----------------------------------------------------------------------
+
+def _shape_requests(prefix, count):
+    return [{"createShape": {"objectId": f"{prefix}_{n}"}} for n in range(count)]
+
+
+class TestAdaptiveBatchExecutor:
+    def test_a_deck_goes_out_in_a_handful_of_calls(self):
+        from src.services.html_to_google_slides import (
+            _AdaptiveBatchExecutor,
+            _coalesce_slide_batches,
+            _SkipTracker,
+        )
+
+        api = _FakeSlidesApi()
+        slides = [(n, _shape_requests(f"s{n}", 12), _SkipTracker()) for n in range(1, 31)]
+        executor = _AdaptiveBatchExecutor(api, "PRES")
+
+        for group in _coalesce_slide_batches(slides):
+            executor.run([(t, n, r) for n, requests, t in group for r in requests])
+
+        # 360 requests: fixed chunks of four took 90 calls.
+        assert executor.calls == 4
+        assert sum(len(batch) for batch in api.batches) == 360
+
+    def test_a_bad_request_is_isolated_by_bisection(self):
+        from src.services.html_to_google_slides import _AdaptiveBatchExecutor, _SkipTracker
+
+        api = _FakeSlidesApi(reject={"a_5"})
+        tracker = _SkipTracker()
+        executor = _AdaptiveBatchExecutor(api, "PRES")
+
+        executor.run([(tracker, 1, r) for r in _shape_requests("a", 16)])
+
+        applied = [r["createShape"]["objectId"] for batch in api.batches for r in batch]
+        assert applied == [f"a_{n}" for n in range(16) if n != 5]
+        assert tracker.dropped == 1
+        assert executor.calls <= 1 + 2 * 4
+
+    def test_requests_on_a_dropped_object_are_skipped(self):
+        from src.services.html_to_google_slides import _AdaptiveBatchExecutor, _SkipTracker
+
+        api = _FakeSlidesApi(reject={"box"})
+        tracker = _SkipTracker()
+        requests = [
+            {"createShape": {"objectId": "box"}},
+            {"createShape": {"objectId": "other"}},
+            {"updateShapeProperties": {"objectId": "box"}},
+        ]
+
+        _AdaptiveBatchExecutor(api, "PRES").run([(tracker, 1, r) for r in requests])
+
+        assert [r for batch in api.batches for r in batch] == [requests[1]]
+        assert tracker.dropped == 1
+
+    def test_slides_with_clashing_object_ids_are_not_coalesced(self):
+        from src.services.html_to_google_slides import _coalesce_slide_batches
+
+        slides = [
+            (1, _shape_requests("a", 2)),
+            (2, _shape_requests("b", 2)),
+            (3, _shape_requests("a", 1)),
+        ]
+
+        groups = _coalesce_slide_batches(slides)
+
+        assert [[slide[0] for slide in group] for group in groups] == [[1, 2], [3]]
+
+    def test_groups_respect_the_batch_size(self):
+        from src.services.html_to_google_slides import _coalesce_slide_batches
+
+        slides = [(n, _shape_requests(f"s{n}", 6)) for n in range(5)]
+
+        groups = _coalesce_slide_batches(slides, max_batch=12)
+
+        assert [len(group) for group in groups] == [2, 2, 1]
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        import src.services.html_to_google_slides as g
+
+        state = {"now": 0.0, "slept": []}
+
+        def _sleep(seconds):
+            state["slept"].append(seconds)
+            state["now"] += seconds
+
+        monkeypatch.setattr(g.time, "monotonic", lambda: state["now"])
+        monkeypatch.setattr(g.time, "sleep", _sleep)
+        return state
+
+    def test_bursts_then_paces_to_the_quota(self, clock):
+        from src.services.html_to_google_slides import _TokenBucket
+
+        bucket = _TokenBucket(60, 3)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.0, 1.0, 1.0]
+
+    def test_a_rate_limit_backs_every_caller_off(self, clock):
+        from src.services.html_to_google_slides import _TokenBucket
+
+        bucket = _TokenBucket(60, 3)
+        bucket.penalize()
+
+        assert bucket.acquire() == pytest.approx(4.0)
+
+    def test_rate_limited_calls_retry_through_the_bucket(self, clock):
+        from src.services.html_to_google_slides import _retry_api_call, _TokenBucket
+
+        bucket = _TokenBucket(60, 2)
+        attempts = []
+
+        def _call():
+            attempts.append(clock["now"])
+            if len(attempts) == 1:
+                raise Exception("429 Quota exceeded for quota metric 'Write requests'")
+            return "ok"
+
+        assert _retry_api_call(_call, limiter=bucket) == "ok"
+        # The retry waited on the bucket rather than a fixed 5s sleep.
+        assert clock["slept"] == [pytest.approx(3.0)]
+
+    def test_each_user_paces_on_their_own_quota(self, clock, monkeypatch):
+        import src.services.html_to_google_slides as g
+
+        monkeypatch.setattr(g, "_WRITE_REQUESTS_PER_MINUTE", 60)
+        alice = g._write_limiter("alice@example.com")
+        alice.penalize()
+
+        assert g._write_limiter("alice@example.com") is alice
+        assert g._write_limiter("bob@example.com").acquire() == 0.0
+        assert alice.acquire() == pytest.approx(11.0)
+
+    def test_a_converter_writes_through_its_users_bucket(self):
+        import src.services.html_to_google_slides as g
+
+        converter = g.HtmlToGoogleSlidesConverter.__new__(g.HtmlToGoogleSlidesConverter)
+        converter.user_identity = "alice@example.com"
+
+        assert converter._write_limiter is g._write_limiter("alice@example.com")
+        assert converter._write_limiter is not g._write_limiter(None)
+
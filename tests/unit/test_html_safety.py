@@ -109,3 +109,58 @@ def test_clean_chartjs_still_passes():
         '<script>const ctx=document.getElementById("c");new Chart(ctx,{});</script>'
     )
     assert scan_html_for_unsafe_patterns(clean) == []
+
+
+_STREAM_SAMPLES = [
+    '<div class="slide"><canvas id="c"></canvas></div><script>new Chart(c, {});</script>',
+    '<script>const x = XMLHttpRequest; fetch ("https://x"); eval(y)</script>',
+    "<script>let a = XMLHttpRequestFoo; document . cookie</script>",
+    '<img src="data:image/png;base64,' + "A" * 3000 + '" onerror="alert(1)">',
+    '<img src="https://attacker.com/a.png"><img src="https://cdn.jsdelivr.net/ok.png">'
+    '<link href="https://evil.example/x.css"><script src="https://attacker.com/b.js"></script>',
+    '<form method="post" action="/x"></form><meta http-equiv="refresh" content="0">',
+    '<a href="javascript:void(0)">x</a><script>window.location.href = u; '
+    "window.open(u); new Image(); location.replace(u)</script>",
+    "<p>Sales by location; navigate the report</p>",
+]
+
+
+@pytest.mark.parametrize("html", _STREAM_SAMPLES)
+def test_incremental_scanner_matches_batch_scan(html):
+    import random
+
+    from src.utils.html_safety import IncrementalSafetyScanner
+
+    rng = random.Random(html)
+    for _ in range(20):
+        scanner = IncrementalSafetyScanner()
+        early, i = [], 0
+        while i < len(html):
+            n = rng.randint(1, 40)
+            early += scanner.feed(html[i : i + n])
+            i += n
+        final = scanner.finish()
+
+        assert final == scan_html_for_unsafe_patterns(html)
+        assert set(early) <= set(final)
+
+
+def test_incremental_scanner_reports_a_split_pattern_before_the_end():
+    from src.utils.html_safety import IncrementalSafetyScanner
+
+    scanner = IncrementalSafetyScanner()
+
+    assert scanner.feed("<script>const r = fet") == []
+    assert scanner.feed("ch(") == []  # settled by the next character
+    assert scanner.feed("url") == ["unsafe pattern: fetch"]
+    assert scanner.feed(")</script>" + "<p>more</p>" * 100) == []
+
+
+def test_incremental_scanner_waits_for_a_trailing_word_boundary():
+    from src.utils.html_safety import IncrementalSafetyScanner
+
+    scanner = IncrementalSafetyScanner()
+
+    assert scanner.feed("const a = XMLHttpRequest") == []
+    assert scanner.feed("Factory;") == []
+    assert scanner.finish() == []
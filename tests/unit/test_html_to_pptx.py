@@ -686,3 +686,100 @@ class TestSlideOutcomeReportMustBeComplete:
             self._convert(tmp_path, 3, (False, False, False))
 
         assert "no slide rendered" in str(excinfo.value).lower()
+
+
+class TestSlideCodeCache:
+    """Unchanged slides reuse code that already ran; only verified code is cached."""
+
+    _CODE = (
+        "def add_slide_to_presentation(prs, html_str, assets_dir):\n"
+        "    slide = prs.slides.add_slide(prs.slide_layouts[6])\n"
+    )
+
+    class _MemoryCache:
+        def __init__(self):
+            self.entries = {}
+            self.puts = []
+
+        def get_many(self, keys):
+            return {k: self.entries[k] for k in keys if k in self.entries}
+
+        def put_many(self, entries, *, prompt_version, model_endpoint):
+            self.puts.append(dict(entries))
+            self.entries.update(entries)
+            return len(entries)
+
+    def _converter(self):
+        converter = _make_converter()
+        converter.code_cache = self._MemoryCache()
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_second_export_skips_codegen_and_reports_hits(self, tmp_path):
+        converter = self._converter()
+        slides = ["<html><body>one</body></html>", "<html><body>two</body></html>"]
+        generate = MagicMock(return_value=self._CODE)
+
+        with patch.object(converter, "_generate_code_sync", generate), patch.object(
+            converter, "_run_pptx_conversion", return_value=(True, True)
+        ):
+            await converter.convert_slide_deck(slides, str(tmp_path / "a.pptx"))
+            assert generate.call_count == 2
+
+            progress = []
+            slides[1] = "<html><body>two, edited</body></html>"
+            await converter.convert_slide_deck(
+                slides, str(tmp_path / "b.pptx"),
+                progress_callback=lambda *args: progress.append(args),
+            )
+
+        # Only the edited slide went back to the LLM.
+        assert generate.call_count == 3
+        assert generate.call_args[0][0] == "<html><body>two, edited</body></html>"
+        assert any("1 cached" in message for _, _, message in progress)
+        assert progress[-1][0] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_snippets_that_produced_their_slide_are_cached(self, tmp_path):
+        converter = self._converter()
+        slides = ["<html><body>one</body></html>", "<html><body>two</body></html>"]
+
+        with patch.object(converter, "_generate_code_sync", return_value=self._CODE), patch.object(
+            converter, "_run_pptx_conversion", return_value=(True, False)
+        ):
+            await converter.convert_slide_deck(slides, str(tmp_path / "a.pptx"))
+
+        assert len(converter.code_cache.puts) == 1
+        assert len(converter.code_cache.puts[0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_an_unknown_outcome_caches_nothing(self, tmp_path):
+        converter = self._converter()
+
+        with patch.object(converter, "_generate_code_sync", return_value=self._CODE), patch.object(
+            converter, "_run_pptx_conversion", return_value=()
+        ):
+            await converter.convert_slide_deck(["<p>one</p>"], str(tmp_path / "a.pptx"))
+
+        assert converter.code_cache.puts == []
+
+    def test_changed_chart_image_changes_the_key(self, tmp_path):
+        converter = self._converter()
+        assets = tmp_path / "assets"
+        assets.mkdir()
+        (assets / "chart_c1.png").write_bytes(b"before")
+        inputs = [("<p>x</p>", ["chart_c1.png"], [], str(assets))]
+        before = converter._slide_cache_keys(inputs)
+
+        (assets / "chart_c1.png").write_bytes(b"after")
+
+        assert converter._slide_cache_keys(inputs) != before
+
+    def test_changed_prompt_changes_the_key(self, tmp_path):
+        converter = self._converter()
+        inputs = [("<p>x</p>", [], [], str(tmp_path))]
+        before = converter._slide_cache_keys(inputs)
+
+        converter.MULTI_SLIDE_SYSTEM_PROMPT = "multi system, revised"
+
+        assert converter._slide_cache_keys(inputs) != before
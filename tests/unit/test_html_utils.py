@@ -1,6 +1,15 @@
 """Tests for HTML utility helpers."""
 
-from src.utils.html_utils import extract_canvas_ids_from_script, split_script_by_canvas
+import random
+
+from bs4 import BeautifulSoup
+
+from src.utils.html_utils import (
+    IncrementalSlideScanner,
+    extract_canvas_ids_from_script,
+    find_slide_roots,
+    split_script_by_canvas,
+)
 
 
 def test_extract_canvas_ids_from_script_various_patterns():
@@ -115,3 +124,47 @@ const charts = ['chart1', 'chart2'].forEach(id => {
     # Should fallback to single segment since we can't determine boundaries
     assert len(unsplit_segments) == 1
 
+
+
+_STREAMED_DECK = """<style>.slide { width: 1280px; }</style>
+<div class='slide title-slide'><h1>Q3</h1>
+<script>el.innerHTML = "<div class='slide'>not a slide</div>"; if (a<b) {}</script></div>
+<!-- <div class="slide">commented out</div> -->
+<section><div class="slide"><p>Revenue<br>1.2M</p></div></section>
+<section><h2>Header</h2><div class="slide">Sibling</div></section>
+<article><div data-note='a>b' class="slide">Outer<div class="slide">Inner</div></div></article>
+<div class="slides"><div class="slide">Last</div></div>
+"""
+
+
+def _scan_in_chunks(html, sizes):
+    scanner = IncrementalSlideScanner()
+    ready, i = [], 0
+    while i < len(html):
+        n = next(sizes)
+        ready += scanner.feed(html[i : i + n])
+        i += n
+    return ready
+
+
+def test_incremental_slide_scanner_matches_find_slide_roots():
+    """Any chunking yields the roots find_slide_roots finds, with their source markup."""
+    expected = [
+        root.get_text() for root in find_slide_roots(BeautifulSoup(_STREAMED_DECK, "html.parser"))
+    ]
+    rng = random.Random(7)
+
+    for _ in range(50):
+        ready = _scan_in_chunks(_STREAMED_DECK, iter(lambda: rng.randint(1, 9), None))
+        assert [BeautifulSoup(html, "html.parser").get_text() for html in ready] == expected
+
+    assert ready[1].startswith("<section>")  # promoted through the sole-child wrapper
+    assert ready[2] == '<div class="slide">Sibling</div>'  # wrapper has another child
+
+
+def test_incremental_slide_scanner_reports_a_slide_as_soon_as_it_closes():
+    scanner = IncrementalSlideScanner()
+
+    assert scanner.feed('<div class="slide"><p>One</p></di') == []
+    assert scanner.feed('v>\n<div class="slide">Two') == ['<div class="slide"><p>One</p></div>']
+    assert scanner.feed("") == []  # unclosed slide is never reported
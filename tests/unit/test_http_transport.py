@@ -0,0 +1,168 @@
+"""Tests for the shared HTTP transport, tool latency histograms and the vector search cache."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from src.core.http_transport import (
+    attach_shared_transport,
+    clear_latency_metrics,
+    get_shared_adapter,
+    latency_report,
+    record_latency,
+    timed,
+)
+from src.core.user_context import set_current_user
+from src.services.tools.vector_tool import (
+    VectorSearchCache,
+    _search_vector_index,
+    get_vector_search_cache,
+)
+
+URL = "https://example.cloud.databricks.com/api/2.0/x"
+
+
+def _sdk_client():
+    """Stand-in with the SDK's layout: ``api_client._api_client._session``."""
+    return SimpleNamespace(
+        api_client=SimpleNamespace(_api_client=SimpleNamespace(_session=requests.Session()))
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    clear_latency_metrics()
+    get_vector_search_cache().clear()
+    yield
+    clear_latency_metrics()
+    get_vector_search_cache().clear()
+    set_current_user(None)
+
+
+class TestSharedTransport:
+    def test_user_clients_share_one_pool(self):
+        first, second = _sdk_client(), _sdk_client()
+
+        assert attach_shared_transport(first)
+        assert attach_shared_transport(second)
+
+        adapter = first.api_client._api_client._session.get_adapter(URL)
+        assert adapter is get_shared_adapter()
+        assert second.api_client._api_client._session.get_adapter(URL) is adapter
+
+    def test_clients_without_a_session_are_left_alone(self):
+        assert attach_shared_transport(object()) is False
+
+    def test_cached_user_client_uses_shared_pool(self):
+        from src.core import databricks_client
+
+        client = _sdk_client()
+        with patch.object(databricks_client, "create_user_client", return_value=client):
+            databricks_client._user_client_cache.clear()
+            try:
+                databricks_client.get_or_create_user_client("t")
+            finally:
+                databricks_client._user_client_cache.clear()
+
+        session = client.api_client._api_client._session
+        assert session.get_adapter(URL) is get_shared_adapter()
+
+
+class TestLatencyHistograms:
+    def test_buckets_and_percentiles(self):
+        for seconds in (0.01, 0.2, 0.2, 3.0):
+            record_latency("serving", "ep", seconds)
+
+        report = latency_report()["endpoints"]["serving:ep"]
+
+        assert report["calls"] == 4
+        assert report["buckets"]["le_0.05s"] == 1
+        assert report["buckets"]["le_0.25s"] == 2
+        assert report["buckets"]["le_5s"] == 1
+        assert report["p50_s"] == 0.2
+        assert report["p95_s"] == 3.0
+
+    def test_timed_counts_errors(self):
+        with pytest.raises(RuntimeError):
+            with timed("vector", "idx"):
+                raise RuntimeError("boom")
+        with timed("vector", "idx"):
+            pass
+
+        report = latency_report()["endpoints"]["vector:idx"]
+        assert report["calls"] == 2
+        assert report["errors"] == 1
+
+    def test_admin_tool_latency_endpoint(self):
+        from src.api.main import app
+
+        record_latency("serving", "ep", 0.1)
+        resp = TestClient(app).get("/api/admin/tool-latency")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["endpoints"]["serving:ep"]["calls"] == 1
+        assert body["vector_search_cache"]["entries"] == 0
+
+
+def _vector_client():
+    client = Mock()
+    client.vector_search_indexes.query_index.return_value = Mock(
+        as_dict=lambda: {
+            "manifest": {"columns": [{"name": "content"}]},
+            "result": {"data_array": [["doc"]]},
+        }
+    )
+    return client
+
+
+class TestVectorSearchCache:
+    def test_repeated_query_is_served_from_cache(self):
+        client = _vector_client()
+        set_current_user("alice")
+
+        with patch("src.services.tools.vector_tool.get_user_client", return_value=client):
+            first = _search_vector_index("cat.sch.idx", "revenue", ["content"], 5)
+            second = _search_vector_index("cat.sch.idx", "revenue", ["content"], 5)
+            _search_vector_index("cat.sch.idx", "revenue", ["content"], 10)
+
+        assert first == second
+        assert json.loads(first)["count"] == 1
+        assert client.vector_search_indexes.query_index.call_count == 2
+        assert latency_report()["endpoints"]["vector:cat.sch.idx"]["calls"] == 2
+
+    def test_users_do_not_share_entries(self):
+        client = _vector_client()
+
+        with patch("src.services.tools.vector_tool.get_user_client", return_value=client):
+            for user in ("alice", "bob"):
+                set_current_user(user)
+                _search_vector_index("idx", "q", ["content"], 5)
+
+        assert client.vector_search_indexes.query_index.call_count == 2
+
+    def test_no_user_is_not_cached(self):
+        client = _vector_client()
+
+        with patch("src.services.tools.vector_tool.get_user_client", return_value=client):
+            _search_vector_index("idx", "q", ["content"], 5)
+            _search_vector_index("idx", "q", ["content"], 5)
+
+        assert client.vector_search_indexes.query_index.call_count == 2
+
+    def test_expiry_and_eviction(self):
+        cache = VectorSearchCache(ttl_seconds=60, max_entries=2)
+        for n in range(3):
+            cache.put(("idx", "u", f"q{n}", ("c",), 5), f"r{n}")
+
+        assert cache.get(("idx", "u", "q0", ("c",), 5)) is None
+        assert cache.get(("idx", "u", "q2", ("c",), 5)) == "r2"
+        with patch("src.services.tools.vector_tool.time.monotonic", return_value=10**12):
+            assert cache.get(("idx", "u", "q2", ("c",), 5)) is None
+
+    def test_zero_ttl_disables(self):
+        assert not VectorSearchCache(ttl_seconds=0).enabled
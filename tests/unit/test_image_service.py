@@ -155,36 +155,36 @@ class TestUploadDatabaseStorage:
 # ===== Thumbnail Generation =====
 
 class TestThumbnailGeneration:
-    """Tests for _generate_thumbnail internal function."""
+    """Tests for render_thumbnail (src.utils.thumbnail_render)."""
 
     def test_generates_for_png(self, png_100x100):
-        thumb = image_service._generate_thumbnail(png_100x100, "image/png")
+        thumb = image_service.render_thumbnail(png_100x100, "image/png")
         assert thumb is not None
         assert thumb.startswith("data:image/")
         assert ";base64," in thumb
 
     def test_generates_for_jpeg(self, jpeg_100x100):
-        thumb = image_service._generate_thumbnail(jpeg_100x100, "image/jpeg")
+        thumb = image_service.render_thumbnail(jpeg_100x100, "image/jpeg")
         assert thumb is not None
         assert thumb.startswith("data:image/jpeg;base64,")
 
     def test_generates_for_rgba_png(self, png_rgba_100x100):
-        thumb = image_service._generate_thumbnail(png_rgba_100x100, "image/png")
+        thumb = image_service.render_thumbnail(png_rgba_100x100, "image/png")
         assert thumb is not None
         # RGBA images should produce PNG thumbnails (to preserve transparency)
         assert thumb.startswith("data:image/png;base64,")
 
     def test_extracts_first_frame_from_animated_gif(self, gif_animated):
-        thumb = image_service._generate_thumbnail(gif_animated, "image/gif")
+        thumb = image_service.render_thumbnail(gif_animated, "image/gif")
         assert thumb is not None
         assert thumb.startswith("data:image/")
 
     def test_returns_none_for_svg(self, svg_content):
-        thumb = image_service._generate_thumbnail(svg_content, "image/svg+xml")
+        thumb = image_service.render_thumbnail(svg_content, "image/svg+xml")
         assert thumb is None
 
     def test_thumbnail_is_reasonable_size(self, png_100x100):
-        thumb = image_service._generate_thumbnail(png_100x100, "image/png")
+        thumb = image_service.render_thumbnail(png_100x100, "image/png")
         assert len(thumb) < 50_000
 
     def test_upload_stores_thumbnail_in_db(self, db_session, png_100x100):
@@ -197,6 +197,221 @@ class TestThumbnailGeneration:
         assert result.thumbnail_base64.startswith("data:image/")
 
 
+# ===== Off-request Thumbnail Pipeline =====
+
+class TestDeferredThumbnail:
+    """upload_image(defer_thumbnail=True) + schedule_thumbnail render off-request."""
+
+    @pytest.fixture
+    def session_factory(self, db_engine):
+        return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def test_deferred_upload_stores_original_without_thumbnail(self, db_session, png_100x100):
+        result = image_service.upload_image(
+            db=db_session, file_content=png_100x100,
+            original_filename="test.png", mime_type="image/png",
+            user="test", defer_thumbnail=True,
+        )
+        assert result.image_data == png_100x100
+        assert result.thumbnail_base64 is None
+        assert result.thumbnail_status == image_service.THUMBNAIL_STATUS_PENDING
+
+    def test_deferred_svg_is_ready_immediately(self, db_session, svg_content):
+        result = image_service.upload_image(
+            db=db_session, file_content=svg_content,
+            original_filename="icon.svg", mime_type="image/svg+xml",
+            user="test", defer_thumbnail=True,
+        )
+        assert result.thumbnail_status == image_service.THUMBNAIL_STATUS_READY
+
+    def test_inline_upload_is_ready(self, db_session, png_100x100):
+        result = image_service.upload_image(
+            db=db_session, file_content=png_100x100,
+            original_filename="test.png", mime_type="image/png",
+            user="test",
+        )
+        assert result.thumbnail_status == image_service.THUMBNAIL_STATUS_READY
+
+    def test_schedule_fills_thumbnail_and_status(
+        self, db_session, session_factory, png_100x100, gif_animated
+    ):
+        images = [
+            image_service.upload_image(
+                db=db_session, file_content=content,
+                original_filename=name, mime_type=mime,
+                user="test", defer_thumbnail=True,
+            )
+            for content, name, mime in (
+                (png_100x100, "a.png", "image/png"),
+                (gif_animated, "b.gif", "image/gif"),
+            )
+        ]
+        futures = [
+            image_service.schedule_thumbnail(
+                img.id, img.image_data, img.mime_type, session_factory=session_factory
+            )
+            for img in images
+        ]
+        assert [f.result(timeout=60) for f in futures] == ["ready", "ready"]
+
+        db_session.expire_all()
+        for img in images:
+            stored = db_session.get(ImageAsset, img.id)
+            assert stored.thumbnail_status == "ready"
+            assert stored.thumbnail_base64.startswith("data:image/")
+
+    def test_undecodable_image_marks_failed(self, db_session, session_factory):
+        image = create_test_image(
+            db_session, image_data=b"not a png", thumbnail_base64=None,
+            thumbnail_status="pending",
+        )
+        future = image_service.schedule_thumbnail(
+            image.id, image.image_data, "image/png", session_factory=session_factory
+        )
+        assert future.result(timeout=60) == "failed"
+        db_session.expire_all()
+        assert db_session.get(ImageAsset, image.id).thumbnail_status == "failed"
+
+    def test_restart_reschedules_stale_pending_rows(
+        self, db_session, session_factory, png_100x100
+    ):
+        from datetime import datetime, timedelta
+
+        stale = datetime.utcnow() - timedelta(minutes=5)
+        pending = create_test_image(
+            db_session, image_data=png_100x100, thumbnail_base64=None,
+            thumbnail_status="pending", updated_at=stale,
+        )
+        deleted = create_test_image(
+            db_session, filename="gone.png", original_filename="gone.png",
+            image_data=png_100x100, thumbnail_base64=None,
+            thumbnail_status="pending", is_active=False, updated_at=stale,
+        )
+        ready = create_test_image(db_session, filename="ok.png", original_filename="ok.png")
+
+        futures = image_service.reschedule_pending_thumbnails(session_factory)
+        assert [f.result(timeout=60) for f in futures] == ["ready"]
+
+        db_session.expire_all()
+        stored = db_session.get(ImageAsset, pending.id)
+        assert stored.thumbnail_status == "ready"
+        assert stored.thumbnail_base64.startswith("data:image/")
+        assert db_session.get(ImageAsset, deleted.id).thumbnail_status == "pending"
+        assert db_session.get(ImageAsset, ready.id).thumbnail_base64 == ready.thumbnail_base64
+
+    def test_reschedule_skips_rows_claimed_by_another_worker(
+        self, db_session, session_factory, png_100x100
+    ):
+        from datetime import datetime, timedelta
+
+        image = create_test_image(
+            db_session, image_data=png_100x100, thumbnail_base64=None,
+            thumbnail_status="pending", updated_at=datetime.utcnow() - timedelta(minutes=5),
+        )
+        claimed_before = datetime.utcnow()
+        assert image_service._rerender_stored_thumbnail(
+            image.id, claimed_before, session_factory
+        ) == "ready"
+        db_session.query(ImageAsset).filter(ImageAsset.id == image.id).update(
+            {ImageAsset.thumbnail_status: "pending"}
+        )
+        db_session.commit()
+        # The first claim bumped updated_at past the sweep's start: a second
+        # worker's sweep of the same boot leaves the row alone.
+        assert image_service._rerender_stored_thumbnail(
+            image.id, claimed_before, session_factory
+        ) is None
+
+
+class TestProcessPoolFailures:
+    """A dead render worker is replaced; the image is never decoded in-process."""
+
+    def _broken_pool(self):
+        from concurrent.futures.process import BrokenProcessPool
+
+        pool = MagicMock()
+        pool.submit.return_value.result.side_effect = BrokenProcessPool("worker died")
+        return pool
+
+    def test_retries_once_on_a_fresh_pool(self, png_100x100):
+        healthy = MagicMock()
+        healthy.submit.return_value.result.return_value = "data:image/png;base64,AAAA"
+        with patch.object(
+            image_service, "_get_process_pool", side_effect=[self._broken_pool(), healthy]
+        ), patch.object(image_service, "_reset_process_pool") as reset, \
+                patch.object(image_service, "render_thumbnail") as inline:
+            thumb = image_service._render_thumbnail_off_request(png_100x100, "image/png")
+
+        assert thumb == "data:image/png;base64,AAAA"
+        assert reset.call_count == 1
+        inline.assert_not_called()
+
+    def test_second_break_raises_instead_of_decoding_inline(self, png_100x100):
+        from concurrent.futures.process import BrokenProcessPool
+
+        with patch.object(
+            image_service,
+            "_get_process_pool",
+            side_effect=[self._broken_pool(), self._broken_pool()],
+        ), patch.object(image_service, "_reset_process_pool"), \
+                patch.object(image_service, "render_thumbnail") as inline:
+            with pytest.raises(BrokenProcessPool):
+                image_service._render_thumbnail_off_request(png_100x100, "image/png")
+        inline.assert_not_called()
+
+    def test_pool_uses_spawn_context(self):
+        image_service._reset_process_pool()
+        try:
+            pool = image_service._get_process_pool()
+            assert pool._mp_context.get_start_method() == "spawn"
+        finally:
+            image_service._reset_process_pool()
+
+    def test_worker_import_stays_light(self):
+        """A spawned worker unpickles render_thumbnail without the agent stack."""
+        import subprocess
+        import sys
+
+        probe = (
+            "import sys, src.utils.thumbnail_render; "
+            "print(sorted(m for m in sys.modules if m.startswith(('src.services', 'src.core'))))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+
+class TestDecodeBudget:
+    """The decoded-pixel budget admits work up to its limit, then blocks."""
+
+    def test_estimate_uses_decoded_pixel_size(self, png_100x100):
+        assert image_service._estimate_decode_bytes(png_100x100, "image/png") == 100 * 100 * 4
+
+    def test_oversized_request_admitted_when_idle(self):
+        budget = image_service._DecodeBudget(10)
+        budget.acquire(100)  # Larger than the limit, nothing in flight: no deadlock.
+        budget.release(100)
+
+    def test_blocks_until_released(self):
+        import threading
+
+        budget = image_service._DecodeBudget(10)
+        budget.acquire(8)
+        acquired = threading.Event()
+
+        def second():
+            budget.acquire(8)
+            acquired.set()
+
+        t = threading.Thread(target=second, daemon=True)
+        t.start()
+        assert not acquired.wait(0.2)
+        budget.release(8)
+        assert acquired.wait(5)
+        t.join(5)
+
+
 # ===== get_image_base64 =====
 
 class TestGetImageBase64:
@@ -0,0 +1,198 @@
+"""Tests for multi-slide judge batching in the Direct judge backend."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.evaluation.llm_judge import (
+    _parse_batch_judge_response,
+    evaluate_batch_with_judge,
+    plan_judge_batches,
+)
+
+
+class StubChat:
+    """Stands in for ChatDatabricks: rates every slide it is shown green.
+
+    ``reply`` overrides the batch reply (a string, or a callable of the slide ids).
+    """
+
+    def __init__(self, reply=None):
+        self.reply = reply
+        self.prompts = []
+
+    def __call__(self, **kwargs):
+        return self
+
+    def invoke(self, messages):
+        prompt = messages[0].content
+        self.prompts.append(prompt)
+        ids = re.findall(r"^### SLIDE (\S+)$", prompt, flags=re.MULTILINE)
+        if not ids:
+            return SimpleNamespace(content=json.dumps({"rating": "green", "explanation": "one"}))
+        if callable(self.reply):
+            return SimpleNamespace(content=self.reply(ids))
+        if self.reply is not None:
+            return SimpleNamespace(content=self.reply)
+        results = [{"slide_id": i, "rating": "green", "explanation": f"s{i}"} for i in ids]
+        return SimpleNamespace(content=json.dumps({"results": results}))
+
+
+@pytest.fixture
+def stub_chat():
+    chat = StubChat()
+    with patch("src.core.databricks_client.get_system_client", return_value=MagicMock()), patch(
+        "databricks_langchain.ChatDatabricks", chat
+    ):
+        yield chat
+
+
+def _slides(n):
+    return {f"hash-{i}": f"<div>Slide {i}: revenue {i}M</div>" for i in range(n)}
+
+
+class TestPlanBatches:
+    def test_respects_slide_cap(self):
+        slides = [(f"h{i}", "<p>x</p>") for i in range(10)]
+
+        batches = plan_judge_batches("corpus", slides, token_budget=10**6, max_slides=4)
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [k for b in batches for k in b] == [k for k, _ in slides]
+
+    def test_respects_token_budget(self):
+        slides = [(f"h{i}", "x" * 4000) for i in range(4)]  # ~1000 tokens each
+
+        batches = plan_judge_batches("corpus", slides, token_budget=2600, max_slides=8)
+
+        assert [len(b) for b in batches] == [2, 2]
+
+    def test_oversized_slide_gets_its_own_batch(self):
+        slides = [("small", "x"), ("huge", "x" * 40_000), ("small2", "x")]
+
+        batches = plan_judge_batches("corpus", slides, token_budget=2000, max_slides=8)
+
+        assert ["huge"] in batches
+
+
+class TestParseBatchResponse:
+    def test_well_formed(self):
+        text = json.dumps(
+            {"results": [{"slide_id": "1", "rating": "Green", "explanation": "ok"}]}
+        )
+
+        assert _parse_batch_judge_response(text, ["1", "2"]) == {"1": ("green", "ok")}
+
+    def test_fenced_bare_list(self):
+        text = '```json\n[{"slide_id": "2", "rating": "red", "explanation": "wrong"}]\n```'
+
+        assert _parse_batch_judge_response(text, ["1", "2"]) == {"2": ("red", "wrong")}
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "not json",
+            json.dumps({"rating": "green"}),
+            json.dumps({"results": [{"slide_id": "9", "rating": "green"}]}),
+            json.dumps({"results": [{"slide_id": "1", "rating": "purple"}]}),
+        ],
+    )
+    def test_malformed_entries_are_dropped(self, text):
+        assert _parse_batch_judge_response(text, ["1"]) == {}
+
+
+class TestEvaluateBatch:
+    def test_one_call_sends_the_corpus_once(self, stub_chat):
+        corpus = "revenue | 2024\n" * 50
+
+        results = asyncio.run(evaluate_batch_with_judge(corpus, _slides(5)))
+
+        assert len(stub_chat.prompts) == 1
+        assert stub_chat.prompts[0].count(corpus) == 1
+        assert set(results) == set(_slides(5))
+        assert all(r.rating == "green" and r.score == 85 for r in results.values())
+
+    def test_malformed_reply_falls_back_to_per_slide_calls(self, stub_chat):
+        stub_chat.reply = "Sure! Here are the ratings: all green."
+
+        results = asyncio.run(evaluate_batch_with_judge("corpus", _slides(3)))
+
+        assert len(stub_chat.prompts) == 1 + 3
+        assert {r.explanation for r in results.values()} == {"one"}
+
+    def test_only_missing_slides_are_rejudged(self, stub_chat):
+        stub_chat.reply = lambda ids: json.dumps(
+            {"results": [{"slide_id": ids[0], "rating": "amber", "explanation": "batch"}]}
+        )
+
+        results = asyncio.run(evaluate_batch_with_judge("corpus", _slides(3)))
+
+        assert len(stub_chat.prompts) == 1 + 2
+        assert results["hash-0"].rating == "amber"
+        assert results["hash-1"].explanation == results["hash-2"].explanation == "one"
+
+    def test_failed_fallback_is_an_error_result(self, stub_chat):
+        stub_chat.reply = "garbage"
+        original = stub_chat.invoke
+
+        def invoke(messages):
+            if "### SLIDE" not in messages[0].content:
+                raise RuntimeError("endpoint down")
+            return original(messages)
+
+        stub_chat.invoke = invoke
+
+        results = asyncio.run(evaluate_batch_with_judge("corpus", _slides(2)))
+
+        assert all(r.error and r.rating == "error" for r in results.values())
+
+    def test_single_slide_uses_the_single_prompt(self, stub_chat):
+        results = asyncio.run(evaluate_batch_with_judge("corpus", _slides(1)))
+
+        assert "### SLIDE" not in stub_chat.prompts[0]
+        assert results["hash-0"].rating == "green"
+
+    def test_failed_single_slide_is_an_error_result(self, stub_chat):
+        def invoke(messages):
+            raise RuntimeError("endpoint down")
+
+        stub_chat.invoke = invoke
+
+        results = asyncio.run(evaluate_batch_with_judge("corpus", _slides(1)))
+
+        assert results["hash-0"].error and results["hash-0"].rating == "error"
+        assert "endpoint down" in results["hash-0"].error_message
+
+
+def test_deck_job_batches_direct_judge_calls(stub_chat, monkeypatch):
+    from src.api.services import deck_verification
+
+    monkeypatch.setenv("VERIFICATION_CACHE_ENABLED", "false")
+    manager = MagicMock()
+    manager.get_session.return_value = {"genie_conversation_id": None}
+    manager.get_slide_deck.return_value = {
+        "slides": [
+            {"html": f"<p>{i}</p>", "content_hash": f"h{i}", "verification": None}
+            for i in range(10)
+        ]
+    }
+    manager.get_messages.return_value = [
+        {"role": "tool", "message_type": "tool_result", "content": "revenue | 1200000"}
+    ]
+
+    async def collect():
+        return [e async for e in deck_verification.verify_deck("s1", batch_max_slides=4)]
+
+    with patch.object(deck_verification, "get_session_manager", return_value=manager), patch.object(
+        deck_verification, "get_settings", return_value=SimpleNamespace(llm_judge_backend="direct")
+    ):
+        events = asyncio.run(collect())
+
+    assert len(stub_chat.prompts) == 3  # 4 + 4 + 2 slides
+    assert events[-1]["judge_calls"] == 3
+    assert events[-1]["verified"] == 10
+    assert len(manager.save_verifications.call_args.args[1]) == 10
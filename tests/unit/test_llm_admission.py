@@ -0,0 +1,223 @@
+"""Tests for LLM admission control: priorities, rate pacing, 429 backoff, metrics."""
+
+import asyncio
+import threading
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import llm_admission
+from src.core.llm_admission import (
+    EndpointGovernor,
+    LLMPriority,
+    admitted_call,
+    allm_slot,
+    get_governor,
+    is_rate_limit_error,
+    llm_priority,
+)
+from src.services.llm_admission_callback import LLMAdmissionCallback
+
+
+@pytest.fixture(autouse=True)
+def _fresh_governors(monkeypatch):
+    monkeypatch.setattr(llm_admission, "_BACKOFF_BASE_S", 0.01)
+    llm_admission.reset_governors()
+    yield
+    llm_admission.reset_governors()
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestEndpointGovernor:
+    def test_queued_calls_are_admitted_by_priority(self):
+        governor = EndpointGovernor("ep", max_concurrent=1, requests_per_minute=0)
+        governor.acquire(LLMPriority.CHAT)
+        admitted = []
+
+        def call(priority):
+            governor.acquire(priority)
+            admitted.append(priority)
+            governor.release()
+
+        threads = []
+        for priority in (LLMPriority.NAMING, LLMPriority.EXPORT, LLMPriority.CHAT,
+                         LLMPriority.VERIFICATION):
+            thread = threading.Thread(target=call, args=(priority,))
+            thread.start()
+            threads.append(thread)
+            _wait_until(lambda n=len(threads): governor.report()["queued"] == n)
+
+        governor.release()
+        for thread in threads:
+            thread.join(5)
+
+        assert admitted == [
+            LLMPriority.CHAT, LLMPriority.VERIFICATION, LLMPriority.EXPORT, LLMPriority.NAMING,
+        ]
+
+    def test_concurrency_is_capped(self):
+        governor = EndpointGovernor("ep", max_concurrent=2, requests_per_minute=0)
+        governor.acquire(LLMPriority.CHAT)
+        governor.acquire(LLMPriority.CHAT)
+        third = threading.Thread(target=governor.acquire, args=(LLMPriority.CHAT,))
+        third.start()
+        _wait_until(lambda: governor.report()["queued"] == 1)
+
+        assert governor.report()["in_flight"] == 2
+        governor.release()
+        third.join(5)
+        assert governor.report()["in_flight"] == 2
+
+    def test_token_bucket_paces_calls(self):
+        governor = EndpointGovernor("ep", max_concurrent=4, requests_per_minute=600, burst=1)
+
+        assert governor.acquire(LLMPriority.CHAT) < 0.05
+        # 600 / minute = one token every 0.1s.
+        assert governor.acquire(LLMPriority.CHAT) >= 0.08
+
+    def test_rate_limits_back_off_and_success_resets(self):
+        governor = EndpointGovernor("ep")
+
+        governor.record_rate_limited()
+        governor.record_rate_limited()
+        assert governor.report()["backoff_s"] == pytest.approx(0.02)
+        assert governor.report()["rate_limited"] == 2
+
+        governor.record_success()
+        assert governor.report()["backoff_s"] == 0
+
+    def test_report_has_waits_per_priority_class(self):
+        governor = EndpointGovernor("ep", requests_per_minute=0)
+        for priority in (LLMPriority.CHAT, LLMPriority.EXPORT, LLMPriority.EXPORT):
+            governor.acquire(priority)
+            governor.release()
+
+        waits = governor.report()["wait_s"]
+
+        assert set(waits) == {"chat", "export"}
+        assert waits["export"]["calls"] == 2
+
+
+class TestAdmittedCall:
+    def test_rate_limited_call_is_retried_after_backoff(self):
+        attempts = []
+
+        def call():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise Exception("Error code: 429 - REQUEST_LIMIT_EXCEEDED")
+            return "ok"
+
+        assert admitted_call("ep", LLMPriority.EXPORT, call) == "ok"
+        report = get_governor("ep").report()
+        assert report["rate_limited"] == 1
+        assert report["backoff_s"] == 0
+        assert report["in_flight"] == 0
+        assert attempts[1] - attempts[0] >= 0.009
+
+    def test_other_errors_propagate_without_retry(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            admitted_call("ep", LLMPriority.EXPORT, call)
+        assert len(calls) == 1
+        assert get_governor("ep").report()["in_flight"] == 0
+
+    def test_async_slot_holds_and_releases(self):
+        async def run():
+            async with allm_slot("ep", LLMPriority.VERIFICATION):
+                return get_governor("ep").report()["in_flight"]
+
+        assert asyncio.run(run()) == 1
+        assert get_governor("ep").report()["in_flight"] == 0
+        assert get_governor("ep").report()["wait_s"]["verification"]["calls"] == 1
+
+
+class TestIsRateLimitError:
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Error code: 429 - REQUEST_LIMIT_EXCEEDED",
+            "HTTP 429",
+            "Received HTTP/1.1 429 from serving endpoint",
+            "status_code=429",
+            "Rate limit reached for endpoint",
+            "429 Too Many Requests",
+        ],
+    )
+    def test_rate_limit_text_is_recognised(self, message):
+        assert is_rate_limit_error(Exception(message))
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "input length 142900 exceeds the model context window",
+            "Request 4291 failed: bad request",
+            "max_tokens must be <= 429 for this model",
+        ],
+    )
+    def test_other_numbers_are_not_rate_limits(self, message):
+        assert not is_rate_limit_error(Exception(message))
+
+    def test_status_code_attributes(self):
+        exc = Exception("upstream error")
+        exc.response = type("Response", (), {"status_code": 429})()
+
+        assert is_rate_limit_error(exc)
+
+
+class TestLLMAdmissionCallback:
+    def test_slot_is_held_for_the_call(self):
+        callback = LLMAdmissionCallback("ep", LLMPriority.NAMING)
+        run_id = uuid.uuid4()
+
+        callback.on_chat_model_start({}, [], run_id=run_id)
+        assert get_governor("ep").report()["in_flight"] == 1
+        callback.on_llm_end(None, run_id=run_id)
+
+        report = get_governor("ep").report()
+        assert report["in_flight"] == 0
+        assert report["wait_s"]["naming"]["calls"] == 1
+
+    def test_priority_follows_the_enclosing_block(self):
+        callback = LLMAdmissionCallback("ep")
+        run_id = uuid.uuid4()
+
+        with llm_priority(LLMPriority.EDIT):
+            callback.on_chat_model_start({}, [], run_id=run_id)
+        callback.on_llm_end(None, run_id=run_id)
+
+        assert set(get_governor("ep").report()["wait_s"]) == {"edit"}
+
+    def test_rate_limit_error_pauses_admissions(self):
+        callback = LLMAdmissionCallback("ep")
+        run_id = uuid.uuid4()
+
+        callback.on_chat_model_start({}, [], run_id=run_id)
+        callback.on_llm_error(Exception("429 Too Many Requests"), run_id=run_id)
+
+        report = get_governor("ep").report()
+        assert report["in_flight"] == 0
+        assert report["rate_limited"] == 1
+
+
+def test_admin_llm_admission_endpoint():
+    from src.api.main import app
+
+    admitted_call("ep", LLMPriority.CHAT, lambda: None)
+    resp = TestClient(app).get("/api/admin/llm-admission")
+
+    assert resp.status_code == 200
+    assert resp.json()["endpoints"]["ep"]["wait_s"]["chat"]["calls"] == 1
@@ -0,0 +1,209 @@
+"""Tests for pooled MCP sessions and the MCP tool helpers that use them."""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from src.services.tools import mcp_tool
+from src.services.tools.mcp_sessions import MCPConnectionManager, session_key
+
+URL = "https://host/api/2.0/mcp/external/conn"
+
+
+class FakeServer:
+    """Opens fake sessions and records what happens to them."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.opened = []
+        self.closed = 0
+        self.active = 0
+        self.peak = 0
+        self.fail_next_call = False
+
+    def open(self, server_url, host, token):
+        server = self
+
+        @asynccontextmanager
+        async def session():
+            fake = SimpleNamespace(token=token, call_tool=None, list_tools=None)
+
+            async def call_tool(name, arguments):
+                server.active += 1
+                server.peak = max(server.peak, server.active)
+                try:
+                    await asyncio.sleep(server.delay)
+                    if server.fail_next_call:
+                        server.fail_next_call = False
+                        raise ConnectionError("stream closed")
+                    return SimpleNamespace(content=[SimpleNamespace(text=f"{name}:{token}")])
+                finally:
+                    server.active -= 1
+
+            async def list_tools():
+                return SimpleNamespace(
+                    tools=[SimpleNamespace(name="search", description="Find", inputSchema={})]
+                )
+
+            fake.call_tool, fake.list_tools = call_tool, list_tools
+            server.opened.append(token)
+            try:
+                yield fake
+            finally:
+                server.closed += 1
+
+        return session()
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def manager(server):
+    manager = MCPConnectionManager(opener=server.open, list_tools_ttl_seconds=60)
+    yield manager
+    manager.close()
+
+
+def test_session_is_reused_per_user(manager, server):
+    for _ in range(3):
+        manager.call_tool(URL, "https://host", "tok-a", "search", {})
+    result = manager.call_tool(URL, "https://host", "tok-b", "search", {})
+
+    assert server.opened == ["tok-a", "tok-b"]
+    assert result.content[0].text == "search:tok-b"
+    assert manager.stats()["sessions_reused"] == 2
+
+
+def test_session_key_does_not_contain_the_token():
+    key = session_key(URL, "secret-token")
+
+    assert key[0] == URL
+    assert "secret-token" not in key[1]
+    assert key != session_key(URL, "other-token")
+
+
+def test_dropped_session_is_reopened_once(manager, server):
+    manager.call_tool(URL, "https://host", "tok", "search", {})
+    server.fail_next_call = True
+
+    result = manager.call_tool(URL, "https://host", "tok", "search", {})
+
+    assert result.content[0].text == "search:tok"
+    assert server.opened == ["tok", "tok"]
+    assert manager.stats()["reconnects"] == 1
+
+
+def test_server_errors_are_not_retried(manager, server):
+    manager.call_tool(URL, "https://host", "tok", "search", {})
+
+    async def reject(name, arguments):
+        raise McpError(ErrorData(code=-32602, message="Unknown tool"))
+
+    session = next(iter(manager._sessions.values())).session
+    session.call_tool = reject
+
+    with pytest.raises(McpError):
+        manager.call_tool(URL, "https://host", "tok", "missing", {})
+    assert server.opened == ["tok"]
+
+
+def test_concurrency_is_bounded_per_server(server):
+    server.delay = 0.1
+    manager = MCPConnectionManager(opener=server.open, max_concurrent_per_server=2)
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(
+                pool.map(
+                    lambda i: manager.call_tool(URL, "https://host", f"tok-{i}", "s", {}),
+                    range(6),
+                )
+            )
+    finally:
+        manager.close()
+
+    assert server.peak == 2
+
+
+def test_idle_sessions_are_closed(server):
+    manager = MCPConnectionManager(opener=server.open, idle_seconds=0)
+    try:
+        manager.call_tool(URL, "https://host", "tok", "search", {})
+
+        asyncio.run_coroutine_threadsafe(_sweep(manager), manager._loop).result(5)
+        time.sleep(0.05)
+
+        assert server.closed == 1
+        assert manager.stats()["idle_evictions"] == 1
+    finally:
+        manager.close()
+
+
+async def _sweep(manager):
+    manager._sweep()
+
+
+def test_list_tools_is_cached_and_refreshed_in_background(server):
+    manager = MCPConnectionManager(opener=server.open, list_tools_ttl_seconds=0)
+    try:
+        first = manager.list_tools(URL, "https://host", "tok")
+        second = manager.list_tools(URL, "https://host", "tok")  # stale: served, then refreshed
+        time.sleep(0.05)
+
+        assert first == second == [{"name": "search", "description": "Find", "input_schema": {}}]
+        stats = manager.stats()
+        assert stats["list_tools_misses"] == 1
+        assert stats["list_tools_hits"] == 1
+        assert stats["sessions_reused"] == 1  # the refresh ran on the pooled session
+    finally:
+        manager.close()
+
+
+def test_close_closes_open_sessions(manager, server):
+    manager.call_tool(URL, "https://host", "tok", "search", {})
+
+    manager.close()
+
+    assert server.closed == 1
+
+
+class TestMCPToolHelpers:
+    @pytest.fixture(autouse=True)
+    def _user_client(self):
+        client = Mock()
+        client.config.host = "https://host"
+        client.config.token = "tok"
+        with patch.object(mcp_tool, "get_user_client", return_value=client):
+            yield
+
+    def test_call_mcp_tool_formats_text_content(self, manager):
+        with patch.object(mcp_tool, "get_mcp_connection_manager", return_value=manager):
+            result = mcp_tool.call_mcp_tool("conn", "search", {"query": "x"})
+
+        assert json.loads(result) == {"result": "search:tok"}
+
+    def test_forbidden_maps_to_permission_error(self):
+        failing = Mock()
+        failing.call_tool.side_effect = RuntimeError("HTTP 403 Forbidden")
+
+        with patch.object(mcp_tool, "get_mcp_connection_manager", return_value=failing):
+            with pytest.raises(mcp_tool.MCPToolError, match="Permission denied"):
+                mcp_tool.call_mcp_tool("conn", "search", {})
+
+    def test_list_mcp_tools_returns_empty_on_failure(self):
+        failing = Mock()
+        failing.list_tools.side_effect = RuntimeError("boom")
+
+        with patch.object(mcp_tool, "get_mcp_connection_manager", return_value=failing):
+            assert mcp_tool.list_mcp_tools("conn") == []
@@ -0,0 +1,88 @@
+"""Tests for stopping an unsafe LLM generation mid-stream (output safety gate)."""
+
+import queue
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.services.agent import _invoke_with_safety_abort, _run_output_safety_gate
+from src.services.output_safety_callback import UnsafeOutputAbortError
+from src.services.streaming_callback import StreamingCallbackHandler
+from src.utils.html_safety import scan_html_for_unsafe_patterns
+
+_TAIL = " ".join(f"<p>row {i}</p>" for i in range(2000))
+_UNSAFE = '<div class="slide"><script> fetch( "https://x" ) </script></div> ' + _TAIL
+
+
+class _StreamingExecutor:
+    """Stands in for the agent executor: streams one model reply, like RunnableAgent."""
+
+    def __init__(self, reply):
+        self.model = GenericFakeChatModel(messages=iter([AIMessage(content=reply)]))
+        self.chunks = 0
+
+    def invoke(self, agent_input, config=None):
+        parts = []
+        for chunk in self.model.stream(agent_input["input"], config=config):
+            self.chunks += 1
+            parts.append(chunk.content)
+        return {"output": "".join(parts), "intermediate_steps": ["step"]}
+
+
+def test_unsafe_generation_is_stopped_early():
+    executor = _StreamingExecutor(_UNSAFE)
+
+    result = _invoke_with_safety_abort(executor, {"input": "deck"}, session_id="s1")
+
+    assert result["safety_aborted"] is True
+    assert len(result["output"]) < 200 < len(_UNSAFE)
+    assert executor.chunks < 20
+    assert scan_html_for_unsafe_patterns(result["output"]) == ["unsafe pattern: fetch"]
+
+
+def test_stopped_output_goes_straight_to_the_corrective_retry():
+    result = _invoke_with_safety_abort(_StreamingExecutor(_UNSAFE), {"input": "deck"})
+    regenerated = []
+
+    def regenerate():
+        regenerated.append(True)
+        return '<div class="slide">clean</div>'
+
+    out, retried = _run_output_safety_gate(result["output"], regenerate, session_id="s1")
+
+    assert retried is True and regenerated == [True]
+    assert out == '<div class="slide">clean</div>'
+
+
+def test_clean_generation_is_untouched():
+    clean = '<div class="slide"><canvas id="c"></canvas></div> ' + _TAIL
+
+    result = _invoke_with_safety_abort(_StreamingExecutor(clean), {"input": "deck"})
+
+    assert "safety_aborted" not in result
+    assert result["output"] == clean
+
+
+def test_prose_turns_are_not_scanned():
+    prose = "I will fetch (via Genie) the quarterly numbers first."
+
+    result = _invoke_with_safety_abort(_StreamingExecutor(prose), {"input": "deck"})
+
+    assert result["output"] == prose
+
+
+def test_abort_can_be_switched_off(monkeypatch):
+    monkeypatch.setenv("OUTPUT_SAFETY_STREAM_ABORT", "false")
+
+    result = _invoke_with_safety_abort(_StreamingExecutor(_UNSAFE), {"input": "deck"})
+
+    assert result["output"] == _UNSAFE
+
+
+def test_streaming_handler_does_not_report_the_abort_as_an_error():
+    q = queue.Queue()
+    handler = StreamingCallbackHandler(event_queue=q, session_id="s1")
+
+    handler.on_chain_error(UnsafeOutputAbortError(["unsafe pattern: fetch"], "<script>fetch("))
+
+    assert q.empty()
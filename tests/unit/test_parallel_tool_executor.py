@@ -0,0 +1,157 @@
+"""Tests for concurrent tool-call execution in the agent executor."""
+
+import queue
+import time
+from unittest.mock import Mock
+
+import pytest
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import StructuredTool
+
+from src.api.schemas.streaming import StreamEventType
+from src.core.user_context import get_current_user, set_current_user
+from src.services.parallel_tool_executor import ParallelToolAgentExecutor
+from src.services.streaming_callback import StreamingCallbackHandler
+
+
+def _agent(*calls):
+    """An agent that asks for ``calls`` (tool, input) in one turn, then finishes."""
+
+    def plan(inputs):
+        if inputs["intermediate_steps"]:
+            return AgentFinish(return_values={"output": "done"}, log="")
+        return [AgentAction(tool=tool, tool_input={"query": q}, log="") for tool, q in calls]
+
+    return RunnableLambda(plan)
+
+
+def _tool(name, delay, log=None):
+    def run(query: str) -> str:
+        if log is not None:
+            log.append(("start", name, query, time.monotonic()))
+        time.sleep(delay)
+        if query == "fail":
+            raise RuntimeError(f"{name} failed")
+        if log is not None:
+            log.append(("end", name, query, time.monotonic()))
+        return f"{name}:{query}:{get_current_user()}"
+
+    return StructuredTool.from_function(func=run, name=name, description=name)
+
+
+def _executor(agent, tools, **kwargs):
+    return ParallelToolAgentExecutor(
+        agent=agent, tools=tools, return_intermediate_steps=True, **kwargs
+    )
+
+
+@pytest.fixture
+def user():
+    set_current_user("alice@example.com")
+    yield
+    set_current_user(None)
+
+
+def test_independent_tools_run_concurrently(user):
+    executor = _executor(
+        _agent(("genie", "q1"), ("vector", "q2"), ("model", "q3")),
+        [_tool("genie", 0.3), _tool("vector", 0.3), _tool("model", 0.3)],
+    )
+
+    started = time.monotonic()
+    result = executor.invoke({"input": "go"})
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.75
+    # Observations keep the order the model asked for, with the caller's context.
+    assert [obs for _, obs in result["intermediate_steps"]] == [
+        "genie:q1:alice@example.com",
+        "vector:q2:alice@example.com",
+        "model:q3:alice@example.com",
+    ]
+    stats = executor.tool_stats
+    assert stats["parallel_batches"] == 1
+    assert stats["saved_seconds"] > 0.4
+
+
+def test_calls_to_the_same_tool_stay_sequential():
+    log = []
+    executor = _executor(
+        _agent(("genie", "a"), ("genie", "b"), ("vector", "c")),
+        [_tool("genie", 0.1, log), _tool("vector", 0.1, log)],
+    )
+
+    executor.invoke({"input": "go"})
+
+    genie = {(kind, q): t for kind, name, q, t in log if name == "genie"}
+    assert genie[("end", "a")] <= genie[("start", "b")]
+
+
+def test_max_parallel_tools_one_runs_sequentially():
+    executor = _executor(
+        _agent(("genie", "q1"), ("vector", "q2")),
+        [_tool("genie", 0.1), _tool("vector", 0.1)],
+        max_parallel_tools=1,
+    )
+
+    result = executor.invoke({"input": "go"})
+
+    assert len(result["intermediate_steps"]) == 2
+    assert executor.tool_stats["parallel_batches"] == 0
+
+
+def test_tool_error_propagates_after_the_batch():
+    log = []
+    executor = _executor(
+        _agent(("genie", "fail"), ("vector", "ok")),
+        [_tool("genie", 0.05, log), _tool("vector", 0.2, log)],
+    )
+
+    with pytest.raises(RuntimeError, match="genie failed"):
+        executor.invoke({"input": "go"})
+    assert ("end", "vector", "ok") in [entry[:3] for entry in log]
+
+
+def test_streaming_events_follow_call_order():
+    events = queue.Queue()
+    handler = StreamingCallbackHandler(events, session_id="s1")
+    handler._session_manager = Mock(add_message=Mock(return_value={"id": 1}))
+    # The first tool finishes last; its result must still be reported first.
+    executor = _executor(
+        _agent(("slow", "q1"), ("fast", "q2")),
+        [_tool("slow", 0.3), _tool("fast", 0.01)],
+    )
+
+    executor.invoke({"input": "go"}, config={"callbacks": [handler]})
+
+    emitted = []
+    while not events.empty():
+        event = events.get()
+        if event.type in (StreamEventType.TOOL_CALL, StreamEventType.TOOL_RESULT):
+            emitted.append((event.type, event.tool_name))
+    assert [e for e in emitted if e[0] == StreamEventType.TOOL_CALL] == [
+        (StreamEventType.TOOL_CALL, "slow"),
+        (StreamEventType.TOOL_CALL, "fast"),
+    ]
+    assert [e for e in emitted if e[0] == StreamEventType.TOOL_RESULT] == [
+        (StreamEventType.TOOL_RESULT, "slow"),
+        (StreamEventType.TOOL_RESULT, "fast"),
+    ]
+
+
+def test_ordered_tool_runs_flushes_runs_that_never_finished():
+    events = queue.Queue()
+    handler = StreamingCallbackHandler(events, session_id="s1")
+    handler._session_manager = Mock(add_message=Mock(return_value={"id": 1}))
+    first, second = object(), object()
+
+    with handler.ordered_tool_runs([first, second]):
+        handler.on_tool_start({"name": "b"}, "{}", run_id=second)
+        handler.on_tool_end("out", run_id=second)
+        assert events.empty()
+
+    assert [(e.type, e.tool_name) for e in list(events.queue)] == [
+        (StreamEventType.TOOL_CALL, "b"),
+        (StreamEventType.TOOL_RESULT, "b"),
+    ]
@@ -0,0 +1,222 @@
+"""Tests for per-section prompt size accounting and the prompt-budget report."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from langchain_community.chat_message_histories import ChatMessageHistory
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.core import prompt_metrics
+from src.core.prompt_modules import (
+    PER_DECK_SECTIONS,
+    build_editing_system_prompt,
+    build_generation_system_prompt,
+    editing_prompt_sections,
+    generation_prompt_sections,
+    shared_prefix,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    prompt_metrics.clear_prompt_metrics()
+    yield
+    prompt_metrics.clear_prompt_metrics()
+
+
+class TestPromptSections:
+    def test_generation_sections_join_to_the_prompt(self):
+        kwargs = dict(
+            slide_style="STYLE",
+            deck_prompt="Quarterly review",
+            image_guidelines="Use image 4",
+            design_system_active=True,
+            type_scale_reassertion="TITLE 48px",
+        )
+        sections = generation_prompt_sections(**kwargs)
+        assert "\n\n".join(text for _, text in sections) == build_generation_system_prompt(**kwargs)
+        assert [name for name, _ in sections][-4:] == [
+            "images", "slide_style", "deck_prompt", "type_scale"
+        ]
+        assert sections[-1] == ("type_scale", "TITLE 48px")
+
+    def test_editing_sections_join_to_the_prompt(self):
+        sections = editing_prompt_sections("STYLE", image_guidelines="Use image 4")
+        assert "\n\n".join(text for _, text in sections) == build_editing_system_prompt(
+            "STYLE", image_guidelines="Use image 4"
+        )
+
+    def test_section_chars_sums_repeated_names(self):
+        sizes = prompt_metrics.section_chars([("base", "abc"), ("base", "de"), ("images", "x")])
+        assert sizes == {"base": 5, "images": 1}
+
+
+class TestReport:
+    def test_percentiles_per_section(self):
+        for chars in range(1, 101):
+            prompt_metrics.record_prompt_sections({"history": chars * 4})
+        prompt_metrics.record_prompt_sections({"slide_context": 40})
+
+        report = prompt_metrics.prompt_section_report()
+
+        assert report["requests"] == 101
+        history = report["sections"]["history"]
+        assert (history["p50_chars"], history["p95_chars"]) == (200, 380)
+        assert (history["p50_tokens"], history["p95_tokens"]) == (50, 95)
+        # Absent from 100 of 101 requests -> p95 is still 0
+        assert report["sections"]["slide_context"]["p95_chars"] == 0
+        assert report["sections"]["slide_context"]["max_chars"] == 40
+
+    def test_empty_window(self):
+        assert prompt_metrics.prompt_section_report()["sections"] == {}
+
+    def test_window_is_bounded(self):
+        for _ in range(prompt_metrics.PROMPT_METRICS_WINDOW + 5):
+            prompt_metrics.record_prompt_sections({"question": 1})
+        assert prompt_metrics.prompt_section_report()["requests"] == (
+            prompt_metrics.PROMPT_METRICS_WINDOW
+        )
+
+
+class TestSharedPrefix:
+    """Per-deck content comes strictly after a byte-stable shared prefix."""
+
+    DS = dict(
+        slide_style="DS STYLE",
+        image_guidelines="Use image 4",
+        design_system_active=True,
+    )
+
+    @pytest.mark.parametrize("build", [generation_prompt_sections, editing_prompt_sections])
+    def test_per_deck_sections_trail_every_shared_one(self, build):
+        kwargs = dict(slide_style="STYLE", deck_prompt="Deck", template_block="PINNED")
+        names = [name for name, _ in build(**kwargs)]
+        first = min(i for i, name in enumerate(names) if name in PER_DECK_SECTIONS)
+        assert all(name in PER_DECK_SECTIONS for name in names[first:])
+
+    def test_prefix_identical_across_decks_of_one_design_system(self):
+        plain = generation_prompt_sections(**self.DS)
+        per_deck = generation_prompt_sections(
+            **self.DS,
+            deck_prompt="Quarterly review",
+            template_block="SELECTED SLIDE TEMPLATE: Title",
+            type_scale_reassertion="TITLE 48px",
+        )
+        prefix = shared_prefix(plain)
+        assert shared_prefix(per_deck) == prefix
+        assert build_generation_system_prompt(
+            **self.DS, deck_prompt="Quarterly review"
+        ).startswith(prefix)
+        assert "DS STYLE" in prefix and "Quarterly review" not in prefix
+
+    def test_prefix_differs_per_design_system(self):
+        other = dict(self.DS, slide_style="OTHER STYLE")
+        assert shared_prefix(generation_prompt_sections(**self.DS)) != shared_prefix(
+            generation_prompt_sections(**other)
+        )
+
+    def test_identical_config_gives_identical_prompt_for_every_user(self):
+        from src.api.schemas.agent_config import AgentConfig
+        from src.core.defaults import DEFAULT_SLIDE_STYLE
+        from src.core.user_context import set_current_user
+        from src.services.agent_factory import _get_prompt_content, clear_prompt_cache
+
+        prompts = []
+        for user in ("alice@example.com", "bob@example.com"):
+            clear_prompt_cache()
+            set_current_user(user)
+            try:
+                prompts.append(_get_prompt_content(AgentConfig()))
+            finally:
+                set_current_user(None)
+
+        assert prompts[0]["system_prompt"] == prompts[1]["system_prompt"]
+        assert prompts[0]["prefix_hash"] == prompts[1]["prefix_hash"]
+        assert prompts[0]["prefix_hash"] == prompt_metrics.prompt_prefix_hash(
+            shared_prefix(generation_prompt_sections(DEFAULT_SLIDE_STYLE))
+        )
+
+
+class TestPromptCacheUsage:
+    @pytest.mark.parametrize("usage, expected", [
+        # LangChain usage_metadata
+        ({"input_tokens": 900, "output_tokens": 10,
+          "input_token_details": {"cache_read": 800}}, (900, 800)),
+        # OpenAI-style usage from a serving endpoint
+        ({"prompt_tokens": 900, "completion_tokens": 10,
+          "prompt_tokens_details": {"cached_tokens": 512}}, (900, 512)),
+        ({"prompt_tokens": 900, "cache_read_input_tokens": 0}, (900, 0)),
+        # No cache reporting at all
+        ({"prompt_tokens": 900, "completion_tokens": 10}, None),
+        ({"input_tokens": 900, "output_tokens": 10}, None),
+        (None, None),
+    ])
+    def test_cache_usage_parsing(self, usage, expected):
+        assert prompt_metrics.cache_usage(usage) == expected
+
+    def test_callback_records_reported_cached_tokens(self):
+        from langchain_core.outputs import ChatGeneration, LLMResult
+
+        from src.services.prompt_cache_usage import PromptCacheUsageCallback
+
+        callback = PromptCacheUsageCallback()
+        callback.on_llm_end(LLMResult(
+            generations=[[ChatGeneration(message=AIMessage(content="<div/>"))]],
+            llm_output={"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 750}},
+        ))
+        callback.on_llm_end(LLMResult(
+            generations=[[ChatGeneration(message=AIMessage(content="<div/>"))]],
+            llm_output={"prompt_tokens": 1000},
+        ))
+
+        cache = prompt_metrics.prompt_section_report()["prefix_cache"]
+        assert cache == {
+            "llm_calls": 1,
+            "input_tokens": 1000,
+            "cached_input_tokens": 750,
+            "cached_ratio": 0.75,
+        }
+
+    def test_report_without_cache_data(self):
+        assert prompt_metrics.prompt_section_report()["prefix_cache"]["cached_ratio"] is None
+
+
+def test_agent_records_system_and_request_sections():
+    from src.services.agent import SlideGeneratorAgent
+
+    agent = SlideGeneratorAgent.__new__(SlideGeneratorAgent)
+    agent._create_prompt({
+        "system_prompt": "S" * 30,
+        "pre_assembled": True,
+        "section_sizes": {"slide_style": 10, "base": 18},
+        "prefix_hash": "abc123",
+    })
+    history = ChatMessageHistory()
+    history.add_messages([HumanMessage(content="q" * 8), AIMessage(content="a" * 12)])
+    span = MagicMock()
+
+    agent._record_prompt_sections(span, "s1", history, "make it blue", "CTX\n\nmake it blue")
+
+    attrs = {c.args[0]: c.args[1] for c in span.set_attribute.call_args_list}
+    assert attrs["prompt_chars.slide_style"] == 10
+    assert attrs["prompt_chars.history"] == 20
+    assert attrs["prompt_chars.slide_context"] == 5
+    assert attrs["history_tokens"] == 5
+    assert attrs["prompt_prefix_hash"] == "abc123"
+    report = prompt_metrics.prompt_section_report()
+    assert set(report["sections"]) == {
+        "slide_style", "base", "history", "slide_context", "question"
+    }
+
+
+def test_admin_prompt_budget_endpoint():
+    from src.api.main import app
+
+    prompt_metrics.record_prompt_sections({"base": 4000, "history": 800})
+    resp = TestClient(app).get("/api/admin/prompt-budget")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["requests"] == 1
+    assert body["sections"]["base"]["p95_tokens"] == 1000
@@ -139,6 +139,9 @@ ALLOWLIST = {
     ("POST", "/api/images/upload"):
         "Shared image library: any authenticated user may upload; writes to "
         "existing images are owner-scoped (SDR-4437 HIGH-1).",
+    ("POST", "/api/images/upload/batch"):
+        "Multi-file form of /api/images/upload — same shared-library rationale; "
+        "every stored row is owned by the caller.",
     ("POST", "/api/feedback/chat"): FEEDBACK_WRITE_RATIONALE,
     ("POST", "/api/feedback/submit"): FEEDBACK_WRITE_RATIONALE,
     ("POST", "/api/feedback/survey"): FEEDBACK_WRITE_RATIONALE,
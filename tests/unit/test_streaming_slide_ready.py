@@ -0,0 +1,70 @@
+"""Tests for slide_ready events streamed from LLM tokens."""
+
+import queue
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.api.schemas.streaming import StreamEventType
+from src.services.streaming_callback import StreamingCallbackHandler
+
+
+def _handler():
+    q = queue.Queue()
+    h = StreamingCallbackHandler(event_queue=q, session_id="s1")
+    h._session_manager = MagicMock()
+    return h, q
+
+
+def _feed(h, text, run_id, size=7):
+    for i in range(0, len(text), size):
+        h.on_llm_new_token(text[i : i + size], run_id=run_id)
+
+
+def _events(q):
+    events = []
+    while not q.empty():
+        events.append(q.get())
+    return events
+
+
+def test_each_slide_is_emitted_when_its_closing_tag_arrives():
+    h, q = _handler()
+    run = uuid4()
+
+    _feed(h, '<style>h1{}</style><div class="slide"><h1>A</h1></div>\n<div class="slide">B', run)
+    first = _events(q)
+    _feed(h, "</div>", run)
+    second = _events(q)
+
+    assert [(e.type, e.slide_index) for e in first] == [(StreamEventType.SLIDE_READY, 0)]
+    assert first[0].slide_html == '<div class="slide"><h1>A</h1></div>'
+    assert [e.slide_index for e in second] == [1]
+    h.session_manager.add_message.assert_not_called()  # provisional, never persisted
+
+
+def test_a_new_llm_run_restarts_slide_indices():
+    h, q = _handler()
+
+    _feed(h, '<div class="slide">attempt 1</div>', uuid4())
+    _feed(h, '<div class="slide">attempt 2</div>', uuid4())
+
+    assert [e.slide_index for e in _events(q)] == [0, 0]
+
+
+def test_unsafe_slides_are_not_streamed():
+    h, q = _handler()
+
+    _feed(h, '<div class="slide"><script>fetch("https://evil")</script></div>', uuid4())
+
+    assert _events(q) == []
+    assert h.slide_stream_stats() == {}
+
+
+def test_time_to_first_slide_is_measured():
+    h, q = _handler()
+    _feed(h, '<div class="slide">A</div><div class="slide">B</div>', uuid4())
+
+    stats = h.slide_stream_stats()
+
+    assert stats["slides_streamed"] == 2
+    assert isinstance(stats["first_slide_ms"], int) and stats["first_slide_ms"] >= 0
@@ -7,6 +7,8 @@ correct naming, descriptions, and index-based suffixes.
 import pytest
 from unittest.mock import MagicMock, patch
 
+from src.services.tools import is_degraded
+
 
 class TestBuildVectorTool:
     """Tests for build_vector_tool."""
@@ -51,6 +53,22 @@ class TestBuildVectorTool:
         tool = build_vector_tool(config, index=1)
         assert "catalog.schema.my_index" in tool.description
 
+    @patch("src.services.tools.vector_tool.get_user_client")
+    def test_unresolved_columns_mark_tool_degraded(self, mock_client_fn):
+        from src.api.schemas.agent_config import VectorIndexTool
+        from src.services.tools.vector_tool import build_vector_tool
+
+        mock_client_fn.return_value.vector_search_indexes.get_index.side_effect = RuntimeError(
+            "unavailable"
+        )
+        config = VectorIndexTool(type="vector_index", endpoint_name="ep", index_name="idx")
+        assert is_degraded(build_vector_tool(config, index=1))
+
+        config = VectorIndexTool(
+            type="vector_index", endpoint_name="ep", index_name="idx", columns=["content"]
+        )
+        assert not is_degraded(build_vector_tool(config, index=1))
+
 
 class TestBuildModelEndpointTool:
     """Tests for build_model_endpoint_tool."""
@@ -208,6 +226,16 @@ class TestBuildMCPTools:
         assert len(tools) == 1
         assert "tavily" in tools[0].name
         assert "search" in tools[0].name
+        assert is_degraded(tools[0])
+
+    @patch("src.services.tools.mcp_tool.list_mcp_tools")
+    def test_discovered_tools_are_not_degraded(self, mock_list):
+        from src.api.schemas.agent_config import MCPTool
+        from src.services.tools.mcp_tool import build_mcp_tools
+
+        mock_list.return_value = [{"name": "search", "description": "Search"}]
+        config = MCPTool(type="mcp", connection_name="jira", server_name="Jira")
+        assert not any(is_degraded(tool) for tool in build_mcp_tools(config))
 
 
 class TestModelEndpointResponseExtractors:
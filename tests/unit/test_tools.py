@@ -81,11 +81,12 @@ def test_query_genie_space_success(mock_databricks_client, mock_settings):
     assert "data" in response
     assert response["data"] is not None
     
-    # Verify CSV format (should have header + 2 data rows)
-    lines = response["data"].strip().split('\n')
-    assert len(lines) == 3  # header + 2 data rows
-    assert "region" in lines[0]
-    assert "sales" in lines[0]
+    # Verify the shaped block: schema header, summary, CSV of both rows
+    data = response["data"]
+    assert data.startswith("Result 1: 2 rows x 2 columns")
+    assert "- sales: min 800000, max 1000000, mean 900000" in data
+    assert data.endswith("region,sales\nAPAC,1000000\nEMEA,800000")
+    assert response["results"][0]["truncated"] is False
 
     # Verify client calls
     mock_databricks_client.genie.start_conversation_and_wait.assert_called_once()
@@ -174,9 +175,8 @@ def test_query_genie_space_retry_success(
     assert "data" in response
     assert response["data"] is not None
     
-    # Verify CSV format
-    lines = response["data"].strip().split('\n')
-    assert len(lines) == 2  # header + 1 data row
+    # Verify CSV format (header + 1 data row)
+    assert response["data"].endswith("region,sales\nAPAC,1000000")
     
     # Verify retry occurred (2 calls to start_conversation)
     assert mock_databricks_client.genie.start_conversation_and_wait.call_count == 2
@@ -225,10 +225,9 @@ def test_query_genie_space_empty_data(mock_databricks_client, mock_settings):
     assert response["message"] == "No data found for your query"
     assert "data" in response
     
-    # CSV with empty data should just have header
-    lines = response["data"].strip().split('\n')
-    assert len(lines) == 1  # Only header, no data rows
-    assert "col1" in lines[0]
+    # Empty data is reported with just the header row
+    assert response["data"].startswith("Result 1: 0 rows x 1 columns")
+    assert response["data"].endswith("\ncol1")
 
 
 def test_query_genie_space_no_result_key(mock_databricks_client, mock_settings):
@@ -274,9 +273,8 @@ def test_query_genie_space_no_result_key(mock_databricks_client, mock_settings):
 
     assert response["conversation_id"] == "conv-no-result"
     assert response["message"] == "No results found"
-    lines = response["data"].strip().split("\n")
-    assert len(lines) == 1  # Header only, no data rows
-    assert "col1" in lines[0]
+    assert response["data"].startswith("Result 1: 0 rows x 2 columns")
+    assert response["data"].endswith("\ncol1,col2")  # Header only, no data rows
 
 
 def test_query_genie_space_error(mock_databricks_client, mock_settings):
@@ -325,3 +323,125 @@ def test_initialize_genie_conversation_error(mock_databricks_client, mock_settin
 
     assert "Failed to initialize Genie conversation" in str(exc_info.value)
 
+
+
+@pytest.fixture
+def genie_cache(monkeypatch):
+    """Enable the Genie result cache for a known user, starting empty."""
+    from src.core.user_context import set_current_user
+    from src.services.tools.genie_cache import get_genie_result_cache
+
+    monkeypatch.setenv("GENIE_RESULT_CACHE_ENABLED", "true")
+    cache = get_genie_result_cache()
+    cache.clear()
+    set_current_user("alice@example.com")
+    yield cache
+    set_current_user(None)
+    cache.clear()
+
+
+def _answer(client, sql="SELECT region, sales FROM q4"):
+    """Set up one Genie answer with a SQL attachment."""
+    response = Mock()
+    response.conversation_id = "conv-1"
+    response.message_id = "msg-1"
+    attachment = Mock()
+    attachment.attachment_id = "att-1"
+    attachment.query.query = sql
+    attachment.text = "Q4 sales by region"
+    response.attachments = [attachment]
+    client.genie.create_message_and_wait.return_value = response
+    result = Mock()
+    result.as_dict.return_value = {
+        "statement_response": {
+            "manifest": {"schema": {"columns": [{"name": "region"}, {"name": "sales"}]}},
+            "result": {"data_array": [["APAC", 1]]},
+        }
+    }
+    client.genie.get_message_attachment_query_result.return_value = result
+
+
+def test_genie_cache_serves_repeated_question(mock_databricks_client, mock_settings, genie_cache):
+    """A normalized repeat of a question is answered from the cache."""
+    _answer(mock_databricks_client)
+
+    first = query_genie_space("What were Q4 sales?", "conv-1")
+    second = query_genie_space("  what were  Q4 sales ", "conv-2")
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["data"] == first["data"]
+    assert second["sql"] == "SELECT region, sales FROM q4"
+    # The caller's own conversation is returned on a hit.
+    assert second["conversation_id"] == "conv-2"
+    assert mock_databricks_client.genie.create_message_and_wait.call_count == 1
+
+
+def test_genie_cache_requeries_when_result_was_evicted(
+    mock_databricks_client, mock_settings, genie_cache
+):
+    """A cached answer whose result_id left the result store is a miss."""
+    _answer(mock_databricks_client)
+    genie_cache.put(
+        "test-space-id", "alice@example.com", "What were Q4 sales?",
+        message="stale", data="stale", sql="SELECT 1", conversation_id="conv-1",
+        results=[{"attachment_id": "att-1", "result_id": "evicted-id"}],
+    )
+
+    result = query_genie_space("What were Q4 sales?", "conv-1")
+
+    assert result["cached"] is False
+    assert result["data"] != "stale"
+    assert mock_databricks_client.genie.create_message_and_wait.call_count == 1
+    # The live answer replaced the stale entry.
+    assert genie_cache.get("test-space-id", "alice@example.com", "What were Q4 sales?").data \
+        == result["data"]
+
+
+def test_genie_cache_is_scoped_by_user(mock_databricks_client, mock_settings, genie_cache):
+    """Another user asking the same question queries Genie with their own permissions."""
+    from src.core.user_context import set_current_user
+
+    _answer(mock_databricks_client)
+    query_genie_space("What were Q4 sales?", "conv-1")
+    set_current_user("bob@example.com")
+
+    assert query_genie_space("What were Q4 sales?", "conv-1")["cached"] is False
+    assert mock_databricks_client.genie.create_message_and_wait.call_count == 2
+
+
+def test_genie_cache_respects_opt_out(mock_databricks_client, mock_settings, genie_cache):
+    """A tool configured with cache_results=False always queries live."""
+    _answer(mock_databricks_client)
+    query_genie_space("What were Q4 sales?", "conv-1", cache_results=False)
+    query_genie_space("What were Q4 sales?", "conv-1", cache_results=False)
+
+    assert mock_databricks_client.genie.create_message_and_wait.call_count == 2
+    assert genie_cache.stats()["entries"] == 0
+
+
+def test_genie_cache_off_by_default(mock_databricks_client, mock_settings, genie_cache,
+                                    monkeypatch):
+    """Without GENIE_RESULT_CACHE_ENABLED nothing is cached."""
+    monkeypatch.delenv("GENIE_RESULT_CACHE_ENABLED")
+    _answer(mock_databricks_client)
+    query_genie_space("What were Q4 sales?", "conv-1")
+    query_genie_space("What were Q4 sales?", "conv-1")
+
+    assert mock_databricks_client.genie.create_message_and_wait.call_count == 2
+
+
+def test_genie_cache_expiry_and_byte_limit():
+    """Entries expire after the TTL and the oldest are evicted over max_bytes."""
+    from src.services.tools.genie_cache import GenieResultCache
+
+    cache = GenieResultCache(ttl_seconds=60, max_bytes=10)
+    cache.put("s", "u", "a", message="", data="12345", sql=None, conversation_id="c")
+    cache.put("s", "u", "b", message="", data="12345", sql=None, conversation_id="c")
+    cache.put("s", "u", "c", message="", data="12345", sql=None, conversation_id="c")
+
+    assert cache.get("s", "u", "a") is None
+    assert cache.get("s", "u", "c").data == "12345"
+
+    with patch("src.services.tools.genie_cache.time.time", return_value=10**12):
+        assert cache.get("s", "u", "c") is None
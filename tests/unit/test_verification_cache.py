@@ -0,0 +1,250 @@
+"""Unit tests for the global verification result cache."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import Base, get_db
+from src.database.models import VerificationCacheEntry
+from src.services.verification_cache import (
+    VerificationCache,
+    clear_verification_cache_stats,
+    corpus_hash,
+    purge_verification_cache,
+    verification_cache_key,
+    verification_cache_report,
+)
+
+_VERDICT = {
+    "score": 85,
+    "rating": "green",
+    "explanation": "Matches",
+    "issues": [],
+    "duration_ms": 900,
+    "trace_id": "tr-1",
+    "genie_conversation_id": "conv-1",
+    "error": False,
+    "error_message": None,
+}
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    clear_verification_cache_stats()
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    clear_verification_cache_stats()
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def _cache(session_factory, backend="direct", corpus="rows", version="v1"):
+    return VerificationCache(
+        backend, corpus_hash(corpus), version, "judge-ep", session_factory=session_factory
+    )
+
+
+class TestCacheKey:
+    def test_identical_inputs_share_a_key(self):
+        assert verification_cache_key("s", "c", "mlflow", "v1", "m") == verification_cache_key(
+            "s", "c", "mlflow", "v1", "m"
+        )
+
+    @pytest.mark.parametrize("index", range(5))
+    def test_any_input_change_changes_the_key(self, index):
+        parts = ["s", "c", "mlflow", "v1", "m"]
+        changed = list(parts)
+        changed[index] = "other"
+
+        assert verification_cache_key(*changed) != verification_cache_key(*parts)
+
+
+class TestVerificationCache:
+    def test_round_trip_drops_session_fields(self, session_factory):
+        cache = _cache(session_factory)
+
+        assert cache.put_many({"h1": _VERDICT}) == 1
+        found = cache.get_many(["h1", "h2"])
+
+        assert set(found) == {"h1"}
+        assert found["h1"]["rating"] == "green"
+        assert "genie_conversation_id" not in found["h1"]
+
+    def test_other_corpus_backend_or_prompt_misses(self, session_factory):
+        _cache(session_factory).put_many({"h1": _VERDICT})
+
+        assert _cache(session_factory, corpus="other rows").get_many(["h1"]) == {}
+        assert _cache(session_factory, backend="mlflow").get_many(["h1"]) == {}
+        assert _cache(session_factory, version="v2").get_many(["h1"]) == {}
+
+    def test_error_results_are_not_stored(self, session_factory):
+        cache = _cache(session_factory)
+
+        assert cache.put_many({"h1": {**_VERDICT, "error": True}}) == 0
+        assert cache.get_many(["h1"]) == {}
+
+    def test_existing_keys_are_not_rewritten(self, session_factory):
+        cache = _cache(session_factory)
+        cache.put_many({"h1": _VERDICT})
+
+        assert cache.put_many({"h1": {**_VERDICT, "rating": "red"}}) == 0
+        assert cache.get_many(["h1"])["h1"]["rating"] == "green"
+
+    def test_hits_are_counted(self, session_factory):
+        cache = _cache(session_factory)
+        cache.put_many({"h1": _VERDICT})
+        cache.get_many(["h1", "h2"])
+        cache.get_many(["h1"])
+
+        db = session_factory()
+        try:
+            report = verification_cache_report(db)
+            row = db.query(VerificationCacheEntry).one()
+        finally:
+            db.close()
+
+        assert row.hit_count == 2
+        assert report["worker"]["lookups"] == 3
+        assert report["worker"]["hits"] == 2
+        assert report["worker"]["hit_rate"] == 0.667
+        assert report["entries"] == {"direct": {"rows": 1, "hits": 2}}
+
+    def test_purge_by_backend(self, session_factory):
+        _cache(session_factory).put_many({"h1": _VERDICT})
+        _cache(session_factory, backend="mlflow").put_many({"h1": _VERDICT})
+
+        db = session_factory()
+        try:
+            assert purge_verification_cache(db, judge_backend="mlflow") == 1
+            assert db.query(VerificationCacheEntry).count() == 1
+        finally:
+            db.close()
+
+    def test_lookup_failure_is_a_miss(self):
+        def broken():
+            raise RuntimeError("db down")
+
+        cache = VerificationCache("direct", "c", "v1", "m", session_factory=broken)
+
+        assert cache.get_many(["h1"]) == {}
+        assert cache.put_many({"h1": _VERDICT}) == 0
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("VERIFICATION_CACHE_ENABLED", "false")
+
+        assert VerificationCache.for_judge("direct", "rows") is None
+
+
+class TestJudgeSlideUsesCache:
+    def test_second_verification_skips_the_judge(self, session_factory):
+        from src.api.services import deck_verification
+
+        calls = []
+
+        async def fake_judge(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(
+                score=85, rating="green", explanation="", issues=[], duration_ms=5,
+                trace_id=None, error=False, error_message=None,
+            )
+
+        def for_judge(judge_backend, genie_data):
+            return _cache(session_factory, backend=judge_backend, corpus=genie_data)
+
+        async def verify(conversation_id):
+            return await deck_verification.judge_slide(
+                "<p>Revenue 1.2M</p>",
+                "revenue 1200000",
+                content_hash="h1",
+                experiment_id=None,
+                judge_backend="direct",
+                genie_conversation_id=conversation_id,
+            )
+
+        with patch.object(deck_verification, "evaluate_with_judge", fake_judge), patch.object(
+            VerificationCache, "for_judge", side_effect=for_judge
+        ):
+            first = asyncio.run(verify("conv-a"))
+            second = asyncio.run(verify("conv-b"))
+
+        assert len(calls) == 1
+        assert second["rating"] == first["rating"] == "green"
+        assert second["genie_conversation_id"] == "conv-b"
+
+
+class TestAdminEndpoints:
+    @pytest.fixture
+    def client(self, session_factory):
+        from src.api.main import app
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_report_and_purge(self, client, session_factory):
+        _cache(session_factory).put_many({"h1": _VERDICT, "h2": _VERDICT})
+
+        report = client.get("/api/admin/verification-cache").json()
+        purged = client.delete("/api/admin/verification-cache", params={"prompt_version": "v1"})
+
+        assert report["entries"]["direct"]["rows"] == 2
+        assert purged.status_code == 200
+        assert purged.json() == {"deleted": 2}
+        assert client.get("/api/admin/verification-cache").json()["entries"] == {}
+
+
+def test_deck_job_reuses_cached_verdicts(session_factory):
+    """A duplicated deck (same slides, same corpus) gets its verdicts without judge calls."""
+    from src.api.services import deck_verification
+
+    _cache(session_factory, corpus="revenue | 1200000").put_many({"h-a": _VERDICT})
+    manager = MagicMock()
+    manager.get_session.return_value = {"genie_conversation_id": "conv-copy"}
+    manager.get_slide_deck.return_value = {
+        "slides": [{"html": "a", "content_hash": "h-a", "verification": None}]
+    }
+    manager.get_messages.return_value = [
+        {"role": "tool", "message_type": "tool_result", "content": "revenue | 1200000"}
+    ]
+
+    async def must_not_judge(**kwargs):
+        raise AssertionError("cached verdict should be reused")
+
+    async def collect():
+        return [e async for e in deck_verification.verify_deck("copy")]
+
+    with patch.object(deck_verification, "get_session_manager", return_value=manager), patch.object(
+        deck_verification, "evaluate_with_judge", must_not_judge
+    ), patch.object(
+        deck_verification, "get_settings", return_value=SimpleNamespace(llm_judge_backend="direct")
+    ), patch.object(
+        VerificationCache,
+        "for_judge",
+        side_effect=lambda backend, corpus: _cache(session_factory, backend, corpus),
+    ):
+        events = asyncio.run(collect())
+
+    assert events[0]["cached"] is True
+    assert events[0]["verification"]["genie_conversation_id"] == "conv-copy"
+    assert events[-1]["cache_hits"] == 1
+    assert events[-1]["judge_calls"] == 0
+    saved = manager.save_verifications.call_args.args[1]
+    assert saved["h-a"]["rating"] == "green"
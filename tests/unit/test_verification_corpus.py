@@ -14,7 +14,7 @@ All fixtures synthetic.
 
 import pytest
 
-from src.api.routes.verification import _build_verification_corpus
+from src.api.services.deck_verification import build_verification_corpus
 
 
 def _tool_result(content: str, tool_name: str | None) -> dict:
@@ -45,14 +45,14 @@ class TestBuildVerificationCorpus:
             _tool_result(_ASSET_LISTING, "search_brand_assets"),
             _tool_result(_IMAGE_LISTING, "search_images"),
         ]
-        assert _build_verification_corpus(messages) == ""
+        assert build_verification_corpus(messages) == ""
 
     def test_data_bearing_results_are_kept(self):
         messages = [
             _tool_result(_ASSET_LISTING, "search_brand_assets"),
             _tool_result(_GENIE_ROWS, "genie_query"),
         ]
-        corpus = _build_verification_corpus(messages)
+        corpus = build_verification_corpus(messages)
         assert _GENIE_ROWS in corpus
         assert "acme-logo-primary" not in corpus
 
@@ -60,7 +60,7 @@ class TestBuildVerificationCorpus:
         """Older rows persisted before tool_name metadata existed keep flowing
         to the judge — exclusion is strictly name-based."""
         messages = [_tool_result(_GENIE_ROWS, None)]
-        assert _build_verification_corpus(messages) == _GENIE_ROWS
+        assert build_verification_corpus(messages) == _GENIE_ROWS
 
     def test_non_tool_messages_and_blank_results_ignored(self):
         messages = [
@@ -70,13 +70,14 @@ class TestBuildVerificationCorpus:
             _tool_result(_GENIE_ROWS, "genie_query"),
             _tool_result(_GENIE_ROWS, "vector_search"),
         ]
-        assert _build_verification_corpus(messages) == f"{_GENIE_ROWS}\n---\n{_GENIE_ROWS}"
+        assert build_verification_corpus(messages) == f"{_GENIE_ROWS}\n---\n{_GENIE_ROWS}"
 
 
 class TestVerifySlideRouteWithAssetOnlySession:
     @pytest.mark.asyncio
     async def test_asset_only_session_takes_no_source_path_without_judge(self, monkeypatch):
         from src.api.routes import verification as verification_route
+        from src.api.services import deck_verification
 
         class FakeSessionManager:
             def __init__(self):
@@ -113,7 +114,7 @@ class TestVerifySlideRouteWithAssetOnlySession:
             judge_calls.append(kwargs)
             raise AssertionError("judge must not run for asset-only sessions")
 
-        monkeypatch.setattr(verification_route, "evaluate_with_judge", fake_judge)
+        monkeypatch.setattr(deck_verification, "evaluate_with_judge", fake_judge)
 
         response = await verification_route.verify_slide(
             0, verification_route.VerifySlideRequest(session_id="synthetic-session")